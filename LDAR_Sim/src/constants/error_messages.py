@@ -125,6 +125,10 @@ class Runtime_Warning_Messages:
         "Please refer to the Installation Guide Section 6 for information"
         " on how to avoid this issue."
     )
+    PYARROW_UNAVAILABLE_WARNING = (
+        "Warning: LDAR-Sim could not import pyarrow, which is required to write {file_format}"
+        " program outputs. The program outputs will be written as csv instead."
+    )
 
 
 class Output_Processing_Messages:
@@ -133,6 +137,14 @@ class Output_Processing_Messages:
 
     DURATION_FACTOR_ERROR = "Duration factor must be between 0.0 and 1.0"
 
+    INVALID_OUTPUT_FORMAT_ERROR = (
+        "Invalid program output file format: {file_format}. Expected csv, parquet or arrow"
+    )
+    PYARROW_UNAVAILABLE_ERROR = (
+        "Reading or writing Parquet and Arrow outputs requires pyarrow. Install pyarrow or write"
+        " csv outputs instead"
+    )
+
 
 class Runtime_Error_Messages:
     NO_BASE_PROG_ERROR = "No baseline program input...Exiting sim"
@@ -42,7 +42,10 @@ class Generator_Files:
 
     GENERATOR_FOLDER = "generator"
 
-    GEN_INFRA_EMISS = "gen_infrastructure_emissions_{i}.p"
+    GEN_INFRA_EMISS = "gen_infrastructure_emissions_{i}.npy"
+
+    WEATHER_CACHE_FOLDER = "weather_{hash}"
+    DAYLIGHT_FILE = "daylight_{lat}_{lon}_{start}_{end}.npy"
 
 
 @dataclass
@@ -65,8 +68,9 @@ class Output_Files:
     TRUE_AND_ESTIMATED_PAIRED_EMISSIONS_DISTRIBUTION_PLOT = (
         "True_and_Estimated_Paired_Emissions_Distribution.png"
     )
-    EMISSIONS_SUMMARY_FILE = "emissions_summary.csv"
-    EST_EMISSIONS_FILE = "estimated_emissions.csv"
-    EST_REP_EMISSIONS_FILE = "estimated_repaired_emissions_to_remove.csv"
-    TIMESERIES_FILE = "timeseries.csv"
+    # The extension of the program output files depends on the program output format
+    EMISSIONS_SUMMARY_FILE = "emissions_summary"
+    EST_EMISSIONS_FILE = "estimated_emissions"
+    EST_REP_EMISSIONS_FILE = "estimated_repaired_emissions_to_remove"
+    TIMESERIES_FILE = "timeseries"
     PARAMETER_FILE = "parameters.yaml"
@@ -40,12 +40,14 @@ class Emissions_Source_Processing_Const:
 
 
 class Multi_Sim_Output_Const:
-    TS_PATTERN = re.compile(r".*timeseries\.csv$")
-    EMIS_PATTERN = re.compile(r".*emissions_summary\.csv$")
-    EST_PATTERN = re.compile(r".*estimated_emissions\.csv$")
-    EST_REP_PATTERN = re.compile(r".*estimated_repaired_emissions_to_remove\.csv$")
+    TS_PATTERN = re.compile(r".*timeseries\.(?:csv|parquet|arrow)$")
+    EMIS_PATTERN = re.compile(r".*emissions_summary\.(?:csv|parquet|arrow)$")
+    EST_PATTERN = re.compile(r".*estimated_emissions\.(?:csv|parquet|arrow)$")
+    EST_REP_PATTERN = re.compile(
+        r".*estimated_repaired_emissions_to_remove\.(?:csv|parquet|arrow)$"
+    )
 
-    OUTPUTS_NAME_SIM_EXTRACTION_REGEX = re.compile(r"^(.*)_((?<=_)\d+)_.+.csv$")
+    OUTPUTS_NAME_SIM_EXTRACTION_REGEX = re.compile(r"^(.*)_((?<=_)\d+)_.+\.(?:csv|parquet|arrow)$")
 
     OUTPUT_KEEP_STR = "kept"
     OUTPUT_KEEP_REGEX = re.compile(re.escape(OUTPUT_KEEP_STR))
@@ -53,6 +55,10 @@ class Multi_Sim_Output_Const:
     PERCENTILE_95 = 95
     PERCENTILE_5 = 5
 
+    MEAN_STAT = "mean"
+    SUM_STAT = "sum"
+    PERCENTILE_STAT = "percentile"
+
 
 class IOLocationConstants:
     GENERATOR_FOLDER = "generator"
@@ -255,6 +255,7 @@ class EMIS_DATA_COL_ACCESSORS:
     RECORDED = "Recorded"
     RECORDED_BY = "Recorded By"
     REPAIRABLE = "Repairable"
+    SPATIAL_COV = "{method} Spatial Coverage"
     SURVEY_LEVEL = "Survey Level"
     SURVEY_START_DATE = "Survey Start Date"
     SURVEY_COMPLETION_DATE = "Survey Completion Date"
@@ -295,6 +296,27 @@ EMIS_INFO_COLUMNS_TO_KEEP_FOR_DURATION_ESTIMATION = [
     EMIS_DATA_COL_ACCESSORS.M_RATE,
 ]
 
+# The emissions summary columns used by the emissions summary statistics
+EMIS_INFO_COLUMNS_TO_KEEP_FOR_SUMMARY = [
+    EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT,
+    EMIS_DATA_COL_ACCESSORS.EST_VOL_EMIT,
+    EMIS_DATA_COL_ACCESSORS.MITIGATED,
+    EMIS_DATA_COL_ACCESSORS.T_RATE,
+    EMIS_DATA_COL_ACCESSORS.REPAIRABLE,
+    EMIS_DATA_COL_ACCESSORS.DATE_BEG,
+    EMIS_DATA_COL_ACCESSORS.DATE_REP_EXP,
+    EMIS_DATA_COL_ACCESSORS.THEORY_DATE,
+]
+
+# Label columns with few distinct values, dictionary encoded in typed program output files
+DICTIONARY_ENCODED_COLUMNS = [
+    EMIS_DATA_COL_ACCESSORS.SITE_ID,
+    EMIS_DATA_COL_ACCESSORS.SITE_TYPE,
+    EMIS_DATA_COL_ACCESSORS.EQG,
+    EMIS_DATA_COL_ACCESSORS.COMP,
+    EMIS_DATA_COL_ACCESSORS.STATUS,
+]
+
 EMIS_DATA_FINAL_COL_ORDER = [
     EMIS_DATA_COL_ACCESSORS.EMIS_ID,
     EMIS_DATA_COL_ACCESSORS.SITE_ID,
@@ -56,6 +56,13 @@ class Duration_Method:
     MEASUREMENT_CONSERVATIVE = "measurement-based"
 
 
+@dataclass
+class Output_File_Formats:
+    CSV = "csv"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
 @dataclass
 class Virtual_World_Params:
     START_DATE = "start_date"
@@ -92,6 +99,8 @@ class Sim_Setting_Params:
     PROCESS = "processes_count"
     SIMS = "simulation_count"
     PRESEED = "preseed_random"
+    COLUMNAR_EMIS = "columnar_emission_state"
+    SHARED_INFRA = "shared_infrastructure"
 
 
 @dataclass
@@ -128,6 +137,7 @@ class Method_Params:
     UPFRONT = "upfront"
     N_CREWS = "crew_count"
     CONSIDER_DAYLIGHT = "consider_daylight"
+    LOCAL_DAYLIGHT = "local_daylight"
     RS = "surveys_per_year"
     TIME = "survey_time"
     MAX_WORKDAY = "max_workday"
@@ -162,6 +172,7 @@ class Method_Params:
 class Output_Params:
     PROGRAM_OUTPUTS = "Program Outputs"
     KEEP_ALL_PROGRAM_OUTPUTS = "Keep All Program Outputs"
+    PROGRAM_OUTPUT_FORMAT = "Program Output Format"
     PROGRAM_EMISSIONS = "Program Emissions"
     PROGRAM_TIMESERIES = "Program Timeseries"
     SUMMARY_OUTPUTS = "Summary Outputs"
@@ -0,0 +1,116 @@
+# ------------------------------------------------------------------------------
+# Program:     The LDAR Simulator (LDAR-Sim)
+# File:        queue_benchmark.py
+# Purpose:     Micro-benchmark of the queues used to dispatch crews and schedule surveys
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License as published
+# by the Free Software Foundation, version 3.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+# You should have received a copy of the MIT License
+# along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+# ------------------------------------------------------------------------------
+
+# HOW TO USE:
+# Run from the src folder: python dev_tools/queue_benchmark.py
+# Times a day of crew dispatch and survey scheduling with a large crew configuration,
+# using the thread-safe queue.PriorityQueue the simulation used to use, and the heapq
+# backed queues in utils.queue.
+
+import itertools
+import os
+import queue
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from scheduling.schedule_dataclasses import CrewDailyReport  # noqa: E402
+from utils.queue import HeapPriorityQueue, PriorityQueueWithFIFO  # noqa: E402
+
+N_CREWS = 500
+N_SITES = 20000
+DAILY_SURVEYS_PER_CREW = 8
+MIN_PER_DAY = 600
+REPEATS = 20
+
+
+class LockingPriorityQueueWithFIFO(queue.PriorityQueue):
+    """The previous PriorityQueueWithFIFO, built on the thread-safe queue.PriorityQueue"""
+
+    def __init__(self):
+        super().__init__()
+        self.counter = itertools.count()
+
+    def put(self, priority, item):
+        super().put((priority, next(self.counter), item))
+
+
+def dispatch_crews(queue_class, crews: list[CrewDailyReport], survey_times: list[float]):
+    """Follows the queue-based Method.deploy_crews: the crew with the most time left surveys
+    the next site"""
+    priority_queue = queue_class()
+    for crew in crews:
+        crew.day_time_remaining = MIN_PER_DAY
+        priority_queue.put((-crew.day_time_remaining, crew.crew_id, crew))
+    for survey_time in survey_times:
+        if not priority_queue.empty():
+            _, _, assigned_crew = priority_queue.get()
+            assigned_crew.day_time_remaining -= survey_time
+            if assigned_crew.day_time_remaining > 0:
+                priority_queue.put(
+                    (-assigned_crew.day_time_remaining, assigned_crew.crew_id, assigned_crew)
+                )
+
+
+def schedule_surveys(queue_class, site_ids: list[str]):
+    """Follows GenericSchedule: queue the due sites and pop a day of surveys for every crew"""
+    survey_queue = queue_class()
+    for site_id in site_ids:
+        survey_queue.put(3, site_id)
+    for _ in range(N_CREWS):
+        for _ in range(DAILY_SURVEYS_PER_CREW):
+            if not survey_queue.empty():
+                _, _, site_id = survey_queue.get()
+                survey_queue.put(2, site_id)
+
+
+def time_per_day(func, *args) -> float:
+    return min(timeit.repeat(lambda: func(*args), number=1, repeat=REPEATS)) * 1000
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    crews = [CrewDailyReport(crew_id=crew_id, day_time_remaining=0) for crew_id in range(N_CREWS)]
+    survey_times = [rng.uniform(30, 120) for _ in range(N_CREWS * DAILY_SURVEYS_PER_CREW)]
+    site_ids = [f"site_{site_n}" for site_n in range(N_SITES)]
+
+    print(f"{N_CREWS} crews, {N_SITES} sites, best of {REPEATS} days (ms per day)")
+    for label, func, args, locking_class, heap_class in [
+        (
+            "crew dispatch",
+            dispatch_crews,
+            (crews, survey_times),
+            queue.PriorityQueue,
+            HeapPriorityQueue,
+        ),
+        (
+            "survey schedule",
+            schedule_surveys,
+            (site_ids,),
+            LockingPriorityQueueWithFIFO,
+            PriorityQueueWithFIFO,
+        ),
+    ]:
+        before: float = time_per_day(func, locking_class, *args)
+        after: float = time_per_day(func, heap_class, *args)
+        print(
+            f"{label:16s} before {before:8.2f}  after {after:8.2f}  speedup {before / after:.1f}x"
+        )
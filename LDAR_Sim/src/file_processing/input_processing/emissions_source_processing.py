@@ -27,6 +27,7 @@ import json
 from pathlib import WindowsPath
 from dataclasses import dataclass
 from numpy import exp as exponential
+from numpy import asarray, ndarray, where, zeros
 
 from utils.unit_converter import gas_convert
 from constants.error_messages import Input_Processing_Messages as ipm
@@ -76,6 +77,10 @@ class EmissionsSource:
     def get_a_rate(self) -> float:
         return 0.0
 
+    def get_rates(self, n_rates: int) -> ndarray:
+        """Draw the rates of n_rates emissions at once"""
+        return zeros(n_rates)
+
 
 class EmissionsSourceDist(EmissionsSource):
     def __init__(
@@ -107,6 +112,23 @@ class EmissionsSourceDist(EmissionsSource):
         )
         return converted_rate
 
+    def get_rates(self, n_rates: int) -> ndarray:
+        """Draw the rates of n_rates emissions from the distribution at once. The draws follow
+        the same sequence of random numbers as n_rates calls to get_a_rate, to within
+        floating point rounding.
+        """
+        if n_rates == 0:
+            return zeros(0)
+        draws: ndarray = self._distribution.rvs(size=n_rates)
+        # Like get_a_rate, draws are not capped when there is no maximum rate (NaN)
+        unconverted_rates: ndarray = where(draws > self._max_emis_rate, self._max_emis_rate, draws)
+        # The conversion is elementwise arithmetic, so it is applied to all rates at once
+        return gas_convert(
+            input_quantity=unconverted_rates,
+            input_metric=self._unit_amount,
+            input_increment=self._unit_time,
+        )
+
     def generate_distribution(
         self, dist_type: str, dist_shape: str, dist_scale: str
     ) -> stats.rv_continuous:
@@ -149,6 +171,16 @@ class EmissionsSourceSample(EmissionsSource):
             sample = self._max_emis_rate
         return sample
 
+    def get_rates(self, n_rates: int) -> ndarray:
+        """Draw the rates of n_rates emissions from the samples at once. The samples are
+        drawn in the same order as n_rates calls to get_a_rate.
+        """
+        if n_rates == 0:
+            return zeros(0)
+        samples: ndarray = random_sample(asarray(self._samples), size=n_rates)
+        # Like get_a_rate, samples are not capped when there is no maximum rate (NaN)
+        return where(samples > self._max_emis_rate, self._max_emis_rate, samples)
+
 
 def read_in_emissions_sources_file(
     inputs_path: WindowsPath,
@@ -0,0 +1,230 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        emissions_summary_exporter.py
+Purpose: Contains the exporter used to build and write the program emissions summary
+in bulk, column by column.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from constants.output_file_constants import (
+    EMIS_DATA_COL_ACCESSORS as eca,
+    EMIS_DATA_FINAL_COL_ORDER,
+)
+from constants.param_default_const import Output_File_Formats as off
+from file_processing.output_processing.output_file_io import open_output_writer
+from virtual_world.emission_types.emission import Emission
+
+
+class EmissionsSummaryExporter:
+    """Builds the emissions summary of a program from the emission summary dictionaries
+    generated by the infrastructure.
+
+    The values of every emission are collected into per column lists in a single pass,
+    and each chunk of rows is converted into a DataFrame at once, using the dtypes of
+    Emission.EMIS_SUMMARY_DTYPES. Chunks can be written to file as they are built, so the
+    full emissions summary never has to be held in memory.
+    """
+
+    CSV = off.CSV
+    PARQUET = off.PARQUET
+    ARROW = off.ARROW
+    DEFAULT_CHUNK_SIZE = 100000
+
+    LOCATION_DTYPES = {
+        eca.SITE_ID: "object",
+        eca.EQG: "object",
+        eca.COMP: "object",
+    }
+    SPATIAL_COVERAGE_DTYPE = "boolean"
+    # Only converted when every value is of the expected type
+    EXACT_DTYPES = {
+        "int32": (int, np.integer),
+        "bool": (bool, np.bool_),
+    }
+
+    def __init__(self, method_names: list[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._spatial_cov_columns: list[str] = [
+            eca.SPATIAL_COV.format(method=method) for method in method_names
+        ]
+        self._columns: list[str] = EMIS_DATA_FINAL_COL_ORDER + self._spatial_cov_columns
+        self._dtypes: dict[str, str] = {**Emission.EMIS_SUMMARY_DTYPES, **self.LOCATION_DTYPES}
+        self._dtypes.update({col: self.SPATIAL_COVERAGE_DTYPE for col in self._spatial_cov_columns})
+        self._chunk_size: int = chunk_size
+
+    @property
+    def columns(self) -> list[str]:
+        return self._columns
+
+    def _to_column(self, values: list[Any], dtype: str):
+        if dtype == "float64":
+            return np.asarray(values, dtype=dtype)
+        elif dtype in self.EXACT_DTYPES and all(
+            isinstance(value, self.EXACT_DTYPES[dtype]) for value in values
+        ):
+            return np.asarray(values, dtype=dtype)
+        elif dtype == self.SPATIAL_COVERAGE_DTYPE:
+            return pd.array(
+                [None if value is None else bool(value) for value in values], dtype=dtype
+            )
+        # Dates and mixed values (ie. "N/A" for emissions that cannot be tagged) are
+        # kept as they are reported by the emissions
+        return pd.Series(values, dtype="object")
+
+    def _build_frame(self, column_values: dict[str, list[Any]]) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                col: self._to_column(values, self._dtypes.get(col, "object"))
+                for col, values in column_values.items()
+            },
+            columns=self._columns,
+        )
+
+    def iter_frames(self, emission_summaries: Iterable[dict[str, Any]]) -> Iterator[pd.DataFrame]:
+        """Build the emissions summary in chunks of at most chunk_size rows
+
+        Args:
+            emission_summaries (Iterable[dict[str, Any]]): The summary dictionary of every
+            emission, as generated by Infrastructure.gen_summary_emis_data
+
+        Yields:
+            pd.DataFrame: The emissions summary rows of the chunk. A single empty
+            DataFrame is yielded if there are no emissions.
+        """
+        column_values: dict[str, list[Any]] = {col: [] for col in self._columns}
+        appenders: list[tuple[str, Callable]] = [
+            (col, values.append) for col, values in column_values.items()
+        ]
+        n_rows: int = 0
+        yielded: bool = False
+        for summary in emission_summaries:
+            get = summary.get
+            for col, append in appenders:
+                append(get(col))
+            n_rows += 1
+            if n_rows == self._chunk_size:
+                yield self._build_frame(column_values)
+                yielded = True
+                for values in column_values.values():
+                    values.clear()
+                n_rows = 0
+        if n_rows or not yielded:
+            yield self._build_frame(column_values)
+
+    def to_dataframe(self, emission_summaries: Iterable[dict[str, Any]]) -> pd.DataFrame:
+        """Build the full emissions summary DataFrame"""
+        frames: list[pd.DataFrame] = list(self.iter_frames(emission_summaries))
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
+
+    def write(
+        self,
+        emission_summaries: Iterable[dict[str, Any]],
+        filepath: Path,
+        file_format: str = CSV,
+        retain: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Stream the emissions summary to file, one chunk at a time
+
+        Args:
+            emission_summaries (Iterable[dict[str, Any]]): The summary dictionary of every
+            emission, as generated by Infrastructure.gen_summary_emis_data
+            filepath (Path): The file to write to
+            file_format (str, optional): Either "csv", "parquet" or "arrow". Defaults to "csv".
+            retain (Callable[[pd.DataFrame], pd.DataFrame], optional): Applied to every chunk,
+            the results are concatenated and returned. Used to keep the subset of the
+            emissions summary needed by the rest of the program outputs.
+
+        Returns:
+            Optional[pd.DataFrame]: The retained rows, if retain was provided
+        """
+        writer = open_output_writer(filepath, file_format)
+        retained: list[pd.DataFrame] = []
+        try:
+            for frame in self.iter_frames(emission_summaries):
+                if file_format == self.CSV:
+                    # Floats are written at full precision, as they were when the emissions
+                    # summary was held in an object DataFrame
+                    writer.write(frame)
+                else:
+                    writer.write(self._to_typed_frame(frame))
+                if retain is not None:
+                    retained.append(retain(frame))
+        finally:
+            writer.close()
+        if retain is None:
+            return None
+        return self._concat_retained(retained)
+
+    def retain(
+        self,
+        emission_summaries: Iterable[dict[str, Any]],
+        retain: Callable[[pd.DataFrame], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """Build the emissions summary one chunk at a time without writing it, keeping only
+        the retained rows and columns of each chunk
+
+        Args:
+            emission_summaries (Iterable[dict[str, Any]]): The summary dictionary of every
+            emission, as generated by Infrastructure.gen_summary_emis_data
+            retain (Callable[[pd.DataFrame], pd.DataFrame]): Applied to every chunk
+
+        Returns:
+            pd.DataFrame: The retained rows
+        """
+        return self._concat_retained(
+            [retain(frame) for frame in self.iter_frames(emission_summaries)]
+        )
+
+    def _to_typed_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        # Every chunk is written with the same column types: booleans and integers are
+        # written as nullable columns, and dates, mixed values (ie. "N/A" for emissions that
+        # cannot be tagged) and other objects as strings
+        columns: dict[str, Any] = {}
+        for col in frame.columns:
+            dtype: str = self._dtypes.get(col, "object")
+            if dtype in ("float64", "boolean"):
+                columns[col] = frame[col]
+            elif dtype == "bool":
+                columns[col] = pd.array(
+                    [
+                        value if isinstance(value, (bool, np.bool_)) else None
+                        for value in frame[col]
+                    ],
+                    dtype="boolean",
+                )
+            elif dtype == "int32":
+                columns[col] = pd.array(frame[col].tolist(), dtype="Int32")
+            else:
+                columns[col] = pd.array(
+                    [
+                        None if value is None or value != value else str(value)
+                        for value in frame[col]
+                    ],
+                    dtype="string",
+                )
+        return pd.DataFrame(columns)
+
+    def _concat_retained(self, retained: list[pd.DataFrame]) -> pd.DataFrame:
+        if len(retained) == 1:
+            return retained[0]
+        return pd.concat(retained, ignore_index=True)
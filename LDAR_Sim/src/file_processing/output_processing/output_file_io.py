@@ -0,0 +1,234 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        output_file_io.py
+Purpose: Contains the writers of the program output files in each supported file format,
+and the reader used for every output file.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import pandas as pd
+
+from constants.error_messages import (
+    Output_Processing_Messages as opm,
+    Runtime_Warning_Messages as rwm,
+)
+from constants.output_file_constants import DICTIONARY_ENCODED_COLUMNS
+from constants.param_default_const import Output_File_Formats as off
+
+FILE_EXTENSIONS: dict[str, str] = {
+    off.CSV: ".csv",
+    off.PARQUET: ".parquet",
+    off.ARROW: ".arrow",
+}
+
+
+def import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        logger: logging.Logger = logging.getLogger(__name__)
+        logger.error(opm.PYARROW_UNAVAILABLE_ERROR)
+        sys.exit()
+    return pyarrow
+
+
+def check_output_format(file_format: str) -> str:
+    """Check the program output format is supported, and that it can be written
+
+    Args:
+        file_format (str): The program output format of the output parameters
+
+    Returns:
+        str: The program output format to use. Parquet and Arrow outputs are written as
+        csv when pyarrow is not installed.
+    """
+    if file_format not in FILE_EXTENSIONS:
+        logger: logging.Logger = logging.getLogger(__name__)
+        logger.error(opm.INVALID_OUTPUT_FORMAT_ERROR.format(file_format=file_format))
+        sys.exit()
+    if file_format != off.CSV:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print(rwm.PYARROW_UNAVAILABLE_WARNING.format(file_format=file_format))
+            return off.CSV
+    return file_format
+
+
+def get_output_file_name(name: str, file_format: str) -> str:
+    return name + FILE_EXTENSIONS[file_format]
+
+
+def to_arrow_table(data: pd.DataFrame):
+    """Convert the output data to an Arrow table, dictionary encoding the label columns
+
+    Object columns that Arrow cannot type, such as columns mixing booleans and "N/A",
+    are written as strings.
+    """
+    pa = import_pyarrow()
+    arrays: list = []
+    for col in data.columns:
+        column: pd.Series = data[col]
+        if column.dtype == object:
+            try:
+                array = pa.array(column, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                array = pa.array(
+                    [None if value is None or value != value else str(value) for value in column],
+                    type=pa.string(),
+                )
+        else:
+            array = pa.Array.from_pandas(column)
+        if col in DICTIONARY_ENCODED_COLUMNS and pa.types.is_string(array.type):
+            array = array.dictionary_encode()
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, names=[str(col) for col in data.columns])
+
+
+class CsvChunkWriter:
+    def __init__(self, filepath: Path, float_format: Optional[str] = None) -> None:
+        self._file = open(filepath, "w", newline="")
+        self._float_format: Optional[str] = float_format
+        self._header: bool = True
+
+    def write(self, frame: pd.DataFrame) -> None:
+        frame.to_csv(self._file, index=False, header=self._header, float_format=self._float_format)
+        self._header = False
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ArrowChunkWriter:
+    """Writes the chunks of an output file as Parquet, or as an Arrow IPC stream.
+
+    Every chunk must have the same column types. The stream format is used for Arrow outputs
+    as it allows the dictionaries of the label columns to change between chunks.
+    """
+
+    def __init__(self, filepath: Path, file_format: str) -> None:
+        self._pa = import_pyarrow()
+        self._filepath: Path = filepath
+        self._file_format: str = file_format
+        self._writer = None
+
+    def write(self, frame: pd.DataFrame) -> None:
+        table = to_arrow_table(frame)
+        if self._writer is None:
+            if self._file_format == off.PARQUET:
+                self._writer = self._pa.parquet.ParquetWriter(self._filepath, table.schema)
+            else:
+                self._writer = self._pa.ipc.new_stream(str(self._filepath), table.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def open_output_writer(filepath: Path, file_format: str, float_format: Optional[str] = None):
+    """Open a writer of an output file, written in one or more chunks of rows
+
+    Args:
+        filepath (Path): The file to write to
+        file_format (str): Either "csv", "parquet" or "arrow"
+        float_format (str, optional): The format of the floats of csv outputs. Defaults to
+        full precision.
+    """
+    if file_format == off.CSV:
+        return CsvChunkWriter(filepath, float_format)
+    elif file_format in (off.PARQUET, off.ARROW):
+        return ArrowChunkWriter(filepath, file_format)
+    logger: logging.Logger = logging.getLogger(__name__)
+    logger.error(opm.INVALID_OUTPUT_FORMAT_ERROR.format(file_format=file_format))
+    sys.exit()
+
+
+def write_output_file(
+    data: pd.DataFrame, filepath: Path, file_format: str, float_format: Optional[str] = None
+) -> None:
+    writer = open_output_writer(filepath, file_format, float_format)
+    try:
+        writer.write(data)
+    finally:
+        writer.close()
+
+
+def find_output_file(filepath: Union[str, Path]) -> Optional[Path]:
+    """Find an output file, in whichever format it was written
+
+    Args:
+        filepath (Union[str, Path]): The output file, without its extension
+
+    Returns:
+        Optional[Path]: The output file, or None if it does not exist in any format
+    """
+    filepath = Path(filepath)
+    for extension in FILE_EXTENSIONS.values():
+        candidate: Path = filepath.with_name(filepath.name + extension)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def read_output_file(filepath: Union[str, Path]) -> pd.DataFrame:
+    """Read an output file written in any of the supported formats
+
+    Dictionary encoded columns are read back as plain values, so the data holds the same
+    values as were written to csv. An empty csv file is read as an empty DataFrame.
+
+    Args:
+        filepath (Union[str, Path]): The output file. If it has no extension, the file is
+        looked for in every supported format.
+
+    Returns:
+        pd.DataFrame: The data of the output file
+    """
+    suffix: str = Path(filepath).suffix
+    if suffix not in FILE_EXTENSIONS.values():
+        found_filepath: Optional[Path] = find_output_file(filepath)
+        if found_filepath is None:
+            raise FileNotFoundError(f"No such output file: '{filepath}'")
+        filepath, suffix = found_filepath, found_filepath.suffix
+
+    if suffix == FILE_EXTENSIONS[off.CSV]:
+        try:
+            return pd.read_csv(filepath)
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame()
+
+    pa = import_pyarrow()
+    if suffix == FILE_EXTENSIONS[off.PARQUET]:
+        table = pa.parquet.read_table(filepath)
+    else:
+        with pa.ipc.open_stream(str(filepath)) as reader:
+            table = reader.read_all()
+    data: pd.DataFrame = table.to_pandas()
+    decoded_columns: dict[str, Any] = {
+        col: data[col].astype(object)
+        for col in data.columns
+        if isinstance(data[col].dtype, pd.CategoricalDtype)
+    }
+    if decoded_columns:
+        data = data.assign(**decoded_columns)
+    return data
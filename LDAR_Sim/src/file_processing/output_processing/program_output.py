@@ -20,13 +20,11 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 ------------------------------------------------------------------------------
 """
 
+import numpy as np
 import pandas as pd
 from datetime import date
 
 from file_processing.output_processing import program_output_helpers
-from scheduling.schedule_dataclasses import (
-    SiteSurveyReport,
-)
 from constants.output_file_constants import (
     EMIS_DATA_COL_ACCESSORS as eca,
     EMIS_ESTIMATION_OUTPUT_COLUMNS,
@@ -57,33 +55,25 @@ def gen_estimated_repairable_emissions_to_remove(
     # Populate a new column in the fugitive emissions rates and repair dates dataframe
     # with the closest future survey date. This wil be used to compute the estimated
     # fugitive emissions to remove to avoid double counting
-    # Create a dictionary to store the unique survey completion dates for each site
-    site_survey_dates = (
-        site_survey_reports_summary.groupby(eca.SITE_ID)
-        .apply(lambda df: list(zip(df[eca.SURVEY_COMPLETION_DATE], df[eca.START_DATE])))
-        .to_dict()
-    )
-    # Use the dictionary to map the closest future survey date for each row
     fugitive_emissions_rates_and_repair_dates[eca.NEXT_SURVEY_DATE] = (
-        fugitive_emissions_rates_and_repair_dates.apply(
-            lambda x: program_output_helpers.find_closest_future_date(
-                x[eca.DATE_REP_EXP], site_survey_dates[x[eca.SITE_ID]]
-            ),
-            axis=1,
+        program_output_helpers.find_closest_future_dates(
+            fugitive_emissions_rates_and_repair_dates[eca.SITE_ID],
+            fugitive_emissions_rates_and_repair_dates[eca.DATE_REP_EXP],
+            site_survey_reports_summary[eca.SITE_ID],
+            site_survey_reports_summary[eca.SURVEY_COMPLETION_DATE],
+            site_survey_reports_summary[eca.START_DATE],
         )
     )
 
     # Assign the Start and End date based on the repaired/expiry date and the next survey date
-    # to be able to re-use the calculate_volume_emitted function
+    # to be able to re-use the calculate_volumes_emitted function
     # to calculate the emissions to remove
     fugitive_emissions_rates_and_repair_dates = fugitive_emissions_rates_and_repair_dates.assign(
         **{eca.START_DATE: lambda x: x[eca.DATE_REP_EXP]},
         **{eca.END_DATE: lambda x: x[eca.NEXT_SURVEY_DATE]},
     )
     fugitive_emissions_rates_and_repair_dates[eca.EST_VOL_EMIT] = (
-        fugitive_emissions_rates_and_repair_dates.apply(
-            program_output_helpers.calculate_volume_emitted, axis=1
-        )
+        program_output_helpers.calculate_volumes_emitted(fugitive_emissions_rates_and_repair_dates)
     )
 
     return fugitive_emissions_rates_and_repair_dates[EST_FUG_OUTPUT_COLUMNS]
@@ -107,17 +97,18 @@ def gen_estimated_emissions_report(
         return
 
     # For all sites, add a survey report for the start and end date of the simulation
-    site_survey_data: list = []
-
-    for site_id in site_ids:
-        start_report = SiteSurveyReport(
-            site_id=site_id, survey_start_date=start_date, survey_completion_date=start_date
-        ).to_report_summary()
-        site_survey_data.append(start_report)
-        end_report = SiteSurveyReport(
-            site_id=site_id, survey_start_date=end_date, survey_completion_date=end_date
-        ).to_report_summary()
-        site_survey_data.append(end_report)
+    site_survey_data: dict = {}
+    if len(site_ids) > 0:
+        survey_dates: list[date] = [start_date, end_date] * len(site_ids)
+        site_survey_data = {
+            eca.SITE_ID: [site_id for site_id in site_ids for _ in range(2)],
+            eca.SURVEY_LEVEL: None,
+            eca.M_RATE: 0.0,
+            eca.FLAGGED: False,
+            eca.SURVEY_COMPLETION_DATE: survey_dates,
+            eca.SURVEY_START_DATE: survey_dates,
+            eca.METHOD: None,
+        }
 
     new_site_survey_data: pd.DataFrame = pd.DataFrame(site_survey_data)
     site_survey_reports_summary = pd.concat([site_survey_reports_summary, new_site_survey_data])
@@ -142,9 +133,9 @@ def gen_estimated_emissions_report(
         fugitive_emissions_rates_and_repair_dates=fugutive_emissions_rates_and_repair_dates,
     )
     # Calculate the estimated volume emitted based on the start/end date and measured rate columns
-    sorted_by_site_summary[eca.EST_VOL_EMIT] = sorted_by_site_summary.apply(
-        program_output_helpers.calculate_volume_emitted, axis=1
-    ).reset_index(drop=True)
+    sorted_by_site_summary[eca.EST_VOL_EMIT] = program_output_helpers.calculate_volumes_emitted(
+        sorted_by_site_summary
+    )
 
     # Select only the predefined columns
     selected_sorted_by_site_summary = sorted_by_site_summary[EMIS_ESTIMATION_OUTPUT_COLUMNS]
@@ -174,7 +165,7 @@ def gen_estimated_comp_emissions_report(
 
     if comp_reports.empty:
         return
-    
+
     # Get Unique measured site IDs
     unique_site_ids = comp_reports[eca.SITE_ID].unique()
 
@@ -187,76 +178,39 @@ def gen_estimated_comp_emissions_report(
         [eca.SITE_ID, eca.SURVEY_COMPLETION_DATE]
     ].drop_duplicates()
 
-    # Convert to a list of tuples
-    unique_combinations_list = list(unique_combinations.itertuples(index=False, name=None))
-
-    unique_site_survey_dates = list(unique_site_survey_dates.itertuples(index=False, name=None))
-
-    # Create a set of tuples for all existing combinations in the DataFrame
-    existing_combinations = set(
-        zip(
-            comp_reports[eca.SITE_ID],
-            comp_reports[eca.EQG],
-            comp_reports[eca.COMP],
-            comp_reports[eca.SURVEY_COMPLETION_DATE],
-        )
-    )
-    new_rows = []
-    # Append unmeasured sites with zero emissions
-    for site_id in unmeasured_site_ids:
-        new_rows.append(
-            {
-                eca.SITE_ID: site_id,
-                eca.EQG: None,
-                eca.COMP: None,
-                eca.SURVEY_COMPLETION_DATE: start_date,
-                eca.M_RATE: 0,
-            }
-        )
-
-    # For each site/equipment/component combination, add in the missing reports
+    # For each site/equipment/component combination, find the missing reports
     # for when there were no detections for a given component at a given date
-    for site_id, eqg, comp in unique_combinations_list:
-        # Get the unique dates for the current site_id from unique_site_survey_dates
-        site_dates = set(u_date for site, u_date in unique_site_survey_dates if site == site_id)
-
-        # Check if a date from site_dates exists for the current combination
-        for s_date in site_dates:
-            if (site_id, eqg, comp, s_date) not in existing_combinations:
-                # If the date does not exist, add a new row with the current combination and date
-                new_rows.append(
-                    {
-                        eca.SITE_ID: site_id,
-                        eca.EQG: eqg,
-                        eca.COMP: comp,
-                        eca.SURVEY_COMPLETION_DATE: s_date,
-                        eca.M_RATE: 0,
-                    }
-                )
-    comp_reports = pd.concat([comp_reports, pd.DataFrame(new_rows)], ignore_index=True)
-    # Adding start and end date for each unique component
-    new_data: list = []
-    for site_id, eqg, comp in unique_combinations_list:
-
-        new_row_1: dict = {
-            eca.SITE_ID: site_id,
-            eca.EQG: eqg,
-            eca.COMP: comp,
-            eca.SURVEY_START_DATE: start_date,
-            eca.SURVEY_COMPLETION_DATE: start_date,
-            eca.M_RATE: 0,
+    report_keys: list[str] = [eca.SITE_ID, eca.EQG, eca.COMP, eca.SURVEY_COMPLETION_DATE]
+    missing_reports = unique_combinations.merge(unique_site_survey_dates, on=eca.SITE_ID).merge(
+        comp_reports[report_keys].drop_duplicates(), how="left", indicator=True
+    )
+    missing_reports = missing_reports[missing_reports["_merge"] == "left_only"]
+
+    # Append unmeasured sites with zero emissions, then the missing reports
+    unmeasured_site_ids: list = list(unmeasured_site_ids)
+    n_new_rows: int = len(unmeasured_site_ids) + len(missing_reports)
+    new_rows: dict = {}
+    if n_new_rows > 0:
+        new_rows = {
+            eca.SITE_ID: unmeasured_site_ids + missing_reports[eca.SITE_ID].tolist(),
+            eca.EQG: [None] * len(unmeasured_site_ids) + missing_reports[eca.EQG].tolist(),
+            eca.COMP: [None] * len(unmeasured_site_ids) + missing_reports[eca.COMP].tolist(),
+            eca.SURVEY_COMPLETION_DATE: [start_date] * len(unmeasured_site_ids)
+            + missing_reports[eca.SURVEY_COMPLETION_DATE].tolist(),
+            eca.M_RATE: [0] * n_new_rows,
         }
+    comp_reports = pd.concat([comp_reports, pd.DataFrame(new_rows)], ignore_index=True)
 
-        new_row_2: dict = {
-            eca.SITE_ID: site_id,
-            eca.EQG: eqg,
-            eca.COMP: comp,
-            eca.SURVEY_START_DATE: end_date,
-            eca.SURVEY_COMPLETION_DATE: end_date,
-            eca.M_RATE: 0,
-        }
-        new_data.append(new_row_1)
-        new_data.append(new_row_2)
+    # Adding start and end date for each unique component
+    survey_dates: list[date] = [start_date, end_date] * len(unique_combinations)
+    new_data: dict = {
+        eca.SITE_ID: np.repeat(unique_combinations[eca.SITE_ID].to_numpy(), 2).tolist(),
+        eca.EQG: np.repeat(unique_combinations[eca.EQG].to_numpy(), 2).tolist(),
+        eca.COMP: np.repeat(unique_combinations[eca.COMP].to_numpy(), 2).tolist(),
+        eca.SURVEY_START_DATE: survey_dates,
+        eca.SURVEY_COMPLETION_DATE: survey_dates,
+        eca.M_RATE: 0,
+    }
 
     new_data_df: pd.DataFrame = pd.DataFrame(new_data)
     comp_reports = pd.concat([comp_reports, new_data_df], ignore_index=True)
@@ -281,9 +235,9 @@ def gen_estimated_comp_emissions_report(
         fugitive_emissions_rates_and_repair_dates=fugitive_emissions_rates_and_repair_dates,
     )
 
-    sorted_by_site_summary[eca.EST_VOL_EMIT] = sorted_by_site_summary.apply(
-        program_output_helpers.calculate_volume_emitted, axis=1
-    ).reset_index(drop=True)
+    sorted_by_site_summary[eca.EST_VOL_EMIT] = program_output_helpers.calculate_volumes_emitted(
+        sorted_by_site_summary
+    )
 
     return (sorted_by_site_summary, fugitive_emissions_to_remove)
 
@@ -298,23 +252,13 @@ def determine_start_and_end_dates(sorted_by_site_summary_df, group_by_summary, d
     sorted_by_site_summary_df = program_output_helpers.calculate_next_condition(
         sorted_by_site_summary_df, group_by_summary
     )
-    # Set the estimated start/end date based on the emission rate condition
-    sorted_by_site_summary_df[eca.START_DATE] = (
-        sorted_by_site_summary_df.groupby(eca.SITE_ID)
-        .apply(
-            lambda x: pd.DataFrame(
-                program_output_helpers.calculate_start_date(x, duration_factor), index=x.index
-            )
-        )
-        .reset_index(drop=True)
+    # Set the estimated start/end date based on the emission rate condition, with the
+    # durations between the surveys of each site
+    site_starts = program_output_helpers.find_group_starts(sorted_by_site_summary_df[eca.SITE_ID])
+    sorted_by_site_summary_df[eca.START_DATE] = program_output_helpers.calculate_start_dates(
+        sorted_by_site_summary_df, site_starts, duration_factor
     )
-    sorted_by_site_summary_df[eca.END_DATE] = (
-        sorted_by_site_summary_df.groupby(eca.SITE_ID)
-        .apply(
-            lambda x: pd.DataFrame(
-                program_output_helpers.calculate_end_date(x, duration_factor), index=x.index
-            )
-        )
-        .reset_index(drop=True)
+    sorted_by_site_summary_df[eca.END_DATE] = program_output_helpers.calculate_end_dates(
+        sorted_by_site_summary_df, site_starts, duration_factor
     )
     return sorted_by_site_summary_df
@@ -49,6 +49,63 @@ def find_closest_future_date(
         return potential_futureDates[closest_index][1]
 
 
+def find_closest_future_dates(
+    reference_site_ids: pd.Series,
+    reference_dates: pd.Series,
+    survey_site_ids: pd.Series,
+    survey_completion_dates: pd.Series,
+    survey_start_dates: pd.Series,
+) -> pd.Series:
+    """Vectorized find_closest_future_date, for every reference date at once.
+
+    For each reference date, the survey of the same site with the earliest completion date
+    after the reference date is found, taking the first of the surveys in the given order
+    if several complete on that date. Returns the start date of that survey, or the
+    reference date if the survey starts before it, and NaT if there is no future survey.
+    """
+    n_surveys: int = len(survey_site_ids)
+    reference_times: np.ndarray = pd.to_datetime(reference_dates).to_numpy("datetime64[ns]")
+    completion_times: np.ndarray = pd.to_datetime(survey_completion_dates).to_numpy(
+        "datetime64[ns]"
+    )
+    start_times: np.ndarray = pd.to_datetime(survey_start_dates).to_numpy("datetime64[ns]")
+    site_codes, _ = pd.factorize(
+        np.concatenate([survey_site_ids.to_numpy(), reference_site_ids.to_numpy()])
+    )
+    # Surveys that were never completed can not be a future survey
+    completed: np.ndarray = np.flatnonzero(~np.isnat(completion_times))
+
+    # Sort the surveys and references together by site and date, with the references placed
+    # after the surveys completed on the same date, so the survey after a reference in the
+    # sorted order is its closest future survey
+    codes: np.ndarray = np.concatenate([site_codes[completed], site_codes[n_surveys:]])
+    times: np.ndarray = np.concatenate(
+        [completion_times[completed].view(np.int64), reference_times.view(np.int64)]
+    )
+    is_survey: np.ndarray = np.zeros(len(codes), dtype=np.bool_)
+    is_survey[: len(completed)] = True
+    ords: np.ndarray = np.concatenate([completed, np.arange(len(reference_times))])
+    order: np.ndarray = np.lexsort((ords, ~is_survey, times, codes))
+
+    # Index, in the sorted order, of the next survey at or after each position
+    sorted_is_survey: np.ndarray = is_survey[order]
+    next_survey: np.ndarray = np.where(sorted_is_survey, np.arange(len(order)), len(order))
+    next_survey = np.minimum.accumulate(next_survey[::-1])[::-1]
+
+    reference_positions: np.ndarray = np.flatnonzero(~sorted_is_survey)
+    next_positions: np.ndarray = next_survey[reference_positions]
+    found: np.ndarray = next_positions < len(order)
+    found[found] = codes[order[next_positions[found]]] == codes[order[reference_positions[found]]]
+
+    reference_ords: np.ndarray = ords[order[reference_positions]]
+    future_dates: np.ndarray = np.full(len(reference_times), np.datetime64("NaT"), "datetime64[ns]")
+    future_dates[reference_ords[found]] = start_times[ords[order[next_positions[found]]]]
+    # if the new start date based on the ratio is before repair date, use the repair date
+    before_reference: np.ndarray = future_dates < reference_times
+    future_dates[before_reference] = reference_times[before_reference]
+    return pd.Series(future_dates, index=reference_dates.index)
+
+
 def find_df_row_value_w_match(
     value_to_match: Any, value_col: str, return_col: str, df: pd.DataFrame
 ):
@@ -129,6 +186,50 @@ def calculate_end_date(df: pd.DataFrame, factor: float):
     return end_dates
 
 
+def find_group_starts(keys: pd.Series) -> np.ndarray:
+    """Flag the first row of every run of equal keys, for keys sorted into groups"""
+    values: np.ndarray = keys.to_numpy()
+    group_starts: np.ndarray = np.ones(len(values), dtype=np.bool_)
+    group_starts[1:] = values[1:] != values[:-1]
+    return group_starts
+
+
+def calculate_start_dates(df: pd.DataFrame, group_starts: np.ndarray, factor: float):
+    """Vectorized calculate_start_date, for every group of rows at once.
+
+    The previous date of the first row of each group is its own survey completion date.
+    """
+    completion_dates: pd.Series = pd.to_datetime(df[eca.SURVEY_COMPLETION_DATE])
+    prev_dates: pd.Series = completion_dates.shift(1)
+    prev_dates[group_starts] = pd.NaT
+    prev_dates = prev_dates.fillna(completion_dates)
+
+    duration_scaling_factor: np.ndarray = calculate_factor(df[eca.PREV_CONDITION], factor)
+    durations: pd.Series = (completion_dates - prev_dates).dt.days
+    return completion_dates - pd.to_timedelta(
+        np.ceil(durations * duration_scaling_factor), unit="D"
+    )
+
+
+def calculate_end_dates(df: pd.DataFrame, group_starts: np.ndarray, factor: float):
+    """Vectorized calculate_end_date, for every group of rows at once.
+
+    The next date of the last row of each group is its own survey completion date.
+    """
+    group_ends: np.ndarray = np.ones(len(group_starts), dtype=np.bool_)
+    group_ends[:-1] = group_starts[1:]
+    completion_dates: pd.Series = pd.to_datetime(df[eca.SURVEY_COMPLETION_DATE])
+    next_dates: pd.Series = completion_dates.shift(-1)
+    next_dates[group_ends] = pd.NaT
+    next_dates = next_dates.fillna(completion_dates)
+
+    duration_scaling_factor: np.ndarray = calculate_factor(df[eca.NEXT_CONDITION], factor)
+    durations: pd.Series = (next_dates - completion_dates).dt.days
+    return completion_dates + pd.to_timedelta(
+        np.floor(durations * duration_scaling_factor), unit="D"
+    )
+
+
 def calculate_volume_emitted(row):
     start_date = row[eca.START_DATE]
     end_date = row[eca.END_DATE]
@@ -140,6 +241,12 @@ def calculate_volume_emitted(row):
     return volume
 
 
+def calculate_volumes_emitted(df: pd.DataFrame) -> pd.Series:
+    """Vectorized calculate_volume_emitted, for every row at once"""
+    days: pd.Series = (df[eca.END_DATE] - df[eca.START_DATE]).dt.days
+    return df[eca.M_RATE] * days * conv_const.GRAMS_PER_SECOND_TO_KG_PER_DAY
+
+
 def expand_column(df: pd.DataFrame, column: str) -> pd.DataFrame:
     """Expand a column of a DataFrame that contains lists of dictionaries
     Args:
@@ -20,24 +20,26 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 
 from datetime import date
 import os
-import numpy as np
+from typing import Any, Iterable
 import pandas as pd
 from pathlib import Path, WindowsPath
-from typing import Any
 
-from file_processing.output_processing import program_specific_visualizations
-
-from file_processing.output_processing.output_utils import (
-    EmisInfo,
-    TsEmisData,
-    TsMethodData,
+from file_processing.output_processing import (
+    output_file_io,
+    program_specific_visualizations,
+    summary_outputs,
 )
+
+from file_processing.output_processing.emissions_summary_exporter import EmissionsSummaryExporter
+from file_processing.output_processing.summary_output_mapper import SummaryOutputMapper
+from file_processing.output_processing.timeseries_recorder import TimeseriesRecorder
 from constants.file_name_constants import Output_Files
 from constants.output_file_constants import (
     TIMESERIES_COL_ACCESSORS as tca,
     TIMESERIES_COLUMNS,
     EMIS_DATA_COL_ACCESSORS as eca,
     EMIS_INFO_COLUMNS_TO_KEEP_FOR_DURATION_ESTIMATION,
+    EMIS_INFO_COLUMNS_TO_KEEP_FOR_SUMMARY,
 )
 from programs.program import Program
 from constants import error_messages
@@ -57,48 +59,117 @@ class ProgramOutputManager:
     }
 
     def __init__(
-        self, path: WindowsPath, name_str: str, method_names: list[str], output_config
+        self,
+        path: WindowsPath,
+        name_str: str,
+        method_names: list[str],
+        output_config,
+        sim_number: int = 0,
+        write_outputs: bool = True,
     ) -> None:
         self._output_dir: Path = path
         if len(str(path)) > wpc.pre_filename_size_limit and os.name == "nt":
             print(error_messages.Runtime_Warning_Messages.PATH_TOO_LONG_WARNING)
 
         self.name_str: str = name_str
+        self._sim_number: int = sim_number
+        # The program outputs are always summarized, but only written to file when kept
+        self._write_outputs: bool = write_outputs
         self._method_names: list[str] = method_names
+        self._emissions_summary_exporter = EmissionsSummaryExporter(method_names)
+        self._output_format: str = output_config[op.PROGRAM_OUTPUTS][op.PROGRAM_OUTPUT_FORMAT]
 
         self.program_visualizations_to_make: list[str] = self.parse_visualization_functions(
             output_config[op.PROGRAM_VISUALIZATIONS]
         )
+        self._summary_stats_config: dict = output_config[op.SUMMARY_OUTPUTS][op.SUMMARY_STATS]
+        self._summary_files_to_make: list[str] = [
+            summary_file
+            for summary_file, wanted in output_config[op.SUMMARY_OUTPUTS][op.SUMMARY_FILES].items()
+            if wanted
+        ]
 
     def parse_visualization_functions(self, output_config: dict) -> list[str]:
         return [output for output, wanted in output_config.items() if wanted]
 
     def summarize_program_outputs(
         self,
-        overall_emission_data: pd.DataFrame,
+        emission_summaries: Iterable[dict[str, Any]],
         timeseries: pd.DataFrame,
         start_date: date,
         end_date: date,
         program: Program,
         measured_tf_df: pd.DataFrame,
-    ) -> None:
-        self.gen_sim_directory()
-        summary_filename = self.generate_file_names(Output_Files.EMISSIONS_SUMMARY_FILE)
-        self.save_results(overall_emission_data, summary_filename)
-        for program_visualization in self.program_visualizations_to_make:
-            visualization_function = self.PROGRAM_VISUALIZATION_FUNCTIONS_MAP.get(
-                program_visualization
+    ) -> dict[str, dict[str, Any]]:
+        """Generate the outputs of the program simulation, writing them to file if they are
+        kept, and summarize them.
+
+        Returns:
+            dict[str, dict[str, Any]]: The summary row of the program simulation, by the name
+            of the summary file it belongs to
+        """
+        make_ts_summary: bool = (
+            Output_Files.SummaryFileNames.TS_SUMMARY in self._summary_files_to_make
+        )
+        make_emis_summary: bool = (
+            Output_Files.SummaryFileNames.EMIS_SUMMARY in self._summary_files_to_make
+        )
+        # 1. Build the emissions summary, keeping only the emissions data needed
+        # for duration estimation and the emissions summary statistics
+        if make_emis_summary:
+            emis_info_columns: list[str] = list(
+                dict.fromkeys(
+                    EMIS_INFO_COLUMNS_TO_KEEP_FOR_DURATION_ESTIMATION
+                    + EMIS_INFO_COLUMNS_TO_KEEP_FOR_SUMMARY
+                )
             )
-            if visualization_function:
-                visualization_function(timeseries, self._output_dir, self.name_str)
-        timeseries_filename = self.generate_file_names(Output_Files.TIMESERIES_FILE)
-        self.save_results(timeseries, timeseries_filename)
-
-        # 1. Trim Emissions data to only include necessary columns
-        emis_info_for_duration_estimation = overall_emission_data.loc[
-            overall_emission_data[eca.REPAIRABLE],
-            EMIS_INFO_COLUMNS_TO_KEEP_FOR_DURATION_ESTIMATION,
-        ]
+
+            def retain(emis_data: pd.DataFrame) -> pd.DataFrame:
+                return emis_data[emis_info_columns]
+
+        else:
+
+            def retain(emis_data: pd.DataFrame) -> pd.DataFrame:
+                return emis_data.loc[
+                    emis_data[eca.REPAIRABLE], EMIS_INFO_COLUMNS_TO_KEEP_FOR_DURATION_ESTIMATION
+                ]
+
+        if self._write_outputs:
+            self.gen_sim_directory()
+            summary_filename = self.generate_file_names(Output_Files.EMISSIONS_SUMMARY_FILE)
+            emis_info: pd.DataFrame = self._emissions_summary_exporter.write(
+                emission_summaries,
+                self._output_dir / summary_filename,
+                file_format=self._output_format,
+                retain=retain,
+            )
+            for program_visualization in self.program_visualizations_to_make:
+                visualization_function = self.PROGRAM_VISUALIZATION_FUNCTIONS_MAP.get(
+                    program_visualization
+                )
+                if visualization_function:
+                    visualization_function(timeseries, self._output_dir, self.name_str)
+            timeseries_filename = self.generate_file_names(Output_Files.TIMESERIES_FILE)
+            self.save_results(timeseries, timeseries_filename)
+        else:
+            emis_info: pd.DataFrame = self._emissions_summary_exporter.retain(
+                emission_summaries, retain
+            )
+
+        if make_emis_summary:
+            emis_info_for_duration_estimation: pd.DataFrame = emis_info.loc[
+                emis_info[eca.REPAIRABLE], EMIS_INFO_COLUMNS_TO_KEEP_FOR_DURATION_ESTIMATION
+            ]
+        else:
+            emis_info_for_duration_estimation: pd.DataFrame = emis_info
+
+        program_outputs: dict[str, pd.DataFrame] = {}
+        if make_ts_summary and timeseries is not None:
+            # Summarized at the precision the timeseries is written to file at
+            program_outputs[Output_Files.SummaryFileNames.TS_SUMMARY] = timeseries.round(5)
+        if make_emis_summary:
+            program_outputs[Output_Files.SummaryFileNames.EMIS_SUMMARY] = emis_info
+
         function_to_call = self.PROGRAM_FUNCTIONS_MAPPING.get(program.duration_method)
         if function_to_call:
             result = function_to_call(
@@ -113,8 +184,6 @@ class ProgramOutputManager:
                 emis_estimation: pd.DataFrame
                 fug_to_remove: pd.DataFrame
                 emis_estimation, fug_to_remove = result
-                emis_file_name = self.generate_file_names(Output_Files.EST_EMISSIONS_FILE)
-                fug_file_name = self.generate_file_names(Output_Files.EST_REP_EMISSIONS_FILE)
 
                 measured_tf_df = measured_tf_df.rename(columns={DTSC.SITE_ID: eca.SITE_ID})
                 measured_tf_df = measured_tf_df.rename(columns={DTSC.SITE_TYPE: eca.SITE_TYPE})
@@ -123,11 +192,39 @@ class ProgramOutputManager:
                     emis_estimation, measured_tf_df, on=eca.SITE_ID, how="left"
                 )
 
-                emis_estimation_merged.to_csv(self._output_dir / emis_file_name, index=False)
-                fug_to_remove.to_csv(self._output_dir / fug_file_name, index=False)
+                if self._write_outputs:
+                    emis_file_name = self.generate_file_names(Output_Files.EST_EMISSIONS_FILE)
+                    fug_file_name = self.generate_file_names(Output_Files.EST_REP_EMISSIONS_FILE)
+                    output_file_io.write_output_file(
+                        emis_estimation_merged,
+                        self._output_dir / emis_file_name,
+                        self._output_format,
+                    )
+                    output_file_io.write_output_file(
+                        fug_to_remove, self._output_dir / fug_file_name, self._output_format
+                    )
+                if make_emis_summary:
+                    program_outputs[Output_Files.SummaryFileNames.EMIS_EST_SUMMARY] = (
+                        emis_estimation_merged
+                    )
+                    program_outputs[Output_Files.SummaryFileNames.EMIS_FUG_EST_SUMMARY] = (
+                        fug_to_remove
+                    )
         else:
             raise KeyError(f"No function found for program: {program}")
 
+        # 2. Summarize the program outputs, once they are no longer needed otherwise
+        return summary_outputs.summarize_program_simulation(
+            program.name,
+            self._sim_number,
+            str(self._output_dir),
+            SummaryOutputMapper(
+                self._summary_stats_config,
+                [year for year in range(start_date.year, end_date.year + 1)],
+            ),
+            program_outputs,
+        )
+
     def gen_sim_directory(self) -> None:
         if not os.path.exists(self._output_dir):
             os.mkdir(self._output_dir)
@@ -136,76 +233,10 @@ class ProgramOutputManager:
         if data is None:
             return
         filepath: Path = self._output_dir / filename
-        with open(filepath, "w", newline="") as f:
-            data.to_csv(f, index=False, float_format="%.5f")
-
-    def _init_ts_row(self, current_date: date):
-        new_ts_row: dict[str, Any] = {
-            tca.DATE: current_date,
-            tca.EMIS: 0,
-            tca.COST: 0,
-            tca.ACT_LEAKS: 0,
-            tca.NEW_LEAKS: 0,
-            tca.REP_LEAKS: 0,
-            tca.NAT_REP_LEAKS: 0,
-            tca.TAGGED_LEAKS: 0,
-            tca.REP_COST: 0,
-            tca.NAT_REP_COST: 0,
-        }
-        return new_ts_row
-
-    def _update_ts_row_w_emis_info(
-        self, new_row: dict[str, Any], ts_emis_info: TsEmisData, ts_emis_rep_info: EmisInfo
-    ):
-        new_row[tca.EMIS] = ts_emis_info.daily_emis
-        new_row[tca.EMIS_MIT] = ts_emis_info.daily_emis_mit
-        new_row[tca.EMIS_NON_MIT] = ts_emis_info.daily_emis_non_mit
-        new_row[tca.ACT_LEAKS] = ts_emis_info.active_leaks
-        new_row[tca.REP_COST] = ts_emis_rep_info.repair_cost
-        new_row[tca.REP_LEAKS] = ts_emis_rep_info.leaks_repaired
-        new_row[tca.NAT_REP_COST] = ts_emis_rep_info.nat_repair_cost
-        new_row[tca.NAT_REP_LEAKS] = ts_emis_rep_info.leaks_nat_repaired
-
-    def _update_ts_row_w_methods_info(
-        self,
-        new_row: dict[str, Any],
-        ts_methods_info: list[TsMethodData],
-        include_upfront_cost: bool = False,
-    ) -> None:
-        total_daily_cost: float = 0.0
-        total_leaks_tagged: int = 0
-        for method_info in ts_methods_info:
-            if include_upfront_cost:
-                total_daily_cost += method_info.upfront_cost
-                new_row[tca.METH_DAILY_DEPLOY_COST.format(method=method_info.method_name)] = (
-                    method_info.daily_deployment_cost + method_info.upfront_cost
-                )
-            else:
-                new_row[tca.METH_DAILY_DEPLOY_COST.format(method=method_info.method_name)] = (
-                    method_info.daily_deployment_cost
-                )
-            total_daily_cost += method_info.daily_deployment_cost
-            total_leaks_tagged += np.nan_to_num(method_info.daily_tags)
-            new_row[tca.METH_DAILY_TAGS.format(method=method_info.method_name)] = (
-                method_info.daily_tags
-            )
-            new_row[tca.METH_DAILY_FLAGS.format(method=method_info.method_name)] = (
-                method_info.daily_flags
-            )
-            new_row[tca.METH_DAILY_SITES_VIS.format(method=method_info.method_name)] = (
-                method_info.sites_visited
-            )
-            new_row[tca.METH_DAILY_TRAVEL_TIME.format(method=method_info.method_name)] = (
-                method_info.travel_time
-            )
-            new_row[tca.METH_DAILY_SURVEY_TIME.format(method=method_info.method_name)] = (
-                method_info.survey_time
-            )
-        new_row[tca.COST] = total_daily_cost + new_row[tca.REP_COST]
-        new_row[tca.TAGGED_LEAKS] = total_leaks_tagged
+        output_file_io.write_output_file(data, filepath, self._output_format, float_format="%.5f")
 
     def _init_ts_columns(self) -> list[str]:
-        ts_columns = TIMESERIES_COLUMNS
+        ts_columns = list(TIMESERIES_COLUMNS)
         for method in self._method_names:
             ts_columns.append(tca.METH_DAILY_DEPLOY_COST.format(method=method))
             ts_columns.append(tca.METH_DAILY_FLAGS.format(method=method))
@@ -215,5 +246,10 @@ class ProgramOutputManager:
             ts_columns.append(tca.METH_DAILY_SURVEY_TIME.format(method=method))
         return ts_columns
 
+    def init_timeseries_recorder(self, start_date: date, n_days: int) -> TimeseriesRecorder:
+        return TimeseriesRecorder(self._init_ts_columns(), self._method_names, start_date, n_days)
+
     def generate_file_names(self, concat_string: str) -> str:
-        return "_".join([self.name_str, concat_string])
+        return output_file_io.get_output_file_name(
+            "_".join([self.name_str, concat_string]), self._output_format
+        )
@@ -24,6 +24,7 @@ import pandas as pd
 import os
 import re
 from constants import file_processing_const, output_file_constants as ofc
+from file_processing.output_processing import output_file_io
 
 
 def get_mean_val(df: pd.DataFrame, column: str) -> float:
@@ -44,6 +45,10 @@ def get_nth_percentile(df: pd.DataFrame, column: str, percentile: float) -> floa
     return np.percentile(df[column], percentile, method="median_unbiased")
 
 
+def get_nth_percentiles(values: pd.Series, percentiles: list[float]) -> np.ndarray:
+    return np.percentile(values, percentiles, method="median_unbiased")
+
+
 def get_yearly_value_for_multi_day_stat(
     df: pd.DataFrame, column: str, year: int, start_date_col: str, end_date_col: str
 ) -> float:
@@ -65,74 +70,131 @@ def get_yearly_value_for_multi_day_stat(
         float: The calculated yearly value.
 
     """
-    # Initialize the yearly sum
-    yearly_sum = 0
+    return get_yearly_values_for_multi_day_stat(df, column, [year], start_date_col, end_date_col)[0]
+
+
+def get_yearly_values_for_multi_day_stat(
+    df: pd.DataFrame, column: str, years: list[int], start_date_col: str, end_date_col: str
+) -> list[float]:
+    """
+    Calculates the part of a value that can be attributed to each of the given years, the same
+    way as get_yearly_value_for_multi_day_stat, for all the years at once.
 
+    Parameters:
+        df (pd.DataFrame): The input DataFrame containing the data.
+        column (str): The name of the column containing the value to be calculated.
+        years (list[int]): The years for which the calculation is performed.
+        start_date_col (str): The name of the column containing the start dates.
+        end_date_col (str): The name of the column containing the end dates.
+
+    Returns:
+        list[float]: The calculated yearly value of each year, in the order of the years.
+    """
     # If the DataFrame is empty, return 0, there is no data to process
     if df.empty:
-        return yearly_sum
+        return [0] * len(years)
 
     # Convert the start and end dates to datetime objects
-    df[start_date_col] = df[start_date_col].astype("datetime64[ns]")
-    df[end_date_col] = df[end_date_col].astype("datetime64[ns]")
+    end_dates: pd.Series = df[end_date_col].astype("datetime64[ns]")
+    # Values without an end date are considered to last until the end of the last year
+    # that any value ends in
+    missing_end_dates: pd.Series = pd.Series(
+        end_dates.max(), index=end_dates.index, dtype="datetime64[ns]"
+    )
+    yearly_values: np.ndarray = apportion_values_to_years(
+        df[column].to_numpy(dtype=float),
+        df[start_date_col].astype("datetime64[ns]").to_numpy(),
+        end_dates.to_numpy(),
+        missing_end_dates.to_numpy(),
+        years,
+    )
+    return yearly_values.sum(axis=0).tolist()
 
-    # Filter the DataFrame to only include rows that are relevant for the current year
-    filtered_df = df.loc[
-        (df[start_date_col].dt.year <= year)
-        & ((df[end_date_col].dt.year >= year) | (df[end_date_col].isna()))
-    ]
 
-    # Iterate over the filtered DataFrame and calculate the yearly sum
-    for index, row in filtered_df.iterrows():
-        # Extract the start and end dates from the row
-        start_date: pd.Timestamp = row[start_date_col]
-        start_year: int = start_date.year
-        end_date: pd.Timestamp = row[end_date_col]
-        # If the end date is not provided, assume it is the end of the year
-        if end_date is pd.NaT:
-            end_date = df[end_date_col].max()
-            end_year: int = end_date.year
-            if end_date is pd.NaT:
-                end_year: int = year
-
-            end_date = pd.Timestamp("-".join([str(end_year), "12", "31"]))
-        else:
-            end_year: int = end_date.year
-        # Extract the value from the row
-        value: np.number = row[column]
-
-        # Initialize timestamps for the start and end of the current year
-        start_of_current_year: pd.Timestamp = pd.Timestamp("-".join([str(year), "01", "01"]))
-        end_of_current_year: pd.Timestamp = pd.Timestamp("-".join([str(year), "12", "31"]))
-
-        # Calculate the total time the value is active and the time it is active in the current year
-        if start_year == year and end_year == year:
-            total_time: int = 1
-            time_in_year: int = 1
-        elif start_year == year:
-            total_time: int = (end_date - start_date).days + 1
-            time_in_year: int = (end_of_current_year - start_date).days + 1
-        elif end_year == year:
-            total_time: int = (end_date - start_date).days + 1
-            time_in_year: int = (end_date - start_of_current_year).days + 1
-        else:
-            total_time: int = (end_date - start_date).days + 1
-            time_in_year: int = 365
+def apportion_values_to_years(
+    values: np.ndarray,
+    start_dates: np.ndarray,
+    end_dates: np.ndarray,
+    missing_end_dates: np.ndarray,
+    years: list[int],
+) -> np.ndarray:
+    """
+    Splits each value between the given years, in proportion to the days of its
+    [start date, end date] interval that fall in each year.
+
+    Values without an end date last until the end of the year of their missing end date. If
+    that is also missing, they last until the end of each year they are apportioned to.
+
+    Parameters:
+        values (np.ndarray): The values to apportion.
+        start_dates (np.ndarray): The start date of each value.
+        end_dates (np.ndarray): The end date of each value, NaT if it has none.
+        missing_end_dates (np.ndarray): The date each value without an end date ends in.
+        years (list[int]): The years to apportion the values to.
+
+    Returns:
+        np.ndarray: The part of each value in each year, with one row per value and one
+        column per year.
+    """
+    day: np.int64 = np.timedelta64(1, "D").astype("timedelta64[ns]").astype(np.int64)
+    years: np.ndarray = np.asarray(years, dtype=np.int64)[np.newaxis, :]
+    start_of_years: np.ndarray = (years - 1970).astype("datetime64[Y]").astype("datetime64[ns]")
+    end_of_years: np.ndarray = (years - 1969).astype("datetime64[Y]").astype(
+        "datetime64[ns]"
+    ) - np.timedelta64(1, "D")
+
+    starts: np.ndarray = start_dates[:, np.newaxis]
+    start_years: np.ndarray = starts.astype("datetime64[Y]").astype(np.int64) + 1970
+    has_end: np.ndarray = ~np.isnat(end_dates)[:, np.newaxis]
+    end_years: np.ndarray = np.where(
+        has_end,
+        end_dates.astype("datetime64[Y]").astype(np.int64)[:, np.newaxis] + 1970,
+        np.where(
+            np.isnat(missing_end_dates)[:, np.newaxis],
+            years,
+            missing_end_dates.astype("datetime64[Y]").astype(np.int64)[:, np.newaxis] + 1970,
+        ),
+    )
+    # Values without an end date end on the last day of their end year
+    ends: np.ndarray = np.where(
+        has_end,
+        end_dates[:, np.newaxis],
+        (end_years - 1969).astype("datetime64[Y]").astype("datetime64[ns]")
+        - np.timedelta64(1, "D"),
+    )
+
+    # Only the values active in a year are apportioned to it
+    in_year: np.ndarray = (
+        ~np.isnat(starts) & (start_years <= years) & (~has_end | (end_years >= years))
+    )
 
+    # Calculate the total days each value is active and the days it is active in each year
+    starts_in_year: np.ndarray = start_years == years
+    ends_in_year: np.ndarray = end_years == years
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total_time: np.ndarray = np.where(
+            starts_in_year & ends_in_year, 1, (ends - starts).astype(np.int64) // day + 1
+        )
+        time_in_year: np.ndarray = np.select(
+            [starts_in_year & ends_in_year, starts_in_year, ends_in_year],
+            [
+                1,
+                (end_of_years - starts).astype(np.int64) // day + 1,
+                (ends - start_of_years).astype(np.int64) // day + 1,
+            ],
+            default=365,
+        )
         # Multiply the value by the ratio of the time active
-        # in the current year to the total time active
-        value *= time_in_year / total_time
-        # Add the value to the yearly sum
-        yearly_sum += value
+        # in the year to the total time active
+        yearly_values: np.ndarray = values[:, np.newaxis] * (time_in_year / total_time)
 
-    return yearly_sum
+    return np.where(in_year, yearly_values, 0.0)
 
 
 def get_summary_file(out_dir: Path, filename: str):
     filepath: Path = out_dir / filename
     if os.path.exists(filepath):
-        with open(filepath, "r") as f:
-            return pd.read_csv(f)
+        return output_file_io.read_output_file(filepath)
     else:
         return pd.DataFrame()
 
@@ -189,19 +251,74 @@ def get_annual_emissions_at_all_sites_with_extrapolation(
         float: The total annual emissions at all sites with extrapolation for sites that were not
         measured for the given year.
     """
-    # Calculate the annual emissions for each site
-    annual_emissions: pd.Series = estimated_emissions_data.groupby(
-        ofc.EMIS_DATA_COL_ACCESSORS.SITE_ID
-    ).apply(
-        lambda x: get_yearly_value_for_multi_day_stat(
-            x,
-            ofc.EMIS_DATA_COL_ACCESSORS.EST_VOL_EMIT,
-            year,
-            ofc.EMIS_DATA_COL_ACCESSORS.START_DATE,
-            ofc.EMIS_DATA_COL_ACCESSORS.END_DATE,
-        )
+    return get_yearly_emissions_at_all_sites_with_extrapolation(
+        dir, estimated_emissions_data, [year]
+    )[0]
+
+
+def get_yearly_emissions_at_all_sites_with_extrapolation(
+    dir: str, estimated_emissions_data: pd.DataFrame, years: list[int]
+) -> list[float]:
+    """
+    Calculate the total annual emissions at all sites with extrapolation for sites that were not
+    measured, for all the given years at once.
+
+    Parameters:
+        estimated_emissions_data (pd.DataFrame): Data from an estimated emissions csv file.
+        years (list[int]): The years for which the emissions are to be calculated.
+
+    Returns:
+        list[float]: The total annual emissions at all sites with extrapolation for sites that
+        were not measured, for each of the given years.
+    """
+    if estimated_emissions_data.empty:
+        return [0] * len(years)
+
+    # Calculate the annual emissions for each site and year. Emissions without an end date
+    # last until the end of the last year that any emission at the same site ends in
+    end_dates: pd.Series = estimated_emissions_data[ofc.EMIS_DATA_COL_ACCESSORS.END_DATE].astype(
+        "datetime64[ns]"
+    )
+    yearly_emissions: np.ndarray = apportion_values_to_years(
+        estimated_emissions_data[ofc.EMIS_DATA_COL_ACCESSORS.EST_VOL_EMIT].to_numpy(dtype=float),
+        estimated_emissions_data[ofc.EMIS_DATA_COL_ACCESSORS.START_DATE]
+        .astype("datetime64[ns]")
+        .to_numpy(),
+        end_dates.to_numpy(),
+        end_dates.groupby(estimated_emissions_data[ofc.EMIS_DATA_COL_ACCESSORS.SITE_ID])
+        .transform("max")
+        .to_numpy(),
+        years,
     )
+    site_annual_emissions: pd.DataFrame = (
+        pd.DataFrame(yearly_emissions, index=estimated_emissions_data.index)
+        .groupby(estimated_emissions_data[ofc.EMIS_DATA_COL_ACCESSORS.SITE_ID])
+        .sum()
+    )
+
+    return [
+        extrapolate_site_annual_emissions(
+            dir, site_annual_emissions[year_index].rename(None), estimated_emissions_data
+        )
+        for year_index in range(len(years))
+    ]
+
+
+def extrapolate_site_annual_emissions(
+    dir: str, annual_emissions: pd.Series, estimated_emissions_data: pd.DataFrame
+) -> float:
+    """
+    Extrapolate the annual emissions of the measured sites to the sites that were not measured,
+    and total them.
+
+    Parameters:
+        annual_emissions (pd.Series): The annual emissions at each site.
+        estimated_emissions_data (pd.DataFrame): Data from an estimated emissions csv file.
 
+    Returns:
+        float: The total annual emissions at all sites with extrapolation for sites that were not
+        measured.
+    """
     # Convert the annual emissions to a DataFrame and join it with site type
     # and measured information
     annual_emissions_and_site_type: pd.DataFrame = (
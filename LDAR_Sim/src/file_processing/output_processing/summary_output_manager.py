@@ -20,13 +20,18 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 
 import os
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 from constants.file_name_constants import Output_Files
 from constants import error_messages, output_file_constants
 from constants.general_const import Conversion_Constants as cc, WindowsPathConstants as wpc
 from constants.file_processing_const import IOLocationConstants as io_loc
-from file_processing.output_processing import summary_outputs, summary_output_helpers
+from file_processing.output_processing import (
+    output_file_io,
+    summary_outputs,
+    summary_output_helpers,
+)
 from file_processing.output_processing.summary_output_mapper import SummaryOutputMapper
 from constants.param_default_const import Program_Params as pp
 
@@ -34,8 +39,8 @@ from constants.param_default_const import Program_Params as pp
 class SummaryOutputManager:
 
     OUTPUT_FUNCTIONS_MAP = {
-        Output_Files.SummaryFileNames.TS_SUMMARY: (summary_outputs.generate_timeseries_summary),
-        Output_Files.SummaryFileNames.EMIS_SUMMARY: (summary_outputs.generate_emissions_summary),
+        Output_Files.SummaryFileNames.TS_SUMMARY: (summary_outputs.build_timeseries_summary),
+        Output_Files.SummaryFileNames.EMIS_SUMMARY: (summary_outputs.build_emissions_summary),
     }
 
     def __init__(
@@ -58,6 +63,10 @@ class SummaryOutputManager:
         )
 
         self.parse_program_cost_info(programs)
+        self._program_order: dict[str, int] = {
+            program_name: program_n for program_n, program_name in enumerate(programs)
+        }
+        self._program_summaries: list[dict[str, dict[str, Any]]] = []
 
     def parse_program_cost_info(self, programs: dict) -> None:
         program_cost_info = {}
@@ -66,20 +75,56 @@ class SummaryOutputManager:
 
         self._program_cost_info = program_cost_info
 
+    def add_program_summaries(self, program_summaries: dict[str, dict[str, Any]]) -> None:
+        """Add the summary rows of a program simulation, as returned by the simulation, to
+        the next summary outputs generated.
+        """
+        self._program_summaries.append(program_summaries)
+
+    def get_program_summaries(self) -> list[dict[str, dict[str, Any]]]:
+        """Get the summary rows added since the last summary outputs were generated, ordered
+        by program and simulation number, independent of the order the simulations finished in.
+        """
+
+        def program_summary_order(program_summaries: dict[str, dict[str, Any]]) -> tuple:
+            summary_row: dict[str, Any] = next(iter(program_summaries.values()))
+            program_name: str = summary_row[
+                output_file_constants.SummaryFileColumns.CommonColumns.PROGRAM_NAME
+            ]
+            return (
+                self._program_order.get(program_name, len(self._program_order)),
+                int(
+                    summary_row[
+                        output_file_constants.SummaryFileColumns.CommonColumns.SIMULATION_NUMBER
+                    ]
+                ),
+            )
+
+        return sorted(
+            [
+                program_summaries
+                for program_summaries in self._program_summaries
+                if program_summaries
+            ],
+            key=program_summary_order,
+        )
+
     def gen_summary_outputs(self, clear_outputs: bool = False):
         directories: list[str] = [f.path for f in os.scandir(self._output_path) if f.is_dir()]
         program_directories = [dir for dir in directories if io_loc.LOG_FOLDER not in dir]
         legacy_outputs: dict[str, pd.DataFrame] = self.get_legacy_outputs()
+        program_summaries: list[dict[str, dict[str, Any]]] = self.get_program_summaries()
+        self._program_summaries = []
         new_outputs: dict[str, list[pd.DataFrame]] = {}
+        for summary_output in self._summary_outputs_to_make:
+            output_function = self.OUTPUT_FUNCTIONS_MAP.get(summary_output)
+            if output_function:
+                new_outputs[summary_output] = [
+                    output_function(program_summaries, self._outputs_mapper)
+                ]
+        # The summaries are built from the summary rows returned by the simulations, so the
+        # program output files written are only cleared or kept
         for program_directory in program_directories:
-            for summary_output in self._summary_outputs_to_make:
-                output_function = self.OUTPUT_FUNCTIONS_MAP.get(summary_output)
-                if output_function:
-                    new_summary_output = new_outputs.get(summary_output, [])
-                    new_summary_output.append(
-                        output_function(program_directory, self._outputs_mapper)
-                    )
-                    new_outputs[summary_output] = new_summary_output
             if clear_outputs:
                 summary_output_helpers.clear_directory(program_directory)
             else:
@@ -120,8 +165,8 @@ class SummaryOutputManager:
     def gen_cost_summary_outputs(self, non_baseline_prog):
         data_source_emis: Path = self._output_path / Output_Files.SummaryFileNames.EMIS_SUMMARY
         data_source_ts: Path = self._output_path / Output_Files.SummaryFileNames.TS_SUMMARY
-        data_emis: pd.DataFrame = pd.read_csv(data_source_emis.with_suffix(".csv"))
-        data_ts: pd.DataFrame = pd.read_csv(data_source_ts.with_suffix(".csv"))
+        data_emis: pd.DataFrame = output_file_io.read_output_file(data_source_emis)
+        data_ts: pd.DataFrame = output_file_io.read_output_file(data_source_ts)
 
         mitigation_data: pd.DataFrame = self.filter_program_mitigation(data_emis, non_baseline_prog)
 
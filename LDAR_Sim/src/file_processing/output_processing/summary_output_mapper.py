@@ -18,163 +18,240 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 ------------------------------------------------------------------------------
 """
 
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
 from constants import output_file_constants, file_processing_const, file_name_constants
 from file_processing.output_processing import summary_output_helpers
 
 
+class YearlySummaryStat:
+    """A summary statistic calculated for every simulation year at once.
+
+    The values of all the years are calculated the first time any year is requested for
+    the data of a file, and reused for the other years of the same data. The data is released
+    once every year has been requested, so it is not kept in memory between files.
+    """
+
+    def __init__(self, calc_func: Callable[[pd.DataFrame, str], list[float]]):
+        self._calc_func: Callable[[pd.DataFrame, str], list[float]] = calc_func
+        self._data: pd.DataFrame = None
+        self._values: list[float] = []
+        self._years_to_request: set[int] = set()
+
+    def get_year_value(self, df: pd.DataFrame, dir: str, year_index: int) -> float:
+        if df is not self._data:
+            self._values = self._calc_func(df, dir)
+            self._data = df
+            self._years_to_request = set(range(len(self._values)))
+        value: float = self._values[year_index]
+        self._years_to_request.discard(year_index)
+        if not self._years_to_request:
+            self._data = None
+            self._values = []
+        return value
+
+    def get_year_mapping(self, year_index: int) -> Callable[[pd.DataFrame, str], float]:
+        return lambda df, dir: self.get_year_value(df, dir, year_index)
+
+
+@dataclass(frozen=True)
+class SummaryStat:
+    """A mean, sum or percentile of a column of a program output file.
+
+    The statistic can be limited to the rows where a boolean column has a given value.
+    Summary stats are compiled into a SummaryPlan to be calculated together, but can also be
+    called on their own like any other summary mapping.
+    """
+
+    column: str
+    stat: str
+    percentile: Optional[float] = None
+    filter_column: Optional[str] = None
+    filter_value: bool = True
+
+    def get_source(self) -> tuple[str, Optional[str], bool]:
+        return self.column, self.filter_column, self.filter_value
+
+    def __call__(self, df: pd.DataFrame, dir: str) -> Any:
+        return SummaryPlan({self.column: self}).calculate(df, dir)[self.column]
+
+
+class SummaryPlan:
+    """The summary statistics of a summary file, compiled to be calculated in a single pass
+    over the data of each program output file.
+
+    Summary stats are grouped by their source column and row filter, so each source is
+    selected once, and all the percentiles of a source are calculated with a single call.
+    Any other mappings, such as the yearly statistics, are called as they are.
+    """
+
+    def __init__(self, summary_mappings: dict[str, callable]):
+        self._summary_columns: list[str] = list(summary_mappings.keys())
+        self._stat_groups: dict[
+            tuple[str, Optional[str], bool], dict[str, dict[str, SummaryStat]]
+        ] = {}
+        self._other_mappings: dict[str, callable] = {}
+        for summary_column, mapping in summary_mappings.items():
+            if isinstance(mapping, SummaryStat):
+                source_stats: dict[str, dict[str, SummaryStat]] = self._stat_groups.setdefault(
+                    mapping.get_source(), {}
+                )
+                source_stats.setdefault(mapping.stat, {})[summary_column] = mapping
+            else:
+                self._other_mappings[summary_column] = mapping
+
+    def get_source_values(
+        self, df: pd.DataFrame, source: tuple[str, Optional[str], bool]
+    ) -> pd.Series:
+        column, filter_column, filter_value = source
+        if filter_column is None:
+            return df[column]
+        row_filter: pd.Series = df[filter_column] if filter_value else ~df[filter_column]
+        return df.loc[row_filter, column]
+
+    def calculate(self, df: pd.DataFrame, dir: str) -> dict[str, Any]:
+        summary_values: dict[str, Any] = {}
+        for source, stats in self._stat_groups.items():
+            values: pd.Series = self.get_source_values(df, source)
+            for stat, summary_stats in stats.items():
+                if stat == file_processing_const.Multi_Sim_Output_Const.SUM_STAT:
+                    stat_values: list = [values.sum()] * len(summary_stats)
+                elif stat == file_processing_const.Multi_Sim_Output_Const.MEAN_STAT:
+                    stat_values = [values.mean()] * len(summary_stats)
+                else:
+                    stat_values = summary_output_helpers.get_nth_percentiles(
+                        values, [summary_stat.percentile for summary_stat in summary_stats.values()]
+                    )
+                summary_values.update(zip(summary_stats.keys(), stat_values))
+        for summary_column, mapping in self._other_mappings.items():
+            summary_values[summary_column] = mapping(df, dir)
+        return {
+            summary_column: summary_values[summary_column]
+            for summary_column in self._summary_columns
+        }
+
+
 class SummaryOutputMapper:
 
     SUMMARY_MAPPINGS = {
         file_name_constants.Output_Files.SummaryFileNames.TS_SUMMARY: {
-            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.AVG_T_DAILY_EMIS: lambda df, dir: (
-                summary_output_helpers.get_mean_val(
-                    df, output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS
-                )
+            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.AVG_T_DAILY_EMIS: SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS,
+                file_processing_const.Multi_Sim_Output_Const.MEAN_STAT,
             ),
-            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.AVG_T_MIT_DAILY_EMIS: lambda df, dir: (
-                summary_output_helpers.get_mean_val(
-                    df, output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_MIT
-                )
+            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.AVG_T_MIT_DAILY_EMIS: SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_MIT,
+                file_processing_const.Multi_Sim_Output_Const.MEAN_STAT,
             ),
             (
                 output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.AVG_T_NON_MIT_DAILY_EMIS
-            ): lambda df, dir: (
-                summary_output_helpers.get_mean_val(
-                    df, output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_NON_MIT
-                )
+            ): SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_NON_MIT,
+                file_processing_const.Multi_Sim_Output_Const.MEAN_STAT,
             ),
-            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.T_DAILY_EMIS_95: lambda df, dir: (
-                summary_output_helpers.get_nth_percentile(
-                    df,
-                    output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS,
-                    file_processing_const.Multi_Sim_Output_Const.PERCENTILE_95,
-                )
+            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.T_DAILY_EMIS_95: SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS,
+                file_processing_const.Multi_Sim_Output_Const.PERCENTILE_STAT,
+                percentile=file_processing_const.Multi_Sim_Output_Const.PERCENTILE_95,
             ),
-            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.T_MIT_DAILY_EMIS_95: lambda df, dir: (
-                summary_output_helpers.get_nth_percentile(
-                    df,
-                    output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_MIT,
-                    file_processing_const.Multi_Sim_Output_Const.PERCENTILE_95,
-                )
+            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.T_MIT_DAILY_EMIS_95: SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_MIT,
+                file_processing_const.Multi_Sim_Output_Const.PERCENTILE_STAT,
+                percentile=file_processing_const.Multi_Sim_Output_Const.PERCENTILE_95,
             ),
-            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.T_NON_MIT_DAILY_EMIS_95: lambda df, dir: (
-                summary_output_helpers.get_nth_percentile(
-                    df,
-                    output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_NON_MIT,
-                    file_processing_const.Multi_Sim_Output_Const.PERCENTILE_95,
-                )
+            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.T_NON_MIT_DAILY_EMIS_95: SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_NON_MIT,
+                file_processing_const.Multi_Sim_Output_Const.PERCENTILE_STAT,
+                percentile=file_processing_const.Multi_Sim_Output_Const.PERCENTILE_95,
             ),
-            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.T_DAILY_EMIS_5: lambda df, dir: (
-                summary_output_helpers.get_nth_percentile(
-                    df,
-                    output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS,
-                    file_processing_const.Multi_Sim_Output_Const.PERCENTILE_5,
-                )
+            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.T_DAILY_EMIS_5: SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS,
+                file_processing_const.Multi_Sim_Output_Const.PERCENTILE_STAT,
+                percentile=file_processing_const.Multi_Sim_Output_Const.PERCENTILE_5,
             ),
-            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.T_MIT_DAILT_EMIS_5: lambda df, dir: (
-                summary_output_helpers.get_nth_percentile(
-                    df,
-                    output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_MIT,
-                    file_processing_const.Multi_Sim_Output_Const.PERCENTILE_5,
-                )
+            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.T_MIT_DAILT_EMIS_5: SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_MIT,
+                file_processing_const.Multi_Sim_Output_Const.PERCENTILE_STAT,
+                percentile=file_processing_const.Multi_Sim_Output_Const.PERCENTILE_5,
             ),
-            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.T_NON_MIT_DAILY_EMIS_5: lambda df, dir: (
-                summary_output_helpers.get_nth_percentile(
-                    df,
-                    output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_NON_MIT,
-                    file_processing_const.Multi_Sim_Output_Const.PERCENTILE_5,
-                )
+            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.T_NON_MIT_DAILY_EMIS_5: SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_NON_MIT,
+                file_processing_const.Multi_Sim_Output_Const.PERCENTILE_STAT,
+                percentile=file_processing_const.Multi_Sim_Output_Const.PERCENTILE_5,
             ),
-            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.AVG_DAILY_COST: lambda df, dir: (
-                summary_output_helpers.get_mean_val(
-                    df, output_file_constants.TIMESERIES_COL_ACCESSORS.COST
-                )
+            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.AVG_DAILY_COST: SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.COST,
+                file_processing_const.Multi_Sim_Output_Const.MEAN_STAT,
             ),
-            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.TOT_COST: lambda df, dir: (
-                summary_output_helpers.get_sum(
-                    df, output_file_constants.TIMESERIES_COL_ACCESSORS.COST
-                )
+            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.TOT_COST: SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.COST,
+                file_processing_const.Multi_Sim_Output_Const.SUM_STAT,
             ),
-            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.DAILY_COST_95: lambda df, dir: (
-                summary_output_helpers.get_nth_percentile(
-                    df,
-                    output_file_constants.TIMESERIES_COL_ACCESSORS.COST,
-                    file_processing_const.Multi_Sim_Output_Const.PERCENTILE_95,
-                )
+            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.DAILY_COST_95: SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.COST,
+                file_processing_const.Multi_Sim_Output_Const.PERCENTILE_STAT,
+                percentile=file_processing_const.Multi_Sim_Output_Const.PERCENTILE_95,
             ),
-            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.DAILY_COST_5: lambda df, dir: (
-                summary_output_helpers.get_nth_percentile(
-                    df,
-                    output_file_constants.TIMESERIES_COL_ACCESSORS.COST,
-                    file_processing_const.Multi_Sim_Output_Const.PERCENTILE_5,
-                )
+            output_file_constants.TS_SUMMARY_COLUMNS_ACCESSORS.DAILY_COST_5: SummaryStat(
+                output_file_constants.TIMESERIES_COL_ACCESSORS.COST,
+                file_processing_const.Multi_Sim_Output_Const.PERCENTILE_STAT,
+                percentile=file_processing_const.Multi_Sim_Output_Const.PERCENTILE_5,
             ),
         },
         file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY: {
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_TOT_MIT: lambda df, dir: (
-                summary_output_helpers.get_sum(
-                    df, output_file_constants.EMIS_DATA_COL_ACCESSORS.MITIGATED
-                )
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_TOT_MIT: SummaryStat(
+                output_file_constants.EMIS_DATA_COL_ACCESSORS.MITIGATED,
+                file_processing_const.Multi_Sim_Output_Const.SUM_STAT,
             ),
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_TOTAL_EMIS: lambda df, dir: (
-                summary_output_helpers.get_sum(
-                    df, output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT
-                )
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_TOTAL_EMIS: SummaryStat(
+                output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT,
+                file_processing_const.Multi_Sim_Output_Const.SUM_STAT,
             ),
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.EST_TOTAL_EMIS: lambda df, dir: (
-                summary_output_helpers.get_sum(
-                    df, output_file_constants.EMIS_DATA_COL_ACCESSORS.EST_VOL_EMIT
-                )
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.EST_TOTAL_EMIS: SummaryStat(
+                output_file_constants.EMIS_DATA_COL_ACCESSORS.EST_VOL_EMIT,
+                file_processing_const.Multi_Sim_Output_Const.SUM_STAT,
             ),
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_TOTAL_MIT_EMIS: lambda df, dir: (
-                summary_output_helpers.get_sum(
-                    df.loc[df[output_file_constants.EMIS_DATA_COL_ACCESSORS.REPAIRABLE]],
-                    output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT,
-                )
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_TOTAL_MIT_EMIS: SummaryStat(
+                output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT,
+                file_processing_const.Multi_Sim_Output_Const.SUM_STAT,
+                filter_column=output_file_constants.EMIS_DATA_COL_ACCESSORS.REPAIRABLE,
             ),
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_TOTAL_NON_MIT_EMIS: lambda df, dir: (
-                summary_output_helpers.get_sum(
-                    df.loc[~df[output_file_constants.EMIS_DATA_COL_ACCESSORS.REPAIRABLE]],
-                    output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT,
-                )
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_TOTAL_NON_MIT_EMIS: SummaryStat(
+                output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT,
+                file_processing_const.Multi_Sim_Output_Const.SUM_STAT,
+                filter_column=output_file_constants.EMIS_DATA_COL_ACCESSORS.REPAIRABLE,
+                filter_value=False,
             ),
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.AVG_T_EMIS_RATE: lambda df, dir: (
-                summary_output_helpers.get_mean_val(
-                    df, output_file_constants.EMIS_DATA_COL_ACCESSORS.T_RATE
-                )
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.AVG_T_EMIS_RATE: SummaryStat(
+                output_file_constants.EMIS_DATA_COL_ACCESSORS.T_RATE,
+                file_processing_const.Multi_Sim_Output_Const.MEAN_STAT,
             ),
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_EMIS_RATE_95: lambda df, dir: (
-                summary_output_helpers.get_nth_percentile(
-                    df,
-                    output_file_constants.EMIS_DATA_COL_ACCESSORS.T_RATE,
-                    file_processing_const.Multi_Sim_Output_Const.PERCENTILE_95,
-                )
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_EMIS_RATE_95: SummaryStat(
+                output_file_constants.EMIS_DATA_COL_ACCESSORS.T_RATE,
+                file_processing_const.Multi_Sim_Output_Const.PERCENTILE_STAT,
+                percentile=file_processing_const.Multi_Sim_Output_Const.PERCENTILE_95,
             ),
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_EMIS_RATE_5: lambda df, dir: (
-                summary_output_helpers.get_nth_percentile(
-                    df,
-                    output_file_constants.EMIS_DATA_COL_ACCESSORS.T_RATE,
-                    file_processing_const.Multi_Sim_Output_Const.PERCENTILE_5,
-                )
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_EMIS_RATE_5: SummaryStat(
+                output_file_constants.EMIS_DATA_COL_ACCESSORS.T_RATE,
+                file_processing_const.Multi_Sim_Output_Const.PERCENTILE_STAT,
+                percentile=file_processing_const.Multi_Sim_Output_Const.PERCENTILE_5,
             ),
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_AVG_EMIS_AMOUNT: lambda df, dir: (
-                summary_output_helpers.get_mean_val(
-                    df, output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT
-                )
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_AVG_EMIS_AMOUNT: SummaryStat(
+                output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT,
+                file_processing_const.Multi_Sim_Output_Const.MEAN_STAT,
             ),
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_EMIS_AMOUNT_95: lambda df, dir: (
-                summary_output_helpers.get_nth_percentile(
-                    df,
-                    output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT,
-                    file_processing_const.Multi_Sim_Output_Const.PERCENTILE_95,
-                )
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_EMIS_AMOUNT_95: SummaryStat(
+                output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT,
+                file_processing_const.Multi_Sim_Output_Const.PERCENTILE_STAT,
+                percentile=file_processing_const.Multi_Sim_Output_Const.PERCENTILE_95,
             ),
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_EMIS_AMOUNT_5: lambda df, dir: (
-                summary_output_helpers.get_nth_percentile(
-                    df,
-                    output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT,
-                    file_processing_const.Multi_Sim_Output_Const.PERCENTILE_5,
-                )
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_EMIS_AMOUNT_5: SummaryStat(
+                output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT,
+                file_processing_const.Multi_Sim_Output_Const.PERCENTILE_STAT,
+                percentile=file_processing_const.Multi_Sim_Output_Const.PERCENTILE_5,
             ),
         },
         file_name_constants.Output_Files.SummaryFileNames.COST_SUMMARY: {},
@@ -184,23 +261,23 @@ class SummaryOutputMapper:
 
     YEARLY_MAPPINGS = {
         file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY: {
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_ANN_MIT: lambda year: (
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_ANN_MIT: lambda years: (
                 lambda df, dir: (
-                    summary_output_helpers.get_yearly_value_for_multi_day_stat(
+                    summary_output_helpers.get_yearly_values_for_multi_day_stat(
                         df,
                         output_file_constants.EMIS_DATA_COL_ACCESSORS.MITIGATED,
-                        year,
+                        years,
                         output_file_constants.EMIS_DATA_COL_ACCESSORS.DATE_REP_EXP,
                         output_file_constants.EMIS_DATA_COL_ACCESSORS.THEORY_DATE,
                     )
                 )
             ),
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_ANN_EMIS: lambda year: (
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_ANN_EMIS: lambda years: (
                 lambda df, dir: (
-                    summary_output_helpers.get_yearly_value_for_multi_day_stat(
+                    summary_output_helpers.get_yearly_values_for_multi_day_stat(
                         df,
                         output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT,
-                        year,
+                        years,
                         output_file_constants.EMIS_DATA_COL_ACCESSORS.DATE_BEG,
                         output_file_constants.EMIS_DATA_COL_ACCESSORS.DATE_REP_EXP,
                     )
@@ -208,23 +285,23 @@ class SummaryOutputMapper:
             ),
         },
         file_name_constants.Output_Files.SummaryFileNames.EMIS_EST_SUMMARY: {
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.EST_ANN_EMIS: lambda year: (
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.EST_ANN_EMIS: lambda years: (
                 lambda df, dir: (
-                    summary_output_helpers.get_annual_emissions_at_all_sites_with_extrapolation(
+                    summary_output_helpers.get_yearly_emissions_at_all_sites_with_extrapolation(
                         dir,
                         df,
-                        year,
+                        years,
                     )
                 )
             )
         },
         file_name_constants.Output_Files.SummaryFileNames.EMIS_FUG_EST_SUMMARY: {
-            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.EST_ANN_EMIS: lambda year: (
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.EST_ANN_EMIS: lambda years: (
                 lambda df, dir: (
-                    summary_output_helpers.get_yearly_value_for_multi_day_stat(
+                    summary_output_helpers.get_yearly_values_for_multi_day_stat(
                         df,
                         output_file_constants.EMIS_DATA_COL_ACCESSORS.EST_VOL_EMIT,
-                        year,
+                        years,
                         output_file_constants.EMIS_DATA_COL_ACCESSORS.START_DATE,
                         output_file_constants.EMIS_DATA_COL_ACCESSORS.END_DATE,
                     )
@@ -260,11 +337,12 @@ class SummaryOutputMapper:
         if summary_file not in self.YEARLY_MAPPINGS:
             return
         for mapping_key, mapping_function in self.YEARLY_MAPPINGS[summary_file].items():
-            for year in sim_years:
+            yearly_stat = YearlySummaryStat(mapping_function(sim_years))
+            for year_index, year in enumerate(sim_years):
                 self.add_summary_mapping(
                     summary_file,
                     mapping_key.format(year),
-                    mapping_function(year),
+                    yearly_stat.get_year_mapping(year_index),
                 )
 
     def add_summary_mapping(self, summary_file: str, map_key: str, map_function: callable):
@@ -282,3 +360,6 @@ class SummaryOutputMapper:
 
     def get_summary_mappings(self, summary_file: str) -> dict[str, callable]:
         return self.summary_mapping[summary_file]
+
+    def get_summary_plan(self, summary_file: str) -> SummaryPlan:
+        return SummaryPlan(self.get_summary_mappings(summary_file))
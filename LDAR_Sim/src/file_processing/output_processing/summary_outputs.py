@@ -22,14 +22,18 @@ import os
 import re
 from typing import Any
 import pandas as pd
-from file_processing.output_processing.summary_output_mapper import SummaryOutputMapper
+from file_processing.output_processing import output_file_io
+from file_processing.output_processing.summary_output_mapper import (
+    SummaryOutputMapper,
+    SummaryPlan,
+)
 from constants import output_file_constants, file_processing_const, file_name_constants
 
 
 def summarize_program_outputs(
     output_path: str,
     summary_output: pd.DataFrame,
-    summary_mappings: dict[str, callable],
+    summary_plan: SummaryPlan,
     source_regex: re.Pattern[str],
 ) -> None:
     with os.scandir(output_path) as entries:
@@ -42,12 +46,8 @@ def summarize_program_outputs(
                 )
             ):
                 new_summary_row: dict[str, Any] = {}
-                # Check to make sure the entry is not empty before reading it
-                # If it is empty, initialize the data variable to an empty dataframe
-                try:
-                    data = pd.read_csv(entry.path)
-                except pd.errors.EmptyDataError:
-                    data = pd.DataFrame()
+                # Empty output files are read as an empty dataframe
+                data: pd.DataFrame = output_file_io.read_output_file(entry.path)
 
                 new_summary_row[
                     output_file_constants.SummaryFileColumns.CommonColumns.PROGRAM_NAME
@@ -63,24 +63,150 @@ def summarize_program_outputs(
                     .match(entry.name)
                     .group(2)
                 )
-                for summary_stat, calc_func in summary_mappings.items():
-                    new_summary_row[summary_stat] = calc_func(data, output_path)
+                new_summary_row.update(summarize_program_data(data, output_path, summary_plan))
                 summary_output.loc[len(summary_output)] = new_summary_row
 
 
-def generate_timeseries_summary(directory: str, outputs_mapper: SummaryOutputMapper):
-    summary_columns: list[str] = outputs_mapper.get_summary_columns(
-        file_name_constants.Output_Files.SummaryFileNames.TS_SUMMARY
-    )
+def summarize_program_data(
+    data: pd.DataFrame, output_path: str, summary_plan: SummaryPlan
+) -> dict[str, Any]:
+    """Calculate the summary statistics of a single program simulation output
+
+    Args:
+        data (pd.DataFrame): The program simulation output, as it is written to file
+        output_path (str): The directory of the program outputs
+        summary_plan (SummaryPlan): The compiled summary statistics to calculate
+
+    Returns:
+        dict[str, Any]: The value of each summary statistic
+    """
+    return summary_plan.calculate(data, output_path)
+
+
+def summarize_program_simulation(
+    program_name: str,
+    simulation_number: int,
+    output_path: str,
+    outputs_mapper: SummaryOutputMapper,
+    program_outputs: dict[str, pd.DataFrame],
+) -> dict[str, dict[str, Any]]:
+    """Calculate the summary rows of a single program simulation from its outputs in memory,
+    so the outputs do not have to be written to file and read back in to be summarized.
+
+    Args:
+        program_name (str): The name of the program
+        simulation_number (int): The simulation number
+        output_path (str): The directory of the program outputs
+        outputs_mapper (SummaryOutputMapper): The mapper of the summary statistics to calculate
+        program_outputs (dict[str, pd.DataFrame]): The program simulation outputs, by the name
+        of the summary file they are summarized into
+
+    Returns:
+        dict[str, dict[str, Any]]: The summary row of the program simulation, by the name of
+        the summary file it belongs to
+    """
+    summary_rows: dict[str, dict[str, Any]] = {}
+    for summary_file, data in program_outputs.items():
+        summary_row: dict[str, Any] = {
+            output_file_constants.SummaryFileColumns.CommonColumns.PROGRAM_NAME: program_name,
+            # Matches the simulation number extracted from the program output file names
+            output_file_constants.SummaryFileColumns.CommonColumns.SIMULATION_NUMBER: str(
+                simulation_number
+            ),
+        }
+        summary_row.update(
+            summarize_program_data(data, output_path, outputs_mapper.get_summary_plan(summary_file))
+        )
+        summary_rows[summary_file] = summary_row
+    return summary_rows
+
+
+def get_summary_columns(outputs_mapper: SummaryOutputMapper, summary_file: str) -> list[str]:
+    summary_columns: list[str] = outputs_mapper.get_summary_columns(summary_file)
     summary_columns.insert(
         0, output_file_constants.SummaryFileColumns.CommonColumns.SIMULATION_NUMBER
     )
     summary_columns.insert(0, output_file_constants.SummaryFileColumns.CommonColumns.PROGRAM_NAME)
+    return summary_columns
+
+
+def build_summary(
+    program_summaries: list[dict[str, dict[str, Any]]],
+    summary_file: str,
+    outputs_mapper: SummaryOutputMapper,
+) -> pd.DataFrame:
+    """Build a summary from the summary rows of each program simulation
+
+    Args:
+        program_summaries (list[dict[str, dict[str, Any]]]): The summary rows of each program
+        simulation, as returned by summarize_program_simulation
+        summary_file (str): The name of the summary file to build
+        outputs_mapper (SummaryOutputMapper): The mapper of the summary statistics
+
+    Returns:
+        pd.DataFrame: The summary, with a row for each program simulation that has one
+    """
+    return pd.DataFrame(
+        [
+            program_summary[summary_file]
+            for program_summary in program_summaries
+            if summary_file in program_summary
+        ],
+        columns=get_summary_columns(outputs_mapper, summary_file),
+    )
+
+
+def build_timeseries_summary(
+    program_summaries: list[dict[str, dict[str, Any]]], outputs_mapper: SummaryOutputMapper
+) -> pd.DataFrame:
+    return build_summary(
+        program_summaries,
+        file_name_constants.Output_Files.SummaryFileNames.TS_SUMMARY,
+        outputs_mapper,
+    )
+
+
+def build_emissions_summary(
+    program_summaries: list[dict[str, dict[str, Any]]], outputs_mapper: SummaryOutputMapper
+) -> pd.DataFrame:
+    emissions_summary_df: pd.DataFrame = build_summary(
+        program_summaries,
+        file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY,
+        outputs_mapper,
+    )
+    estimated_df: pd.DataFrame = build_emissions_estimation_summary(
+        program_summaries, outputs_mapper
+    )
+    return merge_emissions_summaries(emissions_summary_df, estimated_df)
+
+
+def build_emissions_estimation_summary(
+    program_summaries: list[dict[str, dict[str, Any]]], outputs_mapper: SummaryOutputMapper
+) -> pd.DataFrame:
+    # Every program simulation with an estimated emissions summary row also has an estimated
+    # fugitive emissions summary row, so the rows of both summaries line up
+    est_emissions_summary_df: pd.DataFrame = build_summary(
+        program_summaries,
+        file_name_constants.Output_Files.SummaryFileNames.EMIS_EST_SUMMARY,
+        outputs_mapper,
+    )
+    est_rep_emissions_summary_df: pd.DataFrame = build_summary(
+        program_summaries,
+        file_name_constants.Output_Files.SummaryFileNames.EMIS_FUG_EST_SUMMARY,
+        outputs_mapper,
+    )
+    return subtract_repaired_emissions(est_emissions_summary_df, est_rep_emissions_summary_df)
+
+
+def generate_timeseries_summary(directory: str, outputs_mapper: SummaryOutputMapper):
+    summary_columns: list[str] = get_summary_columns(
+        outputs_mapper, file_name_constants.Output_Files.SummaryFileNames.TS_SUMMARY
+    )
     timeseries_summary_df = pd.DataFrame(columns=summary_columns)
     summarize_program_outputs(
         directory,
         timeseries_summary_df,
-        outputs_mapper.get_summary_mappings(
+        outputs_mapper.get_summary_plan(
             file_name_constants.Output_Files.SummaryFileNames.TS_SUMMARY
         ),
         file_processing_const.Multi_Sim_Output_Const.TS_PATTERN,
@@ -89,28 +215,29 @@ def generate_timeseries_summary(directory: str, outputs_mapper: SummaryOutputMap
 
 
 def generate_emissions_summary(directory: str, outputs_mapper: SummaryOutputMapper):
-
-    common_columns = [
-        output_file_constants.SummaryFileColumns.CommonColumns.PROGRAM_NAME,
-        output_file_constants.SummaryFileColumns.CommonColumns.SIMULATION_NUMBER,
-    ]
-    summary_columns: list[str] = outputs_mapper.get_summary_columns(
-        file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY
-    )
-    summary_columns.insert(
-        0, output_file_constants.SummaryFileColumns.CommonColumns.SIMULATION_NUMBER
+    summary_columns: list[str] = get_summary_columns(
+        outputs_mapper, file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY
     )
-    summary_columns.insert(0, output_file_constants.SummaryFileColumns.CommonColumns.PROGRAM_NAME)
     emissions_summary_df = pd.DataFrame(columns=summary_columns)
     summarize_program_outputs(
         directory,
         emissions_summary_df,
-        outputs_mapper.get_summary_mappings(
+        outputs_mapper.get_summary_plan(
             file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY
         ),
         file_processing_const.Multi_Sim_Output_Const.EMIS_PATTERN,
     )
     estimated_df: pd.DataFrame = generate_emissions_estimation_summary(directory, outputs_mapper)
+    return merge_emissions_summaries(emissions_summary_df, estimated_df)
+
+
+def merge_emissions_summaries(
+    emissions_summary_df: pd.DataFrame, estimated_df: pd.DataFrame
+) -> pd.DataFrame:
+    common_columns = [
+        output_file_constants.SummaryFileColumns.CommonColumns.PROGRAM_NAME,
+        output_file_constants.SummaryFileColumns.CommonColumns.SIMULATION_NUMBER,
+    ]
     # Merge summary and estimated data
     merged = pd.merge(
         emissions_summary_df,
@@ -130,19 +257,15 @@ def generate_emissions_summary(directory: str, outputs_mapper: SummaryOutputMapp
 
 
 def generate_emissions_estimation_summary(directory: str, outputs_mapper: SummaryOutputMapper):
-    summary_columns: list[str] = outputs_mapper.get_summary_columns(
-        file_name_constants.Output_Files.SummaryFileNames.EMIS_EST_SUMMARY
+    summary_columns: list[str] = get_summary_columns(
+        outputs_mapper, file_name_constants.Output_Files.SummaryFileNames.EMIS_EST_SUMMARY
     )
-    summary_columns.insert(
-        0, output_file_constants.SummaryFileColumns.CommonColumns.SIMULATION_NUMBER
-    )
-    summary_columns.insert(0, output_file_constants.SummaryFileColumns.CommonColumns.PROGRAM_NAME)
     est_emissions_summary_df = pd.DataFrame(columns=summary_columns)
     est_rep_emissions_summary_df = pd.DataFrame(columns=summary_columns)
     summarize_program_outputs(
         directory,
         est_emissions_summary_df,
-        outputs_mapper.get_summary_mappings(
+        outputs_mapper.get_summary_plan(
             file_name_constants.Output_Files.SummaryFileNames.EMIS_EST_SUMMARY
         ),
         file_processing_const.Multi_Sim_Output_Const.EST_PATTERN,
@@ -150,14 +273,20 @@ def generate_emissions_estimation_summary(directory: str, outputs_mapper: Summar
     summarize_program_outputs(
         directory,
         est_rep_emissions_summary_df,
-        outputs_mapper.get_summary_mappings(
+        outputs_mapper.get_summary_plan(
             file_name_constants.Output_Files.SummaryFileNames.EMIS_FUG_EST_SUMMARY
         ),
         file_processing_const.Multi_Sim_Output_Const.EST_REP_PATTERN,
     )
+    return subtract_repaired_emissions(est_emissions_summary_df, est_rep_emissions_summary_df)
+
+
+def subtract_repaired_emissions(
+    est_emissions_summary_df: pd.DataFrame, est_rep_emissions_summary_df: pd.DataFrame
+) -> pd.DataFrame:
     columns_to_subtract = [
         col
-        for col in summary_columns
+        for col in est_emissions_summary_df.columns
         if col
         not in [
             output_file_constants.SummaryFileColumns.CommonColumns.PROGRAM_NAME,
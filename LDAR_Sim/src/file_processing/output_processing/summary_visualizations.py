@@ -27,7 +27,11 @@ import pandas as pd
 import seaborn as sns
 
 from constants import file_name_constants, output_file_constants
-from file_processing.output_processing import output_utils, summary_visualization_helpers
+from file_processing.output_processing import (
+    output_file_io,
+    output_utils,
+    summary_visualization_helpers,
+)
 from file_processing.output_processing.scaling import QuantileScale
 from file_processing.output_processing.summary_visualization_mapper import (
     SummaryVisualizationMapper,
@@ -381,7 +385,7 @@ def gen_estimated_vs_true_emissions_percent_difference_plot(
     viz_mapper: SummaryVisualizationMapper,
 ):
     data_source: Path = out_dir / file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY
-    data: pd.DataFrame = pd.read_csv(data_source.with_suffix(".csv"))
+    data: pd.DataFrame = output_file_io.read_output_file(data_source)
     visualization_name: str = (
         output_file_constants.SummaryOutputVizFileNames.TRUE_VS_ESTIMATED_PERCENT_DIFF_PLOT
     )
@@ -423,7 +427,7 @@ def gen_estimated_vs_true_emissions_relative_difference_plot(
     viz_mapper: SummaryVisualizationMapper,
 ):
     data_source: Path = out_dir / file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY
-    data: pd.DataFrame = pd.read_csv(data_source.with_suffix(".csv"))
+    data: pd.DataFrame = output_file_io.read_output_file(data_source)
     visualization_name: str = (
         output_file_constants.SummaryOutputVizFileNames.TRUE_VS_ESTIMATED_RELATIVE_DIFF_PLOT
     )
@@ -465,7 +469,7 @@ def gen_true_and_estimated_paired_emissions_distribution_plot(
     viz_mapper: SummaryVisualizationMapper,
 ):
     data_source: Path = out_dir / file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY
-    data: pd.DataFrame = pd.read_csv(data_source.with_suffix(".csv"))
+    data: pd.DataFrame = output_file_io.read_output_file(data_source)
     visualization_name: str = (
         output_file_constants.SummaryOutputVizFileNames
     ).TRUE_AND_ESTIMATED_PAIRED_EMISSIONS_DISTRIBUTION_PLOT
@@ -502,7 +506,7 @@ def gen_true_and_estimated_paired_probit_plot(
     viz_mapper: SummaryVisualizationMapper,
 ):
     data_source: Path = out_dir / file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY
-    data: pd.DataFrame = pd.read_csv(data_source.with_suffix(".csv"))
+    data: pd.DataFrame = output_file_io.read_output_file(data_source)
     visualization_name: str = (
         output_file_constants.SummaryOutputVizFileNames.TRUE_AND_ESTIMATED_PAIRED_PROBIT_PLOT
     )
@@ -539,7 +543,7 @@ def gen_program_mitigation_bars(
     viz_mapper: SummaryVisualizationMapper,
 ):
     data_source: Path = out_dir / file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY
-    data: pd.DataFrame = pd.read_csv(data_source.with_suffix(".csv"))
+    data: pd.DataFrame = output_file_io.read_output_file(data_source)
     visualization_name: str = (
         output_file_constants.SummaryOutputVizFileNames.PROGRAM_MITIGATION_BAR_PLOT
     )
@@ -568,7 +572,7 @@ def gen_cost_to_mit_boxplot(
     viz_mapper: SummaryVisualizationMapper,
 ):
     data_source: Path = out_dir / file_name_constants.Output_Files.SummaryFileNames.COST_SUMMARY
-    data: pd.DataFrame = pd.read_csv(data_source.with_suffix(".csv"))
+    data: pd.DataFrame = output_file_io.read_output_file(data_source)
 
     visualization_name: str = output_file_constants.SummaryOutputVizFileNames.COST_TO_MIT_BOX_PLOT
 
@@ -601,7 +605,7 @@ def gen_program_stacked_cost_value_bars(
     viz_mapper: SummaryVisualizationMapper,
 ):
     data_source: Path = out_dir / file_name_constants.Output_Files.SummaryFileNames.COST_SUMMARY
-    data: pd.DataFrame = pd.read_csv(data_source.with_suffix(".csv"))
+    data: pd.DataFrame = output_file_io.read_output_file(data_source)
 
     visualization_name: str = (
         output_file_constants.SummaryOutputVizFileNames.PROGRAM_COST_VALUE_BAR_PLOT
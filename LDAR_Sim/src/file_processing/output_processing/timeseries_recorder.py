@@ -0,0 +1,117 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        timeseries_recorder.py
+Purpose: Contains the timeseries recorder used to collect the daily program timeseries
+into preallocated columns.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from constants.output_file_constants import TIMESERIES_COL_ACCESSORS as tca
+from file_processing.output_processing.output_utils import EmisInfo, TsEmisData, TsMethodData
+
+
+class TimeseriesRecorder:
+    """Records the daily values of the program timeseries into preallocated, typed
+    NumPy columns, one entry per simulated day. The timeseries DataFrame is only built once,
+    when all days have been recorded.
+    """
+
+    INT_COLUMNS = [
+        tca.ACT_LEAKS,
+        tca.NEW_LEAKS,
+        tca.REP_LEAKS,
+        tca.NAT_REP_LEAKS,
+    ]
+    INT_METHOD_COLUMNS = [tca.METH_DAILY_SITES_VIS]
+
+    def __init__(
+        self, columns: list[str], method_names: list[str], start_date: date, n_days: int
+    ) -> None:
+        self._column_names: list[str] = columns
+        self._dates: list[date] = [start_date + timedelta(days=day) for day in range(n_days)]
+        int_columns: set[str] = set(self.INT_COLUMNS)
+        for method in method_names:
+            int_columns.update(col.format(method=method) for col in self.INT_METHOD_COLUMNS)
+        self._columns: dict[str, np.ndarray] = {
+            col: np.zeros(n_days, dtype=np.int64 if col in int_columns else np.float64)
+            for col in columns
+            if col != tca.DATE
+        }
+        self._day: int = 0
+
+    def next_day(self) -> None:
+        """Move on to recording the values of the next day"""
+        self._day += 1
+
+    def record(self, column: str, value) -> None:
+        """Set the value of the given column for the current day"""
+        self._columns[column][self._day] = value
+
+    def record_emis_info(self, ts_emis_info: TsEmisData, ts_emis_rep_info: EmisInfo) -> None:
+        day: int = self._day
+        columns: dict[str, np.ndarray] = self._columns
+        columns[tca.EMIS][day] = ts_emis_info.daily_emis
+        columns[tca.EMIS_MIT][day] = ts_emis_info.daily_emis_mit
+        columns[tca.EMIS_NON_MIT][day] = ts_emis_info.daily_emis_non_mit
+        columns[tca.ACT_LEAKS][day] = ts_emis_info.active_leaks
+        columns[tca.REP_COST][day] = ts_emis_rep_info.repair_cost
+        columns[tca.REP_LEAKS][day] = ts_emis_rep_info.leaks_repaired
+        columns[tca.NAT_REP_COST][day] = ts_emis_rep_info.nat_repair_cost
+        columns[tca.NAT_REP_LEAKS][day] = ts_emis_rep_info.leaks_nat_repaired
+
+    def record_methods_info(
+        self, ts_methods_info: list[TsMethodData], include_upfront_cost: bool = False
+    ) -> None:
+        day: int = self._day
+        columns: dict[str, np.ndarray] = self._columns
+        total_daily_cost: float = 0.0
+        total_leaks_tagged: int = 0
+        for method_info in ts_methods_info:
+            method: str = method_info.method_name
+            if include_upfront_cost:
+                total_daily_cost += method_info.upfront_cost
+                columns[tca.METH_DAILY_DEPLOY_COST.format(method=method)][day] = (
+                    method_info.daily_deployment_cost + method_info.upfront_cost
+                )
+            else:
+                columns[tca.METH_DAILY_DEPLOY_COST.format(method=method)][day] = (
+                    method_info.daily_deployment_cost
+                )
+            total_daily_cost += method_info.daily_deployment_cost
+            total_leaks_tagged += np.nan_to_num(method_info.daily_tags)
+            columns[tca.METH_DAILY_TAGS.format(method=method)][day] = method_info.daily_tags
+            columns[tca.METH_DAILY_FLAGS.format(method=method)][day] = method_info.daily_flags
+            columns[tca.METH_DAILY_SITES_VIS.format(method=method)][day] = method_info.sites_visited
+            columns[tca.METH_DAILY_TRAVEL_TIME.format(method=method)][day] = method_info.travel_time
+            columns[tca.METH_DAILY_SURVEY_TIME.format(method=method)][day] = method_info.survey_time
+        columns[tca.COST][day] = total_daily_cost + columns[tca.REP_COST][day]
+        columns[tca.TAGGED_LEAKS][day] = total_leaks_tagged
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Build the timeseries DataFrame from all of the days recorded so far"""
+        n_days: int = self._day
+        data: dict = {}
+        for col in self._column_names:
+            if col == tca.DATE:
+                data[col] = pd.Series(self._dates[:n_days], dtype=object)
+            else:
+                data[col] = self._columns[col][:n_days]
+        return pd.DataFrame(data, columns=self._column_names)
@@ -19,17 +19,132 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 """
 
 import logging
+import multiprocessing as mp
+import os
 from pathlib import Path
 import pickle
 import sys
 from datetime import date
 import numpy as np
+from virtual_world.emission_scenario import EmissionScenario
 from virtual_world.infrastructure import Infrastructure
 from initialization.preseed import gen_seed_timeseries
 from constants.file_name_constants import Generator_Files
 from constants.output_messages import RuntimeMessages as rm
 from constants.error_messages import Input_Processing_Messages as ipm
 
+# The infrastructure that the processes of a generation pool generate emissions with
+_generation_infrastructure: Infrastructure = None
+
+
+def _generate_emission_scenario(
+    sim_number: int,
+    preseed: bool,
+    emis_preseed_val: list[int],
+    infrastructure: Infrastructure,
+    start_date: date,
+    end_date: date,
+    generator_dir: Path,
+    pre_simulation_emissions: bool,
+) -> None:
+    if preseed:
+        np.random.seed(emis_preseed_val[sim_number])
+    print(rm.GEN_EMISS.format(i=sim_number))
+    infrastructure.generate_emissions(
+        sim_start_date=start_date,
+        sim_end_date=end_date,
+        sim_number=sim_number,
+        pre_simulation_emissions=pre_simulation_emissions,
+    )
+    emis_file_loc = generator_dir / Generator_Files.GEN_INFRA_EMISS.format(i=sim_number)
+    infrastructure.get_emission_scenario(sim_number, start_date).save(emis_file_loc)
+
+
+def _init_generation_worker(infrastructure: Infrastructure) -> None:
+    global _generation_infrastructure
+    _generation_infrastructure = infrastructure
+
+
+def _generate_emission_scenario_task(
+    sim_number: int,
+    preseed: bool,
+    emis_preseed_val: list[int],
+    start_date: date,
+    end_date: date,
+    generator_dir: Path,
+    pre_simulation_emissions: bool,
+) -> tuple:
+    if not preseed:
+        # Forked workers start from the same random state, reseed so every scenario differs
+        np.random.seed()
+    _generate_emission_scenario(
+        sim_number,
+        preseed,
+        emis_preseed_val,
+        _generation_infrastructure,
+        start_date,
+        end_date,
+        generator_dir,
+        pre_simulation_emissions,
+    )
+    return np.random.get_state()
+
+
+def _generate_emission_scenarios(
+    sim_numbers: list[int],
+    preseed: bool,
+    emis_preseed_val: list[int],
+    infrastructure: Infrastructure,
+    start_date: date,
+    end_date: date,
+    generator_dir: Path,
+    pre_simulation_emissions: bool,
+    n_processes: int,
+) -> None:
+    """Generate and save the emission scenario of each of the given simulations.
+
+    Each scenario only depends on the seed of its simulation, so scenarios can be generated
+    by a pool of processes, one simulation per task, and be identical to those generated
+    one after the other when preseeded.
+    """
+    n_processes = min(n_processes, len(sim_numbers))
+    if n_processes <= 1:
+        for sim_number in sim_numbers:
+            _generate_emission_scenario(
+                sim_number,
+                preseed,
+                emis_preseed_val,
+                infrastructure,
+                start_date,
+                end_date,
+                generator_dir,
+                pre_simulation_emissions,
+            )
+        return
+    with mp.Pool(
+        processes=n_processes, initializer=_init_generation_worker, initargs=(infrastructure,)
+    ) as p:
+        random_states: list[tuple] = p.starmap(
+            _generate_emission_scenario_task,
+            [
+                (
+                    sim_number,
+                    preseed,
+                    emis_preseed_val,
+                    start_date,
+                    end_date,
+                    generator_dir,
+                    pre_simulation_emissions,
+                )
+                for sim_number in sim_numbers
+            ],
+            chunksize=1,
+        )
+    if preseed:
+        # Leave the random state as it would be after generating the scenarios one after the
+        # other, so anything seeded from it afterwards (ie. the preseed timeseries) is unchanged
+        np.random.set_state(random_states[-1])
+
 
 def initialize_emissions(
     n_sims: int,
@@ -42,28 +157,24 @@ def initialize_emissions(
     generator_dir: Path,
     pre_simulation_emissions: bool,
     force_remake: bool = False,
+    n_processes: int = 1,
 ):
     n_sim_loc = generator_dir / Generator_Files.N_SIM_SAVE_FILE
     n_simulation_saved: int = 0
-    # Store params used to generate the pickle files for change detection
+    # Store params used to generate the emission scenario files for change detection
     if not hash_file_exist or force_remake:
         # Generate emissions for all simulation sets
-        for i in range(n_sims):
-            if preseed:
-                np.random.seed(emis_preseed_val[i])
-            emissions: dict = {}
-            emis_file_loc = generator_dir / Generator_Files.GEN_INFRA_EMISS.format(i=i)
-            print(rm.GEN_EMISS.format(i=i))
-            emissions.update(
-                infrastructure.generate_emissions(
-                    sim_start_date=start_date,
-                    sim_end_date=end_date,
-                    sim_number=i,
-                    pre_simulation_emissions=pre_simulation_emissions,
-                )
-            )
-            with open(emis_file_loc, "wb") as f:
-                pickle.dump(emissions, f)
+        _generate_emission_scenarios(
+            list(range(n_sims)),
+            preseed,
+            emis_preseed_val,
+            infrastructure,
+            start_date,
+            end_date,
+            generator_dir,
+            pre_simulation_emissions,
+            n_processes,
+        )
 
         with open(n_sim_loc, "wb") as f:
             pickle.dump(n_sims, f)
@@ -81,25 +192,27 @@ def initialize_emissions(
             with open(n_sim_loc, "wb") as f:
                 pickle.dump(n_sims, f)
 
-            # More simulations are required. Generated emissions can still be re-used,
-            # but it is necessary to generate more emissions scenarios for the extra simulations
-            # Generate emissions for remaining simulation sets
-            for i in range(n_simulation_saved, n_sims):
-                if preseed:
-                    np.random.seed(emis_preseed_val[i])
-                print(rm.GEN_EMISS.format(i=i))
-                emis_file_loc = generator_dir / Generator_Files.GEN_INFRA_EMISS.format(i=i)
-                emissions: dict = {}
-                emissions.update(
-                    infrastructure.generate_emissions(
-                        sim_start_date=start_date,
-                        sim_end_date=end_date,
-                        sim_number=i,
-                        pre_simulation_emissions=pre_simulation_emissions,
-                    )
-                )
-                with open(emis_file_loc, "wb") as f:
-                    pickle.dump(emissions, f)
+        # More simulations may be required. Generated emissions can still be re-used,
+        # but it is necessary to generate more emissions scenarios for the extra simulations.
+        # Scenarios missing from the generator folder (ie. generated by a previous version
+        # in a different format) are generated again as well.
+        missing_sims: list[int] = [
+            i
+            for i in range(n_sims)
+            if i >= n_simulation_saved
+            or not os.path.isfile(generator_dir / Generator_Files.GEN_INFRA_EMISS.format(i=i))
+        ]
+        _generate_emission_scenarios(
+            missing_sims,
+            preseed,
+            emis_preseed_val,
+            infrastructure,
+            start_date,
+            end_date,
+            generator_dir,
+            pre_simulation_emissions,
+            n_processes,
+        )
 
     if preseed:
         seed_timeseries = gen_seed_timeseries(
@@ -110,11 +223,11 @@ def initialize_emissions(
     return seed_timeseries
 
 
-def read_in_emissions(infrastructure: Infrastructure, generator_dir: Path, sim_numb: int):
-    # Load emissions into the pregenerated infrastructure
-    emissions: dict = {}
+def read_in_emissions(
+    infrastructure: Infrastructure, generator_dir: Path, sim_numb: int, sim_start_date: date
+):
+    # Load the emission scenario of the simulation into the pregenerated infrastructure
     emis_file_loc = generator_dir / Generator_Files.GEN_INFRA_EMISS.format(i=sim_numb)
-    with open(emis_file_loc, "rb") as f:
-        emissions: dict = pickle.load(f)
-    infrastructure.set_pregen_emissions(emissions[sim_numb], sim_numb)
+    scenario: EmissionScenario = EmissionScenario.load(emis_file_loc, sim_start_date)
+    infrastructure.set_emission_scenario(scenario, sim_numb)
     return infrastructure
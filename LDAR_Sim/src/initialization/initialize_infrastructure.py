@@ -7,19 +7,7 @@ import numpy as np
 from constants.file_name_constants import Generator_Files
 import constants.param_default_const as pc
 from constants.output_messages import RuntimeMessages as rm
-
-
-def hash_file(file_path) -> str:
-    # Construct the hasher object
-    hasher: hashlib._Hash = hashlib.md5()
-
-    # Open the file to hash
-    with open(file_path, "rb") as f:
-        # Add bytes from the file to the hasher chunk by chunk
-        for chunk in iter(lambda: f.read(4096), b""):
-            hasher.update(chunk)
-    # Return the string containing the hex representation of the hash
-    return hasher.hexdigest()
+from utils.generic_functions import hash_file
 
 
 def hash_dict(in_dict) -> str:
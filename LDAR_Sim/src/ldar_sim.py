@@ -21,10 +21,10 @@
 
 from pathlib import WindowsPath
 from typing import Any
-import pandas as pd
 import numpy as np
 
 from file_processing.output_processing.program_output_manager import ProgramOutputManager
+from file_processing.output_processing.timeseries_recorder import TimeseriesRecorder
 from virtual_world.infrastructure import Infrastructure
 from time_counter import TimeCounter
 from programs.program import Program
@@ -33,12 +33,12 @@ from file_processing.output_processing.output_utils import (
     TsEmisData,
     TsMethodData,
 )
-from constants.output_file_constants import (
-    EMIS_DATA_FINAL_COL_ORDER,
-    TIMESERIES_COL_ACCESSORS as tca,
-)
+from constants.output_file_constants import TIMESERIES_COL_ACCESSORS as tca
 from constants.output_messages import RuntimeMessages as rm
-from constants.param_default_const import Virtual_World_Params as vp
+from constants.param_default_const import (
+    Sim_Setting_Params as sp,
+    Virtual_World_Params as vp,
+)
 
 
 class LdarSim:
@@ -56,6 +56,7 @@ class LdarSim:
         output_dir: WindowsPath,
         preseed_timeseries,
         prog_measured_df,
+        write_program_outputs: bool = True,
     ):
         """
         Construct the simulation.
@@ -65,6 +66,8 @@ class LdarSim:
         )
         self._sim_number: int = sim_number
         self._infrastructure: Infrastructure = infrastructure
+        if simulation_settings[sp.COLUMNAR_EMIS]:
+            self._infrastructure.use_emission_state_store()
         # TODO remove if unused
         self.simulation_settings = simulation_settings
         self._program: Program = program
@@ -79,6 +82,8 @@ class LdarSim:
             name_str=self.name_str,
             method_names=program.method_names,
             output_config=output_config,
+            sim_number=sim_number,
+            write_outputs=write_program_outputs,
         )
         if preseed_timeseries is not None:
             self._preseed = True
@@ -87,43 +92,37 @@ class LdarSim:
             self._preseed = False
         return
 
-    def run_simulation(self):
-        ts_columns = self._output_manager._init_ts_columns()
-        timeseries = pd.DataFrame(columns=ts_columns)
-        total_emissions_count: int = 0
+    def run_simulation(self) -> dict[str, dict[str, Any]]:
+        timeseries: TimeseriesRecorder = self._output_manager.init_timeseries_recorder(
+            self._tc._start_date, self._tc.get_simulation_length()
+        )
         first_day: bool = True
         while not self._tc.at_simulation_end():
             if self._preseed:
                 np.random.seed(self._preseed_ts[self._tc.current_date])
-            new_row: dict[str, Any] = self._output_manager._init_ts_row(self._tc.current_date)
-            new_row[tca.NEW_LEAKS] = self._infrastructure.activate_emissions(
+            new_leaks: int = self._infrastructure.activate_emissions(
                 self._tc.current_date, self._sim_number
             )
-            total_emissions_count += new_row[tca.NEW_LEAKS]
+            timeseries.record(tca.NEW_LEAKS, new_leaks)
             ts_methods_info: list[TsMethodData] = self._program.do_daily_program_deployment()
             ts_emis_rep_info: EmisInfo = EmisInfo()
             ts_emis_info: TsEmisData = self._infrastructure.update_emissions_state(ts_emis_rep_info)
-            self._output_manager._update_ts_row_w_emis_info(
-                new_row=new_row, ts_emis_info=ts_emis_info, ts_emis_rep_info=ts_emis_rep_info
+            timeseries.record_emis_info(
+                ts_emis_info=ts_emis_info, ts_emis_rep_info=ts_emis_rep_info
             )
-            self._output_manager._update_ts_row_w_methods_info(
-                new_row=new_row, ts_methods_info=ts_methods_info, include_upfront_cost=first_day
+            timeseries.record_methods_info(
+                ts_methods_info=ts_methods_info, include_upfront_cost=first_day
             )
             first_day = False
 
-            timeseries.loc[len(timeseries)] = new_row
+            timeseries.next_day()
             self._program.update_date()
             self._tc.next_day()
 
         print(rm.SUMMARIZE_PROG.format(prog_name=self._program.name))
-        overall_emission_data: pd.DataFrame = pd.DataFrame(
-            columns=EMIS_DATA_FINAL_COL_ORDER, index=range(total_emissions_count)
-        )
-        self._infrastructure.gen_summary_emis_data(overall_emission_data, self._tc._end_date)
-
-        self._output_manager.summarize_program_outputs(
-            overall_emission_data,
-            timeseries,
+        return self._output_manager.summarize_program_outputs(
+            self._infrastructure.gen_summary_emis_data(self._tc._end_date),
+            timeseries.to_dataframe(),
             self._tc._start_date,
             self._tc._end_date,
             self._program,
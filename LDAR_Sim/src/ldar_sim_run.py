@@ -50,7 +50,7 @@ def run_ldar_sim(parameter_filenames, DEBUG=False):
 
         simulation_manager.setup_infrastructure()
 
-        simulation_manager.setup_emissions()
+        simulation_manager.setup_emissions(DEBUG=DEBUG)
 
         simulation_manager.setup_weather()
 
@@ -20,9 +20,9 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 
 from datetime import date
 import logging
-from queue import PriorityQueue
 import sys
 from typing import Tuple
+import numpy as np
 from constants.error_messages import Input_Processing_Messages as ipm
 from file_processing.output_processing.output_utils import CrewDeploymentStats, TaggingFlaggingStats
 from programs.method import Method
@@ -61,6 +61,7 @@ class ComponentLevelMethod(Method):
         site_to_survey: Site,
         weather,
         curr_date: date,
+        site_survey_time: int = None,
     ) -> Tuple[SiteSurveyReport, float]:
         survey_report, site_travel_time, last_site_survey, site_visited = super().survey_site(
             crew=crew,
@@ -68,6 +69,7 @@ class ComponentLevelMethod(Method):
             site_to_survey=site_to_survey,
             weather=weather,
             curr_date=curr_date,
+            site_survey_time=site_survey_time,
         )
         if survey_report.survey_complete:
             prev_tagging_survey_date: date = site_to_survey.get_latest_tagging_survey_date()
@@ -135,33 +137,22 @@ class ComponentLevelMethod(Method):
 
     def deploy_crews(self, workplan: Workplan, weather, daylight) -> CrewDeploymentStats:
         """Deploy crews will send crews out to survey sites based on the provided workplan"""
-        deploy_stats: CrewDeploymentStats = CrewDeploymentStats()
-
-        priority_queue = PriorityQueue()
-        day_time_remaining = self._max_work_hours
-        # Initialize the daily available survey time for existing crews
-        if self._daylight_sensitive:
-            day_time_remaining = self.get_daylight_hours(
-                daylight, self._max_work_hours, workplan.date
-            )
-        day_time_remaining = day_time_remaining * 60  # Convert time from hours to minutes
-        for crew in self._crew_reports:
-            # TODO : if method is daylight sensitive, check for max daylight
-            crew.day_time_remaining = day_time_remaining
-            crew.deployed = False
-            priority_queue.put((-crew.day_time_remaining, crew.crew_id, crew))
+        crew_times: np.ndarray = self._start_crew_day(daylight, workplan.date)
+        sites_visited: int = 0
+        travel_time_total: int = 0
+        survey_time_total: int = 0
+        deployment_cost: float = 0.0
 
         incompleteSurveys: list[Tuple] = []
-        # pop the site with the longest remaining hours to assign the next crew
-        # while there are crews that can work
         for survey_plan in workplan.site_survey_planners.values():
             # Get the survey report
             survey_report: SiteSurveyReport = survey_plan.get_current_survey_report()
             site_to_survey: Site = survey_plan.get_site()
-            if not priority_queue.empty():
-                # Get the crew with the most time remaining to work
-                _, _, assigned_crew = priority_queue.get()
-                assigned_crew: CrewDailyReport
+            # Get the crew with the most time remaining to work
+            assigned_crew: CrewDailyReport = self._get_next_crew(crew_times)
+            if assigned_crew is not None:
+                # Crews using local daylight work the daylight hours at their first site
+                self.limit_to_local_daylight(assigned_crew, daylight, workplan.date, site_to_survey)
 
                 # Send the crew to attempt to survey the site
                 survey_report, travel_time, last_site_survey, site_visited = self.survey_site(
@@ -170,40 +161,30 @@ class ComponentLevelMethod(Method):
                     site_to_survey=site_to_survey,
                     weather=weather,
                     curr_date=workplan.date,
+                    site_survey_time=self._get_site_survey_time(site_to_survey),
                 )
                 survey_report: SiteSurveyReport
                 travel_time: float
                 last_site_survey: bool
                 # Tracking Deployment statistics
                 if site_visited:
-                    deploy_stats.sites_visited += 1
+                    sites_visited += 1
                     assigned_crew.deployed = True
-                    deploy_stats.travel_time += travel_time
-                    deploy_stats.survey_time += survey_report.time_surveyed
+                    travel_time_total += travel_time
+                    survey_time_total += survey_report.time_surveyed
 
                 # If this will be last survey of the day, set remaining time
                 # to 0 and track travel home time
                 if last_site_survey:
                     assigned_crew.day_time_remaining = 0
                     workplan.total_travel_time += travel_time
-                    deploy_stats.travel_time += travel_time
+                    travel_time_total += travel_time
                     # TODO Make sure this gets update for other travel times as well
-                # If the crew still has time left, requeue it to go survey another site
+                # If the crew still has time left, it can go survey another site
+                self._update_crew_time(crew_times, assigned_crew)
                 if assigned_crew.day_time_remaining > 0:
-                    # Put the crew back into the queue if there's remaining work hours
-                    priority_queue.put(
-                        (
-                            -assigned_crew.day_time_remaining,
-                            assigned_crew.crew_id,
-                            assigned_crew,
-                        )
-                    )
-
                     if self.cost_type == self.PER_SITE_COST:
-                        site_survey_cost = site_to_survey.get_survey_cost(self._name)
-                        if site_survey_cost == 0 and self.cost > 0:
-                            site_survey_cost = self.cost
-                        deploy_stats.deployment_cost += site_survey_cost
+                        deployment_cost += self._get_site_survey_cost(site_to_survey)
             # Update the survey planner. If the survey was not finished, the update will
             # indicate that the particular site needs to be requeued with higher priority
             incompleteSurveys.append((survey_report, survey_plan))
@@ -215,5 +196,10 @@ class ComponentLevelMethod(Method):
         # based off the number of crews being deployed
         if self.cost_type == self.PER_DAY_COST:
             count_deployed_crews = sum(crew.deployed for crew in self._crew_reports)
-            deploy_stats.deployment_cost = self.cost * count_deployed_crews
-        return deploy_stats
+            deployment_cost = self.cost * count_deployed_crews
+        return CrewDeploymentStats(
+            deployment_cost=deployment_cost,
+            sites_visited=sites_visited,
+            travel_time=travel_time_total,
+            survey_time=survey_time_total,
+        )
@@ -21,7 +21,6 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 from datetime import date
 import logging
 import math
-from queue import PriorityQueue
 from random import choice
 import sys
 from typing import Tuple
@@ -65,8 +64,12 @@ class Method:
         self._initialize_sensor(properties[pdc.Method_Params.SENSOR], input_dir)
         self._max_work_hours: int = properties.get(pdc.Method_Params.MAX_WORKDAY, 24)
         self._daylight_sensitive = properties[pdc.Method_Params.CONSIDER_DAYLIGHT]
+        self._local_daylight: bool = self._daylight_sensitive and properties.get(
+            pdc.Method_Params.LOCAL_DAYLIGHT, False
+        )
         self._weather: bool = consider_weather
         self._weather_envs: dict = properties[pdc.Method_Params.WEATHER_ENVS]
+        self._deployment_days: np.ndarray = None
         self._is_follow_up: bool = properties[pdc.Method_Params.IS_FOLLOW_UP]
         self._initialize_travel_times(
             properties.get(pdc.Method_Params.T_BW_SITES, {}).get(pdc.Common_Params.VAL, 0)
@@ -209,36 +212,76 @@ class Method:
     def get_crew_count(self) -> int:
         return self._crews
 
-    def deploy_crews(self, workplan: Workplan, weather, daylight) -> CrewDeploymentStats:
-        """Deploy crews will send crews out to survey sites based on the provided workplan"""
-        deploy_stats: CrewDeploymentStats = CrewDeploymentStats()
+    def _get_site_survey_time(self, site: Site) -> int:
+        if self._deployment_type == pdc.Deployment_Types.STATIONARY:
+            return 0
+        return site.get_method_survey_time(self._name)
+
+    def _get_site_survey_cost(self, site: Site) -> float:
+        site_survey_cost = site.get_survey_cost(self._name)
+        if site_survey_cost == 0 and self.cost > 0:
+            site_survey_cost = self.cost
+        return site_survey_cost
 
-        priority_queue = PriorityQueue()
+    def _start_crew_day(self, daylight, curr_date: date) -> np.ndarray:
+        """Reset the crews for a day of work
+
+        Returns:
+            np.ndarray: The time each crew has left to work, indexed by crew ID
+        """
         day_time_remaining = self._max_work_hours
         # Initialize the daily available survey time for existing crews
-        if self._daylight_sensitive:
-            day_time_remaining = self.get_daylight_hours(
-                daylight, self._max_work_hours, workplan.date
-            )
+        if self._daylight_sensitive and not self._local_daylight:
+            day_time_remaining = self.get_daylight_hours(daylight, self._max_work_hours, curr_date)
         day_time_remaining = day_time_remaining * 60  # Convert time from hours to minutes
         # TODO Add logic to not deploy all crews if not necessary?
         for crew in self._crew_reports:
-            # TODO : if method is daylight sensitive, check for max daylight
             crew.day_time_remaining = day_time_remaining
             crew.deployed = False
-            priority_queue.put((-crew.day_time_remaining, crew.crew_id, crew))
+        return np.full(len(self._crew_reports), day_time_remaining, dtype=np.float64)
+
+    def _get_next_crew(self, crew_times: np.ndarray) -> CrewDailyReport:
+        """Get the crew with the most time remaining to work, the lowest crew ID among crews
+        with the same time, or None once no crews are left to work"""
+        if crew_times.size == 0:
+            return None
+        crew_n: int = int(np.argmax(crew_times))
+        if crew_times[crew_n] == -np.inf:
+            return None
+        return self._crew_reports[crew_n]
+
+    @staticmethod
+    def _update_crew_time(crew_times: np.ndarray, crew: CrewDailyReport) -> None:
+        """Update the time the crew has left to work, retiring the crew for the day
+        once it has no time left"""
+        if crew.day_time_remaining > 0:
+            crew_times[crew.crew_id] = crew.day_time_remaining
+        else:
+            crew_times[crew.crew_id] = -np.inf
+
+    def deploy_crews(self, workplan: Workplan, weather, daylight) -> CrewDeploymentStats:
+        """Deploy crews will send crews out to survey sites based on the provided workplan
+
+        Each site is assigned to the crew with the most time remaining to work, tracked in
+        an array of the time left for each crew, and the deployment statistics are
+        accumulated locally and set once all the sites of the workplan have been assigned.
+        """
+        crew_times: np.ndarray = self._start_crew_day(daylight, workplan.date)
+        sites_visited: int = 0
+        travel_time_total: int = 0
+        survey_time_total: int = 0
+        deployment_cost: float = 0.0
 
         incompleteSurveys: list[Tuple] = []
-        # pop the site with the longest remaining hours to assign the next crew
-        # while there are crews that can work
         for survey_plan in workplan.site_survey_planners.values():
             # Get the survey report
             survey_report: SiteSurveyReport = survey_plan.get_current_survey_report()
             site_to_survey: Site = survey_plan.get_site()
-            if not priority_queue.empty():
-                # Get the crew with the most time remaining to work
-                _, _, assigned_crew = priority_queue.get()
-                assigned_crew: CrewDailyReport
+            # Get the crew with the most time remaining to work
+            assigned_crew: CrewDailyReport = self._get_next_crew(crew_times)
+            if assigned_crew is not None:
+                # Crews using local daylight work the daylight hours at their first site
+                self.limit_to_local_daylight(assigned_crew, daylight, workplan.date, site_to_survey)
 
                 # Send the crew to attempt to survey the site
                 survey_report, travel_time, last_site_survey, site_visited = self.survey_site(
@@ -247,34 +290,27 @@ class Method:
                     site_to_survey=site_to_survey,
                     weather=weather,
                     curr_date=workplan.date,
+                    site_survey_time=self._get_site_survey_time(site_to_survey),
                 )
                 survey_report: SiteSurveyReport
                 travel_time: float
                 last_site_survey: bool
                 # Tracking Deployment statistics
                 if site_visited:
-                    deploy_stats.sites_visited += 1
+                    sites_visited += 1
                     assigned_crew.deployed = True
-                    deploy_stats.travel_time += travel_time
-                    deploy_stats.survey_time += survey_report.time_surveyed
+                    travel_time_total += travel_time
+                    survey_time_total += survey_report.time_surveyed
 
                 # If this will be last survey of the day, set remaining time
                 # to 0 and track travel home time
                 if last_site_survey:
                     assigned_crew.day_time_remaining = 0
                     workplan.total_travel_time += travel_time
-                    deploy_stats.travel_time += travel_time
+                    travel_time_total += travel_time
                     # TODO Make sure this gets update for other travel times as well
-                # If the crew still has time left, requeue it to go survey another site
-                if assigned_crew.day_time_remaining > 0:
-                    # Put the crew back into the queue if there's remaining work hours
-                    priority_queue.put(
-                        (
-                            -assigned_crew.day_time_remaining,
-                            assigned_crew.crew_id,
-                            assigned_crew,
-                        )
-                    )
+                # If the crew still has time left, it can go survey another site
+                self._update_crew_time(crew_times, assigned_crew)
             # Update the survey planner. If the survey was not finished, the update will
             # indicate that the particular site needs to be requeued with higher priority
             incompleteSurveys.append((survey_report, survey_plan))
@@ -291,10 +327,7 @@ class Method:
                 self._detection_records[workplan.date] = current_records
 
                 if self.cost_type == self.PER_SITE_COST:
-                    site_survey_cost = site_to_survey.get_survey_cost(self._name)
-                    if site_survey_cost == 0 and self.cost > 0:
-                        site_survey_cost = self.cost
-                    deploy_stats.deployment_cost += site_survey_cost
+                    deployment_cost += self._get_site_survey_cost(site_to_survey)
         for survey in incompleteSurveys:
             # Update the survey planner. If the survey was not finished, the update will
             # indicate that the particular site needs to be requeued with higher priority
@@ -303,11 +336,16 @@ class Method:
         # based off the number of crews being deployed
         if self.cost_type == self.PER_DAY_COST:
             if self._deployment_type == pdc.Deployment_Types.STATIONARY:
-                deploy_stats.deployment_cost = self.cost * len(workplan.site_survey_planners)
+                deployment_cost = self.cost * len(workplan.site_survey_planners)
             else:
                 count_deployed_crews = sum(crew.deployed for crew in self._crew_reports)
-                deploy_stats.deployment_cost = self.cost * count_deployed_crews
-        return deploy_stats
+                deployment_cost = self.cost * count_deployed_crews
+        return CrewDeploymentStats(
+            deployment_cost=deployment_cost,
+            sites_visited=sites_visited,
+            travel_time=travel_time_total,
+            survey_time=survey_time_total,
+        )
 
     def update(self, current_date: date) -> TaggingFlaggingStats:
         return None
@@ -319,6 +357,7 @@ class Method:
         site_to_survey: Site,
         weather,
         curr_date: date,
+        site_survey_time: int = None,
     ) -> Tuple[SiteSurveyReport, int, bool, bool]:
         """The method will attempt to survey the site provided as an argument, detecting emissions
         at it's detection level, either tagging sites for follow-up or flagging leaks,
@@ -332,6 +371,8 @@ class Method:
             (of available work hours)
             site (Site): The site to survey
             weather : Dictionary containing information about weather
+            site_survey_time (int): The time to survey the site, looked up from the site
+            if not provided
         """
         workable: bool = True
         last_site_survey: bool = False
@@ -348,7 +389,8 @@ class Method:
                 site_travel_time: int = 0
                 can_complete_survey: bool = True
             else:
-                site_survey_time: int = site_to_survey.get_method_survey_time(self._name)
+                if site_survey_time is None:
+                    site_survey_time = site_to_survey.get_method_survey_time(self._name)
                 site_travel_time: int = self._get_travel_time()
 
                 # Check if the site survey can be completed
@@ -462,64 +504,39 @@ class Method:
             work_hours = max_hours
         return work_hours
 
-    def get_weather_val(self, weather) -> float:
-        # TODO: update this later to consider averaging the hourly weather conditions
-        return weather[Method.HOUR]
-
-    def get_weather_segment(
-        self, weather, lat, long, timerange
-    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        return (
-            weather.temps[timerange, lat, long],
-            weather.winds[timerange, lat, long],
-            weather.precip[timerange, lat, long],
+    def get_local_daylight_hours(self, daylight, max_hours: int, curr_date, site: Site) -> int:
+        """Get the amount of daylight hours at the weather cell of the site"""
+        daylight_hours = daylight.get_local_daylight(
+            curr_date, site.get_weather_lat(), site.get_weather_long()
         )
+        work_hours = daylight_hours
+        if max_hours < daylight_hours:
+            work_hours = max_hours
+        return work_hours
+
+    def limit_to_local_daylight(
+        self, crew: CrewDailyReport, daylight, curr_date, site: Site
+    ) -> None:
+        """Limit the time a crew has left to work to the daylight hours at the site,
+        for crews that have not surveyed a site yet today"""
+        if self._local_daylight and not crew.deployed:
+            local_work_time = (
+                self.get_local_daylight_hours(daylight, self._max_work_hours, curr_date, site) * 60
+            )
+            if local_work_time < crew.day_time_remaining:
+                crew.day_time_remaining = local_work_time
 
     def check_weather(self, weather, curr_date, site: Site) -> bool:
         """
         Check the weather conditions for the given site on the given day
 
-        # TODO : change this such that the matrix is set once for given method
+        The deployment days of the method are set up from the weather on the first check,
+        after which each check is a single lookup.
         """
-
-        # TODO change to getters
-        lat = site.get_weather_lat()
-        long = site.get_weather_long()
-        bool_temp: bool = False
-        bool_wind: bool = False
-        bool_precip: bool = False
-        time = curr_date.timetuple().tm_yday - 1  # 0 indexed.
-        timerange = range(time * 24, time * 24 + 24)
-        temp_seg, wind_seg, precip_seg = self.get_weather_segment(weather, lat, long, timerange)
-        temp_val = self.get_weather_val(temp_seg)
-        wind_val = self.get_weather_val(wind_seg)
-        precip_val = self.get_weather_val(precip_seg)
-
-        if (
-            self._weather_envs[pdc.Method_Params.TEMP][0]
-            <= temp_val
-            <= self._weather_envs[pdc.Method_Params.TEMP][1]
-        ):
-            bool_temp = True
-        if (
-            self._weather_envs[pdc.Method_Params.WIND][0]
-            <= wind_val
-            <= self._weather_envs[pdc.Method_Params.WIND][1]
-        ):
-            bool_wind = True
-        if (
-            self._weather_envs[pdc.Method_Params.PRECIP][0]
-            <= precip_val
-            <= self._weather_envs[pdc.Method_Params.PRECIP][1]
-        ):
-            bool_precip = True
-
-        # if weather permits
-        if bool_precip and bool_wind and bool_temp:
-            return True
-        # if weather conditions are not good
-        else:
-            return False
+        if self._deployment_days is None:
+            self._deployment_days = weather.deployment_days(self._weather_envs, Method.HOUR)
+        day: int = curr_date.timetuple().tm_yday - 1  # 0 indexed.
+        return bool(self._deployment_days[day, site.get_weather_lat(), site.get_weather_long()])
 
     def get_name(self) -> str:
         return self._name
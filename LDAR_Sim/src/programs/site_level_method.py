@@ -31,6 +31,7 @@ from scheduling.follow_up_survey_planner import (
     FollowUpSurveyPlanner,
     StationaryFollowUpSurveyPlanner,
 )
+from scheduling.generic_schedule import GenericSchedule
 from scheduling.surveying_dataclasses import DetectionRecord
 from sensors.default_site_level_sensor import DefaultSiteLevelSensor
 from sensors.METEC_NoWind_sensor import METECNWSite
@@ -72,6 +73,8 @@ class SiteLevelMethod(Method):
         self._candidates_for_flags: SortedList[FollowUpSurveyPlanner] = SortedList(
             key=lambda x: -x.rate_at_site
         )
+        # The candidates for flags by site ID, to find a site's plan without a scan
+        self._candidate_plans: dict[str, FollowUpSurveyPlanner] = {}
         self._site_IDs_in_consideration_for_flag: dict[str, bool] = {}
         self._site_IDs_in_follow_up_queue: dict[str, bool] = (
             follow_up_schedule.get_site_id_queue_list()
@@ -134,7 +137,7 @@ class SiteLevelMethod(Method):
             else:
                 # Adding it back into the queue, therefore do not need to update
                 # the sites to consider for flags
-                self._candidates_for_flags.add(existing_plan)
+                self._add_candidate(existing_plan)
 
         # If the site is already queued to get a follow-up,
         # update the queue priority based on new results
@@ -149,14 +152,18 @@ class SiteLevelMethod(Method):
                 date_to_check,
             )
             if existing_plan.rate_at_site >= self._inst_threshold:
-                self._follow_up_schedule.add_previous_queued_to_survey_queue(existing_plan)
+                self._follow_up_schedule.requeue_survey_plan(
+                    GenericSchedule.QUEUED_SURVEY_PRIORITY, existing_plan
+                )
             else:
-                self._follow_up_schedule.add_to_survey_queue(existing_plan)
+                self._follow_up_schedule.requeue_survey_plan(
+                    GenericSchedule.DEFAULT_SURVEY_PRIORITY, existing_plan
+                )
 
         # Otherwise, the site is not already in processing for a follow-up,
         # process as normal
         else:
-            self._candidates_for_flags.add(
+            self._add_candidate(
                 StationaryFollowUpSurveyPlanner(
                     detection_record,
                     date_to_check,
@@ -187,7 +194,7 @@ class SiteLevelMethod(Method):
                 self._site_IDs_in_follow_up_queue[detection_record.site_id] = True
                 self._site_IDs_in_consideration_for_flag[detection_record.site_id] = False
             elif existing_plan.rate_at_site >= self._threshold:
-                self._candidates_for_flags.add(existing_plan)
+                self._add_candidate(existing_plan)
             else:
                 # If the site is no longer under consideration, remove from the list
                 self._site_IDs_in_consideration_for_flag[detection_record.site_id] = False
@@ -205,11 +212,16 @@ class SiteLevelMethod(Method):
                 date_to_check,
             )
             if existing_plan.rate_at_site >= self._inst_threshold:
-                self._follow_up_schedule.add_previous_queued_to_survey_queue(existing_plan)
+                self._follow_up_schedule.requeue_survey_plan(
+                    GenericSchedule.QUEUED_SURVEY_PRIORITY, existing_plan
+                )
             elif existing_plan.rate_at_site >= self._threshold:
-                self._follow_up_schedule.add_to_survey_queue(existing_plan)
+                self._follow_up_schedule.requeue_survey_plan(
+                    GenericSchedule.DEFAULT_SURVEY_PRIORITY, existing_plan
+                )
             else:
                 # Site is no longer in consideration for follow-up
+                self._follow_up_schedule.remove_from_survey_queue(detection_record.site_id)
                 self._site_IDs_in_follow_up_queue[detection_record.site_id] = False
         # Otherwise, the site is not already in processing for a follow-up,
         # process as normal
@@ -225,9 +237,7 @@ class SiteLevelMethod(Method):
                 detection_record.rate_detected != 0
                 and detection_record.rate_detected >= self._threshold
             ):
-                self._candidates_for_flags.add(
-                    FollowUpSurveyPlanner(detection_record, date_to_check)
-                )
+                self._add_candidate(FollowUpSurveyPlanner(detection_record, date_to_check))
                 self._site_IDs_in_consideration_for_flag[detection_record.site_id] = True
             # count that there was a detection, but it wasn't above the threshold
             elif detection_record.rate_detected > 0:
@@ -271,7 +281,7 @@ class SiteLevelMethod(Method):
                     if not survey_plan.should_follow_up(
                         self._small_window_threshold
                     ) and not survey_plan.should_follow_up_long(self._large_window_threshold):
-                        self._candidates_for_flags.add(survey_plan)
+                        self._add_candidate(survey_plan)
                         continue
                 self._follow_up_schedule.add_to_survey_queue(survey_plan)
                 n_flags += 1
@@ -279,12 +289,12 @@ class SiteLevelMethod(Method):
                 self._site_IDs_in_consideration_for_flag[survey_plan.site_id] = False
         return n_flags
 
+    def _add_candidate(self, survey_plan: FollowUpSurveyPlanner) -> None:
+        self._candidates_for_flags.add(survey_plan)
+        self._candidate_plans[survey_plan.site_id] = survey_plan
+
     def _get_plan_from_candidates(self, site_id: str) -> FollowUpSurveyPlanner:
-        plan_to_return: FollowUpSurveyPlanner = None
-        for plan in self._candidates_for_flags:
-            if plan.site_id == site_id:
-                plan_to_return = plan
-                break
+        plan_to_return: FollowUpSurveyPlanner = self._candidate_plans.pop(site_id, None)
         if plan_to_return:
             self._candidates_for_flags.remove(plan_to_return)
         return plan_to_return
@@ -312,12 +322,14 @@ class SiteLevelMethod(Method):
             self._candidates_for_flags[:candidates_to_keep],
             key=lambda x: -x.rate_at_site,
         )
+        self._candidate_plans = {plan.site_id: plan for plan in self._candidates_for_flags}
 
     def _get_candidates(self) -> SortedList[FollowUpSurveyPlanner]:
         # Returns the candidates list, and resets it, as well as the detection count
         # and the first detection date
         candidates: SortedList[FollowUpSurveyPlanner] = self._candidates_for_flags
         self._candidates_for_flags = SortedList(key=lambda x: -x.rate_at_site)
+        self._candidate_plans = {}
         self._detection_count = 0
         self._first_candidate_date = None
         return candidates
@@ -21,7 +21,8 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 from datetime import date
 from scheduling.follow_up_survey_planner import FollowUpSurveyPlanner
 from scheduling.generic_schedule import GenericSchedule
-from utils.queue import PriorityQueueWithFIFO
+from scheduling.survey_planner import SurveyPlanner
+from utils.queue import IndexedPriorityQueueWithFIFO
 from virtual_world.sites import Site
 from constants.param_default_const import Deployment_Types as dt
 from scheduling.workplan import Workplan
@@ -29,6 +30,10 @@ from scheduling.schedule_dataclasses import SiteSurveyReport, MinimalSurveyRepor
 from scheduling.scheduled_survey_planner import ScheduledSurveyPlanner
 
 
+def get_survey_plan_site_id(survey_plan: SurveyPlanner) -> str:
+    return survey_plan.get_site().get_id()
+
+
 class FollowUpMobileSchedule(GenericSchedule):
     """A schedule class to provide scheduling functionality for follow-up methods classified
     as the "mobile" type. Will overwrite GenericSchedule functionality as required.
@@ -53,6 +58,9 @@ class FollowUpMobileSchedule(GenericSchedule):
             est_meth_daily_surveys,
             method_avail_crews,
         )
+        self._survey_queue: IndexedPriorityQueueWithFIFO = IndexedPriorityQueueWithFIFO(
+            get_survey_plan_site_id
+        )
         self._site_IDs_in_queue: dict[str, bool] = {site.get_id(): False for site in sites}
         return
 
@@ -60,21 +68,17 @@ class FollowUpMobileSchedule(GenericSchedule):
         return self._site_IDs_in_queue
 
     def get_plan_from_queue(self, site_id: str) -> FollowUpSurveyPlanner:
-        new_queue: PriorityQueueWithFIFO = PriorityQueueWithFIFO()
-        target_plan: FollowUpSurveyPlanner = None
-        while not self._survey_queue.empty():
-            prio, _, plan = self._survey_queue.get()
-            prio: int
-            plan: FollowUpSurveyPlanner
-            if plan.site_id == site_id:
-                target_plan = plan
-            else:
-                new_queue.put(prio, plan)
-        self._survey_queue: PriorityQueueWithFIFO = new_queue
-        return target_plan
+        """Get the survey plan of the given site in the queue, so that it can be updated and
+        requeued with a new priority.
+        """
+        return self._survey_queue.get_item(site_id)
 
     def requeue_survey_plan(self, prio: int, survey_plan: FollowUpSurveyPlanner) -> None:
-        self._survey_queue.put(priority=(prio, survey_plan.rate_at_site), item=survey_plan)
+        """Move the queued survey plan to the given priority, using its latest rate"""
+        self._survey_queue.reprioritize(survey_plan.site_id, (prio, survey_plan.rate_at_site))
+
+    def remove_from_survey_queue(self, site_id: str) -> None:
+        self._survey_queue.remove(site_id)
 
     def add_to_survey_queue(self, survey_plan: FollowUpSurveyPlanner) -> None:
         """Add the supplied site to the survey queue to surveyed
@@ -129,6 +133,7 @@ class FollowUpMobileSchedule(GenericSchedule):
                     self.add_previous_queued_to_survey_queue(planner)
             else:
                 planner.add_to_surveys_done(current_date)
+                self.reschedule_survey_plan(planner, current_date)
                 completed_sites.append(site_id)
                 self._site_IDs_in_queue[planner.site_id] = False
 
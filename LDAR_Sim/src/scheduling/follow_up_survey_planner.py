@@ -18,6 +18,7 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 ------------------------------------------------------------------------------
 """
 
+from collections import deque
 from datetime import date
 import logging
 import sys
@@ -27,7 +28,7 @@ from scheduling.surveying_dataclasses import DetectionRecord
 from scheduling.survey_planner import SurveyPlanner
 from constants.error_messages import Runtime_Error_Messages as rem
 import constants.param_default_const as pdc
-import pandas as pd
+from utils.rolling_mean import RollingMean
 
 
 class FollowUpSurveyPlanner(SurveyPlanner):
@@ -88,6 +89,15 @@ class StationaryFollowUpSurveyPlanner(FollowUpSurveyPlanner):
         self._long_window: int = long_window
         self.rate_at_site: float = 0
         self.rate_at_site_long: float = 0
+        # Only the detections within the longest window are kept
+        self._detected_rates: deque[float] = deque(
+            self._detected_rates, maxlen=max(small_window, long_window)
+        )
+        self._small_window_mean: RollingMean = RollingMean(small_window)
+        self._long_window_mean: RollingMean = RollingMean(long_window)
+        for rate in self._detected_rates:
+            self._small_window_mean.add(rate)
+            self._long_window_mean.add(rate)
 
     def update_with_latest_survey(
         self,
@@ -98,19 +108,10 @@ class StationaryFollowUpSurveyPlanner(FollowUpSurveyPlanner):
     ) -> None:
         if redund_filter == pdc.Method_Params.ROLLING_AVRG:
             self._detected_rates.append(new_detection.rate_detected)
-            series_detect_rates = pd.Series(self._detected_rates)
-            self.rate_at_site = (
-                series_detect_rates.rolling(
-                    window=self._small_window, min_periods=self._small_window
-                )
-                .mean()
-                .iloc[-1]
-            )
-            self.rate_at_site_long = (
-                series_detect_rates.rolling(window=self._long_window, min_periods=self._long_window)
-                .mean()
-                .iloc[-1]
-            )
+            self._small_window_mean.add(new_detection.rate_detected)
+            self._long_window_mean.add(new_detection.rate_detected)
+            self.rate_at_site = self._small_window_mean.get_mean()
+            self.rate_at_site_long = self._long_window_mean.get_mean()
             self._latest_detection_date = detect_date
             if isnan(self.rate_at_site):
                 self.rate_at_site = 0
@@ -19,11 +19,13 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 ------------------------------------------------------------------------------
 """
 
-from datetime import date
+from datetime import date, timedelta
 from scheduling.workplan import Workplan
 from virtual_world.sites import Site
 from scheduling.schedule_dataclasses import SiteSurveyReport, MinimalSurveyReport
 from scheduling.scheduled_survey_planner import ScheduledSurveyPlanner
+from scheduling.survey_due_calendar import SurveyDueCalendar
+from scheduling.survey_planner import SurveyPlanner
 from utils.queue import PriorityQueueWithFIFO
 
 
@@ -56,6 +58,13 @@ class GenericSchedule:
         self._survey_plans: list[ScheduledSurveyPlanner] = self._set_survey_plans(
             sim_start_date, sim_end_date, sites
         )
+        self._survey_plan_ords: dict[str, int] = {
+            survey_plan.get_site().get_id(): plan_ord
+            for plan_ord, survey_plan in enumerate(self._survey_plans)
+        }
+        self._due_calendar: SurveyDueCalendar = SurveyDueCalendar()
+        for plan_ord, survey_plan in enumerate(self._survey_plans):
+            self._due_calendar.schedule(plan_ord, survey_plan.get_next_due_date(sim_start_date))
 
     def _set_survey_plans(
         self, sim_start_date, sim_end_date, sites: list[Site]
@@ -104,6 +113,21 @@ class GenericSchedule:
             site (Site) : the Site to be added to the survey queue"""
         self._survey_queue.put(GenericSchedule.QUEUED_SURVEY_PRIORITY, survey_plan)
 
+    def reschedule_survey_plan(self, survey_plan: SurveyPlanner, current_date: date) -> None:
+        """Add a survey plan of the schedule back to the due calendar once its survey is done.
+        Other survey plans, such as follow-up plans, are not scheduled by date and are ignored.
+
+        Args:
+            survey_plan (SurveyPlanner): The survey plan of the completed survey
+            current_date (date): The date the survey was completed
+        """
+        plan_ord: int | None = self._survey_plan_ords.get(survey_plan.get_site().get_id())
+        if plan_ord is None or self._survey_plans[plan_ord] is not survey_plan:
+            return
+        self._due_calendar.schedule(
+            plan_ord, survey_plan.get_next_due_date(current_date + timedelta(days=1))
+        )
+
     def get_daily_sites_to_survey(self) -> "list[ScheduledSurveyPlanner]":
         """This method will go through the method survey queue and return
         the daily sites that are planned to be surveyed by the given method
@@ -126,15 +150,20 @@ class GenericSchedule:
 
     def get_workplan(self, current_date) -> Workplan:
         """
-        Updates the survey plans,
+        Updates the survey plans that come due,
         Adds necessary sites to the queue
         Returns:
             The list sites that the method should do on the given day
         """
-        for survey_plan in self._survey_plans:
+        for plan_ord in self._due_calendar.pop_due(current_date):
+            survey_plan: ScheduledSurveyPlanner = self._survey_plans[plan_ord]
             survey_plan.update_date(current_date)
             if survey_plan.queue_site_for_survey():
                 self.add_to_survey_queue(survey_plan)
+            else:
+                self._due_calendar.schedule(
+                    plan_ord, survey_plan.get_next_due_date(current_date + timedelta(days=1))
+                )
         sites_to_survey: list[ScheduledSurveyPlanner] = self.get_daily_sites_to_survey()
         return Workplan(site_survey_plan_list=sites_to_survey, date=current_date)
 
@@ -157,6 +186,7 @@ class GenericSchedule:
                     self.add_previous_queued_to_survey_queue(planner)
             else:
                 planner.add_to_surveys_done(current_date)
+                self.reschedule_survey_plan(planner, current_date)
                 completed_sites.append(site_id)
         for site in completed_sites:
             completed_report = reports.pop(site)
@@ -240,6 +240,55 @@ class ScheduledSurveyPlanner(SurveyPlanner):
                 return True
         return False
 
+    def _get_deployable_years(self, from_date: date) -> list[int]:
+        return sorted(year for year in set(self._deployment_years) if year >= from_date.year)
+
+    def _get_first_deployable_day(
+        self, year: int, from_date: date, first_month: int = 1, first_day: int = 1
+    ) -> date | None:
+        """Get the first day of the given year, on or after both the from date and the given
+        month and day, that falls in a deployment month.
+        """
+        for month in sorted(set(self._deployment_months)):
+            if month < first_month or month < 1 or month > 12:
+                continue
+            day: int = first_day if month == first_month else 1
+            if year == from_date.year:
+                if month < from_date.month:
+                    continue
+                if month == from_date.month:
+                    day = max(day, from_date.day)
+            if day <= calendar.monthrange(year, month)[1]:
+                return date(year, month, day)
+        return None
+
+    def get_next_due_date(self, from_date: date) -> date | None:
+        """Get the first date, on or after the given date, that the site could be queued to be
+        surveyed, based on the deployment years and months, the surveys done each year and
+        the survey plan. Only valid while the site is not already queued.
+
+        Args:
+            from_date (date): The first date to consider.
+
+        Returns:
+            date | None: The date, or None if the site will not be queued again.
+        """
+        for year in self._get_deployable_years(from_date):
+            survey_counter: Survey_Counter = self._surveys_this_year.get(year)
+            if survey_counter is None:
+                # Years outside of the simulation are left to queue_site_for_survey
+                due_date: date | None = self._get_first_deployable_day(year, from_date)
+            elif survey_counter.Required_surveys <= survey_counter.Surveys_done:
+                continue
+            else:
+                planned_date: date = self._survey_plan[survey_counter.Surveys_done]
+                due_date = self._get_first_deployable_day(
+                    year, from_date, planned_date.month, planned_date.day
+                )
+            if due_date is not None:
+                return due_date
+        return None
+
     def unflag_for_queue(self) -> None:
         """Sets the queued flagged to false, use case is for when surveys are
         done and site is no longer a part of a queue
@@ -325,6 +374,16 @@ class StationarySurveyPlanner(ScheduledSurveyPlanner):
         # if site has already been queued, return false.
         return False
 
+    def get_next_due_date(self, from_date: date) -> date | None:
+        for year in self._get_deployable_years(from_date):
+            survey_counter: Survey_Counter = self._surveys_this_year.get(year)
+            if survey_counter is not None and survey_counter.Required_surveys <= 0:
+                continue
+            due_date: date | None = self._get_first_deployable_day(year, from_date)
+            if due_date is not None:
+                return due_date
+        return None
+
 
 @dataclass
 class Survey_Counter:
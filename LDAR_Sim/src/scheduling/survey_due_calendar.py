@@ -0,0 +1,61 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        survey_due_calendar
+Purpose: Contains the calendar of the dates the survey plans of a schedule next come due to
+be queued for survey.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import heapq
+from datetime import date
+
+
+class SurveyDueCalendar:
+    """A heap of the dates the survey plans of a schedule next come due, so that each day only
+    the plans that come due have to be checked.
+
+    Survey plans are referred to by their position in the schedule's list of survey plans.
+    The plans that come due on the same day are returned in that order, which is the order the
+    schedule would have queued them in when checking every plan.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[date, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, plan_ord: int, due_date: date | None) -> None:
+        """Add a survey plan to the calendar. Plans that will not come due again are not added.
+
+        Args:
+            plan_ord (int): The position of the survey plan in the schedule.
+            due_date (date | None): The next date the plan could come due, or None.
+        """
+        if due_date is not None:
+            heapq.heappush(self._heap, (due_date, plan_ord))
+
+    def pop_due(self, current_date: date) -> list[int]:
+        """Remove and return every survey plan due on or before the given date
+
+        Returns:
+            list[int]: The positions of the survey plans that are due, in schedule order
+        """
+        due: list[int] = []
+        while self._heap and self._heap[0][0] <= current_date:
+            due.append(heapq.heappop(self._heap)[1])
+        due.sort()
+        return due
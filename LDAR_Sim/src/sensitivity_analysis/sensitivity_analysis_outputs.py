@@ -26,7 +26,7 @@ from typing import Any
 
 import pandas as pd
 from constants import sensitivity_analysis_constants, file_name_constants, output_file_constants
-from file_processing.output_processing import output_utils
+from file_processing.output_processing import output_file_io, output_utils
 
 
 def gen_true_vs_est_emissions_sens(
@@ -37,7 +37,7 @@ def gen_true_vs_est_emissions_sens(
             sensitivity_analysis_constants.SensitivityAnalysisOutputs
         ).TrueEstimatedEmisionsSens.COLUMNS
     )
-    emis_data: pd.DataFrame = pd.read_csv(
+    emis_data: pd.DataFrame = output_file_io.read_output_file(
         os.path.join(
             dir.path, file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY + ".csv"
         )
@@ -22,7 +22,7 @@
 from pathlib import Path
 import pandas as pd
 from constants import sensitivity_analysis_constants
-from file_processing.output_processing import summary_output_helpers
+from file_processing.output_processing import output_file_io, summary_output_helpers
 
 
 def process_confidence_interval(ci: list[float] | float) -> tuple[float, float]:
@@ -77,7 +77,9 @@ def gen_true_vs_est_sens_cis(output_dir: str, data_source: str, **kwargs) -> pd.
     ) = sensitivity_analysis_constants.SensitivityAnalysisOutputs.SensitivityTrueVsEstimatedCIs(
         upper_ci, lower_ci
     )
-    sens_data: pd.DataFrame = pd.read_csv(Path(output_dir) / (data_source + ".csv"))
+    sens_data: pd.DataFrame = output_file_io.read_output_file(
+        Path(output_dir) / (data_source + ".csv")
+    )
     # Get the unique sensitivity sets
     sensitivity_sets: pd.Series = sens_data[
         (
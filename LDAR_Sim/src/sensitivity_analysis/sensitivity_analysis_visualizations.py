@@ -28,7 +28,7 @@ import numpy as np
 import pandas as pd
 import seaborn as sns
 from constants import sensitivity_analysis_constants
-from file_processing.output_processing import output_utils
+from file_processing.output_processing import output_file_io, output_utils
 from matplotlib import pyplot as plt
 from matplotlib import ticker
 from sensitivity_analysis import sensitivity_visualization_helpers
@@ -37,7 +37,7 @@ from sensitivity_analysis import sensitivity_visualization_helpers
 def gen_true_vs_est_emissions_percent_difference_sens_viz(
     out_dir: str,
 ):
-    data_source: pd.DataFrame = pd.read_csv(
+    data_source: pd.DataFrame = output_file_io.read_output_file(
         os.path.join(
             out_dir,
             (
@@ -105,7 +105,7 @@ def gen_true_vs_est_emissions_percent_difference_sens_viz(
 
 
 def gen_true_vs_est_emissions_violin_sens_viz(out_dir: str):
-    data_source: pd.DataFrame = pd.read_csv(
+    data_source: pd.DataFrame = output_file_io.read_output_file(
         os.path.join(
             out_dir,
             (
@@ -45,28 +45,20 @@ class DefaultSiteLevelSensor(DefaultSensor):
         )
 
     def detect_emissions(self, site: Site, meth_name: str, survey_report: SiteSurveyReport) -> bool:
-        detectable_emissions: dict[str, dict[str, list[Emission]]] = site.get_detectable_emissions(
+        detectable_emissions: list[Emission]
+        site_level_emission_rate: float
+        detectable_emissions, site_level_emission_rate = site.get_detectable_site_emissions(
             method_name=meth_name
         )
-        site_level_emission_rate: float = sum(
-            [
-                emission.get_rate()
-                for eq_emis_list in detectable_emissions.values()
-                for emis_list in eq_emis_list.values()
-                for emission in emis_list
-            ]
-        )
 
         emissions_detected: bool = self._rate_detected(site_level_emission_rate)
 
         if emissions_detected:
             site_level_measured_rate: float = self._measure_rate(site_level_emission_rate)
-            for eq_emis_list in detectable_emissions.values():
-                for emis_list in eq_emis_list.values():
-                    for emission in emis_list:
-                        emission.update_detection_records(
-                            company=meth_name, detect_date=survey_report.survey_completion_date
-                        )
+            for emission in detectable_emissions:
+                emission.update_detection_records(
+                    company=meth_name, detect_date=survey_report.survey_completion_date
+                )
         else:
             site_level_measured_rate: float = 0.0
 
@@ -24,6 +24,7 @@ import copy
 from math import floor
 import os
 from pathlib import Path
+from typing import Any
 
 
 from ldar_sim import LdarSim
@@ -31,6 +32,7 @@ from programs.program import Program
 
 from constants import param_default_const as pdc
 from constants.output_messages import RuntimeMessages as rm
+from initialization.initialize_emissions import read_in_emissions
 from virtual_world.infrastructure import Infrastructure
 
 
@@ -39,6 +41,42 @@ from datetime import date
 
 import gc
 
+# The infrastructure of a simulation worker process and the simulation whose emissions are
+# currently loaded into it. Set once per worker by the initializer of the simulation pool, so
+# the infrastructure is inherited by (or sent once to) each worker instead of being pickled
+# with every program.
+_worker_infrastructure: Infrastructure = None
+_worker_generator_dir: Path = None
+_worker_sim_start_date: date = None
+_worker_simulation_number: int = None
+
+
+def init_simulation_worker(
+    infrastructure: Infrastructure, generator_dir: Path, sim_start_date: date
+) -> None:
+    """Set the infrastructure that programs run by the worker process are copied from,
+    along with the directory the pregenerated emissions of each simulation are read from.
+    """
+    global _worker_infrastructure, _worker_generator_dir, _worker_sim_start_date
+    global _worker_simulation_number
+    _worker_infrastructure = infrastructure
+    _worker_generator_dir = generator_dir
+    _worker_sim_start_date = sim_start_date
+    _worker_simulation_number = None
+
+
+def get_worker_infrastructure(sim_num: int) -> Infrastructure:
+    """Get the infrastructure of the worker process with the emissions of the given
+    simulation, only reading the emissions in when the simulation changes.
+    """
+    global _worker_simulation_number
+    if _worker_simulation_number != sim_num:
+        read_in_emissions(
+            _worker_infrastructure, _worker_generator_dir, sim_num, _worker_sim_start_date
+        )
+        _worker_simulation_number = sim_num
+    return _worker_infrastructure
+
 
 def batch_simulations(simulation_count: int) -> list[int]:
     if simulation_count > 5:
@@ -69,8 +107,13 @@ def simulate(
     preseed_timeseries,
     lock,
     prog_measured_df,
-):
-    if lock is not None:
+    write_program_outputs: bool = True,
+) -> dict[str, dict[str, Any]]:
+    if infrastructure is None:
+        infrastructure = get_worker_infrastructure(sim_num)
+    if sim_settings[pdc.Sim_Setting_Params.SHARED_INFRA]:
+        infra = infrastructure.get_program_copy(sim_num)
+    elif lock is not None:
         with lock:
             infra = copy.deepcopy(infrastructure)
     else:
@@ -101,11 +144,26 @@ def simulate(
         output_dir,
         preseed_timeseries,
         prog_measured_df,
+        write_program_outputs,
     )
-    simulation.run_simulation()
+    program_summaries: dict[str, dict[str, Any]] = simulation.run_simulation()
     print(rm.FIN_PROG.format(prog_name=prog_name))
     gc.collect()
-    return
+    return program_summaries
+
+
+def simulate_program_task(program_data: tuple) -> tuple[int, str, dict[str, dict[str, Any]]]:
+    """Run a single (simulation, program) task of the simulation pool
+
+    Args:
+        program_data (tuple): The arguments of simulate
+
+    Returns:
+        tuple[int, str, dict[str, dict[str, Any]]]: The simulation number and name of the
+        program that was run, and the summary rows of its outputs
+    """
+    program_summaries: dict[str, dict[str, Any]] = simulate(*program_data)
+    return program_data[2], program_data[3], program_summaries
 
 
 def remove_non_preseed_files(directory):
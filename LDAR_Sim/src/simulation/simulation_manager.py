@@ -35,6 +35,7 @@ from constants.error_messages import Runtime_Error_Messages as rem
 from constants.file_name_constants import Generator_Files, Output_Files
 from constants.output_messages import RuntimeMessages as rm
 from file_processing.input_processing.input_manager import InputManager
+from file_processing.output_processing.output_file_io import check_output_format
 from file_processing.output_processing.summary_output_helpers import get_non_baseline_prog_names
 from file_processing.output_processing.summary_output_manager import SummaryOutputManager
 from file_processing.output_processing.summary_visualization_manager import (
@@ -45,7 +46,12 @@ from initialization.initialize_emissions import initialize_emissions, read_in_em
 from initialization.initialize_infrastructure import initialize_infrastructure
 from initialization.preseed import gen_seed_emis
 from log_utils.logging_config import setup_logging_to_output
-from simulation.simulation_helpers import batch_simulations, simulate
+from simulation.simulation_helpers import (
+    batch_simulations,
+    init_simulation_worker,
+    simulate,
+    simulate_program_task,
+)
 from utils.generic_functions import check_ERA5_file
 from utils.prog_method_measured_func import (
     filter_deployment_tf_by_program_methods,
@@ -138,6 +144,10 @@ class SimulationManager:
 
     def check_inputs(self) -> None:
         check_ERA5_file(self.in_dir, self.virtual_world)
+        program_outputs: dict = self.output_params[pdc.Output_Params.PROGRAM_OUTPUTS]
+        program_outputs[pdc.Output_Params.PROGRAM_OUTPUT_FORMAT] = check_output_format(
+            program_outputs[pdc.Output_Params.PROGRAM_OUTPUT_FORMAT]
+        )
         has_base: bool = self.base_program in self.programs
 
         if not (has_base):
@@ -190,7 +200,7 @@ class SimulationManager:
 
         self.infrastructure.gen_site_measured_tf_data(self.methods, self.site_measurement_matrix)
 
-    def setup_emissions(self) -> None:
+    def setup_emissions(self, DEBUG: bool = False) -> None:
         print(rm.INIT_EMISS)
         self.seed_timeseries = initialize_emissions(
             self.simulation_count,
@@ -202,11 +212,12 @@ class SimulationManager:
             self.sim_end_date,
             self.generator_dir,
             pre_simulation_emissions=self.pre_simulation_emissions,
+            n_processes=1 if DEBUG else self.sim_params[pdc.Sim_Setting_Params.PROCESS],
         )
 
     def setup_weather(self) -> None:
         print(rm.INIT_WEATHER)
-        self.weather = WL(self.virtual_world, self.in_dir)
+        self.weather = WL(self.virtual_world, self.in_dir, self.generator_dir)
         self.infrastructure.set_weather_index(self.weather)
 
     def setup_daylight(self) -> None:
@@ -215,7 +226,20 @@ class SimulationManager:
             self.infrastructure.get_site_avrg_lat_lon(),
             self.sim_start_date,
             self.sim_end_date,
+            self.generator_dir,
         )
+        if any(
+            method[pdc.Method_Params.CONSIDER_DAYLIGHT]
+            and method.get(pdc.Method_Params.LOCAL_DAYLIGHT, False)
+            for method in self.methods.values()
+        ):
+            self.daylight.set_local_daylight(
+                self.weather,
+                self.infrastructure.get_weather_cells(),
+                self.sim_start_date,
+                self.sim_end_date,
+                self.generator_dir,
+            )
 
     def calc_simulation_years(self) -> None:
         self.simulation_years = [
@@ -234,11 +258,16 @@ class SimulationManager:
             for simulation in range(sim_count):
                 simulation_number: int = batch_count * 5 + simulation
                 print(rm.SIM_SET.format(simulation_number=simulation_number))
+                infra: Infrastructure = read_in_emissions(
+                    self.infrastructure, self.generator_dir, simulation_number, self.sim_start_date
+                )
                 program_data: list[Tuple] = self._setup_programs(
-                    simulation_number=simulation_number
+                    simulation_number=simulation_number,
+                    infra=infra,
+                    write_program_outputs=self.write_program_outputs(batch_count),
                 )
                 for program in program_data:
-                    simulate(*program)
+                    self.summary_stats_manager.add_program_summaries(simulate(*program))
                 print(rm.FIN_SIM_SET.format(simulation_number=simulation_number))
             print(rm.BATCH_CLEAN.format(batch_count=batch_count))
             self.summary_stats_manager.gen_summary_outputs(
@@ -246,39 +275,60 @@ class SimulationManager:
             )
 
     def _run_simulation_multiprocessing(self, sim_counts: list[int]) -> None:
-        n_processes: int = self.sim_params[pdc.Sim_Setting_Params.PROCESS]
-        if len(self.programs) < n_processes:
-            n_processes = len(self.programs)
-        with mp.Manager() as manager:
-            lock = manager.Lock()
+        # Every (simulation, program) pair of a batch is run as its own task on a single
+        # pool, kept for the whole run. Workers read in the emissions of each simulation
+        # themselves, so the infrastructure is only sent to each worker once.
+        n_processes: int = min(
+            self.sim_params[pdc.Sim_Setting_Params.PROCESS],
+            max(sim_counts) * len(self.programs),
+        )
+        with mp.Pool(
+            processes=n_processes,
+            initializer=init_simulation_worker,
+            initargs=(self.infrastructure, self.generator_dir, self.sim_start_date),
+        ) as p:
             for batch_count, sim_count in enumerate(sim_counts):
+                program_data: list[Tuple] = []
+                remaining_programs: dict[int, int] = {}
                 for simulation in range(sim_count):
                     simulation_number: int = batch_count * 5 + simulation
                     print(rm.SIM_SET.format(simulation_number=simulation_number))
-                    program_data: list[Tuple] = self._setup_programs(
-                        simulation_number=simulation_number, lock=lock
-                    )
-                    with mp.Pool(processes=n_processes) as p:
-                        _ = p.starmap(
-                            simulate,
-                            program_data,
+                    program_data.extend(
+                        self._setup_programs(
+                            simulation_number=simulation_number,
+                            infra=None,
+                            write_program_outputs=self.write_program_outputs(batch_count),
                         )
-                    gc.collect()
-                    print(rm.FIN_SIM_SET.format(simulation_number=simulation_number))
+                    )
+                    remaining_programs[simulation_number] = len(self.programs)
+                # Workers return the summary rows of the program outputs instead of the
+                # summaries being generated from the program output files
+                for simulation_number, _, program_summaries in p.imap_unordered(
+                    simulate_program_task, program_data
+                ):
+                    self.summary_stats_manager.add_program_summaries(program_summaries)
+                    remaining_programs[simulation_number] -= 1
+                    if remaining_programs[simulation_number] == 0:
+                        print(rm.FIN_SIM_SET.format(simulation_number=simulation_number))
+                gc.collect()
                 print(rm.BATCH_CLEAN.format(batch_count=batch_count))
                 self.summary_stats_manager.gen_summary_outputs(
                     batch_count != 0 and (not self.keep_all_program_outputs)
                 )
 
+    def write_program_outputs(self, batch_count: int) -> bool:
+        """The program outputs of the first batch of simulations are always kept, the outputs
+        of later batches only when all program outputs are kept.
+        """
+        return batch_count == 0 or self.keep_all_program_outputs
+
     def _setup_programs(
         self,
         simulation_number: int,
+        infra: Infrastructure,
         lock=None,
+        write_program_outputs: bool = True,
     ) -> None:
-        # read in pregen emissions
-        infra: Infrastructure = read_in_emissions(
-            self.infrastructure, self.generator_dir, simulation_number
-        )
         prog_data: list = []
         for program in self.programs:
             meth_params = {}
@@ -304,6 +354,7 @@ class SimulationManager:
                     self.seed_timeseries,
                     lock,
                     prog_measured_df,
+                    write_program_outputs,
                 )
             )
         return prog_data
@@ -45,6 +45,13 @@ class TimeCounter:
         self.current_date += timedelta(days=1)
         return
 
+    def get_simulation_length(self) -> int:
+        """
+        Number of days in the simulation, including the start and end dates
+
+        """
+        return (self._end_date - self._start_date).days + 1
+
     def at_simulation_end(self) -> bool:
         if self.current_date > self._end_date:
             return True
@@ -18,6 +18,7 @@
 #
 # ------------------------------------------------------------------------------
 
+import hashlib
 import logging
 import os
 import sys
@@ -57,6 +58,19 @@ def check_ERA5_file(dir, v_world):
         print(rm.COMPLETE_WEATHER_DOWNLOAD)
 
 
+def hash_file(file_path) -> str:
+    # Construct the hasher object
+    hasher: hashlib._Hash = hashlib.md5()
+
+    # Open the file to hash
+    with open(file_path, "rb") as f:
+        # Add bytes from the file to the hasher chunk by chunk
+        for chunk in iter(lambda: f.read(4096), b""):
+            hasher.update(chunk)
+    # Return the string containing the hex representation of the hash
+    return hasher.hexdigest()
+
+
 def find_closest_index_numpy(arr, x):
     idx = np.searchsorted(arr, x)
     if idx == len(arr):
@@ -70,3 +84,14 @@ def find_closest_index_numpy(arr, x):
             return idx - 1
         else:
             return idx
+
+
+def find_closest_indexes_numpy(arr, xs) -> np.ndarray:
+    """Vectorized find_closest_index_numpy, finding the closest index of every value at once"""
+    xs = np.asarray(xs, dtype=np.float64)
+    idx = np.searchsorted(arr, xs)
+    before_idx = np.clip(idx - 1, 0, len(arr) - 1)
+    after_idx = np.clip(idx, 0, len(arr) - 1)
+    before = np.abs(arr[before_idx].astype(np.float64) - xs)
+    after = np.abs(arr[after_idx].astype(np.float64) - xs)
+    return np.where((idx > 0) & ((idx == len(arr)) | (before < after)), before_idx, after_idx)
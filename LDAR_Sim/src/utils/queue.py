@@ -2,7 +2,7 @@
 ------------------------------------------------------------------------------
 Program:     The LDAR Simulator (LDAR-Sim)
 File:        queue
-Purpose: Module for extending the python queue module
+Purpose: Module for the priority queues used while simulating
 
 This program is free software: you can redistribute it and/or modify
 it under the terms of the MIT License as published
@@ -18,11 +18,36 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 ------------------------------------------------------------------------------
 """
 
+import heapq
 import queue
 import itertools
 
 
-class PriorityQueueWithFIFO(queue.PriorityQueue):
+class HeapPriorityQueue:
+    """A priority queue with the put, get and empty methods of queue.PriorityQueue, backed by
+    a heapq list. Simulations run in a single thread, so the queues used while simulating do
+    not need the locking done by queue.PriorityQueue.
+    """
+
+    def __init__(self):
+        self._heap: list = []
+
+    def put(self, item):
+        heapq.heappush(self._heap, item)
+
+    def get(self):
+        if not self._heap:
+            raise queue.Empty
+        return heapq.heappop(self._heap)
+
+    def empty(self) -> bool:
+        return not self._heap
+
+    def qsize(self) -> int:
+        return len(self._heap)
+
+
+class PriorityQueueWithFIFO(HeapPriorityQueue):
     def __init__(self):
         super().__init__()
         self.counter = itertools.count()
@@ -31,3 +56,87 @@ class PriorityQueueWithFIFO(queue.PriorityQueue):
         # Add a tie-breaker using a secondary counter
         entry = (priority, next(self.counter), item)
         super().put(entry)
+
+
+class IndexedPriorityQueueWithFIFO(PriorityQueueWithFIFO):
+    """A priority queue with the same ordering as PriorityQueueWithFIFO, where items can also
+    be looked up, removed or reprioritized by a key, such as their site ID.
+
+    Removed entries are left in the heap and skipped when they reach the top, so that
+    putting, getting, removing and reprioritizing items are all O(log n).
+    """
+
+    def __init__(self, key_func):
+        super().__init__()
+        # Returns the key of an item, must be a module level function to be pickled
+        self._key_func = key_func
+        # The count, priority and item of the entries in the queue for each key
+        self._entries: dict = {}
+        self._removed: set[int] = set()
+
+    def put(self, priority, item):
+        count: int = next(self.counter)
+        heapq.heappush(self._heap, (priority, count, item))
+        self._entries.setdefault(self._key_func(item), {})[count] = (priority, item)
+
+    def _discard_removed(self) -> None:
+        while self._heap and self._heap[0][1] in self._removed:
+            self._removed.remove(heapq.heappop(self._heap)[1])
+
+    def empty(self) -> bool:
+        self._discard_removed()
+        return not self._heap
+
+    def qsize(self) -> int:
+        return len(self._heap) - len(self._removed)
+
+    def get(self):
+        self._discard_removed()
+        entry: tuple = super().get()
+        key = self._key_func(entry[2])
+        key_entries: dict = self._entries[key]
+        del key_entries[entry[1]]
+        if not key_entries:
+            del self._entries[key]
+        return entry
+
+    def get_item(self, key):
+        """Get the item with the given key, without removing it from the queue
+
+        Returns:
+            The item that would be returned last, or None if there is none
+        """
+        key_entries: dict = self._entries.get(key)
+        if key_entries is None:
+            return None
+        _, last_count = max((priority, count) for count, (priority, _) in key_entries.items())
+        return key_entries[last_count][1]
+
+    def remove(self, key):
+        """Remove every item with the given key from the queue
+
+        Returns:
+            The removed item that would have been returned last, or None if there was none
+        """
+        item = self.get_item(key)
+        key_entries: dict = self._entries.pop(key, None)
+        if key_entries is None:
+            return None
+        self._removed.update(key_entries)
+        if len(self._removed) > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if entry[1] not in self._removed]
+            heapq.heapify(self._heap)
+            self._removed.clear()
+        return item
+
+    def reprioritize(self, key, priority):
+        """Move the item with the given key to a new priority. The item is queued behind the
+        items already in the queue with the same priority, as if it were put again.
+
+        Returns:
+            The reprioritized item, or None if there was none
+        """
+        item = self.remove(key)
+        if item is not None:
+            self.put(priority, item)
+        return item
@@ -0,0 +1,100 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        rolling_mean
+Purpose: Module for a rolling mean that is updated one value at a time
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from collections import deque
+from math import copysign, nan
+
+
+class RollingMean:
+    """The mean of the last `window` values added, only keeping those values.
+
+    The running sum is updated the same way as pandas' rolling mean, with compensated
+    additions and removals, so get_mean returns exactly the last value of
+    pd.Series(values).rolling(window=window, min_periods=window).mean() over every value
+    added, without keeping the full history.
+    """
+
+    def __init__(self, window: int) -> None:
+        self._window: int = window
+        self._values: deque[float] = deque(maxlen=max(window, 0))
+        self._restart()
+
+    def _restart(self) -> None:
+        self._sum: float = 0.0
+        self._compensation_add: float = 0.0
+        self._compensation_remove: float = 0.0
+        self._nobs: int = 0
+        self._neg_ct: int = 0
+        self._num_consecutive_same_value: int = 0
+        self._prev_value: float = nan
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            return
+        self._nobs += 1
+        y: float = value - self._compensation_add
+        t: float = self._sum + y
+        self._compensation_add = t - self._sum - y
+        self._sum = t
+        if copysign(1.0, value) < 0:
+            self._neg_ct += 1
+        # Counting repeated values removes floating point artifacts from constant windows
+        if value == self._prev_value:
+            self._num_consecutive_same_value += 1
+        else:
+            self._num_consecutive_same_value = 1
+        self._prev_value = value
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            return
+        self._nobs -= 1
+        y: float = -value - self._compensation_remove
+        t: float = self._sum + y
+        self._compensation_remove = t - self._sum - y
+        self._sum = t
+        if copysign(1.0, value) < 0:
+            self._neg_ct -= 1
+
+    def add(self, value: float) -> None:
+        value = float(value)
+        if self._window <= 1:
+            # Consecutive windows do not overlap, so the sum is started over
+            self._restart()
+            self._prev_value = value
+            self._num_consecutive_same_value = 0
+        elif len(self._values) == self._window:
+            self._remove(self._values[0])
+        if self._window > 0:
+            self._values.append(value)
+            self._add(value)
+
+    def get_mean(self) -> float:
+        """Get the mean of the window, NaN until the window has been filled"""
+        if self._nobs < self._window or self._nobs <= 0:
+            return nan
+        if self._num_consecutive_same_value >= self._nobs:
+            return self._prev_value
+        mean: float = self._sum / self._nobs
+        if self._neg_ct == 0 and mean < 0:
+            return 0.0
+        if self._neg_ct == self._nobs and mean > 0:
+            return 0.0
+        return mean
@@ -22,7 +22,7 @@ from copy import deepcopy
 from datetime import date
 import logging
 import re
-from typing import Any
+from typing import Any, Iterator
 import sys
 import pandas as pd
 from file_processing.output_processing.output_utils import (
@@ -43,6 +43,11 @@ from virtual_world.sources import Source
 
 
 class Component:
+    # Set per simulation when the columnar emission state store is in use
+    _emis_state_store = None
+    # Set per program once the site of the component has been surveyed
+    _emission_index = None
+
     def __init__(self, equip_type, equip_id, infrastructure_inputs, prop_params) -> None:
         STR_FILTER = r"_equipment"
         pattern: re.Pattern[str] = re.compile(re.escape(STR_FILTER), re.IGNORECASE)
@@ -84,9 +89,34 @@ class Component:
         instance.emis_sum_dtypes = emis_sum_dtypes
         return instance
 
+    def get_program_copy(self, sim_number: int) -> "Component":
+        """Copy the component for a program, with its own sources and emissions for the
+        given simulation.
+        """
+        return self._reconstruct(
+            self._equip_type,
+            self._component_ID,
+            [src.get_program_copy(sim_number) for src in self._sources],
+            [emission.get_program_copy() for emission in self._active_emissions],
+            [emission.get_program_copy() for emission in self._inactive_emissions],
+            dict(self.emis_sum_dtypes),
+        )
+
+    def set_emis_state_store(self, emis_state_store) -> None:
+        """Register the columnar store that tracks the daily state of the component emissions.
+        The store is simulation specific and is not carried over when pickling.
+        """
+        self._emis_state_store = emis_state_store
+
+    def set_emission_index(self, emission_index) -> None:
+        """Register the index of the active emissions of the site of the component.
+        The index is program specific and is not carried over when pickling.
+        """
+        self._emission_index = emission_index
+
     def set_emis_sum_dtypes(self, methods: list[str]):
-        self.emis_sum_dtypes = Emission.EMIS_SUMMARY_DTYPES
-        method_spat_dtypes = {method: "bool" for method in methods}
+        self.emis_sum_dtypes = dict(Emission.EMIS_SUMMARY_DTYPES)
+        method_spat_dtypes = {eca.SPATIAL_COV.format(method=method): "bool" for method in methods}
         self.emis_sum_dtypes.update(method_spat_dtypes)
 
     # def _get_methods_for_dtype(self, prop_params) -> dict[str, str]:
@@ -181,18 +211,35 @@ class Component:
             sim_number (int): The simulation number.
             Used to interact with the correct set of emissions.
         """
+        return self.activate_source_emissions(self._sources, date, sim_number)
+
+    def activate_source_emissions(self, sources: list[Source], date: date, sim_number: int) -> int:
+        """Activate the emissions of the given sources of the component that are due to begin
+        on the current date, and add them to the active emissions list of the component.
+
+        Args:
+            sources (list[Source]): The sources to activate emissions for, in source order.
+            date (date): The current date in simulation.
+            sim_number (int): The simulation number.
+            Used to interact with the correct set of emissions.
+        """
         new_emissions_count: int = 0
         new_emissions_list: list[Emission] = []
-        for source in self._sources:
+        for source in sources:
             new_emissions: list[Emission] = source.activate_emissions(date, sim_number)
             new_emissions_list.extend(new_emissions)
 
         new_emissions_count += len(new_emissions_list)
         self._active_emissions.extend(new_emissions_list)
+        if self._emis_state_store is not None:
+            self._emis_state_store.add_emissions(self, new_emissions_list)
+        if self._emission_index is not None:
+            self._emission_index.add_emissions(self, new_emissions_list)
         return new_emissions_count
 
     def update_emissions_state(self, emis_rep_info: EmisInfo, emis_data: TsEmisData) -> None:
         updated_active_emissions: list[Emission] = []
+        deactivated_emissions: list[Emission] = []
         for emission in self._active_emissions:
             if emission.update(emis_rep_info):
                 updated_active_emissions.append(emission)
@@ -203,16 +250,31 @@ class Component:
                     emis_data.daily_emis_non_mit += emis_total_daily
                 emis_data.daily_emis += emis_total_daily
             else:
-                self._inactive_emissions.append(emission)
+                deactivated_emissions.append(emission)
+        self._inactive_emissions.extend(deactivated_emissions)
+        if self._emission_index is not None:
+            self._emission_index.remove_emissions(deactivated_emissions)
         self._active_emissions = updated_active_emissions
         emis_data.active_leaks += len(self._active_emissions)
 
+    def deactivate_emissions(self, emissions: list[Emission]) -> None:
+        """Move emissions that are no longer active to the inactive emissions list.
+        Used by the emission state store in place of update_emissions_state.
+        """
+        deactivated: set[int] = {id(emission) for emission in emissions}
+        self._active_emissions = [
+            emission for emission in self._active_emissions if id(emission) not in deactivated
+        ]
+        self._inactive_emissions.extend(emissions)
+        if self._emission_index is not None:
+            self._emission_index.remove_emissions(emissions)
+
     def tag_emissions(self, tagging_info: TaggingInfo) -> None:
         # TODO improve this logic
         emission_rate = tagging_info.measured_rate / len(self._active_emissions)
         for emission in self._active_emissions:
             if isinstance(emission, RepairableEmission):
-                emission.tag_leak(
+                newly_tagged: bool = emission.tag_leak(
                     measured_rate=emission_rate,
                     cur_date=tagging_info.curr_date,
                     t_since_ldar=tagging_info.t_since_LDAR,
@@ -220,6 +282,8 @@ class Component:
                     crew_id=tagging_info.crew,
                     tagging_rep_delay=tagging_info.report_delay,
                 )
+                if newly_tagged and self._emis_state_store is not None:
+                    self._emis_state_store.tag_emission(emission, tagging_info.report_delay)
                 emission.update_detection_records(
                     company=tagging_info.company, detect_date=tagging_info.curr_date
                 )
@@ -251,23 +315,14 @@ class Component:
     def get_id(self) -> str:
         return self._component_ID
 
-    def gen_emis_data(
-        self, emis_df: pd.DataFrame, site_id: str, eqg_id: str, row_index: int, end_date: date
-    ) -> int:
-        upd_row_index = row_index
-        for emission in self._active_emissions:
-            summary_dict: dict[str, Any] = emission.get_summary_dict(end_date)
-            summary_dict.update(
-                {eca.SITE_ID: site_id, eca.EQG: eqg_id, eca.COMP: self._component_ID}
-            )
-            emis_df.loc[upd_row_index] = summary_dict
-            upd_row_index += 1
-
-        for emission in self._inactive_emissions:
-            summary_dict: dict[str, Any] = emission.get_summary_dict(end_date)
-            summary_dict.update(
-                {eca.SITE_ID: site_id, eca.EQG: eqg_id, eca.COMP: self._component_ID}
-            )
-            emis_df.loc[upd_row_index] = summary_dict
-            upd_row_index += 1
-        return upd_row_index
+    def gen_emis_data(self, site_id: str, eqg_id: str, end_date: date) -> Iterator[dict[str, Any]]:
+        location: dict[str, str] = {
+            eca.SITE_ID: site_id,
+            eca.EQG: eqg_id,
+            eca.COMP: self._component_ID,
+        }
+        for emissions in (self._active_emissions, self._inactive_emissions):
+            for emission in emissions:
+                summary_dict: dict[str, Any] = emission.get_summary_dict(end_date)
+                summary_dict.update(location)
+                yield summary_dict
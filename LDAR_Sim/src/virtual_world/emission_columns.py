@@ -0,0 +1,50 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        emission_columns.py
+Purpose: Contains the helpers shared by the NumPy column stores of active emissions, used
+to keep their results the same as the object model.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import numpy as np
+
+
+def get_traversal_order(live_slots: np.ndarray, comp_ords: np.ndarray) -> np.ndarray:
+    """Order the live emission slots the way the object model traverses the emissions.
+
+    Slots are assigned in activation order, so a stable sort on the component ordinal
+    reproduces the site -> equipment group -> component traversal order.
+
+    Args:
+        live_slots (np.ndarray): The slots of the active emissions, in slot order
+        comp_ords (np.ndarray): The component ordinal of every slot
+
+    Returns:
+        np.ndarray: The live slots in traversal order
+    """
+    return live_slots[np.argsort(comp_ords[live_slots], kind="stable")]
+
+
+def sum_in_sequence(values: np.ndarray) -> float:
+    """Sum the values one after the other, so that the result matches a running total
+    over the emissions instead of the pairwise summation of np.sum.
+
+    Returns:
+        float: The sum of the values, 0.0 if there are none
+    """
+    if not len(values):
+        return 0.0
+    return np.cumsum(values)[-1]
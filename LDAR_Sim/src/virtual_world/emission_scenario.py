@@ -0,0 +1,206 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        emission_scenario.py
+Purpose: Contains the columnar emission scenario used to store the pregenerated emissions
+of a simulation, and the activation calendar built from it.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from virtual_world.emission_types.emission import Emission
+
+
+class EmissionScenario:
+    """The pregenerated emissions of a single simulation, stored as one record per emission.
+
+    Records are ordered by source (in site, equipment group, component and source order)
+    and, for each source, in the order the emissions will be activated. Only the values
+    drawn when the emissions were generated are stored; all other emission properties
+    (type, repair cost, duration, coverage probabilities) are taken from the source when
+    the emission is built.
+
+    Scenarios are saved as a single .npy file, which is memory mapped when read back in.
+    """
+
+    RECORD_DTYPE = np.dtype(
+        [
+            ("source", np.int32),
+            ("emission_n", np.int32),
+            # Days from the start of the simulation, negative for pre-existing emissions
+            ("start_day", np.int32),
+            ("rate", np.float64),
+            # NaN for emissions that cannot be repaired
+            ("repair_delay", np.float64),
+        ]
+    )
+
+    def __init__(self, records: np.ndarray, sim_start_date: date) -> None:
+        self._records: np.ndarray = records
+        self._sim_start_date: date = sim_start_date
+
+    def __deepcopy__(self, memo) -> "EmissionScenario":
+        # Scenarios are never modified once generated, so copies can share the records
+        return self
+
+    @classmethod
+    def from_source_emissions(
+        cls, source_emissions: list[list[Emission]], sim_start_date: date
+    ) -> "EmissionScenario":
+        """Build the scenario from the generated emissions of every source
+
+        Args:
+            source_emissions (list[list[Emission]]): The emissions of each source, in the order
+            of the sources of the infrastructure. As generated, the emissions of a source are
+            stored in reverse activation order.
+            sim_start_date (date): The start date of the simulation
+
+        Returns:
+            EmissionScenario: The scenario of the simulation
+        """
+        n_records: int = sum(len(emissions) for emissions in source_emissions)
+        records: np.ndarray = np.empty(n_records, dtype=cls.RECORD_DTYPE)
+        record: int = 0
+        for source_ord, emissions in enumerate(source_emissions):
+            for emission in reversed(emissions):
+                records[record] = (
+                    source_ord,
+                    int(emission._emissions_id),
+                    (emission._start_date - sim_start_date).days,
+                    emission._rate,
+                    getattr(emission, "_repair_delay", np.nan),
+                )
+                record += 1
+        return cls(records, sim_start_date)
+
+    @classmethod
+    def load(cls, filepath: Path, sim_start_date: date) -> "EmissionScenario":
+        return cls(np.load(filepath, mmap_mode="r"), sim_start_date)
+
+    def save(self, filepath: Path) -> None:
+        with open(filepath, "wb") as f:
+            np.save(f, self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get_sim_start_date(self) -> date:
+        return self._sim_start_date
+
+    def get_record(self, record: int) -> tuple[int, date, float, int | float | None]:
+        """Get the values of a single emission
+
+        Returns:
+            tuple[int, date, float, int | float | None]: The emission number, start date,
+            rate and repair delay of the emission
+        """
+        _, emission_n, start_day, rate, repair_delay = self._records[record].item()
+        if np.isnan(repair_delay):
+            repair_delay = None
+        elif repair_delay.is_integer():
+            repair_delay = int(repair_delay)
+        return (
+            emission_n,
+            self._sim_start_date + timedelta(days=start_day),
+            rate,
+            repair_delay,
+        )
+
+    def split_by_source(self, n_sources: int) -> list["SourceEmissionRecords"]:
+        """Split the scenario into the not yet activated emissions of each source"""
+        bounds: np.ndarray = np.searchsorted(
+            self._records["source"], np.arange(n_sources + 1), side="left"
+        )
+        return [
+            SourceEmissionRecords(self, int(bounds[source]), int(bounds[source + 1]))
+            for source in range(n_sources)
+        ]
+
+
+class SourceEmissionRecords:
+    """The emissions of a source that have not been activated yet, read from the emission
+    scenario one at a time. Takes the place of the list of generated emissions of a source,
+    so that emission objects are only built as the source reaches them.
+    """
+
+    def __init__(self, scenario: EmissionScenario, next_record: int, end_record: int) -> None:
+        self._scenario: EmissionScenario = scenario
+        self._next_record: int = next_record
+        self._end_record: int = end_record
+
+    def __len__(self) -> int:
+        return self._end_record - self._next_record
+
+    def get_sim_start_date(self) -> date:
+        return self._scenario.get_sim_start_date()
+
+    def pop(self) -> tuple[int, date, float, int | float | None]:
+        """Get the values of the next emission to be activated"""
+        record: tuple = self._scenario.get_record(self._next_record)
+        self._next_record += 1
+        return record
+
+    def get_program_copy(self) -> "SourceEmissionRecords":
+        return SourceEmissionRecords(self._scenario, self._next_record, self._end_record)
+
+
+class ActivationCalendar:
+    """The sources that have emissions due to be activated on each day of a simulation,
+    built from the emission scenario of the simulation.
+
+    Pre-existing emissions are due on the first day of the simulation. For each day, the
+    sources are stored in source order, so that the emissions activated on a day are added
+    to each component in the same order as when every source is checked.
+    """
+
+    def __init__(self, sim_start_date: date, day_bounds: np.ndarray, due_sources: np.ndarray):
+        self._sim_start_date: date = sim_start_date
+        # The sources due on day d are due_sources[day_bounds[d]:day_bounds[d + 1]]
+        self._day_bounds: np.ndarray = day_bounds
+        self._due_sources: np.ndarray = due_sources
+
+    def __deepcopy__(self, memo) -> "ActivationCalendar":
+        # Calendars are never modified once built, so copies can share the arrays
+        return self
+
+    @classmethod
+    def from_scenario(cls, scenario: EmissionScenario) -> "ActivationCalendar":
+        records: np.ndarray = scenario._records
+        if len(records) == 0:
+            return cls(
+                scenario.get_sim_start_date(), np.zeros(1, dtype=np.int64), np.zeros(0, np.int32)
+            )
+        sources: np.ndarray = np.asarray(records["source"], dtype=np.int64)
+        days: np.ndarray = np.maximum(np.asarray(records["start_day"], dtype=np.int64), 0)
+        n_sources: int = int(sources.max()) + 1
+        # A source is only listed once per day, however many of its emissions are due
+        due: np.ndarray = np.unique(days * n_sources + sources)
+        due_days: np.ndarray = due // n_sources
+        return cls(
+            scenario.get_sim_start_date(),
+            np.searchsorted(due_days, np.arange(due_days[-1] + 2), side="left"),
+            (due % n_sources).astype(np.int32),
+        )
+
+    def get_due_sources(self, current_date: date) -> np.ndarray:
+        """Get the index of every source with emissions due to begin on the given date"""
+        day: int = (current_date - self._sim_start_date).days
+        if day < 0 or day >= len(self._day_bounds) - 1:
+            return self._due_sources[:0]
+        return self._due_sources[self._day_bounds[day] : self._day_bounds[day + 1]]
@@ -0,0 +1,277 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        emission_state_store
+Purpose: The emission state store module. Provides a columnar, array backed
+alternative to updating the state of every active emission object individually.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import numpy as np
+
+from file_processing.output_processing.output_utils import EmisInfo, TsEmisData
+from virtual_world.component import Component
+from virtual_world.emission_columns import get_traversal_order, sum_in_sequence
+from virtual_world.emission_types.emission import Emission
+from virtual_world.emission_types.intermittency_mixin import IntermittencyMixin
+from virtual_world.emission_types.non_repairable_emissions import NonRepairableEmission
+from virtual_world.emission_types.repairable_emission import RepairableEmission
+from virtual_world.sites import Site
+
+
+class EmissionStateStore:
+    """Keeps the per day state of all active emissions of a simulation in NumPy columns.
+
+    The daily update, natural repair, repair and expiry checks are evaluated as vectorized
+    masks over all active emissions. The emission objects remain the source of truth for
+    everything that happens outside of the daily update (tagging, detection records,
+    summaries), and are only written back to when they change state or when
+    sync_to_emissions is called.
+
+    Emissions are processed in the same order as the object model (site, equipment group,
+    component, activation order), so the values reported, and any random draws made
+    while repairing, are identical to the object model for the same seed.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    COLUMN_DTYPES = {
+        "live": np.bool_,
+        "comp_ord": np.int64,
+        "daily_emis": np.float64,
+        "mitigable": np.bool_,
+        "is_rep": np.bool_,
+        "is_nonrep": np.bool_,
+        "intermittent": np.bool_,
+        "active_days": np.int64,
+        "days_b4_sim": np.int64,
+        "end_days": np.float64,
+        "repairable": np.bool_,
+        "tagged": np.bool_,
+        "days_since_tagged": np.int64,
+        "repair_delay": np.float64,
+        "tagging_rep_delay": np.float64,
+        "emitting": np.bool_,
+        "days_emitting": np.int64,
+        "emitting_period": np.int64,
+        "non_emitting_period": np.int64,
+        "active_dur": np.float64,
+        "inactive_dur": np.float64,
+    }
+
+    def __init__(self, sites: list[Site]) -> None:
+        self._components: list[Component] = [
+            comp for site in sites for eqg in site._equipment_groups for comp in eqg._component
+        ]
+        self._comp_ords: dict[int, int] = {
+            id(comp): comp_ord for comp_ord, comp in enumerate(self._components)
+        }
+        self._size: int = 0
+        self._cols: dict[str, np.ndarray] = {
+            col: np.zeros(self.INITIAL_CAPACITY, dtype=dtype)
+            for col, dtype in self.COLUMN_DTYPES.items()
+        }
+        self._emissions: list[Emission] = []
+        self._slots: dict[int, int] = {}
+        self._order: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._order_stale: bool = False
+        for comp in self._components:
+            comp.set_emis_state_store(self)
+            if comp._active_emissions:
+                self.add_emissions(comp, comp._active_emissions)
+
+    def _grow(self, required: int) -> None:
+        capacity: int = len(self._cols["live"])
+        if required <= capacity:
+            return
+        while capacity < required:
+            capacity *= 2
+        for col, arr in self._cols.items():
+            grown: np.ndarray = np.zeros(capacity, dtype=arr.dtype)
+            grown[: self._size] = arr[: self._size]
+            self._cols[col] = grown
+
+    def _compact(self) -> None:
+        """Drop the rows of emissions that are no longer active, keeping the row order"""
+        keep: np.ndarray = np.flatnonzero(self._cols["live"][: self._size])
+        for col, arr in self._cols.items():
+            arr[: len(keep)] = arr[keep]
+            arr[len(keep) : self._size] = 0
+        self._emissions = [self._emissions[slot] for slot in keep]
+        self._slots = {id(emis): slot for slot, emis in enumerate(self._emissions)}
+        self._size = len(keep)
+        self._order_stale = True
+
+    def _refresh_order(self) -> None:
+        live_slots: np.ndarray = np.flatnonzero(self._cols["live"][: self._size])
+        self._order = get_traversal_order(live_slots, self._cols["comp_ord"])
+        self._order_stale = False
+
+    def add_emissions(self, component: Component, emissions: list[Emission]) -> None:
+        """Add newly activated emissions at the given component to the store
+
+        Args:
+            component (Component): The component the emissions occur at.
+            emissions (list[Emission]): The emissions, in the order they were activated.
+        """
+        if not emissions:
+            return
+        start: int = self._size
+        self._grow(start + len(emissions))
+        cols: dict[str, np.ndarray] = self._cols
+        comp_ord: int = self._comp_ords[id(component)]
+        for slot, emission in enumerate(emissions, start=start):
+            self._emissions.append(emission)
+            self._slots[id(emission)] = slot
+            cols["live"][slot] = True
+            cols["comp_ord"][slot] = comp_ord
+            cols["daily_emis"][slot] = emission.get_daily_emis()
+            cols["mitigable"][slot] = emission._repairable
+            cols["active_days"][slot] = emission._active_days
+            cols["end_days"][slot] = np.inf
+            if isinstance(emission, RepairableEmission):
+                cols["is_rep"][slot] = True
+                cols["days_b4_sim"][slot] = emission._days_active_b4_sim
+                cols["end_days"][slot] = emission._nrd
+                cols["repairable"][slot] = emission._repairable
+                cols["tagged"][slot] = emission._tagged
+                cols["days_since_tagged"][slot] = emission._days_since_tagged
+                cols["repair_delay"][slot] = emission._repair_delay
+                cols["tagging_rep_delay"][slot] = emission._tagging_rep_delay
+            elif isinstance(emission, NonRepairableEmission):
+                cols["is_nonrep"][slot] = True
+                cols["days_b4_sim"][slot] = emission._days_active_b4_sim
+                cols["end_days"][slot] = emission._duration
+            if isinstance(emission, IntermittencyMixin):
+                cols["intermittent"][slot] = True
+                cols["emitting"][slot] = emission._emitting
+                cols["days_emitting"][slot] = emission._days_emitting
+                cols["emitting_period"][slot] = emission._emitting_period_day_count
+                cols["non_emitting_period"][slot] = emission._non_emitting_period_day_count
+                cols["active_dur"][slot] = emission._active_duration
+                cols["inactive_dur"][slot] = emission._inactive_duration
+        self._size += len(emissions)
+        self._order_stale = True
+
+    def tag_emission(self, emission: RepairableEmission, tagging_rep_delay: int) -> None:
+        """Record that an active repairable emission has been tagged for repair"""
+        slot: int = self._slots[id(emission)]
+        self._cols["tagged"][slot] = True
+        self._cols["tagging_rep_delay"][slot] = tagging_rep_delay
+
+    def _write_back(self, slot: int) -> None:
+        cols: dict[str, np.ndarray] = self._cols
+        emission: Emission = self._emissions[slot]
+        emission._active_days = int(cols["active_days"][slot])
+        if cols["is_rep"][slot]:
+            emission._days_since_tagged = int(cols["days_since_tagged"][slot])
+        if cols["intermittent"][slot]:
+            emission._emitting = bool(cols["emitting"][slot])
+            emission._days_emitting = int(cols["days_emitting"][slot])
+            emission._emitting_period_day_count = int(cols["emitting_period"][slot])
+            emission._non_emitting_period_day_count = int(cols["non_emitting_period"][slot])
+
+    def update_emissions_state(self, emis_rep_info: EmisInfo) -> TsEmisData:
+        """Vectorized equivalent of Infrastructure.update_emissions_state for the object model
+
+        Args:
+            emis_rep_info (EmisInfo): The daily repair information to update
+
+        Returns:
+            TsEmisData: The daily emissions data
+        """
+        if self._order_stale:
+            self._refresh_order()
+        n: int = self._size
+        cols: dict[str, np.ndarray] = {col: arr[:n] for col, arr in self._cols.items()}
+        live: np.ndarray = cols["live"]
+
+        cols["active_days"][live] += 1
+        days_active: np.ndarray = cols["active_days"] + cols["days_b4_sim"]
+
+        rep: np.ndarray = live & cols["is_rep"]
+        tagged: np.ndarray = rep & cols["tagged"]
+        cols["days_since_tagged"][tagged] += 1
+        repaired: np.ndarray = (
+            tagged
+            & cols["repairable"]
+            & (cols["days_since_tagged"] >= cols["repair_delay"] + cols["tagging_rep_delay"])
+        )
+        nat_repaired: np.ndarray = rep & ~cols["tagged"] & (days_active >= cols["end_days"])
+        expired: np.ndarray = live & cols["is_nonrep"] & (days_active >= cols["end_days"])
+        retired: np.ndarray = repaired | nat_repaired | expired
+
+        # Intermittency is only progressed for emissions that are still active
+        intermittent: np.ndarray = live & cols["intermittent"] & ~retired
+        emitting: np.ndarray = intermittent & cols["emitting"]
+        non_emitting: np.ndarray = intermittent & ~cols["emitting"]
+        cols["days_emitting"][emitting] += 1
+        cols["emitting_period"][emitting] += 1
+        stopped: np.ndarray = emitting & (cols["emitting_period"] >= cols["active_dur"])
+        cols["emitting"][stopped] = False
+        cols["emitting_period"][stopped] = 0
+        cols["non_emitting_period"][non_emitting] += 1
+        started: np.ndarray = non_emitting & (cols["non_emitting_period"] >= cols["inactive_dur"])
+        cols["emitting"][started] = True
+        cols["non_emitting_period"][started] = 0
+        for slot in np.flatnonzero(stopped | started):
+            self._emissions[slot]._emitting = bool(cols["emitting"][slot])
+
+        if retired.any():
+            self._retire(self._order[retired[self._order]], repaired, nat_repaired, emis_rep_info)
+            live[retired] = False
+            self._order = self._order[~retired[self._order]]
+
+        emis_data = TsEmisData()
+        daily_emis: np.ndarray = cols["daily_emis"][self._order]
+        mitigable: np.ndarray = cols["mitigable"][self._order]
+        emis_data.daily_emis = sum_in_sequence(daily_emis)
+        emis_data.daily_emis_mit = sum_in_sequence(daily_emis[mitigable])
+        emis_data.daily_emis_non_mit = sum_in_sequence(daily_emis[~mitigable])
+        emis_data.active_leaks = len(self._order)
+
+        dead: int = n - len(self._order)
+        if dead > len(self._order) and dead > self.INITIAL_CAPACITY:
+            self._compact()
+        return emis_data
+
+    def _retire(
+        self,
+        slots: np.ndarray,
+        repaired: np.ndarray,
+        nat_repaired: np.ndarray,
+        emis_rep_info: EmisInfo,
+    ) -> None:
+        """Hand the emissions that became inactive today back to the emission objects,
+        in traversal order, so repair costs are drawn in the same order as the object model.
+        """
+        retired_at_comp: dict[int, list[Emission]] = {}
+        for slot in slots:
+            self._write_back(slot)
+            emission: Emission = self._emissions[slot]
+            if repaired[slot]:
+                emission.check_if_repaired(emis_rep_info)
+            elif nat_repaired[slot]:
+                emission.natural_repair(emis_rep_info)
+            else:
+                emission.expire(emis_rep_info)
+            retired_at_comp.setdefault(self._cols["comp_ord"][slot], []).append(emission)
+        for comp_ord, emissions in retired_at_comp.items():
+            self._components[comp_ord].deactivate_emissions(emissions)
+
+    def sync_to_emissions(self) -> None:
+        """Write the state of all active emissions back to the emission objects"""
+        for slot in np.flatnonzero(self._cols["live"][: self._size]):
+            self._write_back(slot)
@@ -32,6 +32,8 @@ class Emission:
         eca.EMIS_ID: "object",
         eca.STATUS: "object",
         eca.DAYS_ACT: "int32",
+        eca.DAYS_EMITTING: "int32",
+        eca.EST_DAYS_ACT: "int32",
         eca.T_VOL_EMIT: "float64",
         eca.MITIGATED: "float64",
         eca.EST_VOL_EMIT: "float64",
@@ -40,10 +42,13 @@ class Emission:
         eca.DATE_BEG: "datetime64",
         eca.INIT_DETECT_BY: "object",
         eca.INIT_DETECT_DATE: "datetime64",
-        eca.TAGGED: "bool",
+        eca.TAGGED: "object",
         eca.TAGGED_BY: "object",
         eca.DATE_REP_EXP: "datetime64",
         eca.THEORY_DATE: "datetime64",
+        eca.RECORDED: "object",
+        eca.RECORDED_BY: "object",
+        eca.REPAIRABLE: "bool",
     }
 
     def __init__(
@@ -85,6 +90,14 @@ class Emission:
         emission.__setstate__(state)
         return emission
 
+    def get_program_copy(self) -> "Emission":
+        """Copy the emission for a program. The emission inputs (coverage probabilities,
+        repair costs) are shared with the original, only the per program state is copied.
+        """
+        emission: Emission = self._reconstruct_emissions(self.__dict__)
+        emission._tech_spat_covs = dict(self._tech_spat_covs)
+        return emission
+
     def update(self, emis_rep_info: EmisInfo) -> bool:
         """
         Increments duration values
@@ -96,7 +109,7 @@ class Emission:
             return False
 
     def check_spatial_cov(self, method) -> int:
-        name_str: str = f"{method} Spatial Coverage"
+        name_str: str = eca.SPATIAL_COV.format(method=method)
         if name_str not in self._tech_spat_covs:
             cov_prob: float = self._tech_spat_cov_probs[method]
             self._tech_spat_covs[name_str] = binomial(1, cov_prob)
@@ -19,6 +19,7 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 """
 
 from datetime import date
+from typing import Any, Iterator
 
 import pandas as pd
 from file_processing.output_processing.output_utils import (
@@ -67,6 +68,15 @@ class Equipment_Group:
         instance._component = component
         return instance
 
+    def get_program_copy(self, sim_number: int) -> "Equipment_Group":
+        """Copy the equipment group for a program, sharing the method survey times and costs"""
+        return self._reconstruct(
+            self._id,
+            self._meth_survey_times,
+            self._meth_survey_costs,
+            [component.get_program_copy(sim_number) for component in self._component],
+        )
+
     def _update_prop_params(self, info: dict, prop_params: dict) -> None:
         meth_specific_params: dict = prop_params.pop(cp.METH_SPECIFIC)
 
@@ -197,11 +207,9 @@ class Equipment_Group:
     def get_id(self) -> str:
         return self._id
 
-    def gen_emis_data(self, emis_df: pd.DataFrame, site_id: str, row_index: int, end_date: date):
-        upd_row_index = row_index
+    def gen_emis_data(self, site_id: str, end_date: date) -> Iterator[dict[str, Any]]:
         for equip in self._component:
-            upd_row_index = equip.gen_emis_data(emis_df, site_id, self._id, upd_row_index, end_date)
-        return upd_row_index
+            yield from equip.gen_emis_data(site_id, self._id, end_date)
 
     def get_survey_cost(self, method_name) -> float:
         return self._meth_survey_costs[method_name]
@@ -19,9 +19,12 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 """
 
 from datetime import date
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Iterator
 import numpy as np
 import pandas as pd
-from utils.generic_functions import find_closest_index_numpy
+from utils.generic_functions import find_closest_indexes_numpy
 from file_processing.output_processing.output_utils import EmisInfo, TsEmisData
 from file_processing.input_processing.emissions_source_processing import (
     EmissionsSource,
@@ -36,7 +39,11 @@ from constants.infrastructure_const import (
     Virtual_World_To_Prop_Params_Mapping as VW,
     Deployment_TF_Sites_Constants as DTSC,
 )
+from virtual_world.component import Component
 from virtual_world.sites import Site
+from virtual_world.sources import Source
+from virtual_world.emission_scenario import ActivationCalendar, EmissionScenario
+from virtual_world.emission_state_store import EmissionStateStore
 from file_processing.input_processing.infrastructure_processing import (
     read_in_infrastructure_files,
     check_site_file,
@@ -49,7 +56,6 @@ from weather.weather_lookup import WeatherLookup as WL
 
 
 class Infrastructure:
-
     def __init__(self, virtual_world, methods, in_dir) -> None:
         self.emission_rate_source_dictionary: dict[str, EmissionsSource] = process_emission_sources(
             inputs_path=in_dir, virtual_world=virtual_world
@@ -58,6 +64,9 @@ class Infrastructure:
             inputs_path=in_dir, virtual_world=virtual_world
         )
         self._sites: list[Site] = []
+        self._emis_state_store: EmissionStateStore = None
+        self._activation_calendars: dict[int, ActivationCalendar] = {}
+        self._source_components: list[tuple[Component, Source]] = None
         self.generate_infrastructure(
             virtual_world=virtual_world,
             methods=methods,
@@ -65,17 +74,47 @@ class Infrastructure:
         )
 
     def __reduce__(self):
-        args = (self.emission_rate_source_dictionary, self.repair_delay_dataframe, self._sites)
+        args = (
+            self.emission_rate_source_dictionary,
+            self.repair_delay_dataframe,
+            self._sites,
+            self._activation_calendars,
+        )
         return (self.__class__._reconstruct, args)
 
     @classmethod
-    def _reconstruct(cls, emission_rate_dict, repair_df, sites):
+    def _reconstruct(cls, emission_rate_dict, repair_df, sites, activation_calendars=None):
         instance = cls.__new__(cls)
         instance.emission_rate_source_dictionary = emission_rate_dict
         instance.repair_delay_dataframe = repair_df
         instance._sites = sites
+        instance._emis_state_store = None
+        instance._activation_calendars = activation_calendars if activation_calendars else {}
+        instance._source_components = None
         return instance
 
+    def get_program_copy(self, sim_number: int) -> "Infrastructure":
+        """Create the infrastructure used by a single program of the given simulation.
+
+        The static part of the infrastructure (site, equipment group, component and source
+        properties, emission rate sources and repair delays) is shared with this
+        infrastructure rather than copied. Only the state a program changes while it runs,
+        the emissions of the simulation and the latest tagging survey date of each site,
+        is copied.
+        """
+        return self._reconstruct(
+            self.emission_rate_source_dictionary,
+            self.repair_delay_dataframe,
+            [site.get_program_copy(sim_number) for site in self._sites],
+            self._activation_calendars,
+        )
+
+    def use_emission_state_store(self) -> None:
+        """Track the daily state of active emissions in a columnar emission state store
+        instead of updating each emission object individually.
+        """
+        self._emis_state_store = EmissionStateStore(self._sites)
+
     def generate_propagating_params(self, virtual_world, methods) -> dict:
         prop_params_dict: dict = {}
         for (
@@ -145,9 +184,53 @@ class Infrastructure:
                     prop_params[pdc.Common_Params.METH_SPECIFIC][param][method] = site_val
 
     def set_pregen_emissions(self, emissions, sim_number) -> None:
+        # Emissions set directly are activated by checking every source each day
+        self._activation_calendars = {}
         for site in self._sites:
             site.set_pregen_emissions(emissions[site.get_id()], sim_number)
 
+    def get_sources(self) -> list[Source]:
+        """Get every source of the infrastructure, in site, equipment group, component
+        and source order
+        """
+        return [
+            source
+            for site in self._sites
+            for eqg in site._equipment_groups
+            for comp in eqg._component
+            for source in comp._sources
+        ]
+
+    def get_emission_scenario(self, sim_number: int, sim_start_date: date) -> EmissionScenario:
+        """Get the emission scenario of the emissions generated for the given simulation"""
+        return EmissionScenario.from_source_emissions(
+            [source._generated_emissions[sim_number] for source in self.get_sources()],
+            sim_start_date,
+        )
+
+    def set_emission_scenario(self, scenario: EmissionScenario, sim_number: int) -> None:
+        """Set the pregenerated emissions of the given simulation from its emission scenario.
+        Emissions are only built from the scenario as they are activated.
+        """
+        sources: list[Source] = self.get_sources()
+        for source, source_records in zip(sources, scenario.split_by_source(len(sources))):
+            source.set_pregen_emissions(source_records, sim_number)
+        self._activation_calendars = {sim_number: ActivationCalendar.from_scenario(scenario)}
+
+    def _get_source_components(self) -> list[tuple[Component, Source]]:
+        """Get every source of the infrastructure and the component it belongs to, in the
+        order of get_sources
+        """
+        if self._source_components is None:
+            self._source_components = [
+                (comp, source)
+                for site in self._sites
+                for eqg in site._equipment_groups
+                for comp in eqg._component
+                for source in comp._sources
+            ]
+        return self._source_components
+
     # Generate Emissions for all infrastructure
     def generate_emissions(
         self,
@@ -180,11 +263,26 @@ class Infrastructure:
             Used to interact with the correct set of emissions.
         """
         new_emissions: int = 0
-        for site in self._sites:
-            new_emissions += site.activate_emissions(date, sim_number)
+        calendar: ActivationCalendar = self._activation_calendars.get(sim_number)
+        if calendar is None:
+            for site in self._sites:
+                new_emissions += site.activate_emissions(date, sim_number)
+            return new_emissions
+        # Only the sources with emissions due on the current date are visited. This relies on
+        # emissions being activated every day of the simulation, as the simulation does.
+        source_components: list[tuple[Component, Source]] = self._get_source_components()
+        for component, due in groupby(
+            (source_components[source_ord] for source_ord in calendar.get_due_sources(date)),
+            key=itemgetter(0),
+        ):
+            new_emissions += component.activate_source_emissions(
+                [source for _, source in due], date, sim_number
+            )
         return new_emissions
 
     def update_emissions_state(self, emis_rep_info: EmisInfo) -> TsEmisData:
+        if self._emis_state_store is not None:
+            return self._emis_state_store.update_emissions_state(emis_rep_info)
         emis_data = TsEmisData()
         for site in self._sites:
             site.update_emissions_state(emis_rep_info, emis_data)
@@ -276,6 +374,8 @@ class Infrastructure:
         """Generate a dictionary that provides info on if a given site will be measured
         by a given method.
 
+        The columns are filled for all sites at once.
+
         Args:
             site_measured_df (pd.DataFrame): The DataFrame with site measured data.
 
@@ -283,38 +383,43 @@ class Infrastructure:
             A dictionary: The dictionary with site potential
             measurement that can be used as a new row.
         """
-        for i, site in enumerate(self._sites):
-
-            site_measured_data: dict = {
-                DTSC.SITE_ID: site.get_id(),
-                DTSC.SITE_TYPE: site.get_type(),
-            }
+        n_sites: int = len(self._sites)
+        site_measured_data: dict[str, np.ndarray] = {
+            DTSC.SITE_ID: np.array([site.get_id() for site in self._sites], dtype=object),
+            DTSC.SITE_TYPE: np.array([site.get_type() for site in self._sites], dtype=object),
+        }
 
-            for method in methods:
-                # If the method is a follow-up method, we do not know if it will ever be triggered
-                # therefore  we set it to False
-                # Follow-up methods will always  be called with another method, and because of this
-                # setting it false is fine, the other method will ensure that the site measured
-                # value is set to true
-                if methods[method][pdc.Method_Params.IS_FOLLOW_UP]:
-                    surveyed = False
-                    deployed = False
-                else:
-                    deployed = site.do_site_deployment(method)
-                    if (
-                        methods[method][pdc.Method_Params.DEPLOYMENT_TYPE]
-                        == pdc.Deployment_Types.STATIONARY
-                    ):
-                        surveyed = True
-                    else:
-                        surveyed = site.get_required_surveys(method) >= 0
-                site_measured_data[DTSC.SITE_DEPLOYMENT.format(method=method)] = deployed
-                site_measured_data[DTSC.REQUIRED_SURVEY.format(method=method)] = surveyed
-                site_measured_data[DTSC.METHOD_MEASURED.format(method=method)] = (
-                    deployed and surveyed
+        for method in methods:
+            # If the method is a follow-up method, we do not know if it will ever be triggered
+            # therefore  we set it to False
+            # Follow-up methods will always  be called with another method, and because of this
+            # setting it false is fine, the other method will ensure that the site measured
+            # value is set to true
+            if methods[method][pdc.Method_Params.IS_FOLLOW_UP]:
+                surveyed: np.ndarray = np.zeros(n_sites, dtype=np.bool_)
+                deployed: np.ndarray = np.zeros(n_sites, dtype=np.bool_)
+            else:
+                deployed: np.ndarray = np.array(
+                    [site.do_site_deployment(method) for site in self._sites], dtype=np.bool_
                 )
-
-            site_tf_df.loc[i] = site_measured_data
+                if (
+                    methods[method][pdc.Method_Params.DEPLOYMENT_TYPE]
+                    == pdc.Deployment_Types.STATIONARY
+                ):
+                    surveyed: np.ndarray = np.ones(n_sites, dtype=np.bool_)
+                else:
+                    surveyed: np.ndarray = np.array(
+                        [site.get_required_surveys(method) >= 0 for site in self._sites],
+                        dtype=np.bool_,
+                    )
+            site_measured_data[DTSC.SITE_DEPLOYMENT.format(method=method)] = deployed
+            site_measured_data[DTSC.REQUIRED_SURVEY.format(method=method)] = surveyed
+            site_measured_data[DTSC.METHOD_MEASURED.format(method=method)] = deployed & surveyed
+
+        site_tf_df.loc[range(n_sites), list(site_measured_data)] = pd.DataFrame(
+            {column: values.tolist() for column, values in site_measured_data.items()},
+            dtype=object,
+        )
         return
 
     # TODO
@@ -332,19 +437,34 @@ class Infrastructure:
         lon_ave = np.mean(lon_list)
         return (lat_ave, lon_ave)
 
-    def gen_summary_emis_data(self, emis_df: pd.DataFrame, end_date: date) -> None:
-        row_index: int = 0
+    def gen_summary_emis_data(self, end_date: date) -> Iterator[dict[str, Any]]:
+        """Generate the summary dictionary of every emission, in site, equipment group,
+        component and activation order.
+        """
+        if self._emis_state_store is not None:
+            self._emis_state_store.sync_to_emissions()
         for site in self._sites:
-            row_index = site.gen_emis_data(emis_df, row_index, end_date)
+            yield from site.gen_emis_data(end_date)
 
     def setup(self, methods: list[str]) -> None:
         for site in self._sites:
             site.setup(methods)
 
     def set_weather_index(self, weather: WL):
-        for site in self._sites:
-            lat, lon = site.get_loc()
-            lat_ind = find_closest_index_numpy(weather.latitude, lat)
-            lon_ind = find_closest_index_numpy(weather.longitude, lon)
-            site.set_weather_lat(weather.lat_sort[lat_ind])
-            site.set_weather_long(weather.lon_sort[lon_ind])
+        # Assign every site to its closest weather cell at once
+        site_locs: np.ndarray = np.array(
+            [site.get_loc() for site in self._sites], dtype=np.float64
+        ).reshape(-1, 2)
+        lat_inds: np.ndarray = weather.lat_sort[
+            find_closest_indexes_numpy(weather.latitude, site_locs[:, 0])
+        ]
+        lon_inds: np.ndarray = weather.lon_sort[
+            find_closest_indexes_numpy(weather.longitude, site_locs[:, 1])
+        ]
+        for site, lat_ind, lon_ind in zip(self._sites, lat_inds, lon_inds):
+            site.set_weather_lat(lat_ind)
+            site.set_weather_long(lon_ind)
+
+    def get_weather_cells(self) -> set[tuple[int, int]]:
+        """Get the weather cells, as (lat, lon) indexes, that contain at least one site"""
+        return {(site.get_weather_lat(), site.get_weather_long()) for site in self._sites}
@@ -0,0 +1,241 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        site_emission_index.py
+Purpose: Contains the index of the active emissions of a site used to find the emissions
+detectable by a survey.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import numpy as np
+from numpy.random import binomial
+
+from virtual_world.component import Component
+from virtual_world.emission_columns import get_traversal_order, sum_in_sequence
+from virtual_world.emission_types.emission import Emission
+from virtual_world.emission_types.intermittency_mixin import IntermittencyMixin
+from virtual_world.equipment_groups import Equipment_Group
+
+
+class SiteEmissionIndex:
+    """Keeps the active emissions of a site, and the properties used to survey them, in
+    NumPy columns.
+
+    The components of the site add and remove emissions as they are activated and
+    become inactive. The spatial coverage of each emission is cached per method once it
+    has been checked, so a survey only has to make the temporal coverage draws, which are
+    made in one vectorized call for all the covered emissions of the site.
+
+    Emissions are checked in the same order as the object model (equipment group,
+    component, activation order), and the spatial and temporal coverage draws are made
+    in the same sequence, so the emissions detected are identical to the object model
+    for the same seed.
+    """
+
+    INITIAL_CAPACITY = 16
+
+    COLUMN_DTYPES = {
+        "live": np.bool_,
+        "comp_ord": np.int64,
+        "rate": np.float64,
+        "intermittent": np.bool_,
+    }
+    # Spatial coverage of an emission that has not been checked by the method yet
+    UNCHECKED = -1
+
+    def __init__(self, equipment_groups: list[Equipment_Group]) -> None:
+        self._components: list[Component] = [
+            comp for eqg in equipment_groups for comp in eqg._component
+        ]
+        self._comp_ords: dict[int, int] = {
+            id(comp): comp_ord for comp_ord, comp in enumerate(self._components)
+        }
+        # The ID of each equipment group, with the ordinal and ID of each of its components
+        self._locations: list[tuple[str, list[tuple[int, str]]]] = [
+            (eqg.get_id(), [(self._comp_ords[id(comp)], comp.get_id()) for comp in eqg._component])
+            for eqg in equipment_groups
+        ]
+        self._size: int = 0
+        self._cols: dict[str, np.ndarray] = {
+            col: np.zeros(self.INITIAL_CAPACITY, dtype=dtype)
+            for col, dtype in self.COLUMN_DTYPES.items()
+        }
+        # Per method columns, added the first time the site is surveyed by the method
+        self._spat_covs: dict[str, np.ndarray] = {}
+        self._temp_cov_probs: dict[str, np.ndarray] = {}
+        self._emissions: list[Emission] = []
+        self._slots: dict[int, int] = {}
+        self._order: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._order_stale: bool = False
+        for comp in self._components:
+            comp.set_emission_index(self)
+            if comp._active_emissions:
+                self.add_emissions(comp, comp._active_emissions)
+
+    def _grow(self, required: int) -> None:
+        capacity: int = len(self._cols["live"])
+        if required <= capacity:
+            return
+        while capacity < required:
+            capacity *= 2
+        for cols in (self._cols, self._spat_covs, self._temp_cov_probs):
+            for col, arr in cols.items():
+                grown: np.ndarray = np.zeros(capacity, dtype=arr.dtype)
+                grown[: self._size] = arr[: self._size]
+                cols[col] = grown
+
+    def _compact(self) -> None:
+        """Drop the rows of emissions that are no longer active, keeping the row order"""
+        keep: np.ndarray = np.flatnonzero(self._cols["live"][: self._size])
+        for cols in (self._cols, self._spat_covs, self._temp_cov_probs):
+            for arr in cols.values():
+                arr[: len(keep)] = arr[keep]
+                arr[len(keep) : self._size] = 0
+        self._emissions = [self._emissions[slot] for slot in keep]
+        self._slots = {id(emis): slot for slot, emis in enumerate(self._emissions)}
+        self._size = len(keep)
+
+    def _refresh_order(self) -> None:
+        live: np.ndarray = self._cols["live"][: self._size]
+        n_live: int = int(np.count_nonzero(live))
+        if self._size - n_live > max(n_live, self.INITIAL_CAPACITY):
+            self._compact()
+            live = self._cols["live"][: self._size]
+        live_slots: np.ndarray = np.flatnonzero(live)
+        self._order = get_traversal_order(live_slots, self._cols["comp_ord"])
+        self._order_stale = False
+
+    def _add_method(self, method_name: str) -> None:
+        capacity: int = len(self._cols["live"])
+        self._spat_covs[method_name] = np.full(capacity, self.UNCHECKED, dtype=np.int8)
+        temp_cov_probs: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        for slot in np.flatnonzero(self._cols["live"][: self._size]):
+            temp_cov_probs[slot] = self._get_temp_cov_prob(self._emissions[slot], method_name)
+        self._temp_cov_probs[method_name] = temp_cov_probs
+
+    @staticmethod
+    def _get_temp_cov_prob(emission: Emission, method_name: str) -> float:
+        # Emissions without a temporal coverage probability for the method fail when
+        # their coverage is drawn, as they do in the object model
+        temp_cov_probs: dict[str, float] = emission._tech_temp_cov_probs
+        if not temp_cov_probs or method_name not in temp_cov_probs:
+            return np.nan
+        return temp_cov_probs[method_name]
+
+    def add_emissions(self, component: Component, emissions: list[Emission]) -> None:
+        """Add newly activated emissions at the given component to the index
+
+        Args:
+            component (Component): The component the emissions occur at.
+            emissions (list[Emission]): The emissions, in the order they were activated.
+        """
+        if not emissions:
+            return
+        start: int = self._size
+        self._grow(start + len(emissions))
+        cols: dict[str, np.ndarray] = self._cols
+        comp_ord: int = self._comp_ords[id(component)]
+        for slot, emission in enumerate(emissions, start=start):
+            self._emissions.append(emission)
+            self._slots[id(emission)] = slot
+            cols["live"][slot] = True
+            cols["comp_ord"][slot] = comp_ord
+            cols["rate"][slot] = emission.get_rate()
+            cols["intermittent"][slot] = isinstance(emission, IntermittencyMixin)
+            for method_name, spat_covs in self._spat_covs.items():
+                spat_covs[slot] = self.UNCHECKED
+                self._temp_cov_probs[method_name][slot] = self._get_temp_cov_prob(
+                    emission, method_name
+                )
+        self._size += len(emissions)
+        self._order_stale = True
+
+    def remove_emissions(self, emissions: list[Emission]) -> None:
+        """Remove emissions that are no longer active from the index"""
+        if not emissions:
+            return
+        for emission in emissions:
+            self._cols["live"][self._slots.pop(id(emission))] = False
+        self._order_stale = True
+
+    def _draw_temporal_covs(
+        self,
+        order: np.ndarray,
+        covered: np.ndarray,
+        emitting: np.ndarray,
+        detected: np.ndarray,
+        temp_cov_probs: np.ndarray,
+        start: int,
+        end: int,
+    ) -> None:
+        checked: np.ndarray = start + np.flatnonzero(
+            (covered[start:end] == 1) & emitting[start:end]
+        )
+        if len(checked):
+            detected[checked] = binomial(1, temp_cov_probs[order[checked]]) == 1
+
+    def get_detectable(self, method_name: str) -> np.ndarray:
+        """Check the spatial and temporal coverage of every active emission for the given
+        method.
+
+        Args:
+            method_name (str): The name of the method surveying the site.
+
+        Returns:
+            np.ndarray: The slots of the detectable emissions, in traversal order
+        """
+        if self._order_stale:
+            self._refresh_order()
+        if method_name not in self._spat_covs:
+            self._add_method(method_name)
+        order: np.ndarray = self._order
+        spat_covs: np.ndarray = self._spat_covs[method_name]
+        temp_cov_probs: np.ndarray = self._temp_cov_probs[method_name]
+        covered: np.ndarray = spat_covs[order]
+        emitting: np.ndarray = np.ones(len(order), dtype=np.bool_)
+        for pos in np.flatnonzero(self._cols["intermittent"][order]):
+            emitting[pos] = self._emissions[order[pos]].is_emitting()
+        detected: np.ndarray = np.zeros(len(order), dtype=np.bool_)
+        # An emission's spatial coverage is drawn the first time it is checked, in between
+        # the temporal coverage draws of the emissions before and after it
+        start: int = 0
+        for pos in np.flatnonzero(covered == self.UNCHECKED):
+            self._draw_temporal_covs(order, covered, emitting, detected, temp_cov_probs, start, pos)
+            slot: int = order[pos]
+            covered[pos] = spat_covs[slot] = self._emissions[slot].check_spatial_cov(method_name)
+            start = pos
+        self._draw_temporal_covs(
+            order, covered, emitting, detected, temp_cov_probs, start, len(order)
+        )
+        return order[detected]
+
+    def get_emissions(self, slots: np.ndarray) -> list[Emission]:
+        return [self._emissions[slot] for slot in slots]
+
+    def get_rate_sum(self, slots: np.ndarray) -> float:
+        """Sum the rates of the given emissions"""
+        return sum_in_sequence(self._cols["rate"][slots])
+
+    def group_by_location(self, slots: np.ndarray) -> dict[str, dict[str, list[Emission]]]:
+        """Group the given emissions by equipment group and component"""
+        comp_emissions: list[list[Emission]] = [[] for _ in self._components]
+        for slot in slots:
+            comp_emissions[self._cols["comp_ord"][slot]].append(self._emissions[slot])
+        grouped: dict[str, dict[str, list[Emission]]] = {}
+        for eqg_id, components in self._locations:
+            grouped[eqg_id] = {
+                comp_id: comp_emissions[comp_ord] for comp_ord, comp_id in components
+            }
+        return grouped
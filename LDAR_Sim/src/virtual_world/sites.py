@@ -22,9 +22,10 @@ import copy
 from datetime import date
 import logging
 import math
-from typing import Union
+from typing import Any, Iterator, Union
 import sys
 
+import numpy as np
 import pandas as pd
 from file_processing.output_processing.output_utils import EmisInfo, TsEmisData
 from file_processing.input_processing.emissions_source_processing import (
@@ -33,6 +34,7 @@ from file_processing.input_processing.emissions_source_processing import (
 from scheduling.schedule_dataclasses import TaggingInfo
 from virtual_world.emission_types.emission import Emission
 from virtual_world.equipment_groups import Equipment_Group
+from virtual_world.site_emission_index import SiteEmissionIndex
 
 from constants.infrastructure_const import (
     Infrastructure_Constants,
@@ -43,6 +45,9 @@ import constants.param_default_const as pdc
 
 
 class Site:
+    # Built per program the first time the site is surveyed
+    _emission_index = None
+
     # TODO its lat and lon not lat and long
     def __init__(
         self,
@@ -77,6 +82,8 @@ class Site:
         ].pop(Infrastructure_Constants.Sites_File_Constants.SITE_DEPLOYMENT_PLACEHOLDER)
         self._equipment_groups: list[Equipment_Group] = []
         self._survey_costs: dict[str, float] = {}
+        # Survey times are summed over the equipment groups the first time a method needs them
+        self._survey_times: dict[str, int] = {}
         self._create_equipment_groups(equipment_groups, infrastructure_inputs, propagating_params)
         self._set_survey_costs(methods=methods)
         self._latest_tagging_survey_date: date = start_date
@@ -96,6 +103,7 @@ class Site:
             self._latest_tagging_survey_date,
             self._survey_costs,
             self._deploy_method,
+            self._survey_times,
         )
         return (self.__class__._reconstruct, args)
 
@@ -115,6 +123,7 @@ class Site:
         latest_tagging_survey_date,
         survey_costs,
         deploy_method,
+        survey_times=None,
     ):
         instance = cls.__new__(cls)
         instance._site_ID = site_ID
@@ -130,8 +139,30 @@ class Site:
         instance._latest_tagging_survey_date = latest_tagging_survey_date
         instance._survey_costs = survey_costs
         instance._deploy_method = deploy_method
+        instance._survey_times = survey_times if survey_times is not None else {}
         return instance
 
+    def get_program_copy(self, sim_number: int) -> "Site":
+        """Copy the site for a program. The site properties are shared with the original,
+        only the equipment groups and the latest tagging survey date are specific to the copy.
+        """
+        return self._reconstruct(
+            self._site_ID,
+            self._lat,
+            self._long,
+            self._weather_lat,
+            self._weather_long,
+            [eqg.get_program_copy(sim_number) for eqg in self._equipment_groups],
+            self._survey_frequencies,
+            self._deployment_months,
+            self._deployment_years,
+            self._site_type,
+            self._latest_tagging_survey_date,
+            self._survey_costs,
+            self._deploy_method,
+            self._survey_times,
+        )
+
     def _create_equipment_groups(
         self,
         equipment_groups: Union[list, str, int, float, None],
@@ -330,12 +361,22 @@ class Site:
 
         return {self._site_ID: site_emissions}
 
+    def _get_emission_index(self) -> SiteEmissionIndex:
+        if self._emission_index is None:
+            self._emission_index = SiteEmissionIndex(self._equipment_groups)
+        return self._emission_index
+
     def get_detectable_emissions(self, method_name: str) -> dict[str, dict[str, list[Emission]]]:
-        detectable_emissions: dict[str, dict[str, Emission]] = {}
-        for eqg in self._equipment_groups:
-            detectable_emissions[eqg.get_id()] = eqg.get_detectable_emissions(method_name)
+        emission_index: SiteEmissionIndex = self._get_emission_index()
+        return emission_index.group_by_location(emission_index.get_detectable(method_name))
 
-        return detectable_emissions
+    def get_detectable_site_emissions(self, method_name: str) -> tuple[list[Emission], float]:
+        """Get the emissions at the site that are detectable by the given method, in
+        equipment group and component order, and the sum of their rates.
+        """
+        emission_index: SiteEmissionIndex = self._get_emission_index()
+        detectable: np.ndarray = emission_index.get_detectable(method_name)
+        return emission_index.get_emissions(detectable), emission_index.get_rate_sum(detectable)
 
     def get_required_surveys(self, method_name) -> int:
         required_surveys: int = self._survey_frequencies[method_name]
@@ -350,12 +391,19 @@ class Site:
     def do_site_deployment(self, method_name) -> bool:
         return self._deploy_method[method_name]
 
-    def get_method_survey_time(self, method_name) -> int:
+    def _calc_method_survey_time(self, method_name) -> int:
         survey_time: float = 0
         for eqg in self._equipment_groups:
             survey_time += eqg.get_survey_time(method_name=method_name)
         return round(survey_time)
 
+    def get_method_survey_time(self, method_name) -> int:
+        survey_time: int = self._survey_times.get(method_name)
+        if survey_time is None:
+            survey_time = self._calc_method_survey_time(method_name)
+            self._survey_times[method_name] = survey_time
+        return survey_time
+
     def get_id(self) -> str:
         return self._site_ID
 
@@ -368,11 +416,9 @@ class Site:
     def get_latest_tagging_survey_date(self) -> date:
         return self._latest_tagging_survey_date
 
-    def gen_emis_data(self, emis_df: pd.DataFrame, row_index: int, end_date: date):
-        upd_row_index = row_index
+    def gen_emis_data(self, end_date: date) -> Iterator[dict[str, Any]]:
         for eqg in self._equipment_groups:
-            upd_row_index = eqg.gen_emis_data(emis_df, self._site_ID, upd_row_index, end_date)
-        return upd_row_index
+            yield from eqg.gen_emis_data(self._site_ID, end_date)
 
     def get_survey_cost(self, method_name: str) -> float:
         return self._survey_costs[method_name]
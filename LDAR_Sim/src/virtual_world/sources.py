@@ -31,6 +31,7 @@ from file_processing.input_processing.emissions_source_processing import (
     EmissionsSource,
 )
 from virtual_world import emission_types
+from virtual_world.emission_scenario import SourceEmissionRecords
 from constants.infrastructure_const import (
     Infrastructure_Constants as IC,
 )
@@ -74,6 +75,7 @@ class Source:
             self._emis_rep_cost,
             self._next_emission,
             self._prefix,
+            self._meth_temp_covs,
         )
         return (self.__class__._reconstruct, args)
 
@@ -95,6 +97,7 @@ class Source:
         emis_rep_cost,
         next_emission,
         prefix,
+        meth_temp_covs=None,
     ):
         # Create a new instance without invoking __init__
         instance = cls.__new__(cls)
@@ -114,8 +117,42 @@ class Source:
         instance._emis_rep_cost = emis_rep_cost
         instance._next_emission = next_emission
         instance._prefix = prefix
+        instance._meth_temp_covs = meth_temp_covs
         return instance
 
+    def get_program_copy(self, sim_number: int) -> "Source":
+        """Copy the source for a program, with its own copy of the emissions of the given
+        simulation. All other source properties are shared with the original.
+        """
+        sim_emissions = self._generated_emissions[sim_number]
+        if isinstance(sim_emissions, SourceEmissionRecords):
+            generated_emissions = {sim_number: sim_emissions.get_program_copy()}
+        else:
+            generated_emissions = {
+                sim_number: [emission.get_program_copy() for emission in sim_emissions]
+            }
+        next_emission: emission_types.Emission = (
+            self._next_emission.get_program_copy() if self._next_emission is not None else None
+        )
+        return self._reconstruct(
+            self._source_ID,
+            self._repairable,
+            self._persistent,
+            self._active_duration,
+            self._inactive_duration,
+            self._multi_emissions,
+            generated_emissions,
+            self._emis_rate_source,
+            self._emis_prod_rate,
+            self._emis_duration,
+            self._meth_spat_covs,
+            self._emis_rep_delay,
+            self._emis_rep_cost,
+            next_emission,
+            self._prefix,
+            self._meth_temp_covs,
+        )
+
     def _set_source_only_properties(self, info) -> None:
         try:
             self._repairable: bool = info[IC.Sources_File_Constants.REPAIRABLE]
@@ -195,6 +232,11 @@ class Source:
     def _get_rate(self, emission_rate_source_dictionary: dict[str, EmissionsSource]):
         return emission_rate_source_dictionary[self._emis_rate_source].get_a_rate()
 
+    def _get_rates(
+        self, n_emissions: int, emission_rate_source_dictionary: dict[str, EmissionsSource]
+    ) -> np.ndarray:
+        return emission_rate_source_dictionary[self._emis_rate_source].get_rates(n_emissions)
+
     def _get_repairable(self):
         return self._repairable
 
@@ -215,6 +257,29 @@ class Source:
             logger.error(im.INVALID_REPAIR_DELAY_ERR_MSG.format(delay=self._emis_rep_delay))
             sys.exit()
 
+    def _get_rep_delays(
+        self, n_emissions: int, repair_delay_dataframe: pd.DataFrame
+    ) -> list[int | float]:
+        if isinstance(self._emis_rep_delay, int):
+            return [self._emis_rep_delay] * n_emissions
+        elif n_emissions == 0:
+            return []
+        elif isinstance(self._emis_rep_delay, list):
+            return list(np.random.choice(self._emis_rep_delay, size=n_emissions))
+        elif isinstance(self._emis_rep_delay, str):
+            if self._emis_rep_delay in repair_delay_dataframe:
+                return list(
+                    np.random.choice(repair_delay_dataframe[self._emis_rep_delay], size=n_emissions)
+                )
+            else:
+                logger: logging.Logger = logging.getLogger(__name__)
+                logger.error(im.INVALID_REPAIR_DELAY_COL_MSG.format(key=self._emis_rep_delay))
+                sys.exit()
+        else:
+            logger: logging.Logger = logging.getLogger(__name__)
+            logger.error(im.INVALID_REPAIR_DELAY_ERR_MSG.format(delay=self._emis_rep_delay))
+            sys.exit()
+
     def _get_rep_cost(self):
         return self._emis_rep_cost
 
@@ -228,31 +293,69 @@ class Source:
         sim_start_date,
         emission_rate_source_dictionary: dict[str, EmissionsSource],
         repair_delay_dataframe: pd.DataFrame,
+    ) -> emission_types.Emission:
+        rate = self._get_rate(emission_rate_source_dictionary)
+        repair_delay = self._get_rep_delay(repair_delay_dataframe) if self._repairable else None
+        return self._build_emission(leak_count, start_date, sim_start_date, rate, repair_delay)
+
+    def _create_emissions(
+        self,
+        leak_count: int,
+        start_dates: list[date],
+        sim_start_date: date,
+        emission_rate_source_dictionary: dict[str, EmissionsSource],
+        repair_delay_dataframe: pd.DataFrame,
+    ) -> list[emission_types.Emission]:
+        """Create an emission for each of the given start dates, numbered from leak_count.
+        The rates, then the repair delays, of all the emissions are drawn in one call each.
+        """
+        n_emissions: int = len(start_dates)
+        rates: np.ndarray = self._get_rates(n_emissions, emission_rate_source_dictionary)
+        if self._repairable:
+            repair_delays = self._get_rep_delays(n_emissions, repair_delay_dataframe)
+        else:
+            repair_delays = [None] * n_emissions
+        return [
+            self._build_emission(
+                leak_count + emission_n, start_date, sim_start_date, rate, repair_delay
+            )
+            for emission_n, (start_date, rate, repair_delay) in enumerate(
+                zip(start_dates, rates, repair_delays)
+            )
+        ]
+
+    def _build_emission(
+        self,
+        leak_count,
+        start_date,
+        sim_start_date,
+        rate,
+        repair_delay,
     ) -> emission_types.Emission:
         if self._repairable:
             if self._persistent:
                 return emission_types.RepairableEmission(
                     emission_n=leak_count,
-                    rate=self._get_rate(emission_rate_source_dictionary),
+                    rate=rate,
                     start_date=start_date,
                     simulation_sd=sim_start_date,
                     repairable=self._get_repairable(),
                     tech_spat_cov_probs=self._meth_spat_covs,
                     tech_temp_cov_probs=self._meth_temp_covs,
-                    repair_delay=self._get_rep_delay(repair_delay_dataframe),
+                    repair_delay=repair_delay,
                     repair_cost=self._get_rep_cost(),
                     nrd=self._get_emis_duration(),
                 )
             else:
                 return emission_types.IntermittentRepairableEmission(
                     emission_number=leak_count,
-                    emission_rate=self._get_rate(emission_rate_source_dictionary),
+                    emission_rate=rate,
                     start_date=start_date,
                     simulation_start_date=sim_start_date,
                     repairable=self._get_repairable(),
                     tech_spatial_coverage_probabilities=self._meth_spat_covs,
                     tech_temporal_coverage_probabilities=self._meth_temp_covs,
-                    repair_delay=self._get_rep_delay(repair_delay_dataframe),
+                    repair_delay=repair_delay,
                     repair_cost=self._get_rep_cost(),
                     duration=self._get_emis_duration(),
                     active_duration=self._active_duration,
@@ -262,7 +365,7 @@ class Source:
             if self._persistent:
                 return emission_types.NonRepairableEmission(
                     emission_n=leak_count,
-                    rate=self._get_rate(emission_rate_source_dictionary),
+                    rate=rate,
                     start_date=start_date,
                     simulation_sd=sim_start_date,
                     repairable=self._get_repairable(),
@@ -273,7 +376,7 @@ class Source:
             else:
                 return emission_types.IntermittentNonRepairableEmission(
                     emission_number=leak_count,
-                    emission_rate=self._get_rate(emission_rate_source_dictionary),
+                    emission_rate=rate,
                     start_date=start_date,
                     simulation_start_date=sim_start_date,
                     repairable=self._get_repairable(),
@@ -320,28 +423,24 @@ class Source:
             #  RNG the number of emissions to create and RNG the date for each emission
 
             # Generate Pre-Existing Emissions to exist at the start of simulation
-            # The loop is working backwards in time, starting from 1 day before simulation start
 
-            # This first loop is to generate emissions that are already active
-            # at the start of the simulation. If only one emission is allowed
-            # for the given source, the loop will break once the first is made,
+            # These are emissions that are already active at the start of the simulation.
+            # If only one emission is allowed for the given source, only the first is made,
             # since no other emissions should exist
-
-            for day in filtered_emission_dates:
-                emis_start_date: date = day.date()
-                emission: emission_types.Emission = self._create_emission(
+            pre_existing_start_dates: list[date] = [day.date() for day in filtered_emission_dates]
+            if not self._multi_emissions and pre_existing_start_dates:
+                pre_existing_start_dates = pre_existing_start_dates[:1]
+                last_emis_day = pre_existing_start_dates[0] + timedelta(days=self._emis_duration)
+            emissions_fifo.extend(
+                self._create_emissions(
                     leak_count=leak_count,
-                    start_date=emis_start_date,
+                    start_dates=pre_existing_start_dates,
                     sim_start_date=sim_start_date,
                     emission_rate_source_dictionary=emission_rate_source_dictionary,
                     repair_delay_dataframe=repair_delay_dataframe,
                 )
-                leak_count += 1
-                emissions_fifo.append(emission)
-                if not self._multi_emissions:
-                    last_emis_day = emis_start_date + timedelta(days=self._emis_duration)
-                    # If only one emission is allowed, break the loop
-                    break
+            )
+            leak_count += len(pre_existing_start_dates)
 
         # Generate Emissions for the course of the simulation
         date_diff: timedelta = sim_end_date - sim_start_date
@@ -354,25 +453,29 @@ class Source:
         # Filter dates where emissions should be created
         emission_dates = simulation_dates[simulation_emissions == 1]
 
+        start_dates: list[date] = []
         for day in emission_dates:
             emis_start_date: date = day.date()
             # Skip emission creation if it's too soon after the last one
             if not self._multi_emissions and emis_start_date <= last_emis_day:
                 continue
+            start_dates.append(emis_start_date)
+            if not self._multi_emissions:
+                # if only a single emission can be made,
+                # update the last_emis_day based on the new emission
+                last_emis_day = emis_start_date + timedelta(days=self._emis_duration)
 
-            emission: emission_types.Emission = self._create_emission(
+        # The emission values do not affect which emissions are made, so all of them
+        # are drawn at once
+        emissions_fifo.extend(
+            self._create_emissions(
                 leak_count=leak_count,
-                start_date=emis_start_date,
+                start_dates=start_dates,
                 sim_start_date=sim_start_date,
                 emission_rate_source_dictionary=emission_rate_source_dictionary,
                 repair_delay_dataframe=repair_delay_dataframe,
             )
-            leak_count += 1
-            emissions_fifo.append(emission)
-            if not self._multi_emissions:
-                # if only a single emission can be made,
-                # update the last_emis_day based on the new emission
-                last_emis_day = emis_start_date + timedelta(days=self._emis_duration)
+        )
         emissions_fifo.reverse()
         self._generated_emissions[sim_number] = emissions_fifo
         return {self._source_ID: emissions_fifo}
@@ -393,14 +496,14 @@ class Source:
         sim_emissions: list[emission_types.Emission] = self._generated_emissions[sim_number]
 
         if self._next_emission is None and sim_emissions:
-            focus_emission: emission_types.Emission = sim_emissions.pop()
+            focus_emission: emission_types.Emission = self._pop_emission(sim_emissions)
         else:
             focus_emission: emission_types.Emission = self._next_emission
 
         while focus_emission and focus_emission.activate(date):
             newly_activated_emissions.append(focus_emission)
             if sim_emissions:
-                focus_emission = sim_emissions.pop()
+                focus_emission = self._pop_emission(sim_emissions)
             else:
                 focus_emission = None
 
@@ -408,6 +511,17 @@ class Source:
 
         return newly_activated_emissions
 
+    def _pop_emission(
+        self, sim_emissions: list[emission_types.Emission] | SourceEmissionRecords
+    ) -> emission_types.Emission:
+        if isinstance(sim_emissions, SourceEmissionRecords):
+            # Emissions read from an emission scenario are only built once they are reached
+            leak_count, start_date, rate, repair_delay = sim_emissions.pop()
+            return self._build_emission(
+                leak_count, start_date, sim_emissions.get_sim_start_date(), rate, repair_delay
+            )
+        return sim_emissions.pop()
+
     def set_pregen_emissions(self, src_emissions, sim_number) -> None:
         self._generated_emissions.clear()
         self._generated_emissions[sim_number] = src_emissions
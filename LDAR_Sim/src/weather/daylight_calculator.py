@@ -18,66 +18,170 @@
 #
 # ------------------------------------------------------------------------------
 
-from datetime import date, timedelta, datetime
-import ephem
+from datetime import date, timedelta
+import os
+from pathlib import Path
+
+import numpy as np
+
+from constants.file_name_constants import Generator_Files
+
+# Altitude of the center of the sun at dawn and dusk, without atmospheric refraction
+# -6 = civil twilight, -12 = nautical, -18 = astronomical
+TWILIGHT_ALTITUDE = np.radians(-6.0)
+J2000_JULIAN_DAY = 2451545.0
+UNIX_EPOCH_JULIAN_DAY = 2440587.5
+# Days before and after each date to look for the previous dawn and next dusk in
+EVENT_DAY_OFFSETS = np.arange(-2, 2)
+# Refinements of the dawn and dusk times, each recalculating the sun position at the last time
+EVENT_TIME_ITERATIONS = 4
+
+
+def _calc_sun_position(julian_day: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate the declination of the sun and the equation of time, both in radians,
+    with the NOAA solar position equations (from Meeus, Astronomical Algorithms)"""
+    T = (julian_day - J2000_JULIAN_DAY) / 36525.0
+    mean_long = np.radians((280.46646 + T * (36000.76983 + 0.0003032 * T)) % 360)
+    mean_anom = np.radians(357.52911 + T * (35999.05029 - 0.0001537 * T))
+    eccent = 0.016708634 - T * (0.000042037 + 0.0000001267 * T)
+    center = np.radians(
+        np.sin(mean_anom) * (1.914602 - T * (0.004817 + 0.000014 * T))
+        + np.sin(2 * mean_anom) * (0.019993 - 0.000101 * T)
+        + np.sin(3 * mean_anom) * 0.000289
+    )
+    omega = np.radians(125.04 - 1934.136 * T)
+    apparent_long = mean_long + center - np.radians(0.00569 + 0.00478 * np.sin(omega))
+    mean_obliq = 23 + (26 + (21.448 - T * (46.815 + T * (0.00059 - T * 0.001813))) / 60) / 60
+    obliq = np.radians(mean_obliq + 0.00256 * np.cos(omega))
+    declination = np.arcsin(np.sin(obliq) * np.sin(apparent_long))
+    y = np.tan(obliq / 2) ** 2
+    equation_of_time = (
+        y * np.sin(2 * mean_long)
+        - 2 * eccent * np.sin(mean_anom)
+        + 4 * eccent * y * np.sin(mean_anom) * np.cos(2 * mean_long)
+        - 0.5 * y * y * np.sin(4 * mean_long)
+        - 1.25 * eccent * eccent * np.sin(2 * mean_anom)
+    )
+    return declination, equation_of_time
+
+
+def _calc_twilight_times(
+    day_start: np.ndarray, lat: float, lon: float, direction: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate the dawn (direction -1) or dusk (direction 1) times, as julian days, around
+    the solar noon of each UTC day. Also returns the cosine of the hour angle of the event,
+    which is outside of [-1, 1] when the sun stays above or below the twilight altitude."""
+    lat_rad: float = np.radians(lat)
+    solar_noon: np.ndarray = day_start + 0.5 - lon / 360.0
+    event_time: np.ndarray = solar_noon
+    for _ in range(EVENT_TIME_ITERATIONS):
+        declination, equation_of_time = _calc_sun_position(event_time)
+        cos_hour_angle = (np.sin(TWILIGHT_ALTITUDE) - np.sin(lat_rad) * np.sin(declination)) / (
+            np.cos(lat_rad) * np.cos(declination)
+        )
+        hour_angle = np.arccos(np.clip(cos_hour_angle, -1, 1))
+        event_time = solar_noon + (direction * hour_angle - equation_of_time) / (2 * np.pi)
+    return event_time, cos_hour_angle
+
+
+def calc_daylight_hours(lat: float, lon: float, start_date: date, end_date: date):
+    """Calculate the daylight hours at a location for each day from start to end date
+
+    The daylight of a date is the time from the last dawn before midnight (UTC) to the first
+    dusk after midnight, the same as from PyEphem's previous_rising and next_setting of the
+    center of the sun with no refraction. The whole date range is calculated at once. The
+    times agree with PyEphem to within a few seconds, so only dates with dawn or dusk within
+    seconds of midnight (UTC) can be counted from a different day.
+    """
+    n_days: int = (end_date - start_date).days + 1
+    midnight: np.ndarray = (
+        UNIX_EPOCH_JULIAN_DAY
+        + (np.datetime64(start_date) - np.datetime64("1970-01-01")).astype(int)
+        + np.arange(n_days, dtype=np.float64)
+    )
+    day_starts: np.ndarray = midnight[:, None] + EVENT_DAY_OFFSETS[None, :]
+    dawns, dawn_cos = _calc_twilight_times(day_starts, lat, lon, -1)
+    dusks, dusk_cos = _calc_twilight_times(day_starts, lat, lon, 1)
+    prev_dawn: np.ndarray = np.where(
+        (np.abs(dawn_cos) <= 1) & (dawns < midnight[:, None]), dawns, -np.inf
+    ).max(axis=1)
+    next_dusk: np.ndarray = np.where(
+        (np.abs(dusk_cos) <= 1) & (dusks > midnight[:, None]), dusks, np.inf
+    ).min(axis=1)
+
+    # Without a dawn or a dusk the sun stays up (polar day) or down (polar night), which is
+    # told by the missing event of the day with solar noon nearest to midnight
+    nearest_day: int = int(np.argmin(np.abs(EVENT_DAY_OFFSETS + 0.5 - lon / 360.0)))
+    missing_cos: np.ndarray = np.where(
+        np.isfinite(next_dusk), dawn_cos[:, nearest_day], dusk_cos[:, nearest_day]
+    )
+    hours: np.ndarray = np.where(
+        np.isfinite(prev_dawn) & np.isfinite(next_dusk),
+        (next_dusk - prev_dawn) * 24,
+        np.where(missing_cos < -1, 24.0, 0.0),
+    )
+    return {start_date + timedelta(days=day): hour for day, hour in enumerate(hours.tolist())}
+
+
+def load_daylight_hours(lat: float, lon: float, start_date: date, end_date: date, cache_dir: Path):
+    """Load the daylight hours at a location from the cache directory, calculating and
+    saving them there if they have not been calculated before"""
+    daylight_file: Path = cache_dir / Generator_Files.DAYLIGHT_FILE.format(
+        lat=lat, lon=lon, start=start_date, end=end_date
+    )
+    if os.path.isfile(daylight_file):
+        hours: np.ndarray = np.load(daylight_file)
+        return {start_date + timedelta(days=day): hour for day, hour in enumerate(hours.tolist())}
+    daylight_hours = calc_daylight_hours(lat, lon, start_date, end_date)
+    os.makedirs(cache_dir, exist_ok=True)
+    np.save(daylight_file, np.array(list(daylight_hours.values())))
+    return daylight_hours
 
 
 # Calculate the study area average daylight for each day of the simulation
 class DaylightCalculatorAve:
-    def __init__(self, site_lat_lon: tuple, start_date: date, end_date: date):
+    def __init__(self, site_lat_lon: tuple, start_date: date, end_date: date, cache_dir: Path):
         # Get average lat and lon values for the sites in your study area
 
         lat_ave = site_lat_lon[0]
         lon_ave = site_lat_lon[1]
 
-        curr_date = start_date
-
-        # Create an empty list to store the daylight hours - rounding down.
-        self.daylight_hours = {}
-        while curr_date <= end_date:
-            # Create ephem object
-            obs = ephem.Observer()
-            # Turn off PyEphem’s native mechanism for computing atmospheric refraction
-            # near the horizon
-            obs.pressure = 0
-            obs.horizon = "-6"  # -6 = civil twilight, -12 = nautical, -18 = astronomical
-            # Set the time
-            obs.date = datetime.combine(curr_date, datetime.min.time())
-            # set the latitude and longitude for object
-            obs.lat = str(lat_ave)
-            obs.lon = str(lon_ave)
-
-            # get the sunset and sunrise UTC time
-            try:
-                # get the sunset and sunrise UTC time
-                sunrise = obs.previous_rising(ephem.Sun(), use_center=True).datetime()
-                sunset = obs.next_setting(ephem.Sun(), use_center=True).datetime()
-                dif_hours = (sunset - sunrise).total_seconds() / 3600
-            except ephem.NeverUpError:
-                # Sun never rises: polar night
-                dif_hours = 0.0
-            except ephem.AlwaysUpError:
-                # Sun never sets: polar day
-                dif_hours = 24.0
-            self.daylight_hours[curr_date] = dif_hours
-            curr_date += timedelta(days=1)
+        self.daylight_hours = load_daylight_hours(lat_ave, lon_ave, start_date, end_date, cache_dir)
+        # Daylight hours of each weather cell with sites, for methods using local daylight
+        self.local_daylight_hours = {}
         return
 
     def __reduce__(self):
-        args = (self.daylight_hours,)
+        args = (self.daylight_hours, self.local_daylight_hours)
         return (self.__class__._reconstruct, args)
 
     @classmethod
-    def _reconstruct(cls, daylight_hours):
+    def _reconstruct(cls, daylight_hours, local_daylight_hours):
         # Create a new instance without invoking __init__
         instance = cls.__new__(cls)
         instance.daylight_hours = daylight_hours
+        instance.local_daylight_hours = local_daylight_hours
         return instance
 
+    def set_local_daylight(
+        self, weather, weather_cells, start_date: date, end_date: date, cache_dir: Path
+    ) -> None:
+        """Calculate the daylight hours once for every weather cell, given as (lat, lon) indexes,
+        at the location of the cell"""
+        for lat_ind, lon_ind in weather_cells:
+            lat, lon = weather.get_cell_loc(lat_ind, lon_ind)
+            self.local_daylight_hours[(lat_ind, lon_ind)] = load_daylight_hours(
+                lat, lon, start_date, end_date, cache_dir
+            )
+
     def get_daylight(self, curr_date: date):
         daylight = self.daylight_hours[curr_date]
         return daylight
 
+    def get_local_daylight(self, curr_date: date, lat_ind: int, lon_ind: int):
+        daylight = self.local_daylight_hours[(lat_ind, lon_ind)][curr_date]
+        return daylight
+
 
 # -----------------------------------------------------------------------------#
 # # TODO: Update and add in the functionality later to allow for more granular daylight calc
@@ -18,152 +18,161 @@
 #
 # ------------------------------------------------------------------------------
 
+import os
+import shutil
+from pathlib import Path
+
 import numpy as np
 from netCDF4 import Dataset
 
+import constants.param_default_const as pdc
+from constants.file_name_constants import Generator_Files
+from utils.generic_functions import hash_file
+
 
 class WeatherLookup:
-    def __init__(self, virtual_world, input_directory):
+    # Fields of the weather cache, saved as float32 arrays indexed as [hour, lat, lon]
+    WEATHER_FIELDS = ("temps", "winds", "precip")
+    COORDINATE_FIELDS = ("time_total", "latitude", "longitude")
+
+    def __init__(self, virtual_world, input_directory, cache_directory):
         """
         Read in NetCDF files and returns the environment at a given place in time.
+        The weather used is converted once into a cache in the cache directory, which is
+        memory-mapped so processes share the weather data instead of each holding a copy.
         """
-        # Initialize attributes to store weather data
-        self.temps = None
-        self.u_wind = None
-        self.v_wind = None
-        self.winds = None
-        self.precip = None
-        self.time_total = None
-        self.latitude = None
-        self.longitude = None
-        self.time_length = None
-        self.lat_length = None
-        self.lon_length = None
+        weather_file: Path = input_directory / virtual_world[pdc.Virtual_World_Params.WEATHER_FILE]
+        cache_dir: Path = cache_directory / Generator_Files.WEATHER_CACHE_FOLDER.format(
+            hash=hash_file(weather_file)
+        )
+        if not os.path.exists(cache_dir):
+            self.write_weather_cache(weather_file, cache_dir)
 
         # Load weather data
-        self.load_weather_data(virtual_world, input_directory)
+        self.load_weather_data(cache_dir)
 
-    def load_weather_data(self, virtual_world, in_dir):
-        # Read in weather data as NetCDF file(s)
-        with Dataset(in_dir / virtual_world["weather_file"], "r") as weather_data:
+    @classmethod
+    def write_weather_cache(cls, weather_file: Path, cache_dir: Path) -> None:
+        # Write to a temporary folder first so an interrupted conversion is never loaded
+        tmp_dir: Path = cache_dir.with_name(f"{cache_dir.name}_{os.getpid()}.tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        # Read in weather data as NetCDF file(s), one variable at a time
+        with Dataset(weather_file, "r") as weather_data:
             # Extract temperatures
-            self.temps = np.array(weather_data.variables["t2m"]) - 273.15
-            # Extract u wind component
-            self.u_wind = np.array(weather_data.variables["u10"])
-            # Extract v wind component
-            self.v_wind = np.array(weather_data.variables["v10"])
-            # Calculate the net wind speed
-            self.winds = np.sqrt(np.square(self.u_wind) + np.square(self.v_wind))
+            cls._save_field(tmp_dir, "temps", np.array(weather_data.variables["t2m"]) - 273.15)
+            # Calculate the net wind speed from the u and v wind components
+            cls._save_field(
+                tmp_dir,
+                "winds",
+                np.sqrt(
+                    np.square(np.array(weather_data.variables["u10"]))
+                    + np.square(np.array(weather_data.variables["v10"]))
+                ),
+            )
             # Extract precipitation values and convert to mm
-            self.precip = np.array(weather_data.variables["tp"]) * 1000
-            # Extract time values
-            self.time_total = weather_data.variables["time"][:]
-            # Extract latitude values
-            self.latitude = weather_data.variables["latitude"][:]
-            # Extract longitude values
-            self.longitude = weather_data.variables["longitude"][:]
-
-            self.lat_sort = np.argsort(self.latitude, kind="mergesort")
-            self.lon_sort = np.argsort(self.longitude, kind="mergesort")
-
-            self.latitude = self.latitude[self.lat_sort]
-            self.longitude = self.longitude[self.lon_sort]
-
-            # Length of time dimension - number of timesteps
-            self.time_length = len(self.time_total)
-            # Length of latitude dimension - n cells
-            self.lat_length = len(self.latitude)
-            # Length of longitude dimension - n cells
-            self.lon_length = len(self.longitude)
+            cls._save_field(tmp_dir, "precip", np.array(weather_data.variables["tp"]) * 1000)
+            # Extract time, latitude and longitude values
+            np.save(tmp_dir / "time_total.npy", np.ma.getdata(weather_data.variables["time"][:]))
+            np.save(tmp_dir / "latitude.npy", np.ma.getdata(weather_data.variables["latitude"][:]))
+            np.save(
+                tmp_dir / "longitude.npy", np.ma.getdata(weather_data.variables["longitude"][:])
+            )
+        try:
+            os.rename(tmp_dir, cache_dir)
+        except OSError:
+            # Another process wrote the same cache first
+            shutil.rmtree(tmp_dir)
+
+    @staticmethod
+    def _save_field(cache_dir: Path, field: str, values: np.ndarray) -> None:
+        np.save(cache_dir / f"{field}.npy", values.astype(np.float32, copy=False))
+
+    def load_weather_data(self, cache_dir: Path):
+        self.cache_dir: Path = cache_dir
+        for field in WeatherLookup.WEATHER_FIELDS:
+            setattr(self, field, np.load(cache_dir / f"{field}.npy", mmap_mode="r"))
+        for field in WeatherLookup.COORDINATE_FIELDS:
+            setattr(self, field, np.load(cache_dir / f"{field}.npy"))
+
+        self.lat_sort = np.argsort(self.latitude, kind="mergesort")
+        self.lon_sort = np.argsort(self.longitude, kind="mergesort")
+
+        self.latitude = self.latitude[self.lat_sort]
+        self.longitude = self.longitude[self.lon_sort]
+
+        # Length of time dimension - number of timesteps
+        self.time_length = len(self.time_total)
+        # Length of latitude dimension - n cells
+        self.lat_length = len(self.latitude)
+        # Length of longitude dimension - n cells
+        self.lon_length = len(self.longitude)
+
+        self._deployment_days: dict[tuple, np.ndarray] = {}
 
     def __reduce__(self):
-        args = (
-            self.temps,
-            self.u_wind,
-            self.v_wind,
-            self.winds,
-            self.precip,
-            self.time_total,
-            self.latitude,
-            self.longitude,
-            self.time_length,
-            self.lat_length,
-            self.lon_length,
-        )
+        # Only the location of the cache is sent to other processes, which map it themselves
+        args = (self.cache_dir,)
         return (self.__class__._reconstruct, args)
 
     @classmethod
-    def _reconstruct(
-        cls,
-        temps,
-        u_wind,
-        v_wind,
-        winds,
-        precip,
-        time_total,
-        latitude,
-        longitude,
-        time_length,
-        lat_length,
-        lon_length,
-    ):
+    def _reconstruct(cls, cache_dir):
         # Create a new instance without invoking __init__
         instance = cls.__new__(cls)
-        instance.temps = temps
-        instance.u_wind = u_wind
-        instance.v_wind = v_wind
-        instance.winds = winds
-        instance.precip = precip
-        instance.time_total = time_total
-        instance.latitude = latitude
-        instance.longitude = longitude
-        instance.time_length = time_length
-        instance.lat_length = lat_length
-        instance.lon_length = lon_length
+        instance.load_weather_data(cache_dir)
         return instance
 
-    def deployment_days(
-        self, method_name, config, start_date, start_work_hour=0, consider_weather=False
-    ):
+    def get_cell_loc(self, lat_ind: int, lon_ind: int) -> tuple[float, float]:
+        """Get the latitude and longitude of a weather cell from its (lat, lon) indexes"""
+        lat: float = float(self.latitude[np.flatnonzero(self.lat_sort == lat_ind)[0]])
+        lon: float = float(self.longitude[np.flatnonzero(self.lon_sort == lon_ind)[0]])
+        return lat, lon
+
+    def deployment_days(self, weather_envs: dict, hour: int) -> np.ndarray:
         """
         Generate a 3D space-time matrix of all days on which weather
         conditions are suitable for a given method to conduct LDAR.
-        Should only be called once/method during initialization.
+        Indexed as [day, lat, lon], with the weather checked at the given hour of each day.
+        Matrices are kept for each weather envelope, so methods with the same envelopes share one.
         DD = deployment day
         """
-
-        # Initialize empty boolean arrays for threshold pass(1)/fail(0)
-        bool_temp = np.zeros((self.lon_length, self.lat_length, self.virtual_world["timesteps"]))
-        bool_wind = np.zeros((self.lon_length, self.lat_length, self.virtual_world["timesteps"]))
-        bool_precip = np.zeros((self.lon_length, self.lat_length, self.virtual_world["timesteps"]))
-
-        # For each day...
-        for day in range(self.virtual_world["timesteps"]):
-            # Count DDs for each criteria
-            for lat in range(self.lat_length):
-                for lon in range(self.lon_length):
-                    # Check daily weather variables are within method range
-                    if (
-                        config["weather_envs"]["temp"][0]
-                        <= self.temps[day, lat, lon]
-                        <= config["weather_envs"]["temp"][1]
-                    ):
-                        bool_temp[lon, lat, day] = 1
-                    if (
-                        config["weather_envs"]["wind"][0]
-                        <= self.winds[day, lat, lon]
-                        <= config["weather_envs"]["wind"][1]
-                    ):
-                        bool_wind[lon, lat, day] = 1
-                    if (
-                        config["weather_envs"]["precip"][0]
-                        <= self.precip[day, lat, lon]
-                        <= config["weather_envs"]["precip"][1]
-                    ):
-                        bool_precip[lon, lat, day] = 1
-
-        # Check to see if all criteria (temp, wind, and precip) were met...
-        bool_sum = np.add(bool_temp, np.add(bool_wind, bool_precip))
-        DD_all = bool_sum == 3
-
+        cache_key = (
+            hour,
+            tuple(
+                tuple(weather_envs[param])
+                for param in (
+                    pdc.Method_Params.TEMP,
+                    pdc.Method_Params.WIND,
+                    pdc.Method_Params.PRECIP,
+                )
+            ),
+        )
+        DD_all = self._deployment_days.get(cache_key)
+        if DD_all is not None:
+            return DD_all
+
+        # Only full days of weather data can be checked
+        n_days = self.time_length // 24
+        hours = slice(hour, n_days * 24, 24)
+
+        DD_all = np.ones((n_days, self.lat_length, self.lon_length), dtype=bool)
+        for weather_vals, (lower, upper) in (
+            (self.temps, cache_key[1][0]),
+            (self.winds, cache_key[1][1]),
+            (self.precip, cache_key[1][2]),
+        ):
+            DD_all &= self._in_envelope(weather_vals[hours], lower, upper)
+
+        self._deployment_days[cache_key] = DD_all
         return DD_all
+
+    @staticmethod
+    def _in_envelope(weather_vals: np.ndarray, lower: float, upper: float) -> np.ndarray:
+        """
+        Check lower <= value <= upper for every value, comparing in the same precision that
+        comparing a single value of the array against the bounds would use.
+        """
+        in_envelope = np.ones(weather_vals.shape, dtype=bool)
+        for bound, compare in ((lower, np.greater_equal), (upper, np.less_equal)):
+            dtype = np.result_type(weather_vals.dtype.type(0), bound)
+            in_envelope &= compare(weather_vals.astype(dtype, copy=False), np.asarray(bound, dtype))
+        return in_envelope
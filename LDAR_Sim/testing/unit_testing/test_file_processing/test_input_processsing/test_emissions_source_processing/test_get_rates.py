@@ -0,0 +1,95 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_get_rates.py
+Purpose: Unit tests for drawing the rates of many emissions at once from an emissions source.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import numpy as np
+
+from file_processing.input_processing.emissions_source_processing import (
+    EmissionsSource,
+    EmissionsSourceDist,
+    EmissionsSourceSample,
+)
+
+
+def gen_dist_source(max_emis_rate: float) -> EmissionsSourceDist:
+    return EmissionsSourceDist(
+        source_id="dist",
+        unit_amount="kilogram",
+        unit_time="hour",
+        dist_type="lognorm",
+        dist_shape=["1.2"],
+        dist_scale="0.5",
+        max_emis_rate=max_emis_rate,
+    )
+
+
+def gen_sample_source(max_emis_rate: float) -> EmissionsSourceSample:
+    return EmissionsSourceSample(
+        source_id="sample",
+        unit_amount="kilogram",
+        unit_time="day",
+        samples=["0.5", "2", "8", "30"],
+        max_emis_rate=max_emis_rate,
+    )
+
+
+def draw_one_at_a_time(emis_source: EmissionsSource, n_rates: int) -> list[float]:
+    np.random.seed(0)
+    return [emis_source.get_a_rate() for _ in range(n_rates)]
+
+
+def draw_at_once(emis_source: EmissionsSource, n_rates: int) -> np.ndarray:
+    np.random.seed(0)
+    return emis_source.get_rates(n_rates)
+
+
+def test_dist_get_rates_matches_get_a_rate():
+    emis_source: EmissionsSourceDist = gen_dist_source(max_emis_rate=4.0)
+
+    rates: np.ndarray = draw_at_once(emis_source, 50)
+
+    np.testing.assert_allclose(rates, draw_one_at_a_time(emis_source, 50), rtol=1e-12)
+    # Some of the draws are capped at the maximum rate
+    assert np.isclose(rates, rates.max()).sum() > 1
+
+
+def test_sample_get_rates_matches_get_a_rate():
+    emis_source: EmissionsSourceSample = gen_sample_source(max_emis_rate=10.0)
+
+    rates: np.ndarray = draw_at_once(emis_source, 50)
+
+    np.testing.assert_array_equal(rates, draw_one_at_a_time(emis_source, 50))
+    assert rates.max() == emis_source._max_emis_rate
+
+
+def test_get_rates_are_not_capped_without_a_maximum_rate():
+    for emis_source in [gen_dist_source(float("nan")), gen_sample_source(float("nan"))]:
+        rates: np.ndarray = draw_at_once(emis_source, 50)
+
+        assert not np.isnan(rates).any()
+        np.testing.assert_allclose(rates, draw_one_at_a_time(emis_source, 50), rtol=1e-12)
+
+
+def test_get_rates_of_no_emissions_does_not_draw():
+    for emis_source in [gen_dist_source(4.0), gen_sample_source(10.0), EmissionsSource("base")]:
+        np.random.seed(0)
+        expected: float = np.random.random()
+        np.random.seed(0)
+        assert len(emis_source.get_rates(0)) == 0
+        assert np.random.random() == expected
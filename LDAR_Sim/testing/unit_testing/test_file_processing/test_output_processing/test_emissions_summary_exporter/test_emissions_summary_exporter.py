@@ -0,0 +1,182 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_emissions_summary_exporter.py
+Purpose: Unit tests for the exporter used to build and write the emissions summary.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from constants.output_file_constants import (
+    EMIS_DATA_COL_ACCESSORS as eca,
+    EMIS_DATA_FINAL_COL_ORDER,
+    EMIS_INFO_COLUMNS_TO_KEEP_FOR_DURATION_ESTIMATION,
+)
+from file_processing.output_processing.emissions_summary_exporter import (
+    EmissionsSummaryExporter,
+)
+from file_processing.output_processing.output_file_io import read_output_file
+from virtual_world.emission_types.non_repairable_emissions import NonRepairableEmission
+from virtual_world.emission_types.repairable_emission import RepairableEmission
+
+SIM_START: date = date(2020, 1, 1)
+SIM_END: date = date(2020, 12, 31)
+
+
+def gen_emission_summaries(n_emissions: int) -> list[dict]:
+    rng: np.random.Generator = np.random.default_rng(0)
+    summaries = []
+    for emission_n in range(n_emissions):
+        start_date: date = SIM_START + timedelta(days=int(rng.integers(0, 100)))
+        common = (emission_n, float(rng.uniform(0.1, 10)), start_date, SIM_START)
+        if emission_n % 3 == 2:
+            emission = NonRepairableEmission(*common, False, {"OGI": 0.5}, {}, 90)
+        else:
+            emission = RepairableEmission(*common, True, {"OGI": 0.5}, {}, 5, [100.0], 200)
+            if emission_n % 2:
+                emission.tag_leak(1.5, start_date + timedelta(days=10), 10, "operator", "1", 0)
+        emission.activate(start_date)
+        emission._active_days = int(rng.integers(1, 200))
+        if emission_n % 4 == 0:
+            emission.check_spatial_cov("OGI")
+        summary = emission.get_summary_dict(SIM_END)
+        summary.update({eca.SITE_ID: str(emission_n // 4), eca.EQG: "0", eca.COMP: "comp"})
+        summaries.append(summary)
+    return summaries
+
+
+def gen_object_emissions_summary(summaries: list[dict]) -> pd.DataFrame:
+    """The emissions summary as it was built before the exporter, one row at a time"""
+    emis_df = pd.DataFrame(columns=EMIS_DATA_FINAL_COL_ORDER, index=range(len(summaries)))
+    for row, summary in enumerate(summaries):
+        emis_df.loc[row] = summary
+    return emis_df
+
+
+def test_to_dataframe_matches_row_by_row_summary():
+    summaries: list[dict] = gen_emission_summaries(20)
+    exporter = EmissionsSummaryExporter(["OGI"])
+
+    emis_df: pd.DataFrame = exporter.to_dataframe(iter(summaries))
+
+    assert list(emis_df.columns) == EMIS_DATA_FINAL_COL_ORDER + ["OGI Spatial Coverage"]
+    assert emis_df[eca.DAYS_ACT].dtype == np.int32
+    assert emis_df[eca.T_VOL_EMIT].dtype == np.float64
+    assert emis_df[eca.REPAIRABLE].dtype == bool
+    assert emis_df["OGI Spatial Coverage"].isna().sum() == 15
+    pd.testing.assert_frame_equal(
+        emis_df[EMIS_DATA_FINAL_COL_ORDER].astype(object).fillna("missing"),
+        gen_object_emissions_summary(summaries).fillna("missing"),
+        check_index_type=False,
+    )
+
+
+def test_write_csv_in_chunks_matches_row_by_row_summary(tmp_path):
+    summaries: list[dict] = gen_emission_summaries(23)
+    exporter = EmissionsSummaryExporter([], chunk_size=5)
+
+    retained: pd.DataFrame = exporter.write(
+        iter(summaries),
+        tmp_path / "emissions_summary.csv",
+        retain=lambda emis_data: emis_data.loc[
+            emis_data[eca.REPAIRABLE], EMIS_INFO_COLUMNS_TO_KEEP_FOR_DURATION_ESTIMATION
+        ],
+    )
+
+    expected: pd.DataFrame = gen_object_emissions_summary(summaries)
+    with open(tmp_path / "expected.csv", "w", newline="") as f:
+        expected.to_csv(f, index=False, float_format="%.5f")
+    assert (tmp_path / "emissions_summary.csv").read_text() == (
+        tmp_path / "expected.csv"
+    ).read_text()
+    assert list(retained[eca.EMIS_ID]) == list(
+        expected.loc[expected[eca.REPAIRABLE].astype(bool), eca.EMIS_ID]
+    )
+
+
+def test_write_csv_writes_header_when_there_are_no_emissions(tmp_path):
+    exporter = EmissionsSummaryExporter(["OGI"])
+
+    retained: pd.DataFrame = exporter.write(
+        iter([]),
+        tmp_path / "emissions_summary.csv",
+        retain=lambda emis_data: emis_data.loc[
+            emis_data[eca.REPAIRABLE], EMIS_INFO_COLUMNS_TO_KEEP_FOR_DURATION_ESTIMATION
+        ],
+    )
+
+    written: pd.DataFrame = pd.read_csv(tmp_path / "emissions_summary.csv")
+    assert written.empty
+    assert list(written.columns) == EMIS_DATA_FINAL_COL_ORDER + ["OGI Spatial Coverage"]
+    assert retained.empty
+
+
+def test_write_parquet_in_chunks_matches_csv(tmp_path):
+    pytest.importorskip("pyarrow")
+    summaries: list[dict] = gen_emission_summaries(23)
+    exporter = EmissionsSummaryExporter(["OGI"], chunk_size=5)
+
+    exporter.write(iter(summaries), tmp_path / "emissions_summary.parquet", file_format="parquet")
+    exporter.write(iter(summaries), tmp_path / "emissions_summary.csv")
+
+    from_parquet: pd.DataFrame = pd.read_parquet(tmp_path / "emissions_summary.parquet")
+    from_csv: pd.DataFrame = pd.read_csv(
+        tmp_path / "emissions_summary.csv", dtype=str, keep_default_na=False
+    )
+    assert len(from_parquet) == 23
+    assert list(from_parquet.columns) == list(from_csv.columns)
+    np.testing.assert_array_equal(
+        from_parquet[eca.T_VOL_EMIT], from_csv[eca.T_VOL_EMIT].astype(float)
+    )
+    assert list(from_parquet[eca.DATE_BEG]) == list(from_csv[eca.DATE_BEG])
+    assert list(from_parquet[eca.TAGGED]) == list(from_csv[eca.TAGGED])
+
+
+def test_write_arrow_in_chunks_matches_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    summaries: list[dict] = gen_emission_summaries(23)
+    exporter = EmissionsSummaryExporter(["OGI"], chunk_size=5)
+
+    exporter.write(iter(summaries), tmp_path / "emissions_summary.parquet", file_format="parquet")
+    exporter.write(iter(summaries), tmp_path / "emissions_summary.arrow", file_format="arrow")
+
+    pd.testing.assert_frame_equal(
+        read_output_file(tmp_path / "emissions_summary.arrow"),
+        read_output_file(tmp_path / "emissions_summary.parquet"),
+    )
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_emissions_that_cannot_be_tagged_are_written_as_in_csv(tmp_path, file_format):
+    pytest.importorskip("pyarrow")
+    summaries: list[dict] = gen_emission_summaries(3)
+    assert summaries[2][eca.TAGGED] == "N/A"
+    exporter = EmissionsSummaryExporter(["OGI"])
+
+    exporter.write(iter(summaries), tmp_path / "emissions_summary.csv")
+    exporter.write(
+        iter(summaries), tmp_path / f"emissions_summary.{file_format}", file_format=file_format
+    )
+
+    from_csv: pd.DataFrame = pd.read_csv(
+        tmp_path / "emissions_summary.csv", dtype=str, keep_default_na=False
+    )
+    read_data: pd.DataFrame = read_output_file(tmp_path / f"emissions_summary.{file_format}")
+    assert list(read_data[eca.TAGGED]) == list(from_csv[eca.TAGGED]) == ["False", "True", "N/A"]
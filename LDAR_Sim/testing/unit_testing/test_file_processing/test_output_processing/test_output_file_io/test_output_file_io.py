@@ -0,0 +1,110 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_output_file_io.py
+Purpose: Unit tests for the writers and the reader of the program output files.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from constants.output_file_constants import EMIS_DATA_COL_ACCESSORS as eca
+from file_processing.output_processing import output_file_io
+
+
+def gen_output_data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            eca.SITE_ID: ["1", "2", "1", "3"],
+            eca.STATUS: ["Active", "Repaired", "Active", None],
+            eca.T_VOL_EMIT: [1.123456789, 2.0, 3.5, 0.0],
+            eca.DAYS_ACT: [1, 2, 3, 4],
+            eca.DATE_BEG: [date(2020, 1, 1), date(2020, 2, 1), date(2020, 3, 1), None],
+            eca.TAGGED: [True, "N/A", False, True],
+        }
+    )
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_typed_outputs_are_read_back_as_written(tmp_path, file_format):
+    pytest.importorskip("pyarrow")
+    data: pd.DataFrame = gen_output_data()
+    filename: str = output_file_io.get_output_file_name("test_0_emissions_summary", file_format)
+
+    output_file_io.write_output_file(data, tmp_path / filename, file_format)
+    read_data: pd.DataFrame = output_file_io.read_output_file(tmp_path / filename)
+
+    assert list(read_data.columns) == list(data.columns)
+    assert list(read_data[eca.SITE_ID]) == list(data[eca.SITE_ID])
+    assert read_data[eca.SITE_ID].dtype == object
+    assert list(read_data[eca.STATUS].iloc[:3]) == list(data[eca.STATUS].iloc[:3])
+    assert pd.isna(read_data[eca.STATUS].iloc[3])
+    pd.testing.assert_series_equal(read_data[eca.T_VOL_EMIT], data[eca.T_VOL_EMIT])
+    pd.testing.assert_series_equal(read_data[eca.DAYS_ACT], data[eca.DAYS_ACT])
+    assert list(read_data[eca.DATE_BEG]) == list(data[eca.DATE_BEG])
+    assert list(read_data[eca.TAGGED]) == ["True", "N/A", "False", "True"]
+
+
+def test_site_ids_and_statuses_are_dictionary_encoded():
+    pa = pytest.importorskip("pyarrow")
+
+    table = output_file_io.to_arrow_table(gen_output_data())
+
+    assert pa.types.is_dictionary(table.schema.field(eca.SITE_ID).type)
+    assert pa.types.is_dictionary(table.schema.field(eca.STATUS).type)
+    assert not pa.types.is_dictionary(table.schema.field(eca.DATE_BEG).type)
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "arrow"])
+def test_outputs_written_in_chunks_are_read_from_their_name(tmp_path, file_format):
+    if file_format != "csv":
+        pytest.importorskip("pyarrow")
+    # Every chunk has the same column types
+    data: pd.DataFrame = gen_output_data().drop(columns=[eca.TAGGED])
+
+    writer = output_file_io.open_output_writer(
+        tmp_path / output_file_io.get_output_file_name("Emissions Summary", file_format),
+        file_format,
+    )
+    writer.write(data.iloc[:2])
+    writer.write(data.iloc[2:])
+    writer.close()
+    read_data: pd.DataFrame = output_file_io.read_output_file(tmp_path / "Emissions Summary")
+
+    assert len(read_data) == 4
+    assert list(read_data[eca.SITE_ID].astype(str)) == list(data[eca.SITE_ID])
+    assert list(read_data[eca.T_VOL_EMIT]) == list(data[eca.T_VOL_EMIT])
+
+
+def test_empty_csv_outputs_are_read_as_empty_data(tmp_path):
+    (tmp_path / "test_0_timeseries.csv").write_text("")
+
+    read_data: pd.DataFrame = output_file_io.read_output_file(tmp_path / "test_0_timeseries.csv")
+
+    assert read_data.empty
+
+
+def test_missing_outputs_are_not_found(tmp_path):
+    assert output_file_io.find_output_file(tmp_path / "Emissions Summary") is None
+    with pytest.raises(FileNotFoundError):
+        output_file_io.read_output_file(tmp_path / "Emissions Summary")
+
+
+def test_invalid_output_formats_exit():
+    with pytest.raises(SystemExit):
+        output_file_io.check_output_format("xlsx")
@@ -0,0 +1,69 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_calculate_start_and_end_dates.py
+Purpose: Unit tests for the functions calculate_start_dates and calculate_end_dates
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import pandas as pd
+
+from file_processing.output_processing.program_output_helpers import (
+    calculate_end_date,
+    calculate_end_dates,
+    calculate_start_date,
+    calculate_start_dates,
+    find_group_starts,
+)
+from constants.output_file_constants import EMIS_DATA_COL_ACCESSORS as eca
+
+
+def gen_sorted_summary() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            eca.SITE_ID: ["site_1", "site_1", "site_1", "site_2", "site_3", "site_3"],
+            eca.SURVEY_COMPLETION_DATE: pd.to_datetime(
+                [
+                    "2023-01-01",
+                    "2023-01-11",
+                    "2023-02-01",
+                    "2023-01-05",
+                    "2023-01-01",
+                    "2023-01-08",
+                ]
+            ),
+            eca.PREV_CONDITION: [True, False, True, True, False, True],
+            eca.NEXT_CONDITION: [False, True, False, False, True, True],
+        }
+    )
+
+
+def test_find_group_starts():
+    group_starts = find_group_starts(gen_sorted_summary()[eca.SITE_ID])
+    assert group_starts.tolist() == [True, False, False, True, True, False]
+
+
+def test_start_and_end_dates_match_the_dates_of_each_site():
+    summary: pd.DataFrame = gen_sorted_summary()
+    group_starts = find_group_starts(summary[eca.SITE_ID])
+
+    start_dates: pd.Series = calculate_start_dates(summary, group_starts, 0.3)
+    end_dates: pd.Series = calculate_end_dates(summary, group_starts, 0.3)
+
+    for _, site_summary in summary.groupby(eca.SITE_ID):
+        expected_start_dates = calculate_start_date(site_summary.copy(), 0.3)
+        expected_end_dates = calculate_end_date(site_summary.copy(), 0.3)
+        assert start_dates[site_summary.index].tolist() == expected_start_dates.tolist()
+        assert end_dates[site_summary.index].tolist() == expected_end_dates.tolist()
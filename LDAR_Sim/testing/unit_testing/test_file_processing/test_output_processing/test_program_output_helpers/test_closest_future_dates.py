@@ -0,0 +1,69 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_closest_future_dates.py
+Purpose: Unit tests for the function find_closest_future_dates
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import pandas as pd
+
+from file_processing.output_processing.program_output_helpers import (
+    find_closest_future_date,
+    find_closest_future_dates,
+)
+
+
+def test_closest_future_dates_match_the_closest_future_date_of_each_row():
+    survey_site_ids = pd.Series(["site_1", "site_1", "site_2", "site_1", "site_2", "site_1"])
+    survey_completion_dates = pd.to_datetime(
+        pd.Series(["2023-01-10", "2023-01-05", "2023-01-04", "2023-01-05", "2023-02-01", None])
+    )
+    survey_start_dates = pd.to_datetime(
+        pd.Series(
+            ["2023-01-08", "2023-01-02", "2023-01-01", "2023-01-04", "2023-01-20", "2023-01-01"]
+        )
+    )
+    reference_site_ids = pd.Series(["site_1", "site_1", "site_2", "site_2", "site_1"])
+    reference_dates = pd.to_datetime(
+        pd.Series(["2023-01-01", "2023-01-03", "2023-01-04", "2023-02-02", "2023-01-05"])
+    )
+
+    result: pd.Series = find_closest_future_dates(
+        reference_site_ids,
+        reference_dates,
+        survey_site_ids,
+        survey_completion_dates,
+        survey_start_dates,
+    )
+
+    for site_id, reference_date, closest_date in zip(reference_site_ids, reference_dates, result):
+        potential_future_dates = [
+            (completion_date, start_date)
+            for survey_site_id, completion_date, start_date in zip(
+                survey_site_ids, survey_completion_dates, survey_start_dates
+            )
+            if survey_site_id == site_id and not pd.isnull(completion_date)
+        ]
+        expected = find_closest_future_date(reference_date, potential_future_dates)
+        if expected is None:
+            assert pd.isnull(closest_date)
+        else:
+            assert closest_date == expected
+    assert result.tolist()[:3] == [
+        pd.Timestamp("2023-01-02"),
+        pd.Timestamp("2023-01-03"),
+        pd.Timestamp("2023-01-20"),
+    ]
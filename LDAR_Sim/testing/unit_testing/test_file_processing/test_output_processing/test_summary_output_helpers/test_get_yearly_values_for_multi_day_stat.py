@@ -0,0 +1,77 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test get yearly values for multi day stat
+Purpose: Unit testing the get yearly values for multi day stat method.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import pandas as pd
+import pytest
+
+from file_processing.output_processing.summary_output_helpers import (
+    get_yearly_value_for_multi_day_stat,
+    get_yearly_values_for_multi_day_stat,
+)
+
+
+def get_mock_data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "start_date": ["2020-01-01", "2020-07-01", "2021-06-30", "2019-03-15", "2022-02-01"],
+            "end_date": ["2021-06-30", pd.NaT, "2022-12-31", "2020-01-02", "2022-02-01"],
+            "value": [15, 20, 20, 7, 3],
+        }
+    )
+
+
+def test_000_get_yearly_values_for_multi_day_stat_matches_each_year():
+    years = [2019, 2020, 2021, 2022, 2023]
+
+    result = get_yearly_values_for_multi_day_stat(
+        get_mock_data(), "value", years, "start_date", "end_date"
+    )
+
+    expected_output = [
+        get_yearly_value_for_multi_day_stat(
+            get_mock_data(), "value", year, "start_date", "end_date"
+        )
+        for year in years
+    ]
+    assert result == pytest.approx(expected_output)
+
+
+def test_001_get_yearly_values_for_multi_day_stat_splits_values_between_years():
+    df = pd.DataFrame(
+        {
+            "start_date": ["2021-12-31", "2020-01-01"],
+            "end_date": ["2022-01-01", "2020-01-01"],
+            "value": [10, 5],
+        }
+    )
+
+    result = get_yearly_values_for_multi_day_stat(
+        df, "value", [2020, 2021, 2022], "start_date", "end_date"
+    )
+
+    assert result == pytest.approx([5, 5, 5])
+
+
+def test_002_get_yearly_values_for_multi_day_stat_returns_zero_for_empty_data():
+    result = get_yearly_values_for_multi_day_stat(
+        pd.DataFrame(), "value", [2020, 2021], "start_date", "end_date"
+    )
+
+    assert result == [0, 0]
@@ -18,6 +18,8 @@ def mock_summary_output_manager_init(self):
         file_name_constants.Output_Files.SummaryFileNames.TS_SUMMARY,
     ]
     self._output_path = Path("test")
+    self._program_order = {}
+    self._program_summaries = []
     self._output_config = output_config = {
         output_file_constants.OutputConfigCategories.SUMMARY_OUTPUTS: {
             output_file_constants.OutputConfigCategories.SummaryOutputCatageories.SUMMARY_STATS: {
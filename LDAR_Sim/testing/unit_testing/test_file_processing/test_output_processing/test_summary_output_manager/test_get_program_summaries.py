@@ -0,0 +1,34 @@
+from file_processing.output_processing.summary_output_manager import SummaryOutputManager
+from constants import file_name_constants
+from constants.output_file_constants import TS_SUMMARY_COLUMNS_ACCESSORS as tsca
+
+
+def mock_summary_output_manager_init(self):
+    self._program_order = {"P_OGI": 0, "P_none": 1}
+    self._program_summaries = []
+
+
+def gen_program_summary(program_name: str, sim: int) -> dict:
+    return {
+        file_name_constants.Output_Files.SummaryFileNames.TS_SUMMARY: {
+            tsca.PROG_NAME: program_name,
+            tsca.SIM: str(sim),
+        }
+    }
+
+
+def test_program_summaries_are_ordered_by_program_and_simulation(mocker):
+    mocker.patch.object(SummaryOutputManager, "__init__", mock_summary_output_manager_init)
+    output_manager: SummaryOutputManager = SummaryOutputManager()
+    for program_name, sim in [("P_none", 1), ("P_OGI", 10), ("P_none", 0), ("P_OGI", 2)]:
+        output_manager.add_program_summaries(gen_program_summary(program_name, sim))
+    output_manager.add_program_summaries({})
+
+    program_summaries: list[dict] = output_manager.get_program_summaries()
+
+    assert program_summaries == [
+        gen_program_summary("P_OGI", 2),
+        gen_program_summary("P_OGI", 10),
+        gen_program_summary("P_none", 0),
+        gen_program_summary("P_none", 1),
+    ]
@@ -1,5 +1,12 @@
+import weakref
+
+import pandas as pd
+
 from constants import output_file_constants, param_default_const, file_name_constants
-from file_processing.output_processing.summary_output_mapper import SummaryOutputMapper
+from file_processing.output_processing.summary_output_mapper import (
+    SummaryOutputMapper,
+    YearlySummaryStat,
+)
 
 
 def get_mock_output_config_data():
@@ -69,3 +76,43 @@ def test_summary_output_mapper_init():
             file_name_constants.Output_Files.SummaryFileNames.TS_SUMMARY
         ).keys()
     ) == set(expected_timeseries_mapping_keys)
+
+
+def test_summary_output_mapper_calculates_yearly_values_once_per_data(mocker):
+    mock_sim_years = [2020, 2021, 2022]
+    mock_yearly_values = mocker.patch(
+        "file_processing.output_processing.summary_output_helpers"
+        ".get_yearly_values_for_multi_day_stat",
+        return_value=[1.0, 2.0, 3.0],
+    )
+    output_mapper: SummaryOutputMapper = SummaryOutputMapper(
+        get_mock_output_config_data(), mock_sim_years
+    )
+    summary_mappings = output_mapper.get_summary_mappings(
+        file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY
+    )
+    mock_data = pd.DataFrame()
+
+    yearly_values = [
+        summary_mappings[
+            output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_ANN_EMIS.format(year)
+        ](mock_data, "")
+        for year in mock_sim_years
+    ]
+
+    assert yearly_values == [1.0, 2.0, 3.0]
+    assert mock_yearly_values.call_count == 1
+
+
+def test_yearly_summary_stat_releases_data_once_every_year_is_read():
+    mock_data = pd.DataFrame({"a": [1, 2]})
+    data_ref = weakref.ref(mock_data)
+    yearly_stat = YearlySummaryStat(lambda df, dir: [1.0, 2.0, 3.0])
+
+    yearly_values = [
+        yearly_stat.get_year_value(mock_data, "", year_index) for year_index in range(3)
+    ]
+    del mock_data
+
+    assert yearly_values == [1.0, 2.0, 3.0]
+    assert data_ref() is None
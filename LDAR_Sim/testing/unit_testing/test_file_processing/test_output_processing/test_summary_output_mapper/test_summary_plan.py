@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from constants import output_file_constants, file_name_constants, file_processing_const
+from file_processing.output_processing import summary_output_helpers
+from file_processing.output_processing.summary_output_mapper import (
+    SummaryOutputMapper,
+    SummaryPlan,
+    SummaryStat,
+)
+
+
+def gen_timeseries_data() -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    return pd.DataFrame(
+        {
+            output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS: rng.exponential(5, 365),
+            output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_MIT: rng.exponential(3, 365),
+            output_file_constants.TIMESERIES_COL_ACCESSORS.EMIS_NON_MIT: rng.exponential(2, 365),
+            output_file_constants.TIMESERIES_COL_ACCESSORS.COST: rng.integers(0, 1000, 365),
+        }
+    )
+
+
+def gen_emissions_data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            output_file_constants.EMIS_DATA_COL_ACCESSORS.T_VOL_EMIT: [1.0, 2.0, 3.0, 4.0],
+            output_file_constants.EMIS_DATA_COL_ACCESSORS.EST_VOL_EMIT: [0.0, 1.0, 2.0, 3.0],
+            output_file_constants.EMIS_DATA_COL_ACCESSORS.MITIGATED: [0.0, 1.0, 1.0, 1.0],
+            output_file_constants.EMIS_DATA_COL_ACCESSORS.T_RATE: [10.0, 9.0, 8.0, 7.0],
+            output_file_constants.EMIS_DATA_COL_ACCESSORS.REPAIRABLE: [True, True, True, False],
+        }
+    )
+
+
+def calc_summary_stat_separately(df: pd.DataFrame, summary_stat: SummaryStat) -> float:
+    if summary_stat.filter_column is not None:
+        if summary_stat.filter_value:
+            df = df.loc[df[summary_stat.filter_column]]
+        else:
+            df = df.loc[~df[summary_stat.filter_column]]
+    if summary_stat.stat == file_processing_const.Multi_Sim_Output_Const.SUM_STAT:
+        return summary_output_helpers.get_sum(df, summary_stat.column)
+    elif summary_stat.stat == file_processing_const.Multi_Sim_Output_Const.MEAN_STAT:
+        return summary_output_helpers.get_mean_val(df, summary_stat.column)
+    return summary_output_helpers.get_nth_percentile(
+        df, summary_stat.column, summary_stat.percentile
+    )
+
+
+@pytest.mark.parametrize(
+    "summary_file, data",
+    [
+        (file_name_constants.Output_Files.SummaryFileNames.TS_SUMMARY, gen_timeseries_data()),
+        (file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY, gen_emissions_data()),
+    ],
+)
+def test_summary_plan_matches_each_summary_stat_calculated_separately(summary_file, data):
+    summary_mappings = SummaryOutputMapper.SUMMARY_MAPPINGS[summary_file]
+
+    summary_values = SummaryPlan(summary_mappings).calculate(data, "")
+
+    assert list(summary_values.keys()) == list(summary_mappings.keys())
+    for summary_column, summary_stat in summary_mappings.items():
+        assert summary_values[summary_column] == calc_summary_stat_separately(data, summary_stat)
+
+
+def test_summary_plan_calculates_the_percentiles_of_each_column_at_once(mocker):
+    summary_mappings = SummaryOutputMapper.SUMMARY_MAPPINGS[
+        file_name_constants.Output_Files.SummaryFileNames.TS_SUMMARY
+    ]
+    mock_percentiles = mocker.patch(
+        "file_processing.output_processing.summary_output_helpers.get_nth_percentiles",
+        wraps=summary_output_helpers.get_nth_percentiles,
+    )
+
+    SummaryPlan(summary_mappings).calculate(gen_timeseries_data(), "")
+
+    assert mock_percentiles.call_count == 4
+    for call in mock_percentiles.call_args_list:
+        assert list(call.args[1]) == [95, 5]
+
+
+def test_summary_plan_filters_rows_of_the_summary_stats():
+    summary_values = SummaryPlan(
+        SummaryOutputMapper.SUMMARY_MAPPINGS[
+            file_name_constants.Output_Files.SummaryFileNames.EMIS_SUMMARY
+        ]
+    ).calculate(gen_emissions_data(), "")
+
+    assert summary_values[output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_TOTAL_EMIS] == 10
+    assert (
+        summary_values[output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_TOTAL_MIT_EMIS] == 6
+    )
+    assert (
+        summary_values[output_file_constants.EMIS_SUMMARY_COLUMNS_ACCESSORS.T_TOTAL_NON_MIT_EMIS]
+        == 4
+    )
+
+
+def test_summary_plan_calls_other_mappings():
+    summary_values = SummaryPlan({"Custom": lambda df, dir: len(df)}).calculate(
+        gen_emissions_data(), ""
+    )
+
+    assert summary_values == {"Custom": 4}
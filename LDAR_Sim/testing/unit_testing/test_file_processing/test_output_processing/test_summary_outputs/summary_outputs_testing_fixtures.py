@@ -0,0 +1,279 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        summary_outputs_testing_fixtures.py
+Purpose: Contains the mock program outputs and expected summaries shared by the
+summary outputs tests
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import pandas as pd
+
+from constants import param_default_const
+from file_processing.output_processing.summary_output_mapper import SummaryOutputMapper
+from src.constants.output_file_constants import (
+    EMIS_DATA_COL_ACCESSORS as eca,
+    EMIS_SUMMARY_COLUMNS_ACCESSORS as esca,
+    TIMESERIES_COL_ACCESSORS as tca,
+    TS_SUMMARY_COLUMNS_ACCESSORS as tsca,
+)
+
+mock_summary_stats_config = {
+    param_default_const.Output_Params.TIMESERIES_SUMMARY: {
+        param_default_const.Output_Params.AVERAGE_DAILY_EMISSIONS: True,
+        param_default_const.Output_Params.AVERAGE_MITIGABLE_DAILY_EMISSIONS: True,
+        param_default_const.Output_Params.AVERAGE_NON_MITIGABLE_DAILY_EMISSIONS: True,
+        param_default_const.Output_Params.PERCENTILE_95_DAILY_EMISSIONS: True,
+        param_default_const.Output_Params.PERCENTILE_95_MITIGABLE_DAILY_EMISSIONS: True,
+        param_default_const.Output_Params.PERCENTILE_95_NON_MITIGABLE_DAILY_EMISSIONS: True,
+        param_default_const.Output_Params.PERCENTILE_5_DAILY_EMISSIONS: True,
+        param_default_const.Output_Params.PERCENTILE_5_MITIGABLE_DAILY_EMISSIONS: True,
+        param_default_const.Output_Params.PERCENTILE_5_NON_MITIGABLE_DAILY_EMISSIONS: True,
+        param_default_const.Output_Params.AVERAGE_DAILY_COST: True,
+        param_default_const.Output_Params.PERCENTILE_95_DAILY_COST: True,
+        param_default_const.Output_Params.PERCENTILE_5_DAILY_COST: True,
+    },
+    param_default_const.Output_Params.EMISSIONS_SUMMARY: {
+        param_default_const.Output_Params.EMISSIONS_SUMMARY_TOT_MITIGATION: True,
+        param_default_const.Output_Params.EMISSIONS_SUMMARY_TOTAL_TRUE: True,
+        param_default_const.Output_Params.EMISSIONS_SUMMARY_TOTAL_ESTIMATED: True,
+        param_default_const.Output_Params.EMISSIONS_SUMMARY_TOTAL_MITIGABLE: True,
+        param_default_const.Output_Params.EMISSIONS_SUMMARY_TOTAL_NON_MITIGABLE: True,
+        param_default_const.Output_Params.EMISSIONS_SUMMARY_AVERAGE_RATE: True,
+        param_default_const.Output_Params.EMISSIONS_SUMMARY_PERCENTILE_95_RATE: True,
+        param_default_const.Output_Params.EMISSIONS_SUMMARY_PERCENTILE_5_RATE: True,
+        param_default_const.Output_Params.EMISSIONS_SUMMARY_AVERAGE_AMOUNT: True,
+        param_default_const.Output_Params.EMISSIONS_SUMMARY_PERCENTILE_95_AMOUNT: True,
+        param_default_const.Output_Params.EMISSIONS_SUMMARY_PERCENTILE_5_AMOUNT: True,
+    },
+}
+
+
+def get_mock_summary_output_mapper(sim_years: list[int] = [2024, 2025]):
+    SummaryOutputsMapper: SummaryOutputMapper = SummaryOutputMapper(
+        mock_summary_stats_config, sim_years
+    )
+    return SummaryOutputsMapper
+
+
+mock_emis_csv_data = {
+    "test_0_emissions_summary.csv": pd.DataFrame(
+        {
+            eca.T_VOL_EMIT: [1, 2, 3, 4],
+            eca.EST_VOL_EMIT: [0, 1, 2, 3],
+            eca.MITIGATED: [0, 1, 1, 1],
+            eca.T_RATE: [10, 9, 8, 7],
+            eca.M_RATE: [9, 8, 7, 6],
+            eca.REPAIRABLE: [True, True, True, False],
+            eca.DATE_BEG: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+            eca.DATE_REP_EXP: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+            eca.THEORY_DATE: ["2024-01-02", "2024-01-02", "2025-01-02", "2025-01-01"],
+        }
+    ),
+    "test_1_emissions_summary.csv": pd.DataFrame(
+        {
+            eca.T_VOL_EMIT: [5, 6, 7, 8],
+            eca.EST_VOL_EMIT: [4, 5, 6, 7],
+            eca.MITIGATED: [1, 1, 1, 0],
+            eca.T_RATE: [6, 5, 4, 3],
+            eca.M_RATE: [5, 4, 3, 2],
+            eca.REPAIRABLE: [True, True, True, False],
+            eca.DATE_BEG: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+            eca.DATE_REP_EXP: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+            eca.THEORY_DATE: ["2024-01-02", "2024-01-02", "2025-01-02", "2025-01-01"],
+        }
+    ),
+    "test_2_emissions_summary.csv": pd.DataFrame(
+        {
+            eca.T_VOL_EMIT: [9, 10, 11, 12],
+            eca.EST_VOL_EMIT: [8, 9, 10, 11],
+            eca.MITIGATED: [1, 1, 1, 1],
+            eca.T_RATE: [3, 2, 1, 0],
+            eca.M_RATE: [2, 1, 0, 0],
+            eca.REPAIRABLE: [True, True, True, False],
+            eca.DATE_BEG: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+            eca.DATE_REP_EXP: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+            eca.THEORY_DATE: ["2024-01-02", "2024-01-02", "2025-01-02", "2025-01-01"],
+        }
+    ),
+}
+
+expected_emis_summary_csv = pd.DataFrame(
+    {
+        esca.PROG_NAME: ["test", "test", "test"],
+        esca.SIM: ["0", "1", "2"],
+        esca.T_TOT_MIT: [3, 3, 4],
+        esca.T_TOTAL_EMIS: [10, 26, 42],
+        esca.EST_TOTAL_EMIS: [6, 22, 38],
+        esca.T_TOTAL_MIT_EMIS: [6, 18, 30],
+        esca.T_TOTAL_NON_MIT_EMIS: [4, 8, 12],
+        esca.AVG_T_EMIS_RATE: [8.5, 4.5, 1.5],
+        esca.T_EMIS_RATE_95: [10.0, 6.0, 3.0],
+        esca.T_EMIS_RATE_5: [7.0, 3.0, 0.0],
+        esca.T_AVG_EMIS_AMOUNT: [2.5, 6.5, 10.5],
+        esca.T_EMIS_AMOUNT_95: [4.0, 8.0, 12.0],
+        esca.T_EMIS_AMOUNT_5: [1.0, 5.0, 9.0],
+        esca.T_ANN_MIT.format(2024): [1.0, 2.0, 2.0],
+        esca.T_ANN_MIT.format(2025): [2.0, 1.0, 2.0],
+        esca.T_ANN_EMIS.format(2024): [3.0, 11.0, 19.0],
+        esca.T_ANN_EMIS.format(2025): [7.0, 15.0, 23.0],
+        esca.EST_ANN_EMIS.format(2024): [0.0, 0.0, 0.0],
+        esca.EST_ANN_EMIS.format(2025): [0.0, 0.0, 0.0],
+    }
+)
+expected_emis_summary_csv2 = pd.DataFrame(
+    {
+        esca.PROG_NAME: ["test", "test", "test"],
+        esca.SIM: ["0", "1", "2"],
+        esca.T_TOT_MIT: [3, 3, 4],
+        esca.T_TOTAL_EMIS: [10, 26, 42],
+        esca.EST_TOTAL_EMIS: [6, 22, 38],
+        esca.T_TOTAL_MIT_EMIS: [6, 18, 30],
+        esca.T_TOTAL_NON_MIT_EMIS: [4, 8, 12],
+        esca.AVG_T_EMIS_RATE: [8.5, 4.5, 1.5],
+        esca.T_EMIS_RATE_95: [10.0, 6.0, 3.0],
+        esca.T_EMIS_RATE_5: [7.0, 3.0, 0.0],
+        esca.T_AVG_EMIS_AMOUNT: [2.5, 6.5, 10.5],
+        esca.T_EMIS_AMOUNT_95: [4.0, 8.0, 12.0],
+        esca.T_EMIS_AMOUNT_5: [1.0, 5.0, 9.0],
+        esca.T_ANN_MIT.format(2024): [1.0, 2.0, 2.0],
+        esca.T_ANN_MIT.format(2025): [2.0, 1.0, 2.0],
+        esca.T_ANN_EMIS.format(2024): [3.0, 11.0, 19.0],
+        esca.T_ANN_EMIS.format(2025): [7.0, 15.0, 23.0],
+        esca.EST_ANN_EMIS.format(2024): [0.0, 7.0, 13.0],
+        esca.EST_ANN_EMIS.format(2025): [3.0, 11.0, 17.0],
+    }
+)
+
+
+mock_ts_csv_data = {
+    "test_0_timeseries.csv": pd.DataFrame(
+        {
+            tca.EMIS: [1, 2, 3, 4],
+            tca.COST: [10, 9, 8, 7],
+            tca.EMIS_MIT: [1, 2, 2, 2],
+            tca.EMIS_NON_MIT: [0, 0, 1, 2],
+        }
+    ),
+    "test_1_timeseries.csv": pd.DataFrame(
+        {
+            tca.EMIS: [5, 6, 7, 8],
+            tca.COST: [6, 5, 4, 3],
+            tca.EMIS_MIT: [5, 6, 6, 6],
+            tca.EMIS_NON_MIT: [0, 0, 1, 2],
+        }
+    ),
+    "test_2_timeseries.csv": pd.DataFrame(
+        {
+            tca.EMIS: [9, 10, 11, 12],
+            tca.COST: [3, 2, 1, 0],
+            tca.EMIS_MIT: [9, 10, 10, 10],
+            tca.EMIS_NON_MIT: [0, 0, 1, 2],
+        }
+    ),
+}
+
+expected_ts_summary_csv = pd.DataFrame(
+    {
+        tsca.PROG_NAME: ["test", "test", "test"],
+        tsca.SIM: ["0", "1", "2"],
+        tsca.AVG_T_DAILY_EMIS: [2.5, 6.5, 10.5],
+        tsca.AVG_T_MIT_DAILY_EMIS: [1.75, 5.75, 9.75],
+        tsca.AVG_T_NON_MIT_DAILY_EMIS: [0.75, 0.75, 0.75],
+        tsca.T_DAILY_EMIS_95: [4.0, 8.0, 12.0],
+        tsca.T_MIT_DAILY_EMIS_95: [2.0, 6.0, 10.0],
+        tsca.T_NON_MIT_DAILY_EMIS_95: [2.0, 2.0, 2.0],
+        tsca.T_DAILY_EMIS_5: [1.0, 5.0, 9.0],
+        tsca.T_MIT_DAILT_EMIS_5: [1.0, 5.0, 9.0],
+        tsca.T_NON_MIT_DAILY_EMIS_5: [0.0, 0.0, 0.0],
+        tsca.AVG_DAILY_COST: [8.5, 4.5, 1.5],
+        tsca.DAILY_COST_95: [10.0, 6.0, 3.0],
+        tsca.DAILY_COST_5: [7.0, 3.0, 0.0],
+    }
+)
+expected_emis_est = pd.DataFrame(
+    {
+        esca.PROG_NAME: ["test", "test", "test"],
+        esca.SIM: ["0", "1", "2"],
+        esca.EST_ANN_EMIS.format(2024): [0.0, 7.0, 13.0],
+        esca.EST_ANN_EMIS.format(2025): [3.0, 11.0, 17.0],
+    }
+)
+
+
+mock_est_emis_csv_data = {
+    "test_0_estimated_emissions.csv": pd.DataFrame(
+        {
+            eca.SITE_ID: [1, 1, 1, 1],
+            eca.SITE_TYPE: ["A", "A", "A", "A"],
+            eca.SITE_MEASURED: [True, True, True, True],
+            eca.EST_VOL_EMIT: [0, 1, 2, 3],
+            eca.M_RATE: [9, 8, 7, 6],
+            eca.REPAIRABLE: [True, True, True, False],
+            eca.START_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+            eca.END_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+        }
+    ),
+    "test_1_estimated_emissions.csv": pd.DataFrame(
+        {
+            eca.SITE_ID: [1, 1, 1, 1],
+            eca.SITE_TYPE: ["A", "A", "A", "A"],
+            eca.SITE_MEASURED: [True, True, True, True],
+            eca.EST_VOL_EMIT: [4, 5, 6, 7],
+            eca.M_RATE: [5, 4, 3, 2],
+            eca.START_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+            eca.END_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+        }
+    ),
+    "test_2_estimated_emissions.csv": pd.DataFrame(
+        {
+            eca.SITE_ID: [1, 1, 1, 1],
+            eca.SITE_TYPE: ["A", "A", "A", "A"],
+            eca.SITE_MEASURED: [True, True, True, True],
+            eca.EST_VOL_EMIT: [8, 9, 10, 11],
+            eca.M_RATE: [2, 1, 0, 0],
+            eca.START_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+            eca.END_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+        }
+    ),
+}
+
+
+mock_emis_to_remove_csv_data = {
+    "test_0_estimated_repaired_emissions_to_remove.csv": pd.DataFrame(
+        {
+            eca.EST_VOL_EMIT: [0, 1, 1, 1],
+            eca.M_RATE: [9, 8, 7, 6],
+            eca.START_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+            eca.END_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+        }
+    ),
+    "test_1_estimated_repaired_emissions_to_remove.csv": pd.DataFrame(
+        {
+            eca.EST_VOL_EMIT: [1, 1, 1, 1],
+            eca.M_RATE: [5, 4, 3, 2],
+            eca.START_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+            eca.END_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+        }
+    ),
+    "test_2_estimated_repaired_emissions_to_remove.csv": pd.DataFrame(
+        {
+            eca.EST_VOL_EMIT: [2, 2, 2, 2],
+            eca.M_RATE: [2, 1, 0, 0],
+            eca.START_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+            eca.END_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
+        }
+    ),
+}
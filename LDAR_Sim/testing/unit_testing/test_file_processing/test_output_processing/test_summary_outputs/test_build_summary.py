@@ -0,0 +1,243 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_build_summary.py
+Purpose: Contains the unit tests for building the summaries from the summary rows
+of each program simulation
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from constants.file_name_constants import Output_Files
+from constants.infrastructure_const import Deployment_TF_Sites_Constants as DTSC
+from constants.output_file_constants import (
+    EMIS_DATA_COL_ACCESSORS as eca,
+    EMIS_SUMMARY_COLUMNS_ACCESSORS as esca,
+    TIMESERIES_COLUMNS,
+)
+from constants.param_default_const import Duration_Method as dm, Output_Params as op
+from file_processing.output_processing.program_output_manager import ProgramOutputManager
+from file_processing.output_processing.summary_outputs import (
+    build_emissions_summary,
+    build_timeseries_summary,
+    generate_emissions_summary,
+    generate_timeseries_summary,
+    summarize_program_simulation,
+)
+from virtual_world.emission_types.non_repairable_emissions import NonRepairableEmission
+from virtual_world.emission_types.repairable_emission import RepairableEmission
+
+from testing.unit_testing.test_file_processing.test_output_processing.test_summary_outputs.summary_outputs_testing_fixtures import (  # noqa
+    expected_emis_summary_csv2,
+    expected_ts_summary_csv,
+    get_mock_summary_output_mapper,
+    mock_emis_csv_data,
+    mock_emis_to_remove_csv_data,
+    mock_est_emis_csv_data,
+    mock_summary_stats_config,
+    mock_ts_csv_data,
+)
+
+SIM_START: date = date(2024, 1, 1)
+SIM_END: date = date(2025, 12, 31)
+SITE_IDS: list[str] = [str(site_n) for site_n in range(6)]
+
+
+def gen_program_summaries() -> list[dict[str, dict[str, Any]]]:
+    program_summaries: list[dict[str, dict[str, Any]]] = []
+    for sim in range(3):
+        program_summaries.append(
+            summarize_program_simulation(
+                "test",
+                sim,
+                "test",
+                get_mock_summary_output_mapper(),
+                {
+                    Output_Files.SummaryFileNames.TS_SUMMARY: mock_ts_csv_data[
+                        f"test_{sim}_timeseries.csv"
+                    ].copy(),
+                    Output_Files.SummaryFileNames.EMIS_SUMMARY: mock_emis_csv_data[
+                        f"test_{sim}_emissions_summary.csv"
+                    ].copy(),
+                    Output_Files.SummaryFileNames.EMIS_EST_SUMMARY: mock_est_emis_csv_data[
+                        f"test_{sim}_estimated_emissions.csv"
+                    ].copy(),
+                    Output_Files.SummaryFileNames.EMIS_FUG_EST_SUMMARY: (
+                        mock_emis_to_remove_csv_data[
+                            f"test_{sim}_estimated_repaired_emissions_to_remove.csv"
+                        ].copy()
+                    ),
+                },
+            )
+        )
+    return program_summaries
+
+
+def test_000_timeseries_summary_matches_the_summary_of_the_files():
+    ts_summary: pd.DataFrame = build_timeseries_summary(
+        gen_program_summaries(), get_mock_summary_output_mapper()
+    )
+    assert_frame_equal(ts_summary, expected_ts_summary_csv, check_dtype=False)
+
+
+def test_001_emissions_summary_matches_the_summary_of_the_files():
+    emis_summary: pd.DataFrame = build_emissions_summary(
+        gen_program_summaries(), get_mock_summary_output_mapper()
+    )
+    assert_frame_equal(emis_summary, expected_emis_summary_csv2, check_dtype=False)
+
+
+def test_002_simulations_without_estimated_emissions_are_summarized_as_zero():
+    program_summaries: list[dict[str, dict[str, Any]]] = gen_program_summaries()
+    for program_summary in program_summaries[:2]:
+        del program_summary[Output_Files.SummaryFileNames.EMIS_EST_SUMMARY]
+        del program_summary[Output_Files.SummaryFileNames.EMIS_FUG_EST_SUMMARY]
+
+    emis_summary: pd.DataFrame = build_emissions_summary(
+        program_summaries, get_mock_summary_output_mapper()
+    )
+
+    expected: pd.DataFrame = expected_emis_summary_csv2.copy()
+    for year in [2024, 2025]:
+        expected.loc[:1, esca.EST_ANN_EMIS.format(year)] = 0.0
+    assert_frame_equal(emis_summary, expected, check_dtype=False)
+
+
+class MockProgram:
+    def __init__(self, rng: np.random.Generator):
+        self.name: str = "P_test"
+        self.duration_method: str = dm.MEASUREMENT_CONSERVATIVE
+        self.duration_factor: float = 1.0
+        n_surveys: int = 40
+        self._survey_reports: pd.DataFrame = pd.DataFrame(
+            {
+                eca.SITE_ID: rng.choice(SITE_IDS[:4], n_surveys),
+                eca.SURVEY_LEVEL: "site_level",
+                eca.M_RATE: rng.exponential(0.3, n_surveys),
+                eca.FLAGGED: rng.random(n_surveys) < 0.5,
+                eca.SURVEY_COMPLETION_DATE: [
+                    SIM_START + timedelta(days=int(day)) for day in rng.integers(0, 730, n_surveys)
+                ],
+                eca.METHOD: "OGI",
+            }
+        )
+        self._survey_reports[eca.SURVEY_START_DATE] = self._survey_reports[
+            eca.SURVEY_COMPLETION_DATE
+        ]
+
+    def aggregate_method_survey_reports(self) -> pd.DataFrame:
+        return self._survey_reports.copy()
+
+    def get_program_site_ids(self) -> list[str]:
+        return SITE_IDS
+
+
+def gen_emission_summaries(rng: np.random.Generator, n_emissions: int) -> list[dict[str, Any]]:
+    summaries: list[dict[str, Any]] = []
+    for emission_n in range(n_emissions):
+        start_date: date = SIM_START + timedelta(days=int(rng.integers(0, 700)))
+        common = (emission_n, float(rng.exponential(0.5)), start_date, SIM_START)
+        if emission_n % 3 == 2:
+            emission = NonRepairableEmission(*common, False, {"OGI": 0.5}, {}, 90)
+        else:
+            emission = RepairableEmission(*common, True, {"OGI": 0.5}, {}, 5, [100.0], 200)
+            if emission_n % 2:
+                emission.tag_leak(1.5, start_date + timedelta(days=10), 10, "OGI", "1", 0)
+        emission.activate(start_date)
+        emission._active_days = int(rng.integers(1, 300))
+        summary: dict[str, Any] = emission.get_summary_dict(SIM_END)
+        summary.update(
+            {eca.SITE_ID: SITE_IDS[emission_n % len(SITE_IDS)], eca.EQG: "0", eca.COMP: "comp"}
+        )
+        summaries.append(summary)
+    return summaries
+
+
+def gen_timeseries(rng: np.random.Generator) -> pd.DataFrame:
+    n_days: int = (SIM_END - SIM_START).days + 1
+    timeseries: pd.DataFrame = pd.DataFrame(
+        rng.exponential(10, (n_days, len(TIMESERIES_COLUMNS))), columns=TIMESERIES_COLUMNS
+    )
+    timeseries[TIMESERIES_COLUMNS[0]] = [SIM_START + timedelta(days=day) for day in range(n_days)]
+    return timeseries
+
+
+def gen_output_config() -> dict:
+    return {
+        op.PROGRAM_OUTPUTS: {op.PROGRAM_OUTPUT_FORMAT: "csv"},
+        op.PROGRAM_VISUALIZATIONS: {},
+        op.SUMMARY_OUTPUTS: {
+            op.SUMMARY_STATS: mock_summary_stats_config,
+            op.SUMMARY_FILES: {
+                Output_Files.SummaryFileNames.TS_SUMMARY: True,
+                Output_Files.SummaryFileNames.EMIS_SUMMARY: True,
+            },
+        },
+    }
+
+
+def sort_summary(summary: pd.DataFrame) -> pd.DataFrame:
+    return summary.sort_values(by=[esca.PROG_NAME, esca.SIM]).reset_index(drop=True)
+
+
+def test_003_in_memory_summaries_match_the_summaries_of_the_written_files(tmp_path: Path):
+    rng: np.random.Generator = np.random.default_rng(0)
+    program: MockProgram = MockProgram(rng)
+    measured_tf_df: pd.DataFrame = pd.DataFrame(
+        {
+            DTSC.SITE_ID: SITE_IDS,
+            DTSC.SITE_TYPE: ["A", "A", "B", "B", "A", "B"],
+            DTSC.MEASURED: [True, True, True, True, False, False],
+        }
+    )
+    program_summaries: list[dict[str, dict[str, Any]]] = []
+    for sim in range(2):
+        output_manager = ProgramOutputManager(
+            tmp_path, f"{program.name}_{sim}", ["OGI"], gen_output_config(), sim_number=sim
+        )
+        program_summaries.append(
+            output_manager.summarize_program_outputs(
+                iter(gen_emission_summaries(rng, 60)),
+                gen_timeseries(rng),
+                SIM_START,
+                SIM_END,
+                program,
+                measured_tf_df,
+            )
+        )
+    outputs_mapper = get_mock_summary_output_mapper()
+
+    assert_frame_equal(
+        sort_summary(build_timeseries_summary(program_summaries, outputs_mapper)),
+        sort_summary(generate_timeseries_summary(tmp_path, outputs_mapper)),
+        check_dtype=False,
+    )
+    emis_summary: pd.DataFrame = sort_summary(
+        build_emissions_summary(program_summaries, outputs_mapper)
+    )
+    assert_frame_equal(
+        emis_summary,
+        sort_summary(generate_emissions_summary(tmp_path, outputs_mapper)),
+        check_dtype=False,
+    )
+    # The summaries include estimated emissions at measured and extrapolated sites
+    assert (emis_summary[esca.EST_ANN_EMIS.format(2025)] > 0).all()
@@ -27,14 +27,13 @@ from file_processing.output_processing.summary_outputs import (
     generate_emissions_estimation_summary,
 )
 
-from src.constants.output_file_constants import (
-    EMIS_DATA_COL_ACCESSORS as eca,
-    EMIS_SUMMARY_COLUMNS_ACCESSORS as esca,
-)
+from src.constants.output_file_constants import EMIS_SUMMARY_COLUMNS_ACCESSORS as esca
 
 
-from testing.unit_testing.test_file_processing.test_output_processing.test_summary_outputs.test_summarize_program_outputs import (
+from testing.unit_testing.test_file_processing.test_output_processing.test_summary_outputs.summary_outputs_testing_fixtures import (  # noqa
     get_mock_summary_output_mapper,
+    mock_emis_to_remove_csv_data,
+    mock_est_emis_csv_data as mock_emis_csv_data,
 )
 
 
@@ -62,71 +61,6 @@ def mock_scandir_emis_sum(dir: Path):
     ]
 
 
-mock_emis_csv_data = {
-    "test_0_estimated_emissions.csv": pd.DataFrame(
-        {
-            eca.SITE_ID: [1, 1, 1, 1],
-            eca.SITE_TYPE: ["A", "A", "A", "A"],
-            eca.SITE_MEASURED: [True, True, True, True],
-            eca.EST_VOL_EMIT: [0, 1, 2, 3],
-            eca.M_RATE: [9, 8, 7, 6],
-            eca.REPAIRABLE: [True, True, True, False],
-            eca.START_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
-            eca.END_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
-        }
-    ),
-    "test_1_estimated_emissions.csv": pd.DataFrame(
-        {
-            eca.SITE_ID: [1, 1, 1, 1],
-            eca.SITE_TYPE: ["A", "A", "A", "A"],
-            eca.SITE_MEASURED: [True, True, True, True],
-            eca.EST_VOL_EMIT: [4, 5, 6, 7],
-            eca.M_RATE: [5, 4, 3, 2],
-            eca.START_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
-            eca.END_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
-        }
-    ),
-    "test_2_estimated_emissions.csv": pd.DataFrame(
-        {
-            eca.SITE_ID: [1, 1, 1, 1],
-            eca.SITE_TYPE: ["A", "A", "A", "A"],
-            eca.SITE_MEASURED: [True, True, True, True],
-            eca.EST_VOL_EMIT: [8, 9, 10, 11],
-            eca.M_RATE: [2, 1, 0, 0],
-            eca.START_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
-            eca.END_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
-        }
-    ),
-}
-
-
-mock_emis_to_remove_csv_data = {
-    "test_0_estimated_repaired_emissions_to_remove.csv": pd.DataFrame(
-        {
-            eca.EST_VOL_EMIT: [0, 1, 1, 1],
-            eca.M_RATE: [9, 8, 7, 6],
-            eca.START_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
-            eca.END_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
-        }
-    ),
-    "test_1_estimated_repaired_emissions_to_remove.csv": pd.DataFrame(
-        {
-            eca.EST_VOL_EMIT: [1, 1, 1, 1],
-            eca.M_RATE: [5, 4, 3, 2],
-            eca.START_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
-            eca.END_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
-        }
-    ),
-    "test_2_estimated_repaired_emissions_to_remove.csv": pd.DataFrame(
-        {
-            eca.EST_VOL_EMIT: [2, 2, 2, 2],
-            eca.M_RATE: [2, 1, 0, 0],
-            eca.START_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
-            eca.END_DATE: ["2024-01-01", "2024-01-01", "2025-01-01", "2025-01-01"],
-        }
-    ),
-}
-
 expected_emis_summary_csv = pd.DataFrame(
     {
         esca.PROG_NAME: ["test", "test", "test"],
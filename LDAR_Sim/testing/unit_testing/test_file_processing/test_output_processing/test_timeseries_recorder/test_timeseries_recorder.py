@@ -0,0 +1,91 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_timeseries_recorder.py
+Purpose: Unit tests for the timeseries recorder used to collect the daily program timeseries.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from constants.output_file_constants import TIMESERIES_COL_ACCESSORS as tca, TIMESERIES_COLUMNS
+from file_processing.output_processing.output_utils import EmisInfo, TsEmisData, TsMethodData
+from file_processing.output_processing.timeseries_recorder import TimeseriesRecorder
+
+
+def gen_recorder(n_days: int) -> TimeseriesRecorder:
+    columns: list[str] = list(TIMESERIES_COLUMNS)
+    for col in [
+        tca.METH_DAILY_DEPLOY_COST,
+        tca.METH_DAILY_FLAGS,
+        tca.METH_DAILY_TAGS,
+        tca.METH_DAILY_SITES_VIS,
+        tca.METH_DAILY_TRAVEL_TIME,
+        tca.METH_DAILY_SURVEY_TIME,
+    ]:
+        columns.append(col.format(method="OGI"))
+    return TimeseriesRecorder(columns, ["OGI"], date(2023, 1, 1), n_days)
+
+
+def test_to_dataframe_builds_recorded_days_in_column_order():
+    recorder: TimeseriesRecorder = gen_recorder(n_days=3)
+    for day in range(3):
+        recorder.record(tca.NEW_LEAKS, day + 1)
+        recorder.record_emis_info(
+            TsEmisData(daily_emis=1.5 * day, daily_emis_mit=1.5 * day, active_leaks=day),
+            EmisInfo(leaks_repaired=day, repair_cost=10.0 * day),
+        )
+        recorder.record_methods_info(
+            [
+                TsMethodData(
+                    method_name="OGI",
+                    upfront_cost=100.0,
+                    daily_deployment_cost=5.0,
+                    daily_tags=np.nan if day == 1 else 2,
+                    daily_flags=np.nan,
+                    sites_visited=3,
+                )
+            ],
+            include_upfront_cost=day == 0,
+        )
+        recorder.next_day()
+
+    timeseries: pd.DataFrame = recorder.to_dataframe()
+
+    assert list(timeseries.columns) == recorder._column_names
+    assert list(timeseries[tca.DATE]) == [date(2023, 1, 1), date(2023, 1, 2), date(2023, 1, 3)]
+    assert list(timeseries[tca.NEW_LEAKS]) == [1, 2, 3]
+    assert list(timeseries[tca.EMIS]) == [0.0, 1.5, 3.0]
+    assert list(timeseries[tca.COST]) == [105.0, 15.0, 25.0]
+    assert list(timeseries[tca.TAGGED_LEAKS]) == [2, 0, 2]
+    assert list(timeseries["OGI Deployment Cost ($)"]) == [105.0, 5.0, 5.0]
+    assert timeseries["OGI Sites flagged for Follow-Up"].isna().all()
+    assert timeseries[tca.ACT_LEAKS].dtype == np.int64
+    assert timeseries["OGI Sites Visited"].dtype == np.int64
+    assert timeseries[tca.EMIS].dtype == np.float64
+
+
+def test_to_dataframe_only_includes_recorded_days():
+    recorder: TimeseriesRecorder = gen_recorder(n_days=5)
+    recorder.record(tca.NEW_LEAKS, 5)
+    recorder.next_day()
+
+    timeseries: pd.DataFrame = recorder.to_dataframe()
+
+    assert len(timeseries) == 1
+    assert timeseries[tca.NEW_LEAKS].iloc[0] == 5
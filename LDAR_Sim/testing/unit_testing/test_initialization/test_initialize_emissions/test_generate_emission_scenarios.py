@@ -0,0 +1,110 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_generate_emission_scenarios.py
+Purpose: Contains unit tests for generating the emission scenarios of the simulations
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date
+
+import numpy as np
+
+from constants.file_name_constants import Generator_Files
+from file_processing.input_processing.emissions_source_processing import EmissionsSourceSample
+from initialization.initialize_emissions import _generate_emission_scenarios
+from virtual_world.component import Component
+from virtual_world.equipment_groups import Equipment_Group
+from virtual_world.infrastructure import Infrastructure
+from virtual_world.sites import Site
+from virtual_world.sources import Source
+
+SIM_START: date = date(2020, 1, 1)
+SIM_END: date = date(2020, 12, 31)
+SEEDS: list[int] = [11, 22, 33, 44, 55]
+
+
+def gen_source(source_id: str, repairable: bool) -> Source:
+    return Source._reconstruct(
+        source_ID=source_id,
+        repairable=repairable,
+        persistent=True,
+        active_duration=1,
+        inactive_duration=0,
+        multi_emissions=True,
+        generated_emissions={},
+        emis_rate_source="rates",
+        emis_prod_rate=0.01,
+        emis_duration=60,
+        meth_spat_covs={"OGI": 1.0},
+        emis_rep_delay=[1, 5, 10] if repairable else None,
+        emis_rep_cost=[50.0] if repairable else None,
+        next_emission=None,
+        prefix="repairable" if repairable else "non_repairable",
+        meth_temp_covs={"OGI": 1.0},
+    )
+
+
+def gen_infrastructure() -> Infrastructure:
+    sites = []
+    for site_n in range(3):
+        component = Component._reconstruct(
+            "comp", "comp_0", [gen_source("rep", True), gen_source("nonrep", False)], [], [], {}
+        )
+        eqg = Equipment_Group._reconstruct("eqg", {"OGI": 60}, {"OGI": 100}, [component])
+        sites.append(
+            Site._reconstruct(
+                str(site_n),
+                50.0,
+                -110.0,
+                50.0,
+                -110.0,
+                [eqg],
+                {"OGI": 2},
+                {"OGI": [1]},
+                {"OGI": [2020]},
+                "type",
+                SIM_START,
+                {"OGI": 100},
+                {"OGI": True},
+            )
+        )
+    rates = EmissionsSourceSample("rates", "gram", "second", [0.5, 1.0, 2.5, 7.0], 1000)
+    return Infrastructure._reconstruct({"rates": rates}, None, sites)
+
+
+def test_generate_emission_scenarios_in_parallel_matches_serial(tmp_path):
+    serial_dir = tmp_path / "serial"
+    parallel_dir = tmp_path / "parallel"
+    serial_dir.mkdir()
+    parallel_dir.mkdir()
+
+    _generate_emission_scenarios(
+        [0, 1, 2, 3, 4], True, SEEDS, gen_infrastructure(), SIM_START, SIM_END, serial_dir, True, 1
+    )
+    serial_random_draw: float = np.random.random()
+    # Only part of the scenarios are generated, as they would be when topping up
+    _generate_emission_scenarios(
+        [1, 3, 4], True, SEEDS, gen_infrastructure(), SIM_START, SIM_END, parallel_dir, True, 3
+    )
+
+    for sim_number in [1, 3, 4]:
+        filename: str = Generator_Files.GEN_INFRA_EMISS.format(i=sim_number)
+        serial_bytes: bytes = (serial_dir / filename).read_bytes()
+        assert serial_bytes == (parallel_dir / filename).read_bytes()
+        assert len(serial_bytes) > 200
+    # The random state is left as it would be after generating the scenarios serially
+    assert np.random.random() == serial_random_draw
+    assert not (parallel_dir / Generator_Files.GEN_INFRA_EMISS.format(i=0)).exists()
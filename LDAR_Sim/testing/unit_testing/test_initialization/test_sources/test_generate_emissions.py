@@ -72,15 +72,15 @@ def mock_source4(self, *args, **kwargs):
     self._generated_emissions = {}
 
 
-def mock_create_emission(
+def mock_create_emissions(
     self,
     leak_count,
-    start_date,
+    start_dates,
     sim_start_date,
     emission_rate_source_dictionary,
     repair_delay_dataframe,
 ):
-    return start_date
+    return list(start_dates)
 
 
 def setup_mock_source(mocker):
@@ -91,7 +91,7 @@ def setup_mock_source(mocker):
     mocker.patch.object(Source, "_get_rep_delay", return_value=10)
     mocker.patch.object(Source, "_get_rep_cost", return_value=1)
     mocker.patch.object(Source, "_get_emis_duration", return_value=10)
-    mocker.patch.object(Source, "_create_emission", mock_create_emission)
+    mocker.patch.object(Source, "_create_emissions", mock_create_emissions)
 
 
 def setup_mock_source2(mocker):
@@ -102,7 +102,7 @@ def setup_mock_source2(mocker):
     mocker.patch.object(Source, "_get_rep_delay", return_value=10)
     mocker.patch.object(Source, "_get_rep_cost", return_value=1)
     mocker.patch.object(Source, "_get_emis_duration", return_value=10)
-    mocker.patch.object(Source, "_create_emission", mock_create_emission)
+    mocker.patch.object(Source, "_create_emissions", mock_create_emissions)
 
 
 def setup_mock_source3(mocker):
@@ -113,7 +113,7 @@ def setup_mock_source3(mocker):
     mocker.patch.object(Source, "_get_rep_delay", return_value=10)
     mocker.patch.object(Source, "_get_rep_cost", return_value=1)
     mocker.patch.object(Source, "_get_emis_duration", return_value=365)
-    mocker.patch.object(Source, "_create_emission", mock_create_emission)
+    mocker.patch.object(Source, "_create_emissions", mock_create_emissions)
 
 
 def setup_mock_source4(mocker):
@@ -124,7 +124,7 @@ def setup_mock_source4(mocker):
     mocker.patch.object(Source, "_get_rep_delay", return_value=10)
     mocker.patch.object(Source, "_get_rep_cost", return_value=1)
     mocker.patch.object(Source, "_get_emis_duration", return_value=365)
-    mocker.patch.object(Source, "_create_emission", mock_create_emission)
+    mocker.patch.object(Source, "_create_emissions", mock_create_emissions)
 
 
 def simple_inputs():
@@ -81,11 +81,15 @@ def mock_estimate_method_crews_required2(self, crews, sites):
     return 4
 
 
-def mock_false_survey_site(self, crew, survey_report, site_to_survey, weather, curr_date):
+def mock_false_survey_site(
+    self, crew, survey_report, site_to_survey, weather, curr_date, site_survey_time=None
+):
     return SiteSurveyReport(1), 0, False, 0
 
 
-def mock_survey_site(self, crew, survey_report, site_to_survey, weather, curr_date):
+def mock_survey_site(
+    self, crew, survey_report, site_to_survey, weather, curr_date, site_survey_time=None
+):
     crew.day_time_remaining -= 120
     return (
         SiteSurveyReport(
@@ -109,7 +113,9 @@ def mock_survey_site(self, crew, survey_report, site_to_survey, weather, curr_da
     )
 
 
-def mock_survey_site2(self, crew, survey_report, site_to_survey, weather, curr_date):
+def mock_survey_site2(
+    self, crew, survey_report, site_to_survey, weather, curr_date, site_survey_time=None
+):
     crew.day_time_remaining -= 120
     return (
         SiteSurveyReport(
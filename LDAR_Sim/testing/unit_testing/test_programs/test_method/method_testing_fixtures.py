@@ -102,11 +102,15 @@ def mock_determine_if_site_survey_can_be_completed(
     return True
 
 
-def mock_false_survey_site(self, crew, survey_report, site_to_survey, weather, curr_date):
+def mock_false_survey_site(
+    self, crew, survey_report, site_to_survey, weather, curr_date, site_survey_time=None
+):
     return SiteSurveyReport(1), 0, False, 0
 
 
-def mock_survey_site(self, crew, survey_report, site_to_survey, weather, curr_date):
+def mock_survey_site(
+    self, crew, survey_report, site_to_survey, weather, curr_date, site_survey_time=None
+):
     return (
         SiteSurveyReport(
             site_id=1,
@@ -0,0 +1,114 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_crew_dispatch
+Purpose: Contains unit tests for dispatching crews from arrays of crew time and site tables
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from programs.method import Method
+from scheduling.schedule_dataclasses import CrewDailyReport
+from utils.queue import HeapPriorityQueue
+import constants.param_default_const as pdc
+
+
+class MockSite:
+    def __init__(self, site_id: str, survey_time: int, survey_cost: float) -> None:
+        self._site_ID: str = site_id
+        self._survey_time: int = survey_time
+        self._survey_cost: float = survey_cost
+
+    def get_id(self) -> str:
+        return self._site_ID
+
+    def get_method_survey_time(self, method_name: str) -> int:
+        return self._survey_time
+
+    def get_survey_cost(self, method_name: str) -> float:
+        return self._survey_cost
+
+
+@pytest.fixture
+def dispatch_method(mocker) -> Method:
+    mocker.patch.object(Method, "__init__", lambda self: None)
+    method = Method()
+    method._name = "test_method"
+    method._deployment_type = pdc.Deployment_Types.MOBILE
+    method._max_work_hours = 8
+    method._daylight_sensitive = False
+    method._local_daylight = False
+    method._crew_reports = [CrewDailyReport(crew_id, 0) for crew_id in range(5)]
+    method.cost_type = Method.PER_SITE_COST
+    method.cost = 50.0
+    return method
+
+
+def test_crews_are_dispatched_in_heap_order(dispatch_method: Method):
+    rng = random.Random(0)
+    survey_times = [rng.choice([30, 45, 60, 90, 120]) for _ in range(200)]
+
+    reference_crews = [CrewDailyReport(crew_id, 8 * 60) for crew_id in range(5)]
+    priority_queue = HeapPriorityQueue()
+    for crew in reference_crews:
+        priority_queue.put((-crew.day_time_remaining, crew.crew_id, crew))
+    expected_crew_ids = []
+    for survey_time in survey_times:
+        if priority_queue.empty():
+            expected_crew_ids.append(None)
+            continue
+        _, _, crew = priority_queue.get()
+        expected_crew_ids.append(crew.crew_id)
+        crew.day_time_remaining -= survey_time
+        if crew.day_time_remaining > 0:
+            priority_queue.put((-crew.day_time_remaining, crew.crew_id, crew))
+
+    crew_times: np.ndarray = dispatch_method._start_crew_day(None, None)
+    crew_ids = []
+    for survey_time in survey_times:
+        crew = dispatch_method._get_next_crew(crew_times)
+        if crew is None:
+            crew_ids.append(None)
+            continue
+        crew_ids.append(crew.crew_id)
+        crew.day_time_remaining -= survey_time
+        Method._update_crew_time(crew_times, crew)
+
+    assert crew_ids == expected_crew_ids
+
+
+def test_crews_without_time_are_dispatched_once(dispatch_method: Method):
+    dispatch_method._max_work_hours = 0
+    crew_times: np.ndarray = dispatch_method._start_crew_day(None, None)
+
+    crew = dispatch_method._get_next_crew(crew_times)
+    assert crew.crew_id == 0
+    Method._update_crew_time(crew_times, crew)
+
+    assert dispatch_method._get_next_crew(crew_times).crew_id == 1
+
+
+def test_site_survey_costs_default_to_the_method_cost(dispatch_method: Method):
+    site_1 = MockSite("site_1", 120, 0)
+    site_2 = MockSite("site_2", 95, 200.0)
+
+    assert dispatch_method._get_site_survey_time(site_1) == 120
+    assert dispatch_method._get_site_survey_time(site_2) == 95
+    assert dispatch_method._get_site_survey_cost(site_1) == 50.0
+    assert dispatch_method._get_site_survey_cost(site_2) == 200.0
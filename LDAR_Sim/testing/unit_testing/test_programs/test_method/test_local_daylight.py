@@ -0,0 +1,87 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_local_daylight
+Purpose: Contains unit tests for limiting crews to the daylight at their site
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date
+
+import pytest
+
+from programs.method import Method
+from scheduling.schedule_dataclasses import CrewDailyReport
+
+CURR_DATE = date(2023, 1, 1)
+
+
+class MockDaylight:
+    def get_local_daylight(self, curr_date: date, lat_ind: int, lon_ind: int) -> float:
+        return {(0, 0): 6.5, (1, 0): 9.0}[(lat_ind, lon_ind)]
+
+
+class MockSite:
+    def __init__(self, lat_ind: int, lon_ind: int) -> None:
+        self._lat_ind: int = lat_ind
+        self._lon_ind: int = lon_ind
+
+    def get_weather_lat(self) -> int:
+        return self._lat_ind
+
+    def get_weather_long(self) -> int:
+        return self._lon_ind
+
+
+@pytest.fixture
+def local_daylight_method(mocker) -> Method:
+    mocker.patch.object(Method, "__init__", lambda self: None)
+    method = Method()
+    method._local_daylight = True
+    method._max_work_hours = 8
+    return method
+
+
+def test_crew_is_limited_to_daylight_at_first_site(local_daylight_method: Method):
+    crew = CrewDailyReport(crew_id=0, day_time_remaining=8 * 60)
+
+    local_daylight_method.limit_to_local_daylight(crew, MockDaylight(), CURR_DATE, MockSite(0, 0))
+
+    assert crew.day_time_remaining == 6.5 * 60
+
+
+def test_crew_is_limited_to_max_workday(local_daylight_method: Method):
+    crew = CrewDailyReport(crew_id=0, day_time_remaining=8 * 60)
+
+    local_daylight_method.limit_to_local_daylight(crew, MockDaylight(), CURR_DATE, MockSite(1, 0))
+
+    assert crew.day_time_remaining == 8 * 60
+
+
+def test_deployed_crew_is_not_limited(local_daylight_method: Method):
+    crew = CrewDailyReport(crew_id=0, day_time_remaining=100, deployed=True)
+
+    local_daylight_method.limit_to_local_daylight(crew, MockDaylight(), CURR_DATE, MockSite(0, 0))
+
+    assert crew.day_time_remaining == 100
+
+
+def test_crew_is_not_limited_without_local_daylight(local_daylight_method: Method):
+    local_daylight_method._local_daylight = False
+    crew = CrewDailyReport(crew_id=0, day_time_remaining=8 * 60)
+
+    local_daylight_method.limit_to_local_daylight(crew, MockDaylight(), CURR_DATE, MockSite(0, 0))
+
+    assert crew.day_time_remaining == 8 * 60
@@ -0,0 +1,126 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_survey_due_calendar
+Purpose: Contains unit tests to test that the due calendar of a schedule queues the same
+sites, in the same order, as checking every survey plan each day
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+
+from src.virtual_world.sites import Site
+from src.scheduling.generic_schedule import GenericSchedule
+from src.scheduling.stationary_schedule import StationarySchedule
+
+SIM_START: date = date(2020, 3, 15)
+SIM_END: date = date(2022, 12, 31)
+
+SITE_PARAMS: list[tuple[int, list[int], list[int]]] = [
+    (4, [], list(range(1, 13))),
+    (2, [2021, 2022], [5, 6, 7, 8]),
+    (1, [], [1, 11, 12]),
+    (3, [2020, 2022], [2, 3, 4, 9, 10]),
+    (12, [], list(range(1, 13))),
+    (0, [], list(range(1, 13))),
+    (6, [], [3, 4, 5, 6, 7, 8, 9]),
+]
+
+
+def gen_sites(mocker) -> list[Site]:
+    sites: list[Site] = []
+    for site_n, (survey_freq, deploy_years, deploy_months) in enumerate(SITE_PARAMS):
+        site = mocker.Mock(spec=Site)
+        site.get_id.return_value = f"site_{site_n}"
+        site.do_site_deployment.return_value = True
+        site._survey_frequencies = {"test": survey_freq}
+        site._deployment_years = {"test": deploy_years}
+        site._deployment_months = {"test": deploy_months}
+        sites.append(site)
+    return sites
+
+
+def gen_schedule(schedule_class: type, sites: list[Site]) -> GenericSchedule:
+    return schedule_class(
+        method_name="test",
+        sites=sites,
+        sim_start_date=SIM_START,
+        sim_end_date=SIM_END,
+        est_meth_daily_surveys=2,
+        method_avail_crews=1,
+    )
+
+
+def check_every_survey_plan(schedule: GenericSchedule, current_date: date) -> list:
+    for survey_plan in schedule._survey_plans:
+        survey_plan.update_date(current_date)
+        if survey_plan.queue_site_for_survey():
+            schedule.add_to_survey_queue(survey_plan)
+    return schedule.get_daily_sites_to_survey()
+
+
+def run_schedule(schedule: GenericSchedule, get_daily_plans) -> list[list[str]]:
+    daily_site_ids: list[list[str]] = []
+    current_date: date = SIM_START
+    survey_n: int = 0
+    while current_date <= SIM_END:
+        daily_plans: list = get_daily_plans(schedule, current_date)
+        daily_site_ids.append([plan.get_site().get_id() for plan in daily_plans])
+        for survey_plan in daily_plans:
+            survey_n += 1
+            # Leave some of the surveys to be done on a later day
+            if survey_n % 3 == 0:
+                schedule.add_previous_queued_to_survey_queue(survey_plan)
+            else:
+                survey_plan.add_to_surveys_done(current_date)
+                schedule.reschedule_survey_plan(survey_plan, current_date)
+        current_date += timedelta(days=1)
+    return daily_site_ids
+
+
+def test_get_workplan_queues_sites_in_the_same_order_as_checking_every_survey_plan(mocker):
+    sites: list[Site] = gen_sites(mocker)
+    expected: list[list[str]] = run_schedule(
+        gen_schedule(GenericSchedule, sites), check_every_survey_plan
+    )
+
+    result: list[list[str]] = run_schedule(
+        gen_schedule(GenericSchedule, sites),
+        lambda schedule, current_date: list(
+            schedule.get_workplan(current_date).site_survey_planners.values()
+        ),
+    )
+
+    assert result == expected
+    assert sum(len(site_ids) for site_ids in expected) > 30
+
+
+def test_stationary_get_workplan_queues_sites_in_the_same_order_as_checking_every_survey_plan(
+    mocker,
+):
+    sites: list[Site] = gen_sites(mocker)
+    expected: list[list[str]] = run_schedule(
+        gen_schedule(StationarySchedule, sites), check_every_survey_plan
+    )
+
+    result: list[list[str]] = run_schedule(
+        gen_schedule(StationarySchedule, sites),
+        lambda schedule, current_date: list(
+            schedule.get_workplan(current_date).site_survey_planners.values()
+        ),
+    )
+
+    assert result == expected
+    assert sum(len(site_ids) for site_ids in expected) > 30
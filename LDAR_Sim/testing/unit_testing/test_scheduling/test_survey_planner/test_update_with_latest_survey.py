@@ -238,7 +238,7 @@ def test_update_with_rolling_survey(mocker):
     stationary_survey_planner.update_with_latest_survey(
         new_detection, redund_filter, method_name, detect_date
     )
-    assert stationary_survey_planner._detected_rates == [
+    assert list(stationary_survey_planner._detected_rates) == [
         0.1,
         0.1,
         0.1,
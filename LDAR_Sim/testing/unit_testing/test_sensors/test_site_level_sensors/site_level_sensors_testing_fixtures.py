@@ -83,10 +83,19 @@ def mock_site_emis_for_detect_emissions_testing_fix(mocker):
 @pytest.fixture(name="mock_site_for_detect_emissions_testing")
 def mock_site_for_detect_emissions_testing_fix(mocker, mock_site_emis_for_detect_emissions_testing):
     mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    detectable_emissions: list[Emission] = [
+        emission
+        for eqg_emissions in mock_site_emis_for_detect_emissions_testing.values()
+        for comp_emissions in eqg_emissions.values()
+        for emission in comp_emissions
+    ]
     mocker.patch.object(
         Site,
-        "get_detectable_emissions",
-        return_value=mock_site_emis_for_detect_emissions_testing,
+        "get_detectable_site_emissions",
+        return_value=(
+            detectable_emissions,
+            sum([emission.get_rate() for emission in detectable_emissions]),
+        ),
     )
     expected_site_emis = 6 * 9
     return (mocker, expected_site_emis)
@@ -147,10 +156,19 @@ def mock_site_for_detect_emissions_testing_lower_emissions_fix(
     mocker, mock_site_emis_for_detect_emissions_testing_lower_emis
 ) -> Tuple[Any, float, float]:
     mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    detectable_emissions: list[Emission] = [
+        emission
+        for eqg_emissions in mock_site_emis_for_detect_emissions_testing_lower_emis.values()
+        for comp_emissions in eqg_emissions.values()
+        for emission in comp_emissions
+    ]
     mocker.patch.object(
         Site,
-        "get_detectable_emissions",
-        return_value=mock_site_emis_for_detect_emissions_testing_lower_emis,
+        "get_detectable_site_emissions",
+        return_value=(
+            detectable_emissions,
+            sum([emission.get_rate() for emission in detectable_emissions]),
+        ),
     )
     expected_site_true_emis: float = 0.55 * 9
     expected_site_measured_emis: float = 0.0
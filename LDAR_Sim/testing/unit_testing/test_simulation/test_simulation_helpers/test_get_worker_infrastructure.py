@@ -0,0 +1,49 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_get_worker_infrastructure.py
+Purpose: Contains unit tests for loading the infrastructure of a simulation worker process.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date
+from pathlib import Path
+
+from simulation import simulation_helpers
+from simulation.simulation_helpers import get_worker_infrastructure, init_simulation_worker
+from virtual_world.infrastructure import Infrastructure
+
+
+def test_get_worker_infrastructure_only_reads_emissions_when_the_simulation_changes(
+    monkeypatch,
+):
+    reads: list[tuple] = []
+
+    def mock_read_in_emissions(infrastructure, generator_dir, sim_numb, sim_start_date):
+        reads.append((infrastructure, generator_dir, sim_numb))
+        return infrastructure
+
+    monkeypatch.setattr(simulation_helpers, "read_in_emissions", mock_read_in_emissions)
+    infrastructure = Infrastructure._reconstruct({}, None, [])
+    init_simulation_worker(infrastructure, Path("generator"), date(2023, 1, 1))
+
+    for sim_num in [0, 0, 1, 1, 0]:
+        assert get_worker_infrastructure(sim_num) is infrastructure
+
+    assert reads == [
+        (infrastructure, Path("generator"), 0),
+        (infrastructure, Path("generator"), 1),
+        (infrastructure, Path("generator"), 0),
+    ]
@@ -0,0 +1,49 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_find_closest_indexes
+Purpose: Contains unit tests for finding the closest indexes of many values at once
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pytest
+
+from utils.generic_functions import find_closest_index_numpy, find_closest_indexes_numpy
+
+WEATHER_AXES = [
+    np.array([-120.0, -119.75, -119.5, -119.25], dtype=np.float32),
+    np.array([49.1, 49.35, 49.6, 49.85, 50.1], dtype=np.float32),
+    np.array([53.0], dtype=np.float32),
+]
+
+
+@pytest.mark.parametrize("arr", WEATHER_AXES)
+def test_find_closest_indexes_matches_finding_each_index(arr: np.ndarray):
+    rng: np.random.Generator = np.random.default_rng(0)
+    midpoints: np.ndarray = (arr[:-1].astype(np.float64) + arr[1:]) / 2
+    values: np.ndarray = np.concatenate(
+        [
+            rng.uniform(arr[0] - 1, arr[-1] + 1, 100),
+            arr.astype(np.float64),
+            midpoints,
+            np.round(midpoints, 3),
+            [arr[0] - 100, arr[-1] + 100],
+        ]
+    )
+
+    closest: np.ndarray = find_closest_indexes_numpy(arr, values)
+
+    assert closest.tolist() == [find_closest_index_numpy(arr, value) for value in values]
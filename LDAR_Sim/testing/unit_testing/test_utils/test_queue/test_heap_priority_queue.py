@@ -0,0 +1,55 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_heap_priority_queue
+Purpose: Contains unit tests for the heapq backed priority queues
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import queue
+import random
+
+import pytest
+
+from utils.queue import HeapPriorityQueue, PriorityQueueWithFIFO
+
+
+def test_heap_priority_queue_matches_queue_priority_queue():
+    rng = random.Random(0)
+    expected_queue: queue.PriorityQueue = queue.PriorityQueue()
+    heap_queue: HeapPriorityQueue = HeapPriorityQueue()
+    for item_n in range(1000):
+        if rng.random() < 0.6:
+            entry: tuple = (-rng.choice([0, 30.5, 60, 90.25]), rng.randint(0, 10), item_n)
+            expected_queue.put(entry)
+            heap_queue.put(entry)
+        else:
+            assert heap_queue.empty() == expected_queue.empty()
+            if not expected_queue.empty():
+                assert heap_queue.get() == expected_queue.get()
+        assert heap_queue.qsize() == expected_queue.qsize()
+
+
+def test_priority_queue_with_fifo_breaks_ties_in_insertion_order():
+    pq: PriorityQueueWithFIFO = PriorityQueueWithFIFO()
+    for item_n, priority in enumerate([3, 2, 3, 1, 2, 3]):
+        pq.put(priority, f"site_{item_n}")
+
+    items: list[str] = [pq.get()[2] for _ in range(pq.qsize())]
+
+    assert items == ["site_3", "site_1", "site_4", "site_0", "site_2", "site_5"]
+    assert pq.empty()
+    with pytest.raises(queue.Empty):
+        pq.get()
@@ -0,0 +1,126 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_indexed_priority_queue
+Purpose: Contains unit tests for the priority queue with removal by key
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import pickle
+import queue
+import random
+
+import pytest
+
+from utils.queue import IndexedPriorityQueueWithFIFO, PriorityQueueWithFIFO
+
+
+def get_item_key(item: tuple[str, int]) -> str:
+    return item[0]
+
+
+def remove_by_draining(pq: PriorityQueueWithFIFO, key: str):
+    """Removes items from the queue by key the way the follow-up schedule used to"""
+    new_queue: PriorityQueueWithFIFO = PriorityQueueWithFIFO()
+    target = None
+    while not pq.empty():
+        prio, _, item = pq.get()
+        if get_item_key(item) == key:
+            target = item
+        else:
+            new_queue.put(prio, item)
+    return new_queue, target
+
+
+def test_indexed_queue_matches_removing_by_draining_the_queue():
+    rng = random.Random(0)
+    expected_queue: PriorityQueueWithFIFO = PriorityQueueWithFIFO()
+    indexed_queue: IndexedPriorityQueueWithFIFO = IndexedPriorityQueueWithFIFO(get_item_key)
+    n_removed: int = 0
+    for item_n in range(2000):
+        action: float = rng.random()
+        if action < 0.5:
+            priority: tuple[int, float] = (rng.randint(1, 3), rng.choice([0.0, 1.5, 3.0]))
+            item: tuple[str, int] = (f"site_{rng.randint(0, 40)}", item_n)
+            expected_queue.put(priority, item)
+            indexed_queue.put(priority, item)
+        elif action < 0.65:
+            key: str = f"site_{rng.randint(0, 40)}"
+            expected_queue, expected_item = remove_by_draining(expected_queue, key)
+            assert indexed_queue.get_item(key) == expected_item
+            removed_item = indexed_queue.remove(key)
+            assert removed_item == expected_item
+            n_removed += removed_item is not None
+        elif action < 0.75:
+            key: str = f"site_{rng.randint(0, 40)}"
+            priority: tuple[int, float] = (rng.randint(1, 3), rng.choice([0.0, 1.5, 3.0]))
+            expected_queue, expected_item = remove_by_draining(expected_queue, key)
+            if expected_item is not None:
+                expected_queue.put(priority, expected_item)
+            assert indexed_queue.reprioritize(key, priority) == expected_item
+        else:
+            assert indexed_queue.empty() == expected_queue.empty()
+            if not expected_queue.empty():
+                expected_prio, _, expected_item = expected_queue.get()
+                prio, _, item = indexed_queue.get()
+                assert (prio, item) == (expected_prio, expected_item)
+        assert indexed_queue.qsize() == expected_queue.qsize()
+    assert n_removed > 50
+    while not expected_queue.empty():
+        assert indexed_queue.get()[2] == expected_queue.get()[2]
+    assert indexed_queue.empty()
+
+
+def test_indexed_queue_can_be_pickled():
+    indexed_queue: IndexedPriorityQueueWithFIFO = IndexedPriorityQueueWithFIFO(get_item_key)
+    for item_n in range(5):
+        indexed_queue.put(3, (f"site_{item_n % 2}", item_n))
+    indexed_queue.remove("site_0")
+
+    copied_queue: IndexedPriorityQueueWithFIFO = pickle.loads(pickle.dumps(indexed_queue))
+
+    assert [copied_queue.get()[2] for _ in range(2)] == [("site_1", 1), ("site_1", 3)]
+    assert copied_queue.empty()
+    assert copied_queue.remove("site_1") is None
+
+
+def test_get_from_empty_indexed_queue_raises_empty():
+    indexed_queue: IndexedPriorityQueueWithFIFO = IndexedPriorityQueueWithFIFO(get_item_key)
+    indexed_queue.put(1, ("site_0", 0))
+    indexed_queue.remove("site_0")
+
+    with pytest.raises(queue.Empty):
+        indexed_queue.get()
+
+
+def test_reprioritized_items_are_queued_behind_items_of_the_same_priority():
+    indexed_queue: IndexedPriorityQueueWithFIFO = IndexedPriorityQueueWithFIFO(get_item_key)
+    indexed_queue.put(1, ("site_0", 0))
+    indexed_queue.put(2, ("site_1", 1))
+    indexed_queue.put(2, ("site_2", 2))
+    indexed_queue.put(3, ("site_3", 3))
+
+    assert indexed_queue.reprioritize("site_0", 2) == ("site_0", 0)
+    assert indexed_queue.reprioritize("site_3", 2) == ("site_3", 3)
+    assert indexed_queue.reprioritize("site_4", 2) is None
+
+    assert indexed_queue.qsize() == 4
+    assert [indexed_queue.get()[2][0] for _ in range(4)] == [
+        "site_1",
+        "site_2",
+        "site_0",
+        "site_3",
+    ]
+    assert indexed_queue.empty()
@@ -0,0 +1,63 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_rolling_mean
+Purpose: Contains unit tests for the rolling mean updated one value at a time
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.rolling_mean import RollingMean
+
+
+def gen_rates(kind: str, n_rates: int) -> np.ndarray:
+    rng: np.random.Generator = np.random.default_rng(0)
+    if kind == "lognormal":
+        return rng.lognormal(0, 2, n_rates)
+    if kind == "repeated":
+        return rng.choice([0.0, 0.1, 0.5, 0.6, 1e-3], n_rates)
+    return np.where(rng.random(n_rates) < 0.1, np.nan, rng.lognormal(-3, 1, n_rates))
+
+
+@pytest.mark.parametrize("window", [1, 2, 7, 30])
+@pytest.mark.parametrize("kind", ["lognormal", "repeated", "missing"])
+def test_rolling_mean_matches_pandas_rolling_mean(window: int, kind: str):
+    rates: np.ndarray = gen_rates(kind, 400)
+    rolling_mean: RollingMean = RollingMean(window)
+    expected: np.ndarray = (
+        pd.Series(rates).rolling(window=window, min_periods=window).mean().to_numpy()
+    )
+
+    for rate_n, rate in enumerate(rates):
+        rolling_mean.add(rate)
+        result: float = rolling_mean.get_mean()
+        if math.isnan(expected[rate_n]):
+            assert math.isnan(result)
+        else:
+            assert result == expected[rate_n]
+
+
+def test_rolling_mean_only_keeps_the_window():
+    rolling_mean: RollingMean = RollingMean(7)
+
+    for rate in gen_rates("lognormal", 1000):
+        rolling_mean.add(rate)
+
+    assert len(rolling_mean._values) == 7
@@ -0,0 +1,42 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_emission_columns.py
+Purpose: Contains unit tests for the helpers shared by the column stores of emissions.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import numpy as np
+
+from virtual_world.emission_columns import get_traversal_order, sum_in_sequence
+
+
+def test_traversal_order_keeps_the_activation_order_within_components():
+    comp_ords: np.ndarray = np.array([2, 0, 1, 0, 2, 1, 0])
+    live_slots: np.ndarray = np.array([0, 1, 2, 4, 5, 6])
+
+    order: np.ndarray = get_traversal_order(live_slots, comp_ords)
+
+    assert order.tolist() == [1, 6, 2, 5, 0, 4]
+
+
+def test_sum_in_sequence_matches_a_running_total():
+    values: np.ndarray = np.random.default_rng(0).exponential(1.0, 1000)
+    running_total: float = 0.0
+    for value in values:
+        running_total += value
+
+    assert sum_in_sequence(values) == running_total
+    assert sum_in_sequence(values[:0]) == 0.0
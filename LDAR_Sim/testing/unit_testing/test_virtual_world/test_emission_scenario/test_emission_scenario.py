@@ -0,0 +1,191 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_emission_scenario.py
+Purpose: Contains unit tests for the columnar emission scenario of a simulation.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import copy
+from datetime import date, timedelta
+
+from file_processing.output_processing.output_utils import EmisInfo
+from virtual_world.component import Component
+from virtual_world.emission_scenario import (
+    ActivationCalendar,
+    EmissionScenario,
+    SourceEmissionRecords,
+)
+from virtual_world.equipment_groups import Equipment_Group
+from virtual_world.infrastructure import Infrastructure
+from virtual_world.sites import Site
+from virtual_world.sources import Source
+
+SIM_START: date = date(2020, 1, 1)
+SIM_NUMBER: int = 3
+
+
+def gen_source(source_id: str, repairable: bool, persistent: bool) -> Source:
+    return Source._reconstruct(
+        source_ID=source_id,
+        repairable=repairable,
+        persistent=persistent,
+        active_duration=2,
+        inactive_duration=3,
+        multi_emissions=True,
+        generated_emissions={},
+        emis_rate_source="rates",
+        emis_prod_rate=0.1,
+        emis_duration=15,
+        meth_spat_covs={"OGI": 1.0},
+        emis_rep_delay=2 if repairable else None,
+        emis_rep_cost=[50.0] if repairable else None,
+        next_emission=None,
+        prefix="repairable" if repairable else "non_repairable",
+        meth_temp_covs={"OGI": 1.0},
+    )
+
+
+def gen_infrastructure(with_emissions: bool) -> Infrastructure:
+    sites = []
+    for site_n in range(2):
+        sources = [
+            gen_source("rep", True, True),
+            gen_source("nonrep", False, True),
+            gen_source("int_rep", True, False),
+            gen_source("empty", False, False),
+        ]
+        for source_n, source in enumerate(sources):
+            emissions = []
+            if with_emissions and source_n < 3:
+                emissions = [
+                    source._build_emission(
+                        emission_n,
+                        SIM_START + timedelta(days=4 * emission_n - 3 + site_n + source_n),
+                        SIM_START,
+                        0.5 + emission_n + 0.25 * source_n,
+                        2 + emission_n if source._repairable else None,
+                    )
+                    for emission_n in range(4)
+                ]
+                emissions.reverse()
+            source.set_pregen_emissions(emissions, SIM_NUMBER)
+        component = Component._reconstruct("comp", "comp_0", sources, [], [], {})
+        eqg = Equipment_Group._reconstruct("eqg", {"OGI": 60}, {"OGI": 100}, [component])
+        sites.append(
+            Site._reconstruct(
+                str(site_n),
+                50.0,
+                -110.0,
+                50.0,
+                -110.0,
+                [eqg],
+                {"OGI": 2},
+                {"OGI": [1]},
+                {"OGI": [2020]},
+                "type",
+                SIM_START,
+                {"OGI": 100},
+                {"OGI": True},
+            )
+        )
+    return Infrastructure._reconstruct({}, None, sites)
+
+
+def run_program(infrastructure: Infrastructure) -> list[dict]:
+    for day in range(25):
+        infrastructure.activate_emissions(SIM_START + timedelta(days=day), SIM_NUMBER)
+        infrastructure.update_emissions_state(EmisInfo())
+    return list(infrastructure.gen_summary_emis_data(SIM_START + timedelta(days=24)))
+
+
+def test_emission_scenario_round_trip_builds_the_same_emissions(tmp_path):
+    generated: Infrastructure = gen_infrastructure(with_emissions=True)
+    scenario: EmissionScenario = generated.get_emission_scenario(SIM_NUMBER, SIM_START)
+    scenario.save(tmp_path / "scenario.npy")
+    loaded: Infrastructure = gen_infrastructure(with_emissions=False)
+
+    loaded.set_emission_scenario(
+        EmissionScenario.load(tmp_path / "scenario.npy", SIM_START), SIM_NUMBER
+    )
+
+    assert len(scenario) == 24
+    source_records = loaded.get_sources()[0]._generated_emissions[SIM_NUMBER]
+    assert isinstance(source_records, SourceEmissionRecords)
+    assert len(source_records) == 4
+    assert len(loaded.get_sources()[3]._generated_emissions[SIM_NUMBER]) == 0
+    program_copy_summaries: list[dict] = run_program(loaded.get_program_copy(SIM_NUMBER))
+    deep_copy_summaries: list[dict] = run_program(copy.deepcopy(loaded))
+    expected: list[dict] = run_program(generated)
+    assert len(expected) == 24
+    assert run_program(loaded) == expected
+    assert program_copy_summaries == expected
+    assert deep_copy_summaries == expected
+
+
+def test_source_emission_records_only_build_emissions_once_reached(tmp_path):
+    generated: Infrastructure = gen_infrastructure(with_emissions=True)
+    generated.get_emission_scenario(SIM_NUMBER, SIM_START).save(tmp_path / "scenario.npy")
+    loaded: Infrastructure = gen_infrastructure(with_emissions=False)
+    loaded.set_emission_scenario(
+        EmissionScenario.load(tmp_path / "scenario.npy", SIM_START), SIM_NUMBER
+    )
+    source: Source = loaded.get_sources()[0]
+
+    new_emissions = source.activate_emissions(SIM_START, SIM_NUMBER)
+
+    # The pre-existing emission is activated and the next emission is built to be checked
+    assert len(new_emissions) == 1
+    assert new_emissions[0]._start_date == SIM_START - timedelta(days=3)
+    assert new_emissions[0]._days_active_b4_sim == 3
+    assert new_emissions[0]._repair_delay == 2
+    assert source._next_emission._start_date == SIM_START + timedelta(days=1)
+    assert len(source._generated_emissions[SIM_NUMBER]) == 2
+
+
+def test_activation_calendar_only_visits_sources_with_due_emissions(mocker):
+    scenario: EmissionScenario = gen_infrastructure(with_emissions=True).get_emission_scenario(
+        SIM_NUMBER, SIM_START
+    )
+    polled: Infrastructure = gen_infrastructure(with_emissions=False)
+    polled.set_emission_scenario(scenario, SIM_NUMBER)
+    polled._activation_calendars = {}
+    indexed: Infrastructure = gen_infrastructure(with_emissions=False)
+    indexed.set_emission_scenario(scenario, SIM_NUMBER)
+    calendar: ActivationCalendar = indexed._activation_calendars[SIM_NUMBER]
+    dates: list[date] = [SIM_START + timedelta(days=day) for day in range(25)]
+    expected_new_emissions: list[int] = [
+        polled.activate_emissions(current_date, SIM_NUMBER) for current_date in dates
+    ]
+
+    source_activations = mocker.spy(Source, "activate_emissions")
+    new_emissions: list[int] = [
+        indexed.activate_emissions(current_date, SIM_NUMBER) for current_date in dates
+    ]
+
+    assert new_emissions == expected_new_emissions
+    assert sum(new_emissions) == 24
+    # The first emission of every source is pre-existing or begins on the first day
+    assert list(calendar.get_due_sources(SIM_START)) == [0, 1, 2, 4, 5, 6]
+    assert len(calendar.get_due_sources(SIM_START - timedelta(days=1))) == 0
+    assert len(calendar.get_due_sources(SIM_START + timedelta(days=100))) == 0
+    # Each source has its 4 emissions due on different days
+    assert source_activations.call_count == 24
+    for polled_site, indexed_site in zip(polled._sites, indexed._sites):
+        polled_comp = polled_site._equipment_groups[0]._component[0]
+        indexed_comp = indexed_site._equipment_groups[0]._component[0]
+        assert [emis._start_date for emis in indexed_comp._active_emissions] == [
+            emis._start_date for emis in polled_comp._active_emissions
+        ]
@@ -0,0 +1,150 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_update_emissions_state.py
+Purpose: Contains unit tests for testing that the emission state store produces the same
+daily emissions state as the emission object model.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+
+from file_processing.output_processing.output_utils import EmisInfo, TsEmisData
+from scheduling.schedule_dataclasses import TaggingInfo
+from virtual_world import emission_types
+from virtual_world.component import Component
+from virtual_world.emission_state_store import EmissionStateStore
+
+SIM_START: date = date(2020, 1, 1)
+SIM_DAYS: int = 120
+
+
+class MockSource:
+    def __init__(self, emissions: list[emission_types.Emission]) -> None:
+        self._emissions = sorted(emissions, key=lambda emis: emis._start_date, reverse=True)
+
+    def activate_emissions(self, date: date, sim_number: int) -> list[emission_types.Emission]:
+        new_emissions = []
+        while self._emissions and self._emissions[-1].activate(date):
+            new_emissions.append(self._emissions.pop())
+        return new_emissions
+
+
+def gen_emission(rng: np.random.Generator, emission_n: int) -> emission_types.Emission:
+    start_date: date = SIM_START + timedelta(days=int(rng.integers(-30, SIM_DAYS)))
+    common = (emission_n, float(rng.uniform(0.1, 10)), start_date, SIM_START, True, {}, {})
+    emis_type: int = int(rng.integers(0, 4))
+    duration: int = int(rng.integers(20, 90))
+    repair_cost = [100.0, 200.0, 350.0]
+    if emis_type == 0:
+        return emission_types.RepairableEmission(
+            *common, int(rng.integers(0, 10)), repair_cost, duration
+        )
+    elif emis_type == 1:
+        return emission_types.NonRepairableEmission(*common[:4], False, {}, {}, duration)
+    elif emis_type == 2:
+        return emission_types.IntermittentRepairableEmission(
+            *common,
+            int(rng.integers(0, 10)),
+            repair_cost,
+            duration,
+            int(rng.integers(1, 6)),
+            int(rng.integers(1, 6)),
+        )
+    return emission_types.IntermittentNonRepairableEmission(
+        *common[:4], False, {}, {}, duration, int(rng.integers(1, 6)), int(rng.integers(1, 6))
+    )
+
+
+def gen_mock_sites(n_sites: int, emissions_per_comp: int) -> list[SimpleNamespace]:
+    rng: np.random.Generator = np.random.default_rng(42)
+    sites = []
+    emission_n: int = 0
+    for _ in range(n_sites):
+        components = []
+        for _ in range(2):
+            component: Component = Component.__new__(Component)
+            component._active_emissions = []
+            component._inactive_emissions = []
+            component._emis_state_store = None
+            emissions = []
+            for _ in range(emissions_per_comp):
+                emissions.append(gen_emission(rng, emission_n))
+                emission_n += 1
+            component._sources = [MockSource(emissions)]
+            components.append(component)
+        sites.append(SimpleNamespace(_equipment_groups=[SimpleNamespace(_component=components)]))
+    return sites
+
+
+def run_days(sites: list[SimpleNamespace], store: EmissionStateStore) -> list:
+    components: list[Component] = [
+        comp for site in sites for eqg in site._equipment_groups for comp in eqg._component
+    ]
+    results = []
+    for day in range(SIM_DAYS):
+        np.random.seed(day)
+        current_date: date = SIM_START + timedelta(days=day)
+        for comp in components:
+            comp.activate_emissions(current_date, 0)
+        if day % 7 == 3:
+            for comp in components[day % 3 :: 3]:
+                if comp._active_emissions:
+                    comp.tag_emissions(TaggingInfo(10.0, current_date, 7, "company", "crew", 2))
+        emis_rep_info = EmisInfo()
+        if store is not None:
+            emis_data: TsEmisData = store.update_emissions_state(emis_rep_info)
+        else:
+            emis_data = TsEmisData()
+            for comp in components:
+                comp.update_emissions_state(emis_rep_info, emis_data)
+        results.append((emis_data, emis_rep_info))
+    if store is not None:
+        store.sync_to_emissions()
+    summaries = [
+        [emis.get_summary_dict(current_date) for emis in comp._active_emissions]
+        + [emis.get_summary_dict(current_date) for emis in comp._inactive_emissions]
+        for comp in components
+    ]
+    return results, summaries
+
+
+def test_update_emissions_state_matches_emission_object_model():
+    object_sites = gen_mock_sites(n_sites=20, emissions_per_comp=6)
+    store_sites = gen_mock_sites(n_sites=20, emissions_per_comp=6)
+
+    expected_results, expected_summaries = run_days(object_sites, None)
+    results, summaries = run_days(store_sites, EmissionStateStore(store_sites))
+
+    assert results == expected_results
+    assert summaries == expected_summaries
+    assert sum(daily[1].leaks_repaired for daily in results) > 0
+    assert sum(daily[1].leaks_nat_repaired for daily in results) > 0
+    assert sum(daily[1].emis_expired for daily in results) > 0
+
+
+def test_update_emissions_state_matches_emission_object_model_when_compacting(monkeypatch):
+    monkeypatch.setattr(EmissionStateStore, "INITIAL_CAPACITY", 8)
+    object_sites = gen_mock_sites(n_sites=20, emissions_per_comp=6)
+    store_sites = gen_mock_sites(n_sites=20, emissions_per_comp=6)
+
+    expected_results, expected_summaries = run_days(object_sites, None)
+    results, summaries = run_days(store_sites, EmissionStateStore(store_sites))
+
+    assert results == expected_results
+    assert summaries == expected_summaries
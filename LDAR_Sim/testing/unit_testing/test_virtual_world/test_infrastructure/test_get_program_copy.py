@@ -0,0 +1,144 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_get_program_copy.py
+Purpose: Contains unit tests for copying the infrastructure for a single program.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import copy
+from datetime import date, timedelta
+
+from file_processing.output_processing.output_utils import EmisInfo
+from scheduling.schedule_dataclasses import TaggingInfo
+from virtual_world.component import Component
+from virtual_world.emission_types.non_repairable_emissions import NonRepairableEmission
+from virtual_world.emission_types.repairable_emission import RepairableEmission
+from virtual_world.equipment_groups import Equipment_Group
+from virtual_world.infrastructure import Infrastructure
+from virtual_world.sites import Site
+from virtual_world.sources import Source
+
+SIM_START: date = date(2020, 1, 1)
+
+
+def gen_source(source_id: str, sim_number: int) -> Source:
+    emissions = []
+    for emission_n in range(4):
+        start_date: date = SIM_START + timedelta(days=3 * emission_n)
+        if emission_n % 2:
+            emissions.append(
+                NonRepairableEmission(
+                    emission_n, 1.0, start_date, SIM_START, False, {"OGI": 1.0}, {}, 20
+                )
+            )
+        else:
+            emissions.append(
+                RepairableEmission(
+                    emission_n, 2.0, start_date, SIM_START, True, {"OGI": 1.0}, {}, 2, [50.0], 30
+                )
+            )
+    emissions.reverse()
+    return Source._reconstruct(
+        source_ID=source_id,
+        repairable=True,
+        persistent=True,
+        active_duration=1,
+        inactive_duration=0,
+        multi_emissions=True,
+        generated_emissions={sim_number: emissions},
+        emis_rate_source="rates",
+        emis_prod_rate=0.1,
+        emis_duration=30,
+        meth_spat_covs={"OGI": 1.0},
+        emis_rep_delay=2,
+        emis_rep_cost=[50.0],
+        next_emission=None,
+        prefix="repairable",
+    )
+
+
+def gen_infrastructure(sim_number: int) -> Infrastructure:
+    sites = []
+    for site_n in range(2):
+        component = Component._reconstruct(
+            "comp", f"comp_{site_n}", [gen_source("src", sim_number)], [], [], {}
+        )
+        eqg = Equipment_Group._reconstruct("eqg", {"OGI": 60}, {"OGI": 100}, [component])
+        sites.append(
+            Site._reconstruct(
+                str(site_n),
+                50.0,
+                -110.0,
+                50.0,
+                -110.0,
+                [eqg],
+                {"OGI": 2},
+                {"OGI": [1]},
+                {"OGI": [2020]},
+                "type",
+                SIM_START,
+                {"OGI": 100},
+                {"OGI": True},
+            )
+        )
+    return Infrastructure._reconstruct({}, None, sites)
+
+
+def run_program(infrastructure: Infrastructure, sim_number: int) -> list[dict]:
+    for day in range(20):
+        current_date: date = SIM_START + timedelta(days=day)
+        infrastructure.activate_emissions(current_date, sim_number)
+        if day == 8:
+            site: Site = infrastructure._sites[0]
+            site.tag_emissions_at_component(
+                "eqg", "comp_0", TaggingInfo(3.0, current_date, 8, "operator", "crew", 0)
+            )
+            site.set_latest_tagging_survey_date(current_date)
+        infrastructure.update_emissions_state(EmisInfo())
+    return list(infrastructure.gen_summary_emis_data(SIM_START + timedelta(days=19)))
+
+
+def test_get_program_copy_runs_the_same_as_a_deep_copy():
+    infrastructure: Infrastructure = gen_infrastructure(sim_number=1)
+
+    expected: list[dict] = run_program(copy.deepcopy(infrastructure), sim_number=1)
+    first: list[dict] = run_program(infrastructure.get_program_copy(1), sim_number=1)
+    second: list[dict] = run_program(infrastructure.get_program_copy(1), sim_number=1)
+
+    assert first == expected
+    assert second == expected
+    assert len(expected) == 8
+
+
+def test_get_program_copy_leaves_the_original_unchanged():
+    infrastructure: Infrastructure = gen_infrastructure(sim_number=0)
+    original_site: Site = infrastructure._sites[0]
+    original_source: Source = original_site._equipment_groups[0]._component[0]._sources[0]
+
+    program_infrastructure: Infrastructure = infrastructure.get_program_copy(0)
+    run_program(program_infrastructure, sim_number=0)
+
+    program_site: Site = program_infrastructure._sites[0]
+    assert original_site.get_latest_tagging_survey_date() == SIM_START
+    assert program_site.get_latest_tagging_survey_date() == SIM_START + timedelta(days=8)
+    assert len(original_source._generated_emissions[0]) == 4
+    assert all(emis.get_status() == "inactive" for emis in original_source._generated_emissions[0])
+    assert original_site._equipment_groups[0]._component[0]._active_emissions == []
+    # The static site properties are shared rather than copied
+    assert program_site._survey_frequencies is original_site._survey_frequencies
+    assert program_site._equipment_groups[0]._meth_survey_times is (
+        original_site._equipment_groups[0]._meth_survey_times
+    )
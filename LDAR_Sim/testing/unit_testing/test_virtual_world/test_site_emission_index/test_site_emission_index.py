@@ -0,0 +1,162 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_site_emission_index.py
+Purpose: Contains unit tests for the index of the active emissions of a site.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import copy
+from datetime import date, timedelta
+
+import numpy as np
+
+from file_processing.output_processing.output_utils import EmisInfo, TsEmisData
+from virtual_world.component import Component
+from virtual_world.equipment_groups import Equipment_Group
+from virtual_world.sites import Site
+from virtual_world.sources import Source
+
+SIM_START: date = date(2020, 1, 1)
+SIM_NUMBER: int = 0
+METHODS: list[str] = ["OGI", "AERIAL"]
+
+
+def gen_source(source_n: int, repairable: bool, persistent: bool) -> Source:
+    source: Source = Source._reconstruct(
+        source_ID=f"source_{source_n}",
+        repairable=repairable,
+        persistent=persistent,
+        active_duration=2,
+        inactive_duration=3,
+        multi_emissions=True,
+        generated_emissions={},
+        emis_rate_source="rates",
+        emis_prod_rate=0.1,
+        emis_duration=12,
+        meth_spat_covs={"OGI": 0.5, "AERIAL": 0.8},
+        emis_rep_delay=2 if repairable else None,
+        emis_rep_cost=[50.0] if repairable else None,
+        next_emission=None,
+        prefix="repairable" if repairable else "non_repairable",
+        meth_temp_covs={"OGI": 0.7, "AERIAL": 1.0},
+    )
+    emissions = [
+        source._build_emission(
+            emission_n,
+            SIM_START + timedelta(days=5 * emission_n + source_n - 2),
+            SIM_START,
+            0.5 + emission_n + 0.1 * source_n,
+            2 if repairable else None,
+        )
+        for emission_n in range(5)
+    ]
+    emissions.reverse()
+    source.set_pregen_emissions(emissions, SIM_NUMBER)
+    return source
+
+
+def gen_site() -> Site:
+    source_types: list[tuple[bool, bool]] = [(True, True), (False, True), (True, False)]
+    components: list[Component] = [
+        Component._reconstruct(
+            "comp",
+            f"comp_{comp_n}",
+            [
+                gen_source(3 * comp_n + source_n, repairable, persistent)
+                for source_n, (repairable, persistent) in enumerate(source_types)
+            ],
+            [],
+            [],
+            {},
+        )
+        for comp_n in range(3)
+    ]
+    equipment_groups: list[Equipment_Group] = [
+        Equipment_Group._reconstruct("eqg_0", {}, {}, components[:2]),
+        Equipment_Group._reconstruct("eqg_1", {}, {}, []),
+        Equipment_Group._reconstruct("eqg_2", {}, {}, components[2:]),
+    ]
+    return Site._reconstruct(
+        "site", 50.0, -110.0, 50.0, -110.0, equipment_groups, {}, {}, {}, "type", SIM_START, {}, {}
+    )
+
+
+def object_model_detectable_emissions(site: Site, method_name: str) -> dict:
+    return {
+        eqg.get_id(): eqg.get_detectable_emissions(method_name) for eqg in site._equipment_groups
+    }
+
+
+def run_surveys(site: Site, get_detectable) -> list:
+    np.random.seed(0)
+    results: list = []
+    for day in range(30):
+        site.activate_emissions(SIM_START + timedelta(days=day), SIM_NUMBER)
+        for method_name in METHODS[: 1 + day % 2]:
+            detectable: dict = get_detectable(site, method_name)
+            results.append(
+                {
+                    eqg_id: {
+                        comp_id: [emis._emissions_id for emis in emissions]
+                        for comp_id, emissions in eqg_emissions.items()
+                    }
+                    for eqg_id, eqg_emissions in detectable.items()
+                }
+            )
+        site.update_emissions_state(EmisInfo(), TsEmisData())
+    results.append(np.random.random())
+    return results
+
+
+def test_get_detectable_emissions_matches_the_object_model():
+    site: Site = gen_site()
+    expected: list = run_surveys(copy.deepcopy(site), object_model_detectable_emissions)
+
+    indexed: list = run_surveys(
+        site, lambda site, method_name: site.get_detectable_emissions(method_name)
+    )
+
+    assert indexed == expected
+    assert list(indexed[0].keys()) == ["eqg_0", "eqg_1", "eqg_2"]
+    assert indexed[0]["eqg_1"] == {}
+    assert sum(len(emissions) for result in expected[:-1] for emissions in result.values()) > 0
+    # Emissions that became inactive are no longer indexed
+    assert len(site._emission_index._slots) == sum(
+        len(comp._active_emissions) for eqg in site._equipment_groups for comp in eqg._component
+    )
+
+
+def test_get_detectable_site_emissions_sums_detectable_rates():
+    site: Site = gen_site()
+    expected: list = run_surveys(copy.deepcopy(site), object_model_detectable_emissions)
+    expected_rates: list[float] = []
+    site_emissions: list[list[str]] = []
+
+    def get_detectable(site: Site, method_name: str) -> dict:
+        emissions, rate = site.get_detectable_site_emissions(method_name)
+        site_emissions.append([emis._emissions_id for emis in emissions])
+        expected_rates.append(sum([emis.get_rate() for emis in emissions]))
+        assert rate == expected_rates[-1]
+        return {"all": {"all": emissions}}
+
+    indexed: list = run_surveys(site, get_detectable)
+
+    assert indexed[-1] == expected[-1]
+    assert site_emissions == [
+        [emis_id for eqg in result.values() for comp in eqg.values() for emis_id in comp]
+        for result in expected[:-1]
+    ]
+    assert any(rate > 0 for rate in expected_rates)
@@ -28,6 +28,7 @@ def mock_site_init(self, equipment_groups: int, survey_times: dict):
         method: time / equipment_groups for method, time in survey_times.items()
     }
 
+    self._survey_times = {}
     self._equipment_groups = []
     for equipment_group in range(equipment_groups):
         self._equipment_groups.append(Equipment_Group(equipment_group_survey_times))
@@ -57,3 +58,24 @@ def test_000_get_method_survey_time_returns_expected_with_multiple_equipment(
     for method in survey_times.keys():
         assert test_site.get_method_survey_time(method) == survey_times[method]
         assert isinstance(test_site.get_method_survey_time(method), int)
+
+
+def test_001_get_method_survey_time_sums_equipment_groups_once(monkeypatch):
+    monkeypatch.setattr(Site, "__init__", mock_site_init)
+
+    monkeypatch.setattr(Equipment_Group, "__init__", mock_equipment_group_init)
+
+    test_site: Site = Site(3, {"method1": 10})
+    calls: list[str] = []
+    get_survey_time = Equipment_Group.get_survey_time
+
+    def counting_get_survey_time(self, method_name):
+        calls.append(method_name)
+        return get_survey_time(self, method_name)
+
+    monkeypatch.setattr(Equipment_Group, "get_survey_time", counting_get_survey_time)
+
+    for _ in range(4):
+        assert test_site.get_method_survey_time("method1") == 10
+
+    assert calls == ["method1"] * 3
@@ -0,0 +1,91 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_calc_daylight_hours
+Purpose: Contains unit tests validating the calculated daylight hours against PyEphem
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, datetime, timedelta
+
+import ephem
+import numpy as np
+import pytest
+
+from weather.daylight_calculator import calc_daylight_hours
+
+START_DATE = date(2017, 1, 1)
+END_DATE = date(2020, 12, 31)
+# Minutes the calculated daylight may be off from PyEphem
+TOLERANCE = 3
+
+
+def calc_ephem_daylight_hours(lat: float, lon: float, start_date: date, end_date: date):
+    """The daylight hours from PyEphem, as they were calculated before"""
+    curr_date = start_date
+    daylight_hours = {}
+    while curr_date <= end_date:
+        obs = ephem.Observer()
+        obs.pressure = 0
+        obs.horizon = "-6"
+        obs.date = datetime.combine(curr_date, datetime.min.time())
+        obs.lat = str(lat)
+        obs.lon = str(lon)
+        try:
+            sunrise = obs.previous_rising(ephem.Sun(), use_center=True).datetime()
+            sunset = obs.next_setting(ephem.Sun(), use_center=True).datetime()
+            dif_hours = (sunset - sunrise).total_seconds() / 3600
+        except ephem.NeverUpError:
+            dif_hours = 0.0
+        except ephem.AlwaysUpError:
+            dif_hours = 24.0
+        daylight_hours[curr_date] = dif_hours
+        curr_date += timedelta(days=1)
+    return daylight_hours
+
+
+@pytest.mark.parametrize(
+    "lat,lon",
+    [
+        (31.9, -102.3),
+        (53.5, -114.0),
+        (40.0, -75.0),
+        (48.0, 10.0),
+        (-33.9, 151.2),
+        (66.0, -140.0),
+        (69.5, 19.0),
+    ],
+)
+def test_daylight_hours_match_pyephem(lat: float, lon: float):
+    expected: dict[date, float] = calc_ephem_daylight_hours(lat, lon, START_DATE, END_DATE)
+
+    daylight_hours: dict[date, float] = calc_daylight_hours(lat, lon, START_DATE, END_DATE)
+
+    assert list(daylight_hours) == list(expected)
+    minutes_off: np.ndarray = (
+        np.abs(np.array(list(daylight_hours.values())) - np.array(list(expected.values()))) * 60
+    )
+    # Dawn or dusk within seconds of midnight (UTC) can be counted from the next or previous
+    # day, which happens on about one day in a thousand
+    assert np.mean(minutes_off <= TOLERANCE) > 0.998
+
+
+def test_daylight_hours_in_polar_day_and_night():
+    daylight_hours: dict[date, float] = calc_daylight_hours(
+        78.2, 15.6, date(2023, 6, 21), date(2023, 12, 21)
+    )
+
+    assert daylight_hours[date(2023, 6, 21)] == 24.0
+    assert daylight_hours[date(2023, 12, 21)] == 0.0
@@ -0,0 +1,69 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_local_daylight
+Purpose: Contains unit tests for the daylight hours of each weather cell
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import os
+from datetime import date
+
+import pytest
+
+from weather import daylight_calculator
+from weather.daylight_calculator import (
+    DaylightCalculatorAve,
+    calc_daylight_hours,
+    load_daylight_hours,
+)
+
+START_DATE = date(2023, 6, 1)
+END_DATE = date(2023, 6, 10)
+CELL_LOCS = {(0, 1): (49.25, -114.0), (2, 0): (58.5, -118.75)}
+
+
+class MockWeather:
+    def get_cell_loc(self, lat_ind: int, lon_ind: int) -> tuple[float, float]:
+        return CELL_LOCS[(lat_ind, lon_ind)]
+
+
+def test_load_daylight_hours_calculates_once(mocker, tmp_path):
+    daylight_hours: dict[date, float] = load_daylight_hours(
+        49.25, -114.0, START_DATE, END_DATE, tmp_path
+    )
+    assert daylight_hours == calc_daylight_hours(49.25, -114.0, START_DATE, END_DATE)
+    assert len(os.listdir(tmp_path)) == 1
+
+    mocker.patch.object(daylight_calculator, "calc_daylight_hours", side_effect=AssertionError)
+    assert load_daylight_hours(49.25, -114.0, START_DATE, END_DATE, tmp_path) == daylight_hours
+    with pytest.raises(AssertionError):
+        load_daylight_hours(49.25, -114.0, START_DATE, date(2023, 6, 11), tmp_path)
+
+
+def test_local_daylight_is_set_for_each_weather_cell(tmp_path):
+    daylight = DaylightCalculatorAve((50.0, -115.0), START_DATE, END_DATE, tmp_path)
+
+    daylight.set_local_daylight(MockWeather(), CELL_LOCS.keys(), START_DATE, END_DATE, tmp_path)
+
+    assert len(os.listdir(tmp_path)) == len(CELL_LOCS) + 1
+
+    assert daylight.daylight_hours == calc_daylight_hours(50.0, -115.0, START_DATE, END_DATE)
+    for (lat_ind, lon_ind), (lat, lon) in CELL_LOCS.items():
+        expected: dict[date, float] = calc_daylight_hours(lat, lon, START_DATE, END_DATE)
+        for curr_date, hours in expected.items():
+            assert daylight.get_local_daylight(curr_date, lat_ind, lon_ind) == hours
+    # Summer days are longer further north
+    assert daylight.get_local_daylight(END_DATE, 2, 0) > daylight.get_local_daylight(END_DATE, 0, 1)
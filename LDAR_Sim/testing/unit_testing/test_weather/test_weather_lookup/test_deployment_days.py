@@ -0,0 +1,127 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_deployment_days
+Purpose: Contains unit tests for the deployment days matrix of the weather lookup
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from constants import param_default_const as pdc
+from programs.method import Method
+from weather.weather_lookup import WeatherLookup
+
+N_DAYS = 20
+N_LAT = 3
+N_LON = 4
+HOUR = 8
+
+WEATHER_ENVS = {
+    pdc.Method_Params.TEMP: [-5.3, 20],
+    pdc.Method_Params.WIND: [0, 5.3],
+    pdc.Method_Params.PRECIP: [0, 0.3],
+}
+
+
+def gen_weather(cache_dir: Path) -> WeatherLookup:
+    rng: np.random.Generator = np.random.default_rng(0)
+    shape: tuple[int, int, int] = (N_DAYS * 24, N_LAT, N_LON)
+    # Values on the envelope bounds are rounded to float32, as they are in the weather cache
+    fields: dict[str, np.ndarray] = {
+        "temps": rng.choice(np.array([-10, -5.3, 0, 15.5, 20, 25], dtype=np.float32), shape),
+        "winds": rng.choice(np.array([0, 2.5, 5.3, 8], dtype=np.float32), shape),
+        "precip": rng.choice(np.array([0, 0.1, 0.3, 1], dtype=np.float32), shape),
+        "time_total": np.arange(N_DAYS * 24),
+        "latitude": np.arange(N_LAT),
+        "longitude": np.arange(N_LON),
+    }
+    for field, values in fields.items():
+        np.save(cache_dir / f"{field}.npy", values)
+    return WeatherLookup._reconstruct(cache_dir)
+
+
+def check_weather_values(weather: WeatherLookup, day: int, lat: int, lon: int) -> bool:
+    """The weather check of a single site and day, done on the hourly values"""
+    timerange = range(day * 24, day * 24 + 24)
+    for weather_vals, param in (
+        (weather.temps, pdc.Method_Params.TEMP),
+        (weather.winds, pdc.Method_Params.WIND),
+        (weather.precip, pdc.Method_Params.PRECIP),
+    ):
+        value = weather_vals[timerange, lat, lon][HOUR]
+        if not WEATHER_ENVS[param][0] <= value <= WEATHER_ENVS[param][1]:
+            return False
+    return True
+
+
+class MockSite:
+    def __init__(self, lat: int, lon: int) -> None:
+        self._lat: int = lat
+        self._lon: int = lon
+
+    def get_weather_lat(self) -> int:
+        return self._lat
+
+    def get_weather_long(self) -> int:
+        return self._lon
+
+
+def test_deployment_days_matches_checking_each_day(tmp_path):
+    weather: WeatherLookup = gen_weather(tmp_path)
+
+    deployment_days: np.ndarray = weather.deployment_days(WEATHER_ENVS, HOUR)
+
+    assert deployment_days.shape == (N_DAYS, N_LAT, N_LON)
+    assert 0 < deployment_days.sum() < deployment_days.size
+    for day in range(N_DAYS):
+        for lat in range(N_LAT):
+            for lon in range(N_LON):
+                assert deployment_days[day, lat, lon] == check_weather_values(
+                    weather, day, lat, lon
+                )
+
+
+def test_deployment_days_are_shared_for_the_same_envelopes(tmp_path):
+    weather: WeatherLookup = gen_weather(tmp_path)
+
+    deployment_days: np.ndarray = weather.deployment_days(WEATHER_ENVS, HOUR)
+
+    assert weather.deployment_days(dict(WEATHER_ENVS), HOUR) is deployment_days
+    assert weather.deployment_days(WEATHER_ENVS, HOUR + 1) is not deployment_days
+
+
+def test_check_weather_looks_up_deployment_days(mocker, tmp_path):
+    mocker.patch.object(Method, "__init__", lambda self: None)
+    method = Method()
+    method._weather_envs = WEATHER_ENVS
+    method._deployment_days = None
+    weather: WeatherLookup = gen_weather(tmp_path)
+    start_date = date(2023, 1, 1)
+
+    for day in range(N_DAYS):
+        curr_date: date = start_date + timedelta(days=day)
+        for lat in range(N_LAT):
+            for lon in range(N_LON):
+                assert method.check_weather(
+                    weather, curr_date, MockSite(lat, lon)
+                ) == check_weather_values(weather, day, lat, lon)
+
+    with pytest.raises(IndexError):
+        method.check_weather(weather, start_date + timedelta(days=N_DAYS), MockSite(0, 0))
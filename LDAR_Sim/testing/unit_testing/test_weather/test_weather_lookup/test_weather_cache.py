@@ -0,0 +1,111 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_weather_cache
+Purpose: Contains unit tests for the memory-mapped weather cache of the weather lookup
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+from netCDF4 import Dataset
+
+from weather.weather_lookup import WeatherLookup
+
+WEATHER_FILE = "weather.nc"
+N_HOURS = 48
+LATITUDES = [52.0, 51.5, 51.0]
+LONGITUDES = [-114.0, -113.5, -114.5, -113.0]
+
+
+def gen_weather_file(in_dir: Path, seed: int = 0) -> dict[str, np.ndarray]:
+    rng: np.random.Generator = np.random.default_rng(seed)
+    shape: tuple[int, int, int] = (N_HOURS, len(LATITUDES), len(LONGITUDES))
+    variables: dict[str, np.ndarray] = {
+        "t2m": rng.uniform(250, 300, shape).astype(np.float32),
+        "u10": rng.normal(0, 5, shape).astype(np.float32),
+        "v10": rng.normal(0, 5, shape).astype(np.float32),
+        "tp": rng.exponential(1e-4, shape).astype(np.float32),
+    }
+    with Dataset(in_dir / WEATHER_FILE, "w") as weather_data:
+        weather_data.createDimension("time", N_HOURS)
+        weather_data.createDimension("latitude", len(LATITUDES))
+        weather_data.createDimension("longitude", len(LONGITUDES))
+        weather_data.createVariable("time", "i4", ("time",))[:] = np.arange(N_HOURS)
+        weather_data.createVariable("latitude", "f4", ("latitude",))[:] = LATITUDES
+        weather_data.createVariable("longitude", "f4", ("longitude",))[:] = LONGITUDES
+        for name, values in variables.items():
+            weather_data.createVariable(name, "f4", ("time", "latitude", "longitude"))[:] = values
+    return variables
+
+
+def test_weather_cache_matches_weather_file(tmp_path):
+    variables: dict[str, np.ndarray] = gen_weather_file(tmp_path)
+
+    weather = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path, tmp_path / "generator")
+
+    assert isinstance(weather.temps, np.memmap)
+    np.testing.assert_array_equal(weather.temps, variables["t2m"] - 273.15)
+    np.testing.assert_array_equal(
+        weather.winds, np.sqrt(np.square(variables["u10"]) + np.square(variables["v10"]))
+    )
+    np.testing.assert_array_equal(weather.precip, variables["tp"] * 1000)
+    for field in WeatherLookup.WEATHER_FIELDS:
+        assert getattr(weather, field).dtype == np.float32
+    np.testing.assert_array_equal(weather.latitude, sorted(LATITUDES))
+    np.testing.assert_array_equal(weather.longitude, sorted(LONGITUDES))
+    np.testing.assert_array_equal(weather.lat_sort, np.argsort(LATITUDES))
+    np.testing.assert_array_equal(weather.lon_sort, np.argsort(LONGITUDES))
+    assert (weather.time_length, weather.lat_length, weather.lon_length) == (
+        N_HOURS,
+        len(LATITUDES),
+        len(LONGITUDES),
+    )
+
+
+def test_weather_cache_is_reused_until_the_weather_file_changes(tmp_path):
+    cache_directory: Path = tmp_path / "generator"
+    gen_weather_file(tmp_path)
+    weather = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path, cache_directory)
+    first_cache_dir: Path = weather.cache_dir
+
+    weather = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path, cache_directory)
+    assert weather.cache_dir == first_cache_dir
+
+    variables: dict[str, np.ndarray] = gen_weather_file(tmp_path, seed=1)
+    weather = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path, cache_directory)
+    assert weather.cache_dir != first_cache_dir
+    np.testing.assert_array_equal(weather.temps, variables["t2m"] - 273.15)
+    assert sorted(os.listdir(cache_directory)) == sorted(
+        [first_cache_dir.name, weather.cache_dir.name]
+    )
+
+
+def test_pickled_weather_lookup_maps_the_cache(tmp_path):
+    gen_weather_file(tmp_path)
+    weather = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path, tmp_path / "generator")
+
+    pickled: bytes = pickle.dumps(weather)
+    unpickled: WeatherLookup = pickle.loads(pickled)
+
+    assert len(pickled) < weather.temps.nbytes
+    assert isinstance(unpickled.temps, np.memmap)
+    for field in WeatherLookup.WEATHER_FIELDS + WeatherLookup.COORDINATE_FIELDS:
+        np.testing.assert_array_equal(getattr(unpickled, field), getattr(weather, field))
+    np.testing.assert_array_equal(unpickled.lat_sort, weather.lat_sort)
+    np.testing.assert_array_equal(unpickled.lon_sort, weather.lon_sort)